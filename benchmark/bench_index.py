@@ -0,0 +1,72 @@
+"""
+Grid (SpatialIndex) and packed R-tree (RTreeIndex) spatial indexes on
+clustered data: dense "cities" of short tracks, and a few long "rural"
+tracks crossing the whole extent.
+
+Usage: python benchmark/bench_index.py [number of tracks, default 20000]
+"""
+
+import sys
+import time
+
+import numpy as np
+import tracklib as tkl
+
+
+def clusteredCollection(N, seed=0):
+    """Tracks of 20 points: 95% in 5 small clusters, 5% random walks on the
+    whole extent (100 km x 100 km)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, 100000, size=(5, 2))
+    collection = tkl.TrackCollection()
+    T = np.arange(20, dtype=float)
+    for k in range(N):
+        if k % 20 == 0:
+            start = rng.uniform(0, 100000, size=2)
+            steps = rng.normal(scale=2000, size=(20, 2))
+        else:
+            start = centers[k % 5] + rng.normal(scale=500, size=2)
+            steps = rng.normal(scale=10, size=(20, 2))
+        XY = np.clip(start + np.cumsum(steps, axis=0), 0, 100000)
+        collection.addTrack(tkl.Track.fromArrays(XY[:, 0], XY[:, 1], None, T, track_id=k))
+    return collection, centers
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    collection, centers = clusteredCollection(N)
+    print("Number of tracks:", N, "(tracks of 20 points)")
+
+    # Queries: half of them in the clusters, half on the whole extent
+    rng = np.random.default_rng(1)
+    Q = np.concatenate([centers[rng.integers(0, 5, 500)] + rng.normal(scale=500, size=(500, 2)),
+                        rng.uniform(0, 100000, size=(500, 2))])
+    coords = [tkl.ENUCoords(x, y) for x, y in Q]
+
+    indexes = [
+        ("Grid 100 x 100  ", lambda: tkl.SpatialIndex(collection, verbose=False, compact=True)),
+        ("Grid 1000 x 1000", lambda: tkl.SpatialIndex(collection, (100, 100), verbose=False, compact=True)),
+        ("R-tree (STR)    ", lambda: tkl.RTreeIndex(collection, resolution=100, verbose=False)),
+    ]
+    print("Index              Build (s)  neighborhood (ms)  candidates  within 50 m (ms)  5-nearest (ms)")
+    for name, build in indexes:
+        start = time.time()
+        index = build()
+        t_build = time.time() - start
+
+        start = time.time()
+        candidates = sum(len(index.neighborhood(c, unit=0) or []) for c in coords)
+        t_neighborhood = (time.time() - start) / len(coords) * 1000
+
+        start = time.time()
+        for c in coords:
+            index.within(c, 50)
+        t_within = (time.time() - start) / len(coords) * 1000
+
+        start = time.time()
+        for c in coords:
+            index.nearest(c, 5)
+        t_nearest = (time.time() - start) / len(coords) * 1000
+
+        print("{}   {:8.3f}   {:16.3f}   {:9.1f}   {:15.3f}   {:13.3f}".format(
+            name, t_build, t_neighborhood, candidates / len(coords), t_within, t_nearest))
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Memory footprint of a track (bytes per point).
+
+Compares observations stored with per-instance dictionaries (layout of
+tracklib before slotted classes), slotted :class:`Obs` objects and the
+columnar mode of :class:`Track`.
+
+Usage: python benchmark/bench_memory.py [number of points, default 1000000]
+"""
+
+import sys
+import gc
+import tracemalloc
+
+import tracklib as tkl
+
+
+# Former layout: every object carries its own __dict__
+class DictENUCoords:
+    def __init__(self, E, N, U=0):
+        self.E = E
+        self.N = N
+        self.U = U
+
+
+class DictObsTime:
+    def __init__(self, year=1970, month=1, day=1, hour=0, min=0, sec=0, ms=0, zone=0):
+        self.day = day
+        self.month = month
+        self.year = year
+        self.hour = hour
+        self.min = min
+        self.sec = sec
+        self.ms = ms
+        self.zone = zone
+
+
+class DictObs:
+    def __init__(self, position, timestamp):
+        self.position = position
+        self.timestamp = timestamp
+        self.features = []
+        self.gdop = 0
+        self.pdop = 0
+        self.vdop = 0
+        self.hdop = 0
+        self.tdop = 0
+        self.nb_sats = 0
+        self.mask = 0
+        self.code = 0
+        self.azimut = 0
+        self.elevation = 0
+
+
+def measure(build, n):
+    """Number of bytes allocated per point by build(n)"""
+    gc.collect()
+    tracemalloc.start()
+    data = build(n)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size / n
+
+
+def buildDict(n):
+    return [DictObs(DictENUCoords(float(i), float(i), 0.0),
+                    DictObsTime(2020, 1, 1, 0, 0, i % 60, 0)) for i in range(n)]
+
+
+def buildSlots(n):
+    return tkl.Track([tkl.Obs(tkl.ENUCoords(float(i), float(i), 0.0),
+                              tkl.ObsTime(2020, 1, 1, 0, 0, i % 60, 0)) for i in range(n)])
+
+
+def buildColumnar(n):
+    X = [float(i) for i in range(n)]
+    return tkl.Track.fromArrays(X, X, T=X)
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("Number of points:", N)
+    print("Dict-based objects : {:7.1f} bytes/point".format(measure(buildDict, N)))
+    print("Slotted objects    : {:7.1f} bytes/point".format(measure(buildSlots, N)))
+    print("Columnar track     : {:7.1f} bytes/point".format(measure(buildColumnar, N)))
@@ -0,0 +1,47 @@
+"""
+Writing and loading of a collection of columnar tracks in the binary format
+of TrackStore.
+
+Usage: python benchmark/bench_store.py [number of points, default 10000000]
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+import numpy as np
+import tracklib as tkl
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    SIZE = 10000
+    print("Number of points:", N, "(tracks of", SIZE, "points)")
+
+    collection = tkl.TrackCollection()
+    for k in range(N // SIZE):
+        X = np.cumsum(np.random.normal(size=SIZE))
+        Y = np.cumsum(np.random.normal(size=SIZE))
+        T = 1.6e9 + np.arange(SIZE, dtype=float)
+        collection.addTrack(tkl.Track.fromArrays(X, Y, None, T, af={"speed": np.abs(X)},
+                                                 track_id=k))
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "collection.tlb")
+        start = time.time()
+        tkl.TrackStore.write(collection, path)
+        print("Write        : {:7.3f} s".format(time.time() - start))
+
+        start = time.time()
+        store = tkl.TrackStore(path)
+        print("Open         : {:7.3f} s".format(time.time() - start))
+
+        start = time.time()
+        length = sum(track.size() for track in store)
+        print("Materialize  : {:7.3f} s".format(time.time() - start))
+
+        start = time.time()
+        speed = sum(float(np.sum(track["speed"])) for track in store)
+        print("Sum of AF    : {:7.3f} s".format(time.time() - start))
+
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Speed of timestamp conversions (ObsTime.readUnixTime and ObsTime.toAbsTime)
+and comparisons.
+
+Usage: python benchmark/bench_time.py [number of conversions, default 10000000]
+"""
+
+import sys
+import time
+
+import tracklib as tkl
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    print("Number of conversions:", N)
+
+    # Timestamps between 1970 and 2050
+    step = 2.5e9 / N
+
+    start = time.time()
+    TIMES = [tkl.ObsTime.readUnixTime(i * step) for i in range(N)]
+    print("readUnixTime : {:7.3f} s".format(time.time() - start))
+
+    start = time.time()
+    T = [t.toAbsTime() for t in TIMES]
+    print("toAbsTime    : {:7.3f} s".format(time.time() - start))
+
+    start = time.time()
+    TIMES = [tkl.ObsTime(t.year, t.month, t.day, t.hour, t.min, t.sec, t.ms) for t in TIMES]
+    print("Fields       : {:7.3f} s".format(time.time() - start))
+
+    start = time.time()
+    sorted = all(TIMES[i] <= TIMES[i + 1] for i in range(N - 1))
+    print("Comparisons  : {:7.3f} s".format(time.time() - start))
@@ -12,7 +12,7 @@ from numpy import pi
 from tracklib import (Obs, ObsTime, ENUCoords, NAN,
                       speed, acceleration, ds, heading, slope,
                       anglegeom, orientation, calculAngleOriente,
-                      Track)
+                      Track, getVectorizedAF)
 
 
 
@@ -275,6 +275,34 @@ class TestAlgoAnalyticsMethods(unittest.TestCase):
         a = calculAngleOriente(self.trace1, 6)
         self.assertTrue(abs(a - 90) < 0.000001)
 		
+    def testVectorized(self):
+        algorithms = [ds, heading, speed, acceleration, slope, anglegeom, orientation]
+        for track in [self.trace1, self.trace2, self.trace3, self.trace1[0:1]]:
+            for algorithm in algorithms:
+                expected = []
+                for i in range(track.size()):
+                    try:
+                        expected.append(algorithm(track, i))
+                    except IndexError:
+                        expected.append(NAN)
+                values = getVectorizedAF(algorithm)(track)
+                self.assertEqual(len(values), track.size())
+                for i in range(track.size()):
+                    if math.isnan(expected[i]):
+                        self.assertTrue(math.isnan(values[i]))
+                    else:
+                        self.assertAlmostEqual(expected[i], values[i], places=9)
+                # Dispatch from track (object and columnar modes)
+                name = algorithm.__name__ + "_v"
+                output = track.addAnalyticalFeature(algorithm, name)
+                self.assertEqual(len(output), track.size())
+                for i in range(track.size()):
+                    self.assertEqual(math.isnan(expected[i]), math.isnan(output[i]))
+                track.removeAnalyticalFeature(name)
+            columnar = track.copy().toColumnar()
+            self.assertEqual(list(columnar.addAnalyticalFeature(ds)),
+                             track.addAnalyticalFeature(ds))
+
 		
 if __name__ == '__main__':
     
@@ -287,6 +315,7 @@ if __name__ == '__main__':
     suite.addTest(TestAlgoAnalyticsMethods("testSlope"))
     suite.addTest(TestAlgoAnalyticsMethods("testAngleGeom"))
     suite.addTest(TestAlgoAnalyticsMethods("testCalculAngleOriente"))
+    suite.addTest(TestAlgoAnalyticsMethods("testVectorized"))
     runner = unittest.TextTestRunner()
     runner.run(suite)
 
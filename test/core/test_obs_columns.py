@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from unittest import TestCase, TestSuite, TextTestRunner
+
+from tracklib import (ENUCoords, GeoCoords, ObsTime, Obs, Track,
+                      ObsColumns, ObsView,
+                      speed, heading)
+from tracklib.util.exceptions import CoordTypeError
+
+
+class TestObsColumns(TestCase):
+
+    __epsilon = 0.001
+
+    def setUp (self):
+        ObsTime.setReadFormat("4Y-2M-2D 2h:2m:2s")
+        self.track = Track([], 1, 2)
+        X = [1.0, 2.0, 3.0, 5.0, 7.0]
+        Y = [5.0, 5.0, 6.0, 5.0, 4.0]
+        T = ["10:00:00", "10:00:05", "10:00:10", "10:00:20", "10:00:45"]
+        for i in range(len(X)):
+            time = ObsTime.readTimestamp("2018-01-01 " + T[i])
+            self.track.addObs(Obs(ENUCoords(X[i], Y[i], 0.5*i), time))
+        self.track.createAnalyticalFeature("a", [1, 2, 3, 4, 5])
+        self.track.createAnalyticalFeature("label", "p")
+
+    def test_conversion(self):
+        columnar = self.track.copy().toColumnar()
+        self.assertTrue(columnar.isColumnar())
+        self.assertFalse(self.track.isColumnar())
+        self.assertEqual(columnar.size(), 5)
+        self.assertEqual(columnar.getSRID(), "ENU")
+        self.assertIsInstance(columnar.getX(), np.ndarray)
+        self.assertEqual(list(columnar.getX()), self.track.getX())
+        self.assertEqual(list(columnar.getZ()), self.track.getZ())
+        self.assertEqual(list(columnar.getT()), self.track.getT())
+        self.assertEqual(list(columnar["a"]), self.track["a"])
+        self.assertEqual(list(columnar["label"]), self.track["label"])
+        self.assertEqual(list(columnar["idx"]), self.track["idx"])
+        self.assertEqual(columnar["timestamp"], self.track["timestamp"])
+        self.assertEqual(columnar.getListAnalyticalFeatures(), ["a", "label"])
+
+        back = columnar.copy().toPoints()
+        self.assertFalse(back.isColumnar())
+        self.assertEqual(back.getX(), self.track.getX())
+        self.assertEqual(back["a"], self.track["a"])
+        self.assertIsInstance(back[0], Obs)
+        self.assertNotIsInstance(back[0], ObsView)
+
+    def test_zero_copy(self):
+        columnar = self.track.copy().toColumnar()
+        X = columnar.getX()
+        X[0] = 100.0
+        self.assertEqual(columnar[0].position.getX(), 100.0)
+        columnar["a"][1] = 20.0
+        self.assertEqual(columnar["a", 1], 20.0)
+        columnar[2].position.setY(42.0)
+        self.assertEqual(columnar.getY(2), 42.0)
+        columnar[3].features[0] = 40.0
+        self.assertEqual(columnar.getAnalyticalFeature("a")[3], 40.0)
+        columnar[4].timestamp = ObsTime.readTimestamp("2018-01-01 11:00:00")
+        self.assertEqual(columnar[4].timestamp, ObsTime.readTimestamp("2018-01-01 11:00:00"))
+
+    def test_analytical_features(self):
+        columnar = self.track.copy().toColumnar()
+        V1 = self.track.addAnalyticalFeature(speed)
+        V2 = columnar.addAnalyticalFeature(speed)
+        for i in range(len(V1)):
+            self.assertAlmostEqual(V1[i], V2[i], delta=self.__epsilon)
+        H1 = self.track.addAnalyticalFeature(heading)
+        H2 = columnar.addAnalyticalFeature(heading)
+        self.assertTrue(np.allclose(np.array(H1), H2, equal_nan=True))
+
+        columnar.updateAnalyticalFeature("a", 0)
+        self.assertEqual(list(columnar["a"]), [0] * 5)
+        columnar.removeAnalyticalFeature("a")
+        self.assertFalse(columnar.hasAnalyticalFeature("a"))
+        self.assertEqual(list(columnar["label"]), ["p"] * 5)
+        self.assertTrue(np.allclose(np.array(V1), columnar["speed"], equal_nan=True))
+        columnar.setObsAnalyticalFeature("speed", 0, "fast")
+        self.assertEqual(columnar["speed", 0], "fast")
+
+    def test_edition(self):
+        columnar = self.track.copy().toColumnar()
+        columnar.addObs(Obs(ENUCoords(9, 9, 9), ObsTime.readTimestamp("2018-01-01 09:00:00")))
+        self.assertEqual(columnar.size(), 6)
+        self.assertTrue(np.isnan(columnar["a", 5]))
+        columnar.sort()
+        self.assertEqual(columnar.getX(0), 9)
+        self.assertTrue(columnar.isSorted())
+        columnar.removeObs(0)
+        self.assertEqual(list(columnar.getX()), self.track.getX())
+        columnar.insertObs(Obs(ENUCoords(4, 4, 0), ObsTime.readTimestamp("2018-01-01 10:00:15")))
+        self.assertEqual(list(columnar.getX()), [1, 2, 3, 4, 5, 7])
+        self.assertEqual(columnar[1:3].getX().tolist(), [2, 3])
+        self.assertEqual(columnar[1:3].getListAnalyticalFeatures(), ["a", "label"])
+        self.assertEqual(list(columnar.reverse().getX()), [7, 5, 4, 3, 2, 1])
+        self.assertEqual(columnar.length(), (columnar.copy().toPoints()).length())
+        with self.assertRaises(CoordTypeError):
+            columnar.addObs(Obs(GeoCoords(2.0, 48.0, 0)))
+
+    def test_from_arrays(self):
+        track = Track.fromArrays([2.0, 2.1], [48.0, 48.1], T=[0, 10], srid="Geo",
+                                 af={"v": [1.5, 2.5]})
+        self.assertTrue(track.isColumnar())
+        self.assertEqual(track.getSRID(), "Geo")
+        self.assertEqual(track[1].timestamp, ObsTime.readUnixTime(10))
+        self.assertEqual(list(track["v"]), [1.5, 2.5])
+        self.assertIsInstance(track[0].position, GeoCoords)
+        track.toENUCoords(track[0].position.copy())
+        self.assertTrue(track.isColumnar())
+        self.assertEqual(track.getSRID(), "ENU")
+        self.assertAlmostEqual(track.getX(0), 0, delta=self.__epsilon)
+        self.assertEqual(list(track["v"]), [1.5, 2.5])
+        columns = ObsColumns.fromArrays([0, 1, 2], [0, 0, 0])
+        self.assertEqual(len(columns), 3)
+
+    def test_copy(self):
+        self.track.uid = 7
+        copy = self.track.copy()
+        self.assertEqual(copy.uid, 7)
+        self.assertEqual(copy.getX(), self.track.getX())
+        self.assertEqual(copy["label"], self.track["label"])
+        self.assertIsNot(copy[0], self.track[0])
+        self.assertIsNot(copy[0].position, self.track[0].position)
+        copy[0].position.setX(100.0)
+        copy["a", 1] = 20
+        copy.createAnalyticalFeature("b")
+        self.assertEqual(self.track.getX(0), 1.0)
+        self.assertEqual(self.track["a", 1], 2)
+        self.assertFalse(self.track.hasAnalyticalFeature("b"))
+
+    def test_copy_on_write(self):
+        columnar = self.track.copy().toColumnar()
+        copy = columnar.copy(cow=True)
+        self.assertIs(copy.getAnalyticalFeature("a").base, columnar.getAnalyticalFeature("a").base)
+
+        # Shared columns are read-only in the original track too
+        self.assertFalse(columnar.getAnalyticalFeature("a").flags.writeable)
+        with self.assertRaises(ValueError):
+            columnar.getAnalyticalFeature("a")[0] = 5.0
+        copy["a", 0] = 10.0
+        self.assertEqual(copy["a", 0], 10.0)
+        self.assertEqual(columnar["a", 0], 1.0)
+        columnar["a", 1] = 20.0
+        self.assertEqual(copy["a", 1], 2.0)
+        self.assertEqual(columnar["a", 1], 20.0)
+        columnar.getAnalyticalFeature("a")[2] = 30.0
+        self.assertEqual(copy["a", 2], 3.0)
+        copy.removeObs(0)
+        self.assertEqual(list(copy["label"]), ["p"] * 4)
+        self.assertEqual(columnar.size(), 5)
+        with self.assertRaises(ValueError):
+            columnar["label"][0] = "q"
+
+    def test_view(self):
+        columnar = self.track.copy().toColumnar()
+        for track in [self.track, columnar]:
+            view = track.view(1, 3)
+            self.assertEqual(view.size(), 2)
+            self.assertEqual(list(view.getX()), [2.0, 3.0])
+            self.assertEqual(list(view["a"]), [2, 3])
+            view[0].position.setX(12.0)
+            view["a", 1] = 30
+            self.assertEqual(track.getX(1), 12.0)
+            self.assertEqual(track["a", 2], 30)
+            view.addObs(Obs(ENUCoords(0, 0, 0), ObsTime()))
+            view.removeObs(0)
+            self.assertEqual(view.size(), 2)
+            self.assertEqual(track.size(), 5)
+            self.assertEqual(track.getX(1), 12.0)
+        self.assertEqual(columnar.view(3, 10).size(), 2)
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestObsColumns("test_conversion"))
+    suite.addTest(TestObsColumns("test_zero_copy"))
+    suite.addTest(TestObsColumns("test_analytical_features"))
+    suite.addTest(TestObsColumns("test_edition"))
+    suite.addTest(TestObsColumns("test_from_arrays"))
+    suite.addTest(TestObsColumns("test_copy"))
+    suite.addTest(TestObsColumns("test_copy_on_write"))
+    suite.addTest(TestObsColumns("test_view"))
+    runner = TextTestRunner()
+    runner.run(suite)
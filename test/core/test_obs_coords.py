@@ -2,7 +2,7 @@
 from unittest import TestCase, TestSuite, TextTestRunner
 
 from math import degrees 
-from tracklib import (ENUCoords)
+from tracklib import (ENUCoords, GeoCoords, ECEFCoords, ObsTime, Obs)
 
 class TestCoords(TestCase):
     '''
@@ -19,6 +19,25 @@ class TestCoords(TestCase):
         c2 = ENUCoords(75.0, 100.0, 0)
         self.assertTrue(abs(degrees(c1.azimuthTo(c2)) - 42.273) < self.__epsilon)
         self.assertTrue(abs(degrees(c2.azimuthTo(c1)) - 222.273 + 360) < self.__epsilon)
+
+    def test_slots(self):
+        for coords in [ENUCoords(1, 2, 3), GeoCoords(2.0, 48.0, 0), ECEFCoords(1, 2, 3)]:
+            self.assertFalse(hasattr(coords, "__dict__"))
+            with self.assertRaises(AttributeError):
+                coords.foo = 1
+        self.assertFalse(hasattr(ObsTime(), "__dict__"))
+
+        obs = Obs(ENUCoords(1, 2, 3), ObsTime())
+        self.assertFalse(hasattr(obs, "__dict__"))
+        self.assertIsNone(obs._gnss)
+        self.assertEqual(obs.hdop, 0)
+        self.assertEqual(obs.nb_sats, 0)
+        obs.nb_sats = 7
+        copy = obs.copy()
+        copy.hdop = 1.5
+        self.assertEqual(copy.nb_sats, 7)
+        self.assertEqual(obs.hdop, 0)
+        self.assertEqual(copy.position.getX(), 1)
     
 
 
@@ -26,6 +45,7 @@ if __name__ == '__main__':
     suite = TestSuite()
     
     suite.addTest(TestCoords("test_azimuth"))
+    suite.addTest(TestCoords("test_slots"))
     
     runner = TextTestRunner()
     runner.run(suite)
\ No newline at end of file
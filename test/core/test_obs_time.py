@@ -4,6 +4,7 @@
 """
 
 import unittest
+import numpy as np
 from tracklib import (ObsTime)
 
 class TestObsTime(unittest.TestCase):
@@ -122,8 +123,58 @@ class TestObsTime(unittest.TestCase):
         t5 = ObsTime.readTimestamp(date5)
         
         self.assertTrue(t4 == t5)
-        
-        
+
+
+    def test_epoch(self):
+        # Last day of leap years
+        t = ObsTime.readUnixTime(1230747832.0)
+        self.assertEqual((t.year, t.month, t.day), (2008, 12, 31))
+        self.assertEqual((t.hour, t.min, t.sec, t.ms), (18, 23, 52, 0))
+        self.assertEqual(ObsTime.readUnixTime(86400 * 365).year, 1971)
+        self.assertEqual(ObsTime(2008, 12, 31, 18, 23, 52).toAbsTime(), 1230747832.0)
+        self.assertEqual(ObsTime.readUnixTime(1.5).getEpoch(), 1500)
+
+        # Fields may be out of range until next conversion
+        t = ObsTime()
+        t.day = 29
+        t.month = 2
+        t.year = 2020
+        self.assertEqual((t.year, t.month, t.day), (2020, 2, 29))
+        self.assertEqual(t, ObsTime.readUnixTime(ObsTime(2020, 2, 29).toAbsTime()))
+        t.day = 30
+        self.assertEqual(t, ObsTime(2020, 3, 1))
+        self.assertEqual(t - ObsTime(2020, 2, 28), 2 * 86400)
+        self.assertTrue(ObsTime(2020, 2, 28, 23, 59, 59, 999) < t)
+
+    def test_read_timestamps(self):
+        fmt = ObsTime.getReadFormat()
+        ObsTime.setReadFormat("4Y-2M-2DT2h:2m:2s.3zZ")
+        dates = ['2018-01-31T13:21:46.120Z', '2020-02-29T00:00:00.000Z',
+                 '2018-13-01T00:00:00.005Z', ' 2018-01-31', '', 'abc']
+        T = ObsTime.readTimestamps(dates)
+        self.assertEqual(len(T), len(dates))
+        for i in range(3):
+            self.assertEqual(T[i], ObsTime.readTimestamp(dates[i]).toAbsTime())
+        self.assertTrue(all(t != t for t in T[3:]))
+
+        ObsTime.setReadFormat("2D/2M/2Y 2h:2m:2s")
+        T = ObsTime.readTimestamps(['31/01/18 13:21:46', '31/01/18 13:21: 6'])
+        self.assertEqual(T[0], ObsTime(2018, 1, 31, 13, 21, 46).toAbsTime())
+        self.assertEqual(T[1], ObsTime.readTimestamp('31/01/18 13:21: 6').toAbsTime())
+        ObsTime.setReadFormat(fmt)
+
+    def test_print_timestamps(self):
+        fmt = ObsTime.getPrintFormat()
+        times = [ObsTime(2018, 1, 31, 13, 21, 46, 120), ObsTime(2020, 2, 29),
+                 ObsTime(1969, 12, 31, 23, 59, 59, 995), ObsTime(2099, 12, 31, 5, 4, 3, 2)]
+        T = [t.toAbsTime() for t in times]
+        for f in ["2D/2M/4Y 2h:2m:2s", "4Y-2M-2DT2h:2m:2s.3zZ", "2Y2M2D 1h1m1s.1z 2z 100%"]:
+            ObsTime.setPrintFormat(f)
+            self.assertEqual(ObsTime.printTimestamps(T), [str(t) for t in times])
+            self.assertEqual(ObsTime.printTimestamps(np.array(T)), [str(t) for t in times])
+        ObsTime.setPrintFormat(fmt)
+
+
 if __name__ == '__main__':
     
     suite = unittest.TestSuite()
@@ -132,6 +183,9 @@ if __name__ == '__main__':
     suite.addTest(TestObsTime("test_readunixtime"))
     suite.addTest(TestObsTime("test_compare"))
     suite.addTest(TestObsTime("test_add"))
+    suite.addTest(TestObsTime("test_epoch"))
+    suite.addTest(TestObsTime("test_read_timestamps"))
+    suite.addTest(TestObsTime("test_print_timestamps"))
     
     runner = unittest.TextTestRunner()
     runner.run(suite)
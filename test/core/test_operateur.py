@@ -344,7 +344,42 @@ class TestOperateurMethods(unittest.TestCase):
         #print (c11)
         #vt = [c11, 1, 0, 0, 1, 1, 1]
         #self.assertListEqual(vt, trace.getAnalyticalFeature('op10'))
-        
+
+    def test_algebraic_expression(self):
+        trace = Track([], 1)
+        for i in range(7):
+            trace.addObs(Obs(ENUCoords(i, i % 2, 0), ObsTime.readUnixTime(2 * i)))
+        trace["s"] = [0.0, 1.0, 3.0, 6.0, 10.0, 15.0, 21.0]
+        trace["a"] = [1, -1, 1, -2, 2, -3, 2]
+
+        trace.operate("v=3.6*D{s}/D{t}")
+        self.assertTrue(math.isnan(trace["v", 0]))
+        self.assertListEqual([1.8, 3.6, 5.4, 7.2, 9.0, 10.8], trace["v"][1:])
+        self.assertListEqual(["s", "a", "v"], trace.getListAnalyticalFeatures())
+
+        trace.operate("w=3.6*(s-(s>>1))/(t-(t>>1))")
+        self.assertListEqual(trace["v"][1:], trace["w"][1:])
+
+        output = trace.operate("a*factor+1", {"factor": 2})
+        self.assertListEqual([3, -1, 3, -3, 5, -5, 5], output)
+        self.assertListEqual(["s", "a", "v", "w"], trace.getListAnalyticalFeatures())
+
+        trace.operate("a/=AVG{ABS{a}}")
+        self.assertAlmostEqual(7/12, trace["a", 0], places=9)
+        self.assertAlmostEqual(-21/12, trace["a", 5], places=9)
+        self.assertEqual(trace.getListAnalyticalFeatures()[-1], "a")
+
+        trace.operate("x=x*2")
+        self.assertListEqual([0, 2, 4, 6, 8, 10, 12], trace.getX())
+
+        plan1 = Track.compileExpression("v=3.6*D{s}/D{t}")
+        plan2 = Track.compileExpression("v=3.6*D{s}/D{t}")
+        self.assertIs(plan1, plan2)
+
+        columnar = trace.copy().toColumnar()
+        self.assertTrue(np.allclose(columnar.operate("3.6*D{s}/D{t}"),
+                                    trace.operate("3.6*D{s}/D{t}"), equal_nan=True))
+
         
         
         
@@ -358,6 +393,7 @@ if __name__ == '__main__':
     suite.addTest(TestOperateurMethods("test_abs_curv1"))
     suite.addTest(TestOperateurMethods("test_unary_void_operator"))
     suite.addTest(TestOperateurMethods("test_binary_void_operator"))
+    suite.addTest(TestOperateurMethods("test_algebraic_expression"))
     runner = unittest.TextTestRunner()
     runner.run(suite)
     
\ No newline at end of file
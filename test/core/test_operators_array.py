@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from unittest import TestCase, TestSuite, TextTestRunner
+
+from tracklib import (ENUCoords, ObsTime, Obs, Track, TrackCollection,
+                      Operator, GaussianKernel, NAN,
+                      UnaryOperator, BinaryOperator, ScalarOperator,
+                      UnaryVoidOperator, BinaryVoidOperator, ScalarVoidOperator)
+
+
+SIGNED = [1.5, -2.0, 3.25, 0.5, 4.0, -1.0, 2.5, 6.0, -3.5]
+POSITIVE = [2.0, 1.0, 0.5, 3.0, 1.5, 2.5, 4.0, 0.75, 1.25]
+NODATA = [1.5, -2.0, NAN, 0.5, 4.0, -1.0, NAN, 6.0, -3.5]
+
+
+class TestOperatorsArray(TestCase):
+    """Parity between observation-wise execute and array-level executeArray"""
+
+    def setUp (self):
+        ObsTime.setReadFormat("4Y-2M-2D 2h:2m:2s")
+
+    def __track(self, *arrays):
+        track = Track([], 1, 2)
+        for i in range(len(arrays[0])):
+            track.addObs(Obs(ENUCoords(i, 0, 0), ObsTime.readUnixTime(i)))
+        for k in range(len(arrays)):
+            track.createAnalyticalFeature("a" + str(k), list(arrays[k]))
+        return track
+
+    def __run(self, operator, arrays, arg=None):
+        """Output of execute (on a list-mode track) and of executeArray"""
+        track = self.__track(*arrays)
+        inputs = ["a" + str(k) for k in range(len(arrays))]
+        copy = list(arg) if isinstance(arg, list) else arg
+        if isinstance(operator, (UnaryVoidOperator, BinaryVoidOperator)):
+            operator.execute(track, *inputs, "out")
+            expected = track["out"]
+        elif isinstance(operator, ScalarVoidOperator):
+            operator.execute(track, inputs[0], copy, "out")
+            expected = track["out"]
+        elif isinstance(operator, ScalarOperator):
+            expected = operator.execute(track, inputs[0], copy)
+        else:
+            expected = operator.execute(track, *inputs)
+        copy = list(arg) if isinstance(arg, list) else arg
+        if isinstance(operator, (ScalarOperator, ScalarVoidOperator)):
+            output = operator.executeArray(np.array(arrays[0]), copy)
+        else:
+            output = operator.executeArray(*[np.array(X) for X in arrays])
+        return expected, output
+
+    def assertSameValues(self, expected, output, msg=None):
+        if isinstance(expected, bool):
+            self.assertEqual(expected, output, msg)
+            return
+        expected = np.asarray(expected, dtype=float)
+        output = np.asarray(output, dtype=float)
+        self.assertEqual(expected.shape, output.shape, msg)
+        self.assertTrue(np.allclose(expected, output, equal_nan=True), msg)
+
+    def test_unary_void(self):
+        for name in ["IDENTITY", "RECTIFIER", "INTEGRATOR", "SHIFT_RIGHT", "SHIFT_LEFT",
+                     "SHIFT_CIRCULAR_RIGHT", "SHIFT_CIRCULAR_LEFT", "INVERTER",
+                     "INVERSER", "REVERSER", "DEBIASER", "SQUARE", "NORMALIZER",
+                     "DIFFERENTIATOR", "BACKWARD_FINITE_DIFF", "FORWARD_FINITE_DIFF",
+                     "CENTERED_FINITE_DIFF", "SECOND_ORDER_FINITE_DIFF", "DIODE",
+                     "SIGN", "EXP", "LOG", "COS", "SIN", "TAN"]:
+            expected, output = self.__run(getattr(Operator, name), [SIGNED])
+            self.assertSameValues(expected, output, name)
+        expected, output = self.__run(Operator.SQRT, [POSITIVE])
+        self.assertSameValues(expected, output, "SQRT")
+
+    def test_binary_void(self):
+        for name in ["ADDER", "SUBSTRACTER", "MULTIPLIER", "DIVIDER", "MODULO",
+                     "ABOVE", "BELOW", "QUAD_ADDER", "RENORMALIZER", "DERIVATOR",
+                     "POINTWISE_EQUALER", "CONVOLUTION", "CORRELATOR"]:
+            expected, output = self.__run(getattr(Operator, name), [SIGNED, POSITIVE])
+            self.assertSameValues(expected, output, name)
+        expected, output = self.__run(Operator.POWER, [POSITIVE, SIGNED])
+        self.assertSameValues(expected, output, "POWER")
+
+    def test_unary(self):
+        for name in ["SUM", "AVERAGER", "VARIANCE", "STDDEV", "MSE", "RMSE", "MAD",
+                     "MIN", "MAX", "MEDIAN", "ARGMIN", "ARGMAX", "ZEROS"]:
+            expected, output = self.__run(getattr(Operator, name), [SIGNED])
+            self.assertSameValues(expected, output, name)
+        expected, output = self.__run(Operator.ZEROS, [[0, 1, 0, 2]])
+        self.assertEqual(expected, output)
+
+    def test_binary(self):
+        for name in ["COVARIANCE", "CORRELATION", "L0", "L1", "L2", "LINF", "EQUAL"]:
+            expected, output = self.__run(getattr(Operator, name), [SIGNED, POSITIVE])
+            self.assertSameValues(expected, output, name)
+        expected, output = self.__run(Operator.EQUAL, [NODATA, NODATA])
+        self.assertTrue(expected)
+        self.assertTrue(output)
+
+    def test_scalar(self):
+        expected, output = self.__run(Operator.AGGREGATE, [SIGNED], max)
+        self.assertEqual(expected, output)
+        for name in ["SHIFT", "SHIFT_REV", "SHIFT_CIRCULAR", "SHIFT_CIRCULAR_REV"]:
+            expected, output = self.__run(getattr(Operator, name), [SIGNED], 2)
+            self.assertSameValues(expected, output, name)
+        for name in ["SCALAR_ADDER", "SCALAR_SUBSTRACTER", "SCALAR_MULTIPLIER",
+                     "SCALAR_DIVIDER", "SCALAR_MODULO", "SCALAR_ABOVE", "SCALAR_BELOW",
+                     "SCALAR_REV_ABOVE", "SCALAR_REV_BELOW", "SCALAR_REV_SUBSTRACTER",
+                     "SCALAR_REV_DIVIDER", "SCALAR_REV_MODULO", "THRESHOLDER"]:
+            expected, output = self.__run(getattr(Operator, name), [SIGNED], 1.5)
+            self.assertSameValues(expected, output, name)
+        for name in ["SCALAR_POWER", "SCALAR_REV_POWER"]:
+            expected, output = self.__run(getattr(Operator, name), [POSITIVE], 1.5)
+            self.assertSameValues(expected, output, name)
+        expected, output = self.__run(Operator.APPLY, [SIGNED], lambda x: 2 * x + 1)
+        self.assertSameValues(expected, output, "APPLY")
+        expected, output = self.__run(Operator.RANDOM, [SIGNED], lambda: 0.5)
+        self.assertSameValues(expected, output, "RANDOM")
+        for kernel in [[1, 2, 1], GaussianKernel(3)]:
+            expected, output = self.__run(Operator.FILTER, [SIGNED], kernel)
+            self.assertSameValues(expected, output, "FILTER")
+        expected, output = self.__run(Operator.FILTER_FFT, [SIGNED], [1, 2, 1])
+        self.assertSameValues(expected, output, "FILTER_FFT")
+
+    def test_no_data(self):
+        for name in ["SUM", "AVERAGER", "VARIANCE", "MSE", "MAD", "MIN", "MAX",
+                     "ARGMIN", "ARGMAX", "DIFFERENTIATOR", "INTEGRATOR", "RECTIFIER",
+                     "SHIFT_RIGHT", "REVERSER"]:
+            expected, output = self.__run(getattr(Operator, name), [NODATA])
+            self.assertSameValues(expected, output, name)
+        for name in ["ADDER", "DIVIDER", "COVARIANCE", "L0", "L1", "L2", "LINF", "EQUAL"]:
+            expected, output = self.__run(getattr(Operator, name), [NODATA, SIGNED])
+            self.assertSameValues(expected, output, name)
+        expected, output = self.__run(Operator.FILTER, [NODATA], [1, 2, 1])
+        self.assertSameValues(expected, output, "FILTER")
+
+    def test_operate(self):
+        track = self.__track(SIGNED, POSITIVE)
+        columnar = track.copy().toColumnar()
+        for t in [track, columnar]:
+            t.operate(Operator.DIFFERENTIATOR, "a0", "d")
+            t.operate(Operator.DIVIDER, "a0", "a1", "r")
+            t.operate(Operator.SHIFT, "a0", 1, "s")
+            t.operate(Operator.FILTER, "a0", [1, 2, 1], "f")
+        for af in ["d", "r", "s", "f"]:
+            self.assertSameValues(track[af], columnar[af], af)
+        self.assertIs(track["d", 0], NAN)
+        self.assertEqual(track.operate(Operator.AVERAGER, ["a0", "a1"]),
+                         [np.mean(SIGNED), np.mean(POSITIVE)])
+        self.assertEqual(track.operate(Operator.L0, "a0", "a0"), 0)
+
+        track.operate(Operator.INVERTER, "a0")
+        self.assertEqual(track["a0"], [-x for x in SIGNED])
+        track.operate(Operator.SCALAR_MULTIPLIER, "x", 2)
+        self.assertEqual(track.getX(), [2 * i for i in range(len(SIGNED))])
+
+        collection = TrackCollection([self.__track(SIGNED), self.__track(POSITIVE)])
+        self.assertEqual(collection.operate(Operator.SUM, "a0"), [sum(SIGNED), sum(POSITIVE)])
+        collection.operate(Operator.SCALAR_ADDER, "a0", 1, "b")
+        self.assertEqual(collection[1]["b"], [x + 1 for x in POSITIVE])
+
+    def test_user_operator(self):
+        class Counter(UnaryOperator):
+            def execute(self, track, af_input):
+                return track.size()
+        track = self.__track(SIGNED)
+        self.assertEqual(track.operate(Counter(), "a0"), len(SIGNED))
+        self.assertEqual(Counter().executeArray(SIGNED), len(SIGNED))
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestOperatorsArray("test_unary_void"))
+    suite.addTest(TestOperatorsArray("test_binary_void"))
+    suite.addTest(TestOperatorsArray("test_unary"))
+    suite.addTest(TestOperatorsArray("test_binary"))
+    suite.addTest(TestOperatorsArray("test_scalar"))
+    suite.addTest(TestOperatorsArray("test_no_data"))
+    suite.addTest(TestOperatorsArray("test_operate"))
+    suite.addTest(TestOperatorsArray("test_user_operator"))
+    runner = TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import math
+import os.path
+import tempfile
+from unittest import TestCase, TestSuite, TextTestRunner
+
+from tracklib import (ENUCoords, Track, TrackCollection,
+                      SpatialIndex, RTreeIndex, NetworkReader,
+                      WrongArgumentError, UnknownModeError)
+
+
+class TestRTreeIndex(TestCase):
+
+    def setUp (self):
+        self.resource_path = os.path.join(os.path.split(__file__)[0], "../..")
+        track1 = Track.fromArrays([0, 10, 10], [0, 0, 10], None, [0, 1, 2])
+        track2 = Track.fromArrays([0, 4], [5, 5], None, [0, 1])
+        track3 = Track.fromArrays([20, 20], [0, 10], None, [0, 1])
+        track4 = Track.fromArrays([15], [9], None, [0])
+        self.collection = TrackCollection([track1, track2, track3, track4])
+
+    def test_requests(self):
+        index = RTreeIndex(self.collection, resolution=1, verbose=False, capacity=2)
+        self.assertEqual(index.size(), 5)
+        self.assertEqual(len(index.levels), 3)
+        self.assertTrue(index.covers(ENUCoords(15, 5)))
+        self.assertFalse(index.covers(ENUCoords(25, 5)))
+
+        self.assertCountEqual(index.request(ENUCoords(10, 0)), [0])
+        self.assertCountEqual(index.request(ENUCoords(2, 5)), [1])
+        self.assertEqual(index.request(ENUCoords(5, 6)), [])
+        self.assertCountEqual(index.request([ENUCoords(3, 4), ENUCoords(12, 6)]), [0, 1])
+        self.assertCountEqual(index.request(Track.fromArrays([5, 18, 18], [6, 6, 9], None, [0, 1, 2])),
+                              [0])
+        self.assertCountEqual(index.request([ENUCoords(14, 8), ENUCoords(16, 10)]), [3])
+        self.assertRaises(WrongArgumentError, index.request, 1, 1)
+
+        self.assertEqual(index.neighborhood(ENUCoords(7, 7), unit=1), [])
+        self.assertCountEqual(index.neighborhood(ENUCoords(7, 7), unit=3), [0, 1])
+        self.assertCountEqual(index.neighborhood(ENUCoords(7, 7), unit=-1), [0, 1])
+        self.assertCountEqual(index.neighborhood(ENUCoords(17, 9), unit=2), [3])
+        self.assertCountEqual(index.neighborhood(ENUCoords(17, 9), unit=3), [3, 2])
+        self.assertEqual(index.neighborhood([ENUCoords(5, 6), ENUCoords(6, 6)], None, 0), [])
+        self.assertCountEqual(index.neighborhood([ENUCoords(5, 6), ENUCoords(6, 6)], None, 1), [1])
+        self.assertEqual(index.groundDistanceToUnits(2.5), 3)
+
+    def test_distances(self):
+        index = RTreeIndex(self.collection, verbose=False, capacity=2)
+
+        (data, i, proj, d) = index.nearest(ENUCoords(8, 4))[0]
+        self.assertEqual((data, i), (0, 1))
+        self.assertAlmostEqual(proj.getY(), 4)
+        self.assertAlmostEqual(d, 2)
+        result = index.nearest(ENUCoords(16, 8), 4)
+        self.assertEqual([r[0] for r in result], [3, 2, 0, 1])
+        self.assertAlmostEqual(result[0][3], math.sqrt(2))
+
+        # Same results as grid index (on polylines)
+        collection = TrackCollection(self.collection[0:3])
+        index2 = RTreeIndex(collection, verbose=False, capacity=2)
+        grid = SpatialIndex(collection, (1, 1), verbose=False)
+        for x, y in [(8, 4), (16, 5), (1, 1), (30, 5)]:
+            coord = ENUCoords(x, y)
+            expected = grid.nearest(coord, 3)
+            result = index2.nearest(coord, 3)
+            self.assertEqual([r[0] for r in result], [r[0] for r in expected])
+            self.assertEqual([r[1] for r in result], [r[1] for r in expected])
+            self.assertEqual([r[3] for r in result], [r[3] for r in expected])
+            expected = grid.within(coord, 6)
+            self.assertEqual([r[0] for r in index2.within(coord, 6)], [r[0] for r in expected])
+
+        points = Track.fromArrays([8, 16, 30], [4, 5, 5], None, [0, 1, 2])
+        offsets, data, vertices, X, Y, D = index.withinPoints(points, 5)
+        self.assertEqual(offsets.tolist(), [0, 2, 4, 4])
+        self.assertEqual(data.tolist(), [0, 1, 2, 3])
+        self.assertEqual(vertices.tolist(), [1, 0, 0, 0])
+        offsets, values = index.requestPoints(points, 1)
+        self.assertEqual(offsets.tolist(), [0, 0, 0, 0])
+
+    def test_update(self):
+        index = RTreeIndex(self.collection, verbose=False, capacity=2)
+        index.removeFeature(0)
+        self.assertEqual(index.size(), 3)
+        self.assertEqual(index.nearest(ENUCoords(8, 4))[0][0], 1)
+
+        index.addFeature(Track.fromArrays([8, 9], [3, 3], None, [0, 1]), 4)
+        self.assertEqual(index.pending[0].size, 1)
+        self.assertEqual(index.nearest(ENUCoords(8, 4))[0][0], 4)
+        self.assertCountEqual(index.request(ENUCoords(8.5, 3)), [4])
+        for k in range(4):
+            index.addFeature(Track.fromArrays([k, k + 1], [9, 9], None, [0, 1]), 5 + k)
+        self.assertEqual(index.pending[0].size, 0)
+        self.assertEqual(index.size(), 8)
+        self.assertCountEqual([r[0] for r in index.within(ENUCoords(2.5, 9), 1)], [6, 7, 8])
+
+        path = os.path.join(tempfile.gettempdir(), "rtree_index.pkl")
+        index.save(path)
+        self.assertEqual(RTreeIndex.load(path).size(), 8)
+
+    def test_network(self):
+        chemin = os.path.join(self.resource_path, 'data/network/network_igast.csv')
+        network = NetworkReader.readFromFile(chemin, 'TEST_UNITAIRE', False)
+        network.createSpatialIndex(resolution=(1, 1), verbose=False, method="RTREE")
+        self.assertIsInstance(network.spatial_index, RTreeIndex)
+        self.assertCountEqual(network.spatial_index.neighborhood(ENUCoords(5, 46), unit=0),
+                              [5, 8, 9])
+        self.assertRaises(UnknownModeError, network.createSpatialIndex, method="QUADTREE")
+
+        self.collection.createSpatialIndex(verbose=False, method="rtree")
+        self.assertEqual(self.collection.spatial_index.size(), 5)
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestRTreeIndex("test_requests"))
+    suite.addTest(TestRTreeIndex("test_distances"))
+    suite.addTest(TestRTreeIndex("test_update"))
+    suite.addTest(TestRTreeIndex("test_network"))
+    runner = TextTestRunner()
+    runner.run(suite)
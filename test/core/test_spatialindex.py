@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import math
 import matplotlib.pyplot as plt
 from unittest import TestCase, TestSuite, TextTestRunner
 import os.path
@@ -539,6 +540,109 @@ class TestSpatialIndex(TestCase):
 
 
 
+    def test_compact_index(self):
+        chemin = os.path.join(self.resource_path, 'data/network/network_igast.csv')
+        network = NetworkReader.readFromFile(chemin, 'TEST_UNITAIRE', False)
+
+        index = SpatialIndex(network, (1, 1), verbose=False)
+        compact = SpatialIndex(network, (1, 1), verbose=False, compact=True)
+        self.assertTrue(compact.isCompact())
+        self.assertIsNone(compact.grid)
+        offsets, values = compact.getCells()
+        self.assertEqual(len(offsets), compact.csize * compact.lsize + 1)
+        for i in range(index.csize):
+            for j in range(index.lsize):
+                self.assertEqual(compact.request(i, j), index.request(i, j))
+        track = network[3].geom
+        self.assertEqual(compact.request(track), index.request(track))
+        self.assertEqual(compact.neighborhood(track, None, 1), index.neighborhood(track, None, 1))
+        self.assertCountEqual(compact.neighborhood(ENUCoords(5, 46), unit=-1),
+                              index.neighborhood(ENUCoords(5, 46), unit=-1))
+
+        # Updates
+        for idx in [index, compact]:
+            idx.removeFeature(5)
+            idx.addFeature(network[5].geom, 50)
+        self.assertTrue(compact.isCompact())
+        self.assertGreater(compact.npending, 0)
+        compact.addFeature(network[5].geom, 50)
+        for i in range(index.csize):
+            for j in range(index.lsize):
+                self.assertEqual(compact.request(i, j), index.request(i, j))
+        self.assertEqual(compact.getCells()[0].tolist(), index.getCells()[0].tolist())
+        self.assertEqual(compact.getCells()[1].tolist(), index.getCells()[1].tolist())
+        self.assertEqual(compact.npending, 0)
+        compact.addFeature(network[6].geom, 'e6')
+        self.assertFalse(compact.isCompact())
+        self.assertIn('e6', compact.neighborhood(network[6].geom, None, 0))
+
+
+    def test_nearest_within(self):
+        track1 = Track.fromArrays([0, 10, 10], [0, 0, 10], None, [0, 1, 2])
+        track2 = Track.fromArrays([0, 4], [5, 5], None, [0, 1])
+        track3 = Track.fromArrays([20, 20], [0, 10], None, [0, 1])
+        collection = TrackCollection([track1, track2, track3])
+        for compact in [False, True]:
+            index = SpatialIndex(collection, (1, 1), verbose=False, compact=compact)
+
+            result = index.nearest(ENUCoords(8, 4))
+            self.assertEqual(len(result), 1)
+            (data, i, proj, d) = result[0]
+            self.assertEqual((data, i), (0, 1))
+            self.assertAlmostEqual(proj.getX(), 10)
+            self.assertAlmostEqual(proj.getY(), 4)
+            self.assertAlmostEqual(d, 2)
+
+            result = index.nearest(ENUCoords(8, 4), 3)
+            self.assertEqual([r[0] for r in result], [0, 1, 2])
+            self.assertAlmostEqual(result[1][3], math.hypot(4, 1))
+            self.assertAlmostEqual(result[2][3], 12)
+            self.assertEqual(len(index.nearest(ENUCoords(8, 4), 5)), 3)
+
+            # Location out of grid
+            (data, i, proj, d) = index.nearest(ENUCoords(30, 5))[0]
+            self.assertEqual(data, 2)
+            self.assertAlmostEqual(d, 10)
+
+            result = index.within(ENUCoords(8, 4), 5)
+            self.assertEqual([r[0] for r in result], [0, 1])
+            self.assertEqual(index.within(ENUCoords(15, 5), 4), [])
+            self.assertEqual([r[0] for r in index.within(ENUCoords(15, 5), 5)], [0, 2])
+
+
+    def test_batch_requests(self):
+        track1 = Track.fromArrays([0, 10, 10], [0, 0, 10], None, [0, 1, 2])
+        track2 = Track.fromArrays([0, 4], [5, 5], None, [0, 1])
+        track3 = Track.fromArrays([20, 20], [0, 10], None, [0, 1])
+        collection = TrackCollection([track1, track2, track3])
+        points = Track.fromArrays([8, 15, 30, 1], [4, 5, 5, 1], None, [0, 1, 2, 3])
+        for compact in [False, True]:
+            index = SpatialIndex(collection, (1, 1), verbose=False, compact=compact)
+
+            offsets, values = index.requestPoints(points, 1)
+            self.assertEqual(len(offsets), 5)
+            for k in range(points.size()):
+                expected = index.neighborhood(points[k].position, unit=1) or []
+                self.assertCountEqual(values[offsets[k]:offsets[k+1]].tolist(), expected)
+            offsets, values = index.requestPoints(([8, 15], [4, 5]))
+            self.assertEqual(offsets.tolist()[-1], len(values))
+
+            offsets, data, vertices, X, Y, D = index.withinPoints(points, 5)
+            for k in range(points.size()):
+                expected = index.within(points[k].position, 5)
+                r = range(offsets[k], offsets[k+1])
+                self.assertEqual(data[r].tolist(), [e[0] for e in expected])
+                self.assertEqual(vertices[r].tolist(), [e[1] for e in expected])
+                self.assertEqual(X[r].tolist(), [e[2].getX() for e in expected])
+                self.assertEqual(D[r].tolist(), [e[3] for e in expected])
+            self.assertEqual(offsets.tolist(), [0, 2, 4, 4, 6])
+
+            collection2 = TrackCollection([points, points])
+            offsets, data, vertices, X, Y, D = index.withinPoints(collection2, 5)
+            self.assertEqual(len(offsets), 9)
+            self.assertEqual(data[offsets[4]:].tolist(), data[:offsets[4]].tolist())
+
+
 
     
 if __name__ == '__main__':
@@ -550,6 +654,9 @@ if __name__ == '__main__':
     suite.addTest(TestSpatialIndex("test_create_index_collection2"))
     suite.addTest(TestSpatialIndex("test_remove_obj"))
     suite.addTest(TestSpatialIndex("test_index_network"))
+    suite.addTest(TestSpatialIndex("test_compact_index"))
+    suite.addTest(TestSpatialIndex("test_nearest_within"))
+    suite.addTest(TestSpatialIndex("test_batch_requests"))
     runner = TextTestRunner()
     runner.run(suite)
     
\ No newline at end of file
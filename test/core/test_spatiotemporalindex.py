@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import os.path
+import tempfile
+from unittest import TestCase, TestSuite, TextTestRunner
+
+from tracklib import (ENUCoords, ObsTime, Bbox, Track, TrackCollection,
+                      SpatioTemporalIndex, WrongArgumentError)
+
+
+class TestSpatioTemporalIndex(TestCase):
+
+    def setUp (self):
+        # Track 0 goes east and back, track 1 goes north, later
+        track1 = Track.fromArrays([0, 1, 2, 3, 4, 3, 2, 1, 0], [0] * 9, None, range(9))
+        track2 = Track.fromArrays([2] * 5, [-2, -1, 0, 1, 2], None, range(100, 105))
+        self.collection = TrackCollection([track1, track2])
+        self.index = SpatioTemporalIndex(self.collection, resolution=(1, 1), duration=2, verbose=False)
+
+    def test_request(self):
+        index = self.index
+        self.assertEqual(index.size(), 14)
+        self.assertEqual(index.request((1.5, 2.5, -0.5, 0.5)), [(0, 2, 3), (0, 6, 7), (1, 2, 3)])
+        self.assertEqual(index.request((1.5, 4.5, -0.5, 0.5), 0, 10), [(0, 2, 7)])
+        self.assertEqual(index.request((1.5, 4.5, -0.5, 0.5), 3, 5), [(0, 3, 6)])
+        self.assertEqual(index.request(Bbox(ENUCoords(1.5, -3), ENUCoords(2.5, 3)), 50), [(1, 0, 5)])
+        self.assertEqual(index.request((10, 20, 10, 20)), [])
+        self.assertEqual(index.request((0, 4, -2, 2), 200), [])
+
+        t = ObsTime.readUnixTime(5)
+        self.assertEqual(index.request((-1, 5, -3, 3), t1=t, t2=t), [(0, 5, 6)])
+
+    def test_within(self):
+        index = self.index
+        self.assertEqual(index.within(ENUCoords(2, 0), 1), [(0, 1, 4), (0, 5, 8), (1, 1, 4)])
+        self.assertEqual(index.within(ENUCoords(2, 0), 1, 0, 9), [(0, 1, 4), (0, 5, 8)])
+        self.assertEqual(index.within(ENUCoords(2, 0), 1, 100.5, 200), [(1, 1, 4)])
+        self.assertEqual(index.within(ENUCoords(3, 1), 1), [(0, 3, 4), (0, 5, 6), (1, 3, 4)])
+
+        tracks = index.getTracks(index.within(ENUCoords(2, 0), 1, 0, 4))
+        self.assertEqual(len(tracks), 1)
+        self.assertEqual(tracks[0].getX(), [1, 2, 3])
+
+    def test_build(self):
+        index = SpatioTemporalIndex(self.collection, verbose=False)
+        self.assertEqual((index.csize, index.tsize), (100, 100))
+        self.assertEqual(index.request((-1, 5, -3, 3)), [(0, 0, 9), (1, 0, 5)])
+        self.assertEqual(index.within(ENUCoords(0, 0), 0.5, 8), [(0, 8, 9)])
+        self.assertRaises(WrongArgumentError, SpatioTemporalIndex, TrackCollection(), verbose=False)
+
+        path = os.path.join(tempfile.gettempdir(), "spatiotemporal_index.pkl")
+        self.index.save(path)
+        index = SpatioTemporalIndex.load(path)
+        self.assertEqual(index.within(ENUCoords(2, 0), 1, 0, 9), [(0, 1, 4), (0, 5, 8)])
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestSpatioTemporalIndex("test_request"))
+    suite.addTest(TestSpatioTemporalIndex("test_within"))
+    suite.addTest(TestSpatioTemporalIndex("test_build"))
+    runner = TextTestRunner()
+    runner.run(suite)
@@ -5,7 +5,8 @@ import math
 import numpy as np
 
 from tracklib import (ENUCoords, ObsTime, Obs, Track,
-                      speed, heading, orientation, QueryError)
+                      speed, heading, orientation, QueryError,
+                      compileQuery)
 
 
 class TestTrackQuery(TestCase):
@@ -206,16 +207,49 @@ class TestTrackQuery(TestCase):
         self.assertEqual(0, trace.size())
         
     
-#    def test_bool(self):
-#        
-#        self.track['indicateur'] = [True,False,False,False,False,True,True,False,True]
-#        
-#        query  = " SELECT * WHERE indicateur = True "
-#        trace = self.track.query(query)
-#        self.assertEqual(4, trace.size())
+    def test_bool(self):
+        
+        self.track['indicateur'] = [True,False,False,False,False,True,True,False,True]
+        
+        query  = " SELECT * WHERE indicateur = True "
+        trace = self.track.query(query)
+        self.assertEqual(4, trace.size())
+
+        # Mixed column (evaluated observation by observation)
+        self.track['mixte'] = [True, 'x', False, True, None, 'T', False, True, 'y']
+        trace = self.track.query(" SELECT * WHERE mixte = True ")
+        self.assertEqual(3, trace.size())
+        trace = self.track.query(" SELECT * WHERE mixte = t ")
+        self.assertEqual(3, trace.size())
+    
+    def test_compiled_query(self):
+        self.track.addAnalyticalFeature(speed)
+        self.track.addAnalyticalFeature(heading)
+        
+        query = "SELECT speed WHERE speed < 0.3 OR heading > 1.0 AND speed > 0.6"
+        self.assertIs(compileQuery(query), compileQuery(query))
+        fields, aggregators, where = compileQuery(query)
+        self.assertEqual(fields, ("speed",))
+        self.assertEqual(aggregators, ())
+        self.assertEqual(where, ((("speed", "<", "0.3"),), 
+                                 (("heading", ">", "1.0"), ("speed", ">", "0.6"))))
+        
+        columnar = self.track.copy().toColumnar()
+        for query in ["SELECT speed, heading WHERE speed < 0.3 OR heading > 1.0 AND speed > 0.6",
+                      "SELECT x, y WHERE timestamp > 2020-01-01 10:00:04",
+                      "SELECT AVG(speed), COUNT(x) WHERE heading != 0"]:
+            self.assertEqual(self.track.query(query), columnar.query(query))
+        trace = columnar.query("SELECT * WHERE speed < 0.4")
+        self.assertTrue(trace.isColumnar())
+        self.assertEqual(trace.size(), 3)
+        self.assertEqual(list(trace["speed"]), self.track.query("SELECT speed WHERE speed < 0.4")[0])
+        
+        with self.assertRaises(QueryError):
+            self.track.query("SELECT * WHERE speed ~ 1")
+        with self.assertRaises(QueryError):
+            self.track.query("SELECT speed, AVG(heading)")
     
     
-
 if __name__ == '__main__':
     suite = TestSuite()
     suite.addTest(TestTrackQuery("test_selectstar"))
@@ -226,7 +260,8 @@ if __name__ == '__main__':
     suite.addTest(TestTrackQuery("test_query_with_parenthesis"))
     suite.addTest(TestTrackQuery("test_agg_zeros"))
     suite.addTest(TestTrackQuery("test_like"))
-    #suite.addTest(TestTrackQuery("test_bool"))
+    suite.addTest(TestTrackQuery("test_bool"))
+    suite.addTest(TestTrackQuery("test_compiled_query"))
     runner = TextTestRunner()
     runner.run(suite)
 
@@ -44,6 +44,11 @@ class TestTrackCollection(TestCase):
         
         collection.plot()
         collection.spatial_index.plot()
+
+        # Default margin without progress bar
+        collection.createSpatialIndex(verbose=False)
+        self.assertAlmostEqual(collection.spatial_index.xmin, -0.5)
+        self.assertEqual(collection.spatial_index.request(ENUCoords(7, 5)), [0])
         
         collection.summary()
         
@@ -146,6 +151,31 @@ class TestTrackCollection(TestCase):
         T = tracks[uids]
         self.assertEqual(T.size(), 2)
 
+    def test_collection_query(self):
+        ObsTime.setReadFormat("4Y-2M-2D 2h:2m:2s")
+        track1 = Track.fromArrays([0, 1, 2, 3], [0, 0, 0, 0], T=[0, 1, 2, 3],
+                                  af={"v": [1.0, 5.0, 2.0, 8.0]})
+        track2 = Track()
+        for i in range(3):
+            track2.addObs(Obs(ENUCoords(i, 1), ObsTime.readUnixTime(i)))
+        track2.createAnalyticalFeature("v", [4.0, 0.5, 6.0])
+        track3 = Track.fromArrays([0, 1], [2, 2], af={"v": [0.0, 1.0]})
+        collection = TrackCollection([track1, track2, track3])
+
+        selection = collection.query("SELECT * WHERE v > 3")
+        self.assertIsInstance(selection, TrackCollection)
+        self.assertEqual(selection.size(), 2)
+        self.assertEqual(list(selection[0]["v"]), [5.0, 8.0])
+        self.assertEqual(selection[1]["v"], [4.0, 6.0])
+
+        tab = collection.query("SELECT x, v WHERE v >= 4 OR y = 2")
+        self.assertListEqual(tab[0], [1, 3, 0, 2, 0, 1])
+        self.assertListEqual(tab[1], [5.0, 8.0, 4.0, 6.0, 0.0, 1.0])
+
+        self.assertEqual(collection.query("SELECT COUNT(v), MAX(v) WHERE v > 1"), [5, 8.0])
+        self.assertEqual(collection.query("SELECT SUM(v)"), 27.5)
+        self.assertIsNone(collection.query("SELECT AVG(v) WHERE v > 10"))
+
         
         
 if __name__ == '__main__':
@@ -155,5 +185,6 @@ if __name__ == '__main__':
     suite.addTest(TestTrackCollection("test_collection_operation"))
     suite.addTest(TestTrackCollection("test_collection_segmentation"))
     suite.addTest(TestTrackCollection("test_collection_getitem"))
+    suite.addTest(TestTrackCollection("test_collection_query"))
     runner = TextTestRunner()
     runner.run(suite)
\ No newline at end of file
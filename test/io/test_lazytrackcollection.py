@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import os.path
+import shutil
+import tempfile
+import numpy as np
+from unittest import TestCase, TestSuite, TextTestRunner, mock
+from tracklib import (Track, TrackFormat, TrackWriter, TrackReader, TrackCollection,
+                      LazyTrackCollection, ObsTime, Operator, speed)
+
+
+class TestLazyTrackCollection(TestCase):
+
+    def setUp (self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.tracks = []
+        for i in range(10):
+            X = np.arange(10.0 + i)
+            Y = np.full(10 + i, float(i))
+            T = 1.6e9 + 2 * np.arange(10 + i)
+            self.tracks.append(Track.fromArrays(X, Y, None, T, user_id='u' + str(i % 2),
+                                                track_id='t' + str(i)))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_store_shards(self):
+        memory = 3 * 19 * 8 * 4
+        collection = LazyTrackCollection.write(iter(self.tracks), self.folder.name,
+                                               shard_size=4, memory=memory)
+        self.assertEqual(len(collection.shards), 3)
+        self.assertEqual(collection.size(), 10)
+        self.assertEqual(collection.getNumberOfPoints(), 145)
+        self.assertEqual(collection.getTids(), ['t' + str(i) for i in range(10)])
+        bbox = collection.bbox()
+        self.assertEqual((bbox.getXmin(), bbox.getXmax()), (0, 18))
+        self.assertEqual((bbox.getYmin(), bbox.getYmax()), (0, 9))
+        self.assertEqual(collection.getCacheMemory(), 0)
+
+        track = collection.getTrackWithTid('t5')
+        self.assertEqual(track.size(), 15)
+        self.assertIs(collection[5], track)
+        self.assertIsNone(collection.getTrackWithTid('t10'))
+        self.assertEqual(collection[-1].tid, 't9')
+        self.assertRaises(IndexError, collection.__getitem__, 10)
+        self.assertEqual(collection[2:5].size(), 3)
+        self.assertEqual(collection[('u1', '%')].size(), 5)
+
+        # Memory budget
+        self.assertEqual([t.size() for t in collection], list(range(10, 20)))
+        self.assertLessEqual(collection.getCacheMemory(), memory)
+        self.assertEqual(collection.getCacheMemory(), (17 + 18 + 19) * 8 * 4)
+        self.assertIsNot(collection[5], track)
+        collection.cache_size = 1
+        collection[0]
+        self.assertEqual(collection.getCacheMemory(), 10 * 8 * 4)
+
+        # Per-track algorithms
+        self.assertEqual(collection.map(lambda t: t.size())[3], 13)
+        self.assertEqual(collection.length(), 135)
+        collection.addAnalyticalFeature(speed)
+        collection.transform(lambda t: t.operate("x = 2 * x"))
+        self.assertEqual(collection.operate(Operator.MAX, 'speed'), [0.5] * 10)
+        self.assertEqual(collection.query("SELECT COUNT(speed) WHERE speed >= 0.5"), 145)
+        self.assertEqual(collection.bbox().getXmax(), 36)
+        self.assertEqual(collection.getTrack(9).getX()[18], 36)
+        self.assertIsInstance(collection.toTrackCollection(), TrackCollection)
+
+    def test_file_shards(self):
+        for track in self.tracks[:3]:
+            path = os.path.join(self.folder.name, track.tid + '.csv')
+            TrackWriter.writeToFile(track, path, 0, 1, 2, 3, ',', 0)
+        fmt = TrackFormat({'ext': 'CSV', 'id_E': 0, 'id_N': 1, 'id_U': 2, 'id_T': 3,
+                           'time_fmt': '2D/2M/4Y 2h:2m:2s', 'header': 0})
+        collection = LazyTrackCollection(self.folder.name, fmt, cache_size=2)
+        self.assertEqual(collection.size(), 3)
+        self.assertEqual(collection.getNumberOfPoints(2), 12)
+        self.assertEqual(collection.bbox().getYmax(), 2)
+        self.assertEqual(collection[1].getX()[10], 10)
+        self.assertEqual(collection[2].getLastObs().timestamp.toAbsTime(), 1.6e9 + 22)
+
+    def test_multitrack_file_shards(self):
+        ObsTime.setReadFormat("4Y-2M-2DT2h:2m:2sZ")
+        resource_path = os.path.join(os.path.split(__file__)[0], "../..")
+        for name in ['DC_garmin_neg.gpx', 'DC_garmin_pos.gpx']:
+            shutil.copy(os.path.join(resource_path, 'data/sep/DC/garmin', name), self.folder.name)
+        fmt = TrackFormat({'ext': 'GPX', 'srid': 'GEO'})
+        collection = LazyTrackCollection(self.folder.name, fmt, cache_size=2)
+        self.assertEqual(collection.size(), 20)
+
+        # Each file is read once per iteration (not once per track)
+        with mock.patch.object(TrackReader, 'readFromFile', wraps=TrackReader.readFromFile) as reading:
+            tracks = list(collection)
+            self.assertEqual(reading.call_count, 2)
+        expected = TrackReader.readFromFile(collection.shards[1], fmt)
+        self.assertEqual(list(tracks[19].getX()), list(expected[9].getX()))
+
+        # Transforms are applied once on reloaded tracks
+        collection.transform(lambda t: t.operate("x = 2 * x"))
+        for k in range(2):
+            self.assertAlmostEqual(collection[19].getX()[0], 2 * expected[9].getX()[0])
+            collection.clearCache()
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestLazyTrackCollection("test_store_shards"))
+    suite.addTest(TestLazyTrackCollection("test_file_shards"))
+    suite.addTest(TestLazyTrackCollection("test_multitrack_file_shards"))
+    runner = TextTestRunner()
+    runner.run(suite)
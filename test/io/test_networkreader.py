@@ -2,6 +2,8 @@
 
 import matplotlib.pyplot as plt
 import os.path
+import tempfile
+import zipfile
 from unittest import TestCase, TestSuite, TextTestRunner
 from tracklib import (Bbox, NetworkReader, GeoCoords,
                       WrongArgumentError, Network, NetworkFormat,
@@ -97,6 +99,14 @@ class TestNetworkReader(TestCase):
         self.assertIsInstance(net, Network)
 
 
+    def test_format_registry(self):
+        self.assertIn('TSUKUBA', NetworkFormat.getFormatNames())
+        fmt = NetworkFormat("TSUKUBA")
+        self.assertEqual((fmt.pos_edge_id, fmt.pos_source, fmt.pos_target), (-1, 24, 25))
+        NetworkFormat.reloadFormats()
+        self.assertEqual(NetworkFormat("IGN").pos_wkt, 4)
+
+
     def test_format_str(self):
 
         fmt = NetworkFormat("TSUKUBA")
@@ -119,6 +129,18 @@ class TestNetworkReader(TestCase):
         plt.legend()
 
 
+    def test_read_network_compressed(self):
+        path = os.path.join(self.resource_path, 'data/network/network_22245.csv')
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        zippath = os.path.join(folder.name, 'network.zip')
+        with zipfile.ZipFile(zippath, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.write(path, 'network_22245.csv')
+        network = NetworkReader.readFromFile(zippath + '/network_22245.csv', NetworkFormat("IGN"))
+        self.assertEqual(8086, len(network.EDGES), 'Edges number')
+        self.assertEqual(5820, len(network.NODES), 'Nodes number')
+
+
     def test_read_wfs(self):
 
         xmin = 6.74168
@@ -167,8 +189,10 @@ if __name__ == '__main__':
     suite = TestSuite()
 
     suite.addTest(TestNetworkReader("test_read_network_error_param"))
+    suite.addTest(TestNetworkReader("test_format_registry"))
     suite.addTest(TestNetworkReader("test_format_str"))
     suite.addTest(TestNetworkReader("test_read_network"))
+    suite.addTest(TestNetworkReader("test_read_network_compressed"))
     suite.addTest(TestNetworkReader("test_read_wfs"))
 
     runner = TextTestRunner()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import os.path
+import tempfile
+import numpy as np
+from unittest import TestCase, TestSuite, TextTestRunner
+from tracklib import (Network, NetworkStore, Node, Edge, Track, ENUCoords,
+                      WrongArgumentError, computeAbsCurv)
+
+
+class TestNetworkStore(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'network.tln')
+        self.network = Network()
+        coords = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        for k, (i, j) in enumerate([(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]):
+            X = np.linspace(coords[i][0], coords[j][0], 3 + k)
+            Y = np.linspace(coords[i][1], coords[j][1], 3 + k)
+            track = Track.fromArrays(X, Y).toPoints()
+            computeAbsCurv(track)
+            edge = Edge('e' + str(k), track)
+            edge.orientation = [Edge.DOUBLE_SENS, Edge.SENS_DIRECT, Edge.SENS_INVERSE][k % 3]
+            edge.weight = track.length()
+            self.network.addEdge(edge, Node(i, ENUCoords(*coords[i])), Node(j, ENUCoords(*coords[j])))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_save_load(self):
+        network = self.network
+        network.createSpatialIndex(verbose=False)
+        network.save(self.path)
+        loaded = Network.load(self.path)
+
+        self.assertEqual(loaded.getIndexNodes(), network.getIndexNodes())
+        self.assertEqual(loaded.getIndexEdges(), network.getIndexEdges())
+        for name in Network.ADJACENCY:
+            self.assertEqual(getattr(loaded, name), getattr(network, name))
+        for edge in network:
+            other = loaded.getEdge(edge.id)
+            self.assertTrue(other.geom.isColumnar())
+            self.assertEqual(list(other.geom.getX()), edge.geom.getX())
+            self.assertEqual(list(other.geom.getAnalyticalFeature('abs_curv')),
+                             edge.geom.getAnalyticalFeature('abs_curv'))
+            self.assertEqual((other.orientation, other.weight), (edge.orientation, edge.weight))
+            self.assertIs(other.source, loaded.getNode(edge.source.id))
+        self.assertEqual(loaded.getNode(2).coord.getY(), 10)
+        index = loaded.spatial_index
+        self.assertTrue(index.isCompact())
+        for i in range(index.csize):
+            for j in range(index.lsize):
+                self.assertEqual(index.request(i, j), network.spatial_index.request(i, j))
+        self.assertAlmostEqual(loaded.shortest_distance(1, 3), network.shortest_distance(1, 3))
+
+        # Modifications of a loaded network are private
+        loaded.getEdge('e0').geom.getX()[0] = 100
+        self.assertEqual(Network.load(self.path).getEdge('e0').geom.getX()[0], 0)
+
+    def test_save_without_index(self):
+        network = self.network
+        network.removeEdge(network.getEdge('e4'))
+        network.getEdge('e1').geom.createAnalyticalFeature('name', ['a'] * 4)
+        network.getEdge('e3').geom.createAnalyticalFeature('name', [True, None, 2, 'b', [1, 2], 0.5])
+        NetworkStore.write(network, self.path, spatial_index=False)
+        with open(self.path, 'rb') as f:
+            self.assertNotIn(b'\x80\x05', f.read())  # No pickle in the file
+        loaded = NetworkStore.read(self.path, columnar=False)
+        self.assertIsNone(loaded.spatial_index)
+        self.assertEqual(loaded.getNumberOfEdges(), 4)
+        self.assertEqual(loaded.NEXT_EDGES, network.NEXT_EDGES)
+        self.assertFalse(loaded.getEdge('e1').geom.isColumnar())
+        self.assertEqual(loaded.getEdge('e1').geom.getAnalyticalFeature('name'), ['a'] * 4)
+        self.assertEqual(loaded.getEdge('e3').geom.getAnalyticalFeature('name'),
+                         [True, None, 2, 'b', [1, 2], 0.5])
+        self.assertFalse(loaded.getEdge('e2').geom.hasAnalyticalFeature('name'))
+
+        NetworkStore.write(Network(), self.path)
+        self.assertEqual(Network.load(self.path).getNumberOfEdges(), 0)
+        with open(self.path, 'wb') as f:
+            f.write(b'TRACKLIB')
+        self.assertRaises(WrongArgumentError, Network.load, self.path)
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestNetworkStore("test_save_load"))
+    suite.addTest(TestNetworkStore("test_save_without_index"))
+    runner = TextTestRunner()
+    runner.run(suite)
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
 import os.path
-from unittest import TestCase, TestSuite, TextTestRunner
+import shutil
+import tempfile
+import numpy as np
+from unittest import TestCase, TestSuite, TextTestRunner, mock
 from tracklib import (Track, TrackFormat,
                       Rectangle, ObsTime, TrackCollection, ENUCoords,
-                      TrackReader, Constraint,
+                      TrackReader, TrackSource, Constraint,
                       TYPE_CUT_AND_SELECT, MODE_INSIDE,
-                      Selector, WrongArgumentError)
+                      Selector, WrongArgumentError, isnan, listArchive)
 
 
 class TestTrackReader(TestCase):
@@ -45,6 +48,34 @@ class TestTrackReader(TestCase):
         self.assertEqual(fmt.read_all, False)
 
 
+    def test_track_format_registry(self):
+        self.assertIn('MAPMATCHER', TrackFormat.getFormatNames())
+        fmt = TrackFormat('MAPMATCHER')
+        self.assertEqual((fmt.ext, fmt.id_E, fmt.id_N, fmt.id_T), ('dat', 2, 3, 1))
+        self.assertEqual(fmt.getColumnPlan(), (',', [2, 3, 1], 'ENU'))
+        fmt.id_U = 4
+        fmt.srid = 'GEO'
+        self.assertEqual(fmt.getColumnPlan(), (',', [2, 3, 4, 1], 'Geo'))
+
+        # Formats are read once, until they are reloaded
+        folder = tempfile.mkdtemp()
+        resource = TrackFormat.TRACK_FILE_FORMAT
+        try:
+            TrackFormat.TRACK_FILE_FORMAT = os.path.join(folder, 'track_file_format')
+            with open(TrackFormat.TRACK_FILE_FORMAT, 'w') as f:
+                f.write("# Test\nTEST_TMP, csv, 0, 1, -1, 2, -1, s, 0, #, -1, GEO, 4Y-2M-2D 2h:2m:2s, FALSE, -1, -1\n")
+            self.assertNotIn('TEST_TMP', TrackFormat.getFormatNames())
+            TrackFormat.reloadFormats()
+            self.assertEqual(TrackFormat.getFormatNames(), ['TEST_TMP'])
+            fmt = TrackFormat('TEST_TMP')
+            self.assertEqual((fmt.separator, fmt.srid, fmt.id_T), (';', 'GEO', 2))
+        finally:
+            TrackFormat.TRACK_FILE_FORMAT = resource
+            TrackFormat.reloadFormats()
+            shutil.rmtree(folder)
+        self.assertIn('MAPMATCHER', TrackFormat.getFormatNames())
+
+
     def test_read_simple_csv_format(self):
         csvpath = os.path.join(self.resource_path, 'data/csv/22245.csv')
 
@@ -126,6 +157,11 @@ class TestTrackReader(TestCase):
         self.assertIsInstance(TRACES, TrackCollection)
         self.assertEqual(3, TRACES.size())
 
+        COLUMNS = TrackReader.readFromFile(csvpath, param, columnar=True)
+        self.assertEqual(3, COLUMNS.size())
+        self.assertTrue(COLUMNS[0].isColumnar())
+        self.assertEqual(list(COLUMNS[2].getX()), TRACES[2].getX())
+
     def test_read_wkt_multilinestring(self):
         wkt = "MULTILINESTRING((996650.11647090199403465 6543000.30213597603142262, 996648.01232606021221727 6542999.45545507315546274), (996655.91265207773540169 6543010.73748384788632393, 996658.86122083698865026 6543014.4771343320608139),(996655.91265207773540169 6543010.73748384788632393, 996655.71583024342544377 6543010.01380750071257353),(996655.71583024342544377 6543010.01380750071257353, 996652.44237655051983893 6543005.95702100824564695),(996652.44237655051983893 6543005.95702100824564695, 996651.91560408123768866 6543003.65730366297066212),(996651.91560408123768866 6543003.65730366297066212, 996650.41783572779968381 6543001.62264404352754354),(996650.41783572779968381 6543001.62264404352754354, 996650.11647090199403465 6543000.30213597603142262),(996650.11647090199403465 6543000.30213597603142262, 996651.0192229722160846 6542998.67892009764909744),(996655.17944290838204324 6542995.91113406512886286, 996651.0192229722160846 6542998.67892009764909744),(996656.94917890150099993 6542996.08491136785596609, 996655.17944290838204324 6542995.91113406512886286),(996656.94917890150099993 6542996.08491136785596609, 996659.90240167547017336 6542994.01624550763517618),(996662.69101955939549953 6542994.80311255995184183, 996659.90240167547017336 6542994.01624550763517618),(996662.69101955939549953 6542994.80311255995184183, 996664.93295634770765901 6542993.3369878027588129),(996667.89205733861308545 6542994.05954674631357193, 996664.93295634770765901 6542993.3369878027588129),(996667.89205733861308545 6542994.05954674631357193, 996670.13725782255642116 6542992.80164186377078295),(996670.13725782255642116 6542992.80164186377078295, 996672.96432189317420125 6542993.29430998675525188),(996675.49101663113106042 6542992.08920585177838802, 996672.96432189317420125 6542993.29430998675525188),(996677.87858522450551391 6542992.33889986388385296, 996675.49101663113106042 6542992.08920585177838802),(996677.87858522450551391 6542992.33889986388385296, 996681.01695903507061303 6542991.01363334897905588),(996681.01695903507061303 6542991.01363334897905588, 996682.4986422877991572 6542991.06987814232707024),(996682.4986422877991572 6542991.06987814232707024, 996686.43688657938037068 6542989.50474618095904589),(996686.43688657938037068 6542989.50474618095904589, 996686.66367841197643429 6542989.29915812890976667),(996686.66367841197643429 6542989.29915812890976667, 996689.37793848034925759 6542988.21187729574739933),(996690.96538174711167812 6542986.80318438541144133, 996689.37793848034925759 6542988.21187729574739933))"
         with self.assertRaises(Exception):
@@ -196,25 +232,173 @@ class TestTrackReader(TestCase):
         self.assertIsInstance(tracks, TrackCollection)
         
         
-    # def testReadGpxWithAF(self):
-    #     path = os.path.join(self.resource_path, 'data/test/12.gpx')
-    #     ObsTime.setReadFormat("4Y-2M-2D 2h:2m:2s")
-    #     tracks = TrackReader.readFromFile(path, srid='ENU', type='trk', read_all=True)
-        
-    #     self.assertEqual(1, tracks.size())
-    #     self.assertIsInstance(tracks, TrackCollection)
-    
-    #     trace = tracks.getTrack(0)
-    #     self.assertEqual(13, trace.size())
-        
-    #     self.assertEqual(trace.getListAnalyticalFeatures(), ['speed', 'abs_curv'])
-    #     self.assertEqual(trace.getObsAnalyticalFeature('speed', 0), 0.25)
-    #     v1 = trace.getObsAnalyticalFeature('speed', 1)
-    #     self.assertTrue(abs(v1 - 0.1285) < 0.001)
-    #     self.assertEqual(trace.getObsAnalyticalFeature('abs_curv', 0), 
-    #             [0, 1.0, 2.0, 3.0, 5.0, 6.0, 9.0, 10.0, 14.0, 15.0, 20.0, 21.0, 27.0])
-        
-        
+    def testReadGpxWithAF(self):
+        path = os.path.join(self.resource_path, 'data/test/12.gpx')
+        ObsTime.setReadFormat("4Y-2M-2DT2h:2m:2sZ")
+        tracks = TrackReader.readFromGpx(path, srid='ENU', type='trk', read_all=True)
+
+        self.assertEqual(1, tracks.size())
+        self.assertIsInstance(tracks, TrackCollection)
+
+        trace = tracks.getTrack(0)
+        self.assertEqual(13, trace.size())
+
+        self.assertEqual(trace.getListAnalyticalFeatures(), ['speed', 'abs_curv'])
+        self.assertEqual(trace.getObsAnalyticalFeature('speed', 0), 0.25)
+        v1 = trace.getObsAnalyticalFeature('speed', 1)
+        self.assertTrue(abs(v1 - 0.1285) < 0.001)
+        self.assertEqual(trace.getObsAnalyticalFeature('abs_curv', 0),
+                [0, 1.0, 2.0, 3.0, 5.0, 6.0, 9.0, 10.0, 14.0, 15.0, 20.0, 21.0, 27.0])
+
+    def testStreamGpx(self):
+        ObsTime.setReadFormat("4Y-2M-2DT2h:2m:2sZ")
+        gpx = ('<?xml version="1.0"?><gpx xmlns="http://www.topografix.com/GPX/1/1" '
+               'xmlns:tpx="http://www.garmin.com/xmlschemas/TrackPointExtension/v1">'
+               '<wpt lat="45.1" lon="5.1"><name>A</name></wpt>'
+               '<trk><name>1</name><trkseg>'
+               '<trkpt lat="45.0" lon="5.0"><ele>210.5</ele><time>2023-10-15T06:33:22Z</time>'
+               '<extensions><tpx:TrackPointExtension><tpx:hr>95</tpx:hr>'
+               '</tpx:TrackPointExtension></extensions></trkpt>'
+               '<trkpt lat="45.001" lon="5.001"><time>2023-10-15T06:33:23Z</time></trkpt>'
+               '</trkseg><trkseg><trkpt lat="45.002" lon="5.002"><speed>1.5</speed></trkpt>'
+               '</trkseg></trk><trk><trkseg><trkpt lat="46" lon="6"></trkpt></trkseg></trk>'
+               '<rte><rtept lat="45.1" lon="5.1"/><rtept lat="45.2" lon="5.2"/></rte>'
+               '<rte><rtept lat="45.3" lon="5.3"/></rte></gpx>')
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        path = os.path.join(folder.name, 'minified.gpx')
+        with open(path, 'w') as fp:
+            fp.write(gpx)
+
+        tracks = TrackReader.streamFromGpx(path, read_all=True)
+        self.assertNotIsInstance(tracks, TrackCollection)
+        track = next(tracks)
+        self.assertEqual(track.size(), 3)
+        self.assertEqual(track.getObs(0).position.lon, 5.0)
+        self.assertEqual(track.getObs(0).position.lat, 45.0)
+        self.assertEqual(track.getObs(0).position.hgt, 210.5)
+        self.assertEqual(track.getObs(1).timestamp.toAbsTime(),
+                         ObsTime.readTimestamp("2023-10-15T06:33:23Z").toAbsTime())
+        self.assertEqual(track.getObs(2).timestamp.toAbsTime(), 0)
+        self.assertEqual(track.getListAnalyticalFeatures(), ['hr', 'speed'])
+        self.assertEqual(track['hr', 0], 95)
+        self.assertTrue(isnan(track['hr', 1]))
+        self.assertEqual(track['speed', 2], 1.5)
+        self.assertEqual(next(tracks).size(), 1)
+        self.assertRaises(StopIteration, next, tracks)
+
+        tracks = TrackReader.readFromFile(path, TrackFormat({'ext': 'GPX', 'srid': 'ENU'}))
+        self.assertEqual([t.size() for t in tracks], [3, 1])
+        self.assertEqual(tracks[0].getListAnalyticalFeatures(), [])
+        self.assertEqual(tracks[0].getObs(0).position.getZ(), 0)
+
+        with open(path, 'rb') as fp:
+            routes = list(TrackReader.streamFromGpx(fp, type='rte'))
+        self.assertEqual([t.size() for t in routes], [2, 1])
+        waypoints = TrackReader.readFromGpx(path, type='wpt', read_all=True)
+        self.assertEqual(waypoints.size(), 1)
+        self.assertEqual(waypoints[0]['name', 0], 'A')
+
+    def testReadCompressed(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        csvpath = os.path.join(self.resource_path, 'data/csv/22245.csv')
+        gpxpath = os.path.join(self.resource_path, 'data/gpx/456.gpx')
+        with open(csvpath, 'rb') as fp:
+            csvdata = fp.read()
+        with open(gpxpath, 'rb') as fp:
+            gpxdata = fp.read()
+        fmt = TrackFormat({'ext': 'CSV', 'id_E': 0, 'id_N': 1, 'id_U': 2, 'id_T': 3,
+                           'header': 1})
+        expected = TrackReader.readFromFile(csvpath, fmt)
+
+        import bz2, gzip, lzma, zipfile
+        for ext, compress in [('gz', gzip.compress), ('bz2', bz2.compress), ('xz', lzma.compress)]:
+            path = os.path.join(folder.name, '22245.csv.' + ext)
+            with open(path, 'wb') as fp:
+                fp.write(compress(csvdata))
+            track = TrackReader.readFromFile(path, fmt)
+            self.assertEqual(track.tid, '22245')
+            self.assertEqual(track.size(), expected.size())
+            self.assertEqual(track.getT(), expected.getT())
+
+        # Members of a zip archive (possibly compressed)
+        zippath = os.path.join(folder.name, 'tracks.zip')
+        with zipfile.ZipFile(zippath, 'w') as archive:
+            archive.writestr('a/22245.csv', csvdata)
+            archive.writestr('b/22245.csv.gz', gzip.compress(csvdata))
+        self.assertEqual(listArchive(zippath), ['a/22245.csv', 'b/22245.csv.gz'])
+        collection = TrackReader.readFromFile(zippath, fmt)
+        self.assertEqual(collection.size(), 2)
+        self.assertEqual([t.tid for t in collection], ['a/22245.csv', 'b/22245.csv.gz'])
+        self.assertEqual(collection[1].getX(), expected.getX())
+        track = TrackReader.readFromFile(zippath + '/b/22245.csv.gz', fmt)
+        self.assertEqual(track.getY(), expected.getY())
+        self.assertRaises(WrongArgumentError, TrackReader.readFromFile, zippath + '/c.csv', fmt)
+
+        # The archive is opened once for all its members
+        zippath = os.path.join(folder.name, 'many.zip')
+        with zipfile.ZipFile(zippath, 'w') as archive:
+            for k in range(50):
+                archive.writestr('%02d.csv' % k, csvdata)
+        with mock.patch('zipfile.ZipFile', wraps=zipfile.ZipFile) as opening:
+            collection = TrackReader.readFromFile(zippath, fmt)
+        self.assertEqual(collection.size(), 50)
+        self.assertEqual(opening.call_count, 1)
+
+        ObsTime.setReadFormat("4Y-2M-2DT2h:2m:2sZ")
+        path = os.path.join(folder.name, '456.gpx.gz')
+        with open(path, 'wb') as fp:
+            fp.write(gzip.compress(gpxdata))
+        self.assertEqual(TrackReader.readFromGpx(path)[0].getX(),
+                         TrackReader.readFromGpx(gpxpath)[0].getX())
+
+    def testReadNMEA(self):
+        def sentence(body):
+            checksum = 0
+            for c in body.encode():
+                checksum ^= c
+            return "$%s*%02X\r\n" % (body, checksum)
+
+        lines = []
+        for i, t in enumerate(["235958.50", "235959.00", "235959.50", "000000.00", "000000.50"]):
+            date = "311223" if t[0] == "2" else "010124"
+            lines.append(sentence("GPGGA,%s,4851.3960,N,00221.1320,W,1,%02d,0.9,35.%d,M,46.9,M,,"
+                                  % (t, 8 + i, i)))
+            lines.append(sentence("GNGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1"))
+            lines.append(sentence("GPRMC,%s,A,4851.3960,N,00221.1320,W,0.5,54.7,%s,,," % (t, date)))
+            lines.append(sentence("GPGST,%s,1.2,2.0,1.0,35,0.%d,0.6,1.1" % (t, i + 1)))
+        # Invalid checksum and incomplete sentence
+        lines.insert(4, "$GPGGA,235958.70,4851.3960,N,00221.1320,W,1,08,0.9,35.0,M,46.9,M,,*00\r\n")
+        lines.append("$GPGGA,000001.00,4851.39")
+
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        path = os.path.join(folder.name, 'log.nmea')
+        with open(path, 'w') as fp:
+            fp.write("".join(lines))
+
+        track = TrackReader.readFromNMEA(path)
+        self.assertEqual(track.size(), 5)
+        self.assertEqual(track.getListAnalyticalFeatures(),
+                         ['nb_sats', 'hdop', 'pdop', 'vdop', 'sigma_lat', 'sigma_lon', 'sigma_hgt'])
+        obs = track.getObs(1)
+        self.assertAlmostEqual(obs.position.lat, 48 + 51.396 / 60, 10)
+        self.assertAlmostEqual(obs.position.lon, -2 - 21.132 / 60, 10)
+        self.assertEqual(obs.position.hgt, 35.1)
+        self.assertEqual((obs.nb_sats, obs.hdop, obs.pdop, obs.vdop), (9, 0.9, 2.5, 2.1))
+        self.assertEqual(track['sigma_lat', 1], 0.2)
+        self.assertEqual(obs.timestamp, ObsTime(2023, 12, 31, 23, 59, 59))
+        self.assertEqual(track.getObs(0).timestamp, ObsTime(2023, 12, 31, 23, 59, 58, 500))
+        self.assertEqual(track.getObs(3).timestamp, ObsTime(2024, 1, 1))
+
+        tracks = TrackReader.streamFromNMEA(path, duration=1)
+        self.assertEqual([t.size() for t in tracks], [2, 2, 1])
+        observations = list(TrackReader.streamObsFromNMEA(path, follow=True,
+                                                          poll_interval=0.01, timeout=0.05))
+        self.assertEqual(len(observations), 5)
+        self.assertEqual(observations[4].nb_sats, 12)
+
     def testReadCsvWithAFTrack(self):
         ObsTime.setReadFormat("2D/2M/4Y 2h:2m:2s")
         chemin = os.path.join(self.resource_path, 'data/test/ecrins_interpol4.csv')
@@ -232,6 +416,39 @@ class TestTrackReader(TestCase):
         self.assertEqual(track.getListAnalyticalFeatures(),
                 ['anglegeom', 'angledeg', 'sommet', 'sommet2', 'virage', 'serie'])
 
+    def testReadCsvColumnar(self):
+        from tracklib.io.track_reader import _CsvColumns
+        ObsTime.setReadFormat("2D/2M/4Y 2h:2m:2s")
+        chemin = os.path.join(self.resource_path, 'data/test/ecrins_interpol4.csv')
+        param = TrackFormat({'ext': 'CSV',
+                             'id_E': 0,
+                             'id_N': 1,
+                             'id_U': 2,
+                             'id_T': 3,
+                             'separator': ";",
+                             'read_all': True})
+        track = TrackReader.readFromFile(chemin, param)
+        columnar = TrackReader.readFromFile(chemin, param, columnar=True)
+        self.assertTrue(columnar.isColumnar())
+        self.assertFalse(track.isColumnar())
+
+        # Small chunks: lines are split across chunk boundaries
+        chunk_size = _CsvColumns.CHUNK_SIZE
+        _CsvColumns.CHUNK_SIZE = 1000
+        try:
+            chunked = TrackReader.readFromFile(chemin, param)
+        finally:
+            _CsvColumns.CHUNK_SIZE = chunk_size
+
+        for t in [columnar, chunked]:
+            self.assertEqual(track.size(), t.size())
+            self.assertEqual(list(track.getX()), list(t.getX()))
+            self.assertEqual(list(track.getZ()), list(t.getZ()))
+            self.assertEqual(list(track.getT()), list(t.getT()))
+            for af in track.getListAnalyticalFeatures():
+                self.assertTrue(np.array_equal(np.asarray(track[af], dtype=float),
+                                               np.asarray(t[af], dtype=float), equal_nan=True))
+
     def testReadCsvDir(self):
         ObsTime.setReadFormat("2D/2M/4Y 2h:2m:2s")
         chemin = os.path.join(self.resource_path, 'data/test/csv')
@@ -262,6 +479,65 @@ class TestTrackReader(TestCase):
         self.assertIsInstance(collection, TrackCollection)
         self.assertEqual(collection.size(), 2)
 
+    def testTrackSource(self):
+        ObsTime.setReadFormat("2D/2M/4Y 2h:2m:2s")
+        chemin = os.path.join(self.resource_path, 'data/test/csv')
+        param = TrackFormat({'ext': 'CSV',
+                             'id_E': 1,
+                             'id_N': 2,
+                             'separator': ","})
+        collection = TrackReader.readFromFile(chemin, param)
+        sizes = sorted(t.size() for t in collection)
+
+        for workers, executor, ordered in [(1, "process", True), (2, "thread", True),
+                                           (2, "process", True), (2, "process", False)]:
+            source = TrackSource(chemin, param, workers=workers, executor=executor,
+                                 ordered=ordered)
+            self.assertEqual(len(source), 2)
+            tracks = source.toTrackCollection()
+            self.assertIsInstance(tracks, TrackCollection)
+            self.assertEqual(sorted(t.size() for t in tracks), sizes)
+            self.assertEqual(sorted(t.tid for t in tracks), sorted(t.tid for t in collection))
+            self.assertFalse(tracks[0].isColumnar())
+            if ordered:
+                self.assertEqual([t.size() for t in source], [t.size() for t in tracks])
+
+        source = TrackSource(chemin, param, workers=2, columnar=True)
+        self.assertTrue(all(t.isColumnar() for t in source))
+
+        with tempfile.TemporaryDirectory() as folder:
+            for f in os.listdir(chemin):
+                shutil.copy(os.path.join(chemin, f), folder)
+            with open(os.path.join(folder, 'invalid.csv'), 'w') as fp:
+                fp.write("a,b,c\n")
+            source = TrackSource(folder, param, workers=2, executor="thread")
+            self.assertRaises(WrongArgumentError, list, source)
+            source = TrackSource(folder, param, workers=2, errors="capture")
+            self.assertEqual(len(list(source)), 2)
+            self.assertEqual(len(source.errors), 1)
+            self.assertEqual(source.errors[0][0].name, 'invalid.csv')
+            self.assertIsInstance(source.errors[0][1], WrongArgumentError)
+
+        self.assertRaises(WrongArgumentError, TrackSource, chemin, param, executor="gpu")
+
+    def testTrackSourceTimeFormat(self):
+        # Files read by threads in a format different from the read format
+        ObsTime.setReadFormat("2D/2M/4Y 2h:2m:2s")
+        param = TrackFormat({'ext': 'CSV', 'id_E': 0, 'id_N': 1, 'id_T': 2,
+                             'time_fmt': '4Y-2M-2D 2h:2m:2s', 'separator': ","})
+        with tempfile.TemporaryDirectory() as folder:
+            for k in range(40):
+                with open(os.path.join(folder, 'track%02d.csv' % k), 'w') as fp:
+                    for i in range(2000):
+                        fp.write("%d,%d,%d-03-04 10:%02d:%02d\n" % (i, k, 2000 + k, i // 60, i % 60))
+            source = TrackSource(folder, param, workers=8, executor="thread")
+            for track in source:
+                k = int(track.tid[5:7])
+                self.assertEqual(track.getFirstObs().timestamp.year, 2000 + k)
+                self.assertEqual(track.getLastObs().timestamp.sec, 19)
+                self.assertEqual(track.getLastObs().timestamp.min, 33)
+        self.assertEqual(ObsTime.getReadFormat(), "2D/2M/4Y 2h:2m:2s")
+
     def testReadCsvSelect(self):
         Xmin = 29.72
         Xmax = 29.77
@@ -367,6 +643,7 @@ if __name__ == '__main__':
 
     # TrackFormat: dict
     suite.addTest(TestTrackReader("test_track_format_default_parameter"))
+    suite.addTest(TestTrackReader("test_track_format_registry"))
 
     # TrackFormat : str
     suite.addTest(TestTrackReader("test_read_csv_format_date"))
@@ -374,8 +651,11 @@ if __name__ == '__main__':
     # CSV
     suite.addTest(TestTrackReader("test_read_simple_csv_format"))
     suite.addTest(TestTrackReader("testReadCsvWithAFTrack"))
+    suite.addTest(TestTrackReader("testReadCsvColumnar"))
     suite.addTest(TestTrackReader("testReadCsvDir"))
     suite.addTest(TestTrackReader("testReadCsvSelect"))
+    suite.addTest(TestTrackReader("testTrackSource"))
+    suite.addTest(TestTrackReader("testTrackSourceTimeFormat"))
     suite.addTest(TestTrackReader("test_read_csv_verbose"))
 
     # WKT
@@ -389,7 +669,10 @@ if __name__ == '__main__':
     suite.addTest(TestTrackReader("test_read_gpx_geo_trk"))
     suite.addTest(TestTrackReader("test_read_gpx_geo_rte"))
     suite.addTest(TestTrackReader("test_read_gpx_dir"))
-    #suite.addTest(TestTrackReader("testReadGpxWithAF"))
+    suite.addTest(TestTrackReader("testReadGpxWithAF"))
+    suite.addTest(TestTrackReader("testStreamGpx"))
+    suite.addTest(TestTrackReader("testReadNMEA"))
+    suite.addTest(TestTrackReader("testReadCompressed"))
     suite.addTest(TestTrackReader("test_read_millisecond"))
 
     # for resource
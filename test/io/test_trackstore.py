@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+import os.path
+import tempfile
+import numpy as np
+from unittest import TestCase, TestSuite, TextTestRunner
+from tracklib import (Track, ENUCoords, GeoCoords, Obs, ObsTime,
+                      TrackCollection, TrackStore, WrongArgumentError)
+
+
+class TestTrackStore(TestCase):
+
+    def setUp (self):
+        ObsTime.setReadFormat("4Y-2M-2D 2h:2m:2s")
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "collection.tlb")
+
+        self.trace1 = Track([], 'u1', '11')
+        for i in range(5):
+            timestamp = ObsTime.readTimestamp('2020-01-01 10:00:0' + str(i))
+            self.trace1.addObs(Obs(ENUCoords(i, i % 2, 0.5 * i), timestamp))
+        self.trace1.createAnalyticalFeature("speed", [1, 2, 3, 4, 5])
+        self.trace1.createAnalyticalFeature("label", ["a", "b", None, "d", "e"])
+
+        X = np.array([2.35, 2.36, 2.37])
+        Y = np.array([48.85, 48.86, 48.87])
+        T = np.array([1.6e9, 1.6e9 + 1, 1.6e9 + 2])
+        self.trace2 = Track.fromArrays(X, Y, None, T, srid="Geo", af={"speed": [0.5, 0.5, 1]},
+                                       user_id=3, track_id='12', base=GeoCoords(2.35, 48.85, 35))
+        self.trace2.setTimeZone(2)
+
+        self.collection = TrackCollection([self.trace1, self.trace2, Track([], 0, 'empty')])
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_write_read(self):
+        TrackStore.write(self.collection, self.path)
+        store = TrackStore(self.path)
+        self.assertEqual(store.size(), 3)
+        self.assertEqual(store.getNumberOfPoints(), 8)
+        self.assertEqual(store.getNumberOfPoints(1), 3)
+        self.assertEqual([store.getTid(i) for i in range(3)], ['11', '12', 'empty'])
+        self.assertEqual(store.getUid(1), 3)
+
+        for track, expected in zip(store, self.collection):
+            self.assertTrue(track.isColumnar())
+            self.assertEqual(track.size(), expected.size())
+            self.assertEqual(track.uid, expected.uid)
+            self.assertEqual(track.tid, expected.tid)
+            self.assertEqual(track.getListAnalyticalFeatures(),
+                             expected.getListAnalyticalFeatures())
+            if track.size() == 0:
+                continue
+            self.assertEqual(track.getSRID(), expected.getSRID())
+            self.assertEqual(track.getTimeZone(), expected.getTimeZone())
+            self.assertEqual(list(track.getX()), list(expected.getX()))
+            self.assertEqual(list(track.getY()), list(expected.getY()))
+            self.assertEqual(list(track.getZ()), list(expected.getZ()))
+            self.assertEqual(list(track.getT()), list(expected.getT()))
+            self.assertEqual(list(track["speed"]), list(expected["speed"]))
+
+        self.assertEqual(list(store[0]["label"]), ["a", "b", None, "d", "e"])
+        self.assertEqual(list(store[0]["speed"]), [1, 2, 3, 4, 5])
+        self.assertIsInstance(store[0]["speed", 0], int)
+        self.assertEqual(str(store[0].getFirstObs().timestamp), str(self.trace1.getFirstObs().timestamp))
+        self.assertEqual(store[1].base.lat, 48.85)
+        self.assertEqual(store[-1].tid, 'empty')
+        self.assertRaises(IndexError, store.__getitem__, 3)
+        self.assertEqual(store.toTrackCollection().size(), 3)
+
+        bbox = store.getTrackBbox(0)
+        self.assertEqual((bbox.getXmin(), bbox.getXmax()), (0, 4))
+        self.assertEqual((bbox.getYmin(), bbox.getYmax()), (0, 1))
+
+    def test_copy_on_write(self):
+        TrackStore.write(self.collection, self.path)
+        track = TrackStore(self.path)[0]
+        self.assertFalse(track.getX().flags.writeable)
+        self.assertRaises(ValueError, track.getX().__setitem__, 0, 100)
+        track[0].position.setX(100)
+        track.setObsAnalyticalFeature("speed", 1, 10)
+        track.addObs(Obs(ENUCoords(5, 5), ObsTime.readTimestamp('2020-01-01 10:00:05')))
+        self.assertEqual(track.size(), 6)
+        self.assertEqual(track.getX()[0], 100)
+        track = TrackStore(self.path)[0]
+        self.assertEqual(track.getX()[0], 0)
+        self.assertEqual(track["speed", 1], 2)
+        store = TrackStore(self.path)
+        track = store[0]
+        track[1].position.setX(100)
+        track[1].timestamp = ObsTime.readTimestamp('2020-01-01 11:00:00')
+        track.setObsAnalyticalFeature("speed", 2, 10)
+        self.assertEqual(track.getX()[1], 100)
+        self.assertEqual(store[0].getX()[1], 1)
+        self.assertEqual(store[0].getT()[1], self.trace1.getT()[1])
+        self.assertEqual(store[0]["speed", 2], 3)
+        track = store[0]
+        track.operate("x = 2 * x")
+        self.assertEqual(track.getX()[1], 2)
+        self.assertEqual(store[0].getX()[1], 1)
+
+    def test_feature_types(self):
+        self.trace1.createAnalyticalFeature("flag", [True, False, True, True, False])
+        self.trace2.createAnalyticalFeature("flag", np.array([1.5, 0, 1]))
+        TrackStore.write(self.collection, self.path)
+        store = TrackStore(self.path)
+        self.assertEqual(list(store[0]["flag"]), [True, False, True, True, False])
+        self.assertIsInstance(store[0]["flag", 0], bool)
+        self.assertEqual(store[0].query("SELECT * WHERE flag = True").size(), 3)
+        self.assertEqual(store[1]["flag"].dtype, np.float64)
+        self.assertEqual(list(store[1]["flag"]), [1.5, 0, 1])
+
+    def test_object_features(self):
+        self.trace1.createAnalyticalFeature("values", ["a", None, 3, [1, 2], (0.5, "b")])
+        TrackStore.write(self.collection, self.path)
+        with open(self.path, "rb") as fp:
+            self.assertNotIn(b"\x80\x05", fp.read())  # No pickle in the file
+        store = TrackStore(self.path)
+        self.assertEqual(list(store[0]["values"]), ["a", None, 3, [1, 2], [0.5, "b"]])
+        self.assertIsInstance(store[0]["values", 2], int)
+
+    def test_invalid_file(self):
+        with open(self.path, "w") as fp:
+            fp.write("x,y,t\n")
+        self.assertRaises(WrongArgumentError, TrackStore, self.path)
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestTrackStore("test_write_read"))
+    suite.addTest(TestTrackStore("test_copy_on_write"))
+    suite.addTest(TestTrackStore("test_feature_types"))
+    suite.addTest(TestTrackStore("test_object_features"))
+    suite.addTest(TestTrackStore("test_invalid_file"))
+    runner = TextTestRunner()
+    runner.run(suite)
@@ -2,6 +2,8 @@
 
 import os.path
 import filecmp
+import json
+import tempfile
 from unittest import TestCase, TestSuite, TextTestRunner
 from tracklib import (Track, ENUCoords, Obs,
                       TrackCollection, ObsTime,
@@ -292,6 +294,50 @@ class TestTrackWriter(TestCase):
         out = json.loads(txttocompare)
         self.assertEqual(out, txtjson)
 
+    def testWriteStream(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.trace2.setTimeZone(2)
+
+        # Columnar tracks are written as tracks of observations
+        for trace in [self.trace1, self.trace2]:
+            path1 = os.path.join(folder.name, 'points.csv')
+            path2 = os.path.join(folder.name, 'columns.csv')
+            TrackWriter.writeToFile(trace, path1, 0, 1, 2, 3, ";", 1, ['speed'])
+            TrackWriter.writeToFile(trace.copy().toColumnar(), path2, 0, 1, 2, 3, ";", 1, ['speed'])
+            self.assertTrue(filecmp.cmp(path1, path2, shallow=False))
+
+        # Tracks produced by a generator
+        def tracks():
+            for trace in [self.trace1, self.trace2]:
+                yield trace.copy().toColumnar()
+
+        gpxpath = os.path.join(folder.name, 'tracks.gpx')
+        TrackWriter.writeToGpx(tracks(), path=gpxpath, af=True)
+        with open(gpxpath) as fp:
+            gpx = fp.read()
+        self.assertIn('<time>2020-01-01T10:00:15+02:00</time>', gpx)
+        self.assertEqual(gpx.count('<speed>'), 18)
+        ObsTime.setReadFormat("4Y-2M-2DT2h:2m:2s")
+        collection = TrackReader.readFromGpx(gpxpath, srid='ENU')
+        self.assertEqual([t.size() for t in collection], [5, 13])
+        self.assertEqual(collection[1].getLastObs().position.getY(), 20)
+
+        kmlpath = os.path.join(folder.name, 'tracks.kml')
+        TrackWriter.writeToKml(tracks(), path=kmlpath)
+        with open(kmlpath) as fp:
+            self.assertEqual(fp.read().count('<Placemark>'), 2)
+
+        jsonpath = os.path.join(folder.name, 'tracks.geojson')
+        TrackWriter.writeToGeojson(tracks(), jsonpath, type='POINT')
+        with open(jsonpath) as fp:
+            features = json.load(fp)['features']
+        self.assertEqual(len(features), 18)
+        self.assertEqual(features[17]['geometry']['coordinates'], [4, 20])
+
+        TrackWriter.writeToFiles(tracks(), folder.name, 'csv')
+        self.assertTrue(os.path.exists(os.path.join(folder.name, 'track_output_1.csv')))
+
 
 if __name__ == '__main__':
     
@@ -319,6 +365,7 @@ if __name__ == '__main__':
     
     suite.addTest(TestTrackWriter("testWriteKml"))
     suite.addTest(TestTrackWriter("testExportGeoJson"))
+    suite.addTest(TestTrackWriter("testWriteStream"))
     
     runner = TextTestRunner()
     runner.run(suite)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from unittest import TestCase, TestSuite, TextTestRunner
+from tracklib import (parseWktColumn, wktGeometryType, makeObsList, TrackReader,
+                      ENUCoords, GeoCoords, WrongArgumentError)
+
+
+class TestWktParser(TestCase):
+
+    def test_geometry_type(self):
+        self.assertEqual(wktGeometryType("LINESTRING (1 2, 3 4)"), "LINESTRING")
+        self.assertEqual(wktGeometryType("SRID=2154;MultiLineString Z((1 2 3))"), "MULTILINESTRING")
+        self.assertEqual(wktGeometryType("POLYGON EMPTY"), "POLYGON")
+
+    def test_parse_column(self):
+        wkts = ["LINESTRING (1 2, 3 4)",
+                "SRID=2154;MULTILINESTRING Z ((1 2 3, 4 5 6), (7 8 9, 1 1 1, 2 2 2))",
+                "LINESTRING EMPTY",
+                "POLYGON ((0 0, 1 0, 1 1, 0 0), (0.2 0.2, 0.4 0.2, 0.2 0.2))",
+                "LINESTRING ZM (1 2 3 4, 5 6 7 8)",
+                "LINESTRING (1 2, 3 4 5)"]
+        coords, parts, geoms = parseWktColumn(wkts)
+        self.assertEqual(geoms.tolist(), [0, 1, 3, 3, 5, 6, 7])
+        self.assertEqual(parts.tolist(), [0, 2, 4, 7, 11, 14, 16, 18])
+        self.assertEqual(coords[0:2].tolist(), [[1, 2, 0], [3, 4, 0]])
+        self.assertEqual(coords[parts[2]:parts[3]].tolist(), [[7, 8, 9], [1, 1, 1], [2, 2, 2]])
+        self.assertEqual(coords[parts[4]:parts[5], 0].tolist(), [0.2, 0.4, 0.2])
+        self.assertEqual(coords[14:16].tolist(), [[1, 2, 3], [5, 6, 7]])
+        self.assertEqual(coords[16:18].tolist(), [[1, 2, 0], [3, 4, 5]])
+
+        coords, parts, geoms = parseWktColumn([])
+        self.assertEqual(coords.shape, (0, 3))
+        self.assertEqual(geoms.tolist(), [0])
+
+        self.assertRaises(WrongArgumentError, parseWktColumn, ["LINESTRING (1 2, 3)"])
+        self.assertRaises(WrongArgumentError, parseWktColumn, ["LINESTRING (1 2, 3 a)"])
+
+    def test_obs(self):
+        coords, parts, geoms = parseWktColumn(["LINESTRING (2.5 48.1, 2.6 48.2 10)"])
+        obs = makeObsList(coords, "GEO")
+        self.assertEqual(len(obs), 2)
+        self.assertIsInstance(obs[0].position, GeoCoords)
+        self.assertEqual(obs[1].position.hgt, 10)
+        self.assertIsNot(obs[0].timestamp, obs[1].timestamp)
+        self.assertEqual(obs[0].timestamp.toAbsTime(), 0)
+
+        track = TrackReader.parseWkt("SRID=2154;LINESTRING (1 2, 3 4, 5 6)")
+        self.assertEqual(track.size(), 3)
+        self.assertIsInstance(track[0].position, ENUCoords)
+        self.assertEqual(track.getY(), [2, 4, 6])
+        collection = TrackReader.parsMultiWkt("MULTIPOLYGON (((0 0, 1 0, 0 0)), ((5 5, 6 5, 5 5)))")
+        self.assertEqual(collection.size(), 2)
+        self.assertEqual(collection[1][0].position.getX(), 5)
+
+
+if __name__ == '__main__':
+    suite = TestSuite()
+    suite.addTest(TestWktParser("test_geometry_type"))
+    suite.addTest(TestWktParser("test_parse_column"))
+    suite.addTest(TestWktParser("test_obs"))
+    runner = TextTestRunner()
+    runner.run(suite)
@@ -293,3 +293,173 @@ def diffJourAnneeTrace(track, i):
     return track.getObs(i).timestamp.day - track.getObs(i - 1).timestamp.day
 
 
+
+
+# =============================================================================
+#    Vectorized (whole track) versions of AF algorithms
+# =============================================================================
+# Registry: per-index algorithm -> function computing the AF for all the
+# observations of a track at once. A vectorized function returns an array
+# (or a list) of track.size() values, or None when it cannot handle the track
+# (e.g. non-ENU coordinates): the per-index algorithm is then used.
+_VECTORIZED_AF = {}
+
+
+def registerVectorizedAF(algorithm, vectorized):
+    """Register a whole track implementation of an AF algorithm
+
+    :param algorithm: Per-index AF algorithm (track, i) -> value
+    :param vectorized: Function track -> list of values (same NaN values at
+        track ends as algorithm), or None if it cannot handle the track
+    """
+    _VECTORIZED_AF[algorithm] = vectorized
+
+
+def getVectorizedAF(algorithm):
+    """Return the whole track implementation of an AF algorithm (or None)"""
+    return _VECTORIZED_AF.get(algorithm)
+
+
+def _columns(track, with_z=False):
+    """Coordinates and times of a track as float arrays"""
+    X = np.asarray(track.getX(), dtype=float)
+    Y = np.asarray(track.getY(), dtype=float)
+    if with_z:
+        return X, Y, np.asarray(track.getZ(), dtype=float)
+    return X, Y, np.asarray(track.getT(), dtype=float)
+
+
+def _divide(num, den):
+    """Element-wise division, NaN when denominator is 0"""
+    out = np.full(len(num), NAN)
+    ok = den != 0
+    out[ok] = num[ok] / den[ok]
+    return out
+
+
+def _vectorizedDs(track):
+    """Vectorized version of :func:`ds` (ENU tracks only)"""
+    if track.size() == 0 or track.getSRID() != "ENU":
+        return None
+    X, Y, _ = _columns(track)
+    out = np.zeros(len(X))
+    out[1:] = np.sqrt((X[:-1] - X[1:]) ** 2 + (Y[:-1] - Y[1:]) ** 2)
+    return out
+
+
+def _vectorizedHeading(track):
+    """Vectorized version of :func:`heading` (ENU tracks only)"""
+    if track.size() == 0 or track.getSRID() != "ENU":
+        return None
+    X, Y, _ = _columns(track)
+    out = np.full(len(X), NAN)
+    out[1:] = np.arctan2(X[1:] - X[:-1], Y[1:] - Y[:-1])
+    if len(X) > 1:
+        out[0] = out[1]
+    return out
+
+
+def _speeds(X, Y, T):
+    """Speed values of :func:`speed` for N >= 2 observations"""
+    N = len(X)
+    out = np.empty(N)
+    out[0] = _divide(np.array([math.sqrt((X[0]-X[1])**2 + (Y[0]-Y[1])**2)]),
+                      np.array([T[1] - T[0]]))[0]
+    out[N-1] = _divide(np.array([math.sqrt((X[N-2]-X[N-1])**2 + (Y[N-2]-Y[N-1])**2)]),
+                        np.array([T[N-1] - T[N-2]]))[0]
+    if N > 2:
+        d = np.sqrt((X[:-2] - X[2:]) ** 2 + (Y[:-2] - Y[2:]) ** 2)
+        out[1:-1] = _divide(d, T[2:] - T[:-2])
+    return out
+
+
+def _vectorizedSpeed(track):
+    """Vectorized version of :func:`speed` (ENU tracks only)"""
+    if track.size() == 0 or track.getSRID() != "ENU":
+        return None
+    X, Y, T = _columns(track)
+    if len(X) == 1:
+        return np.array([NAN])
+    return _speeds(X, Y, T)
+
+
+def _vectorizedAcceleration(track):
+    """Vectorized version of :func:`acceleration` (ENU tracks only)"""
+    if track.size() == 0 or track.getSRID() != "ENU":
+        return None
+    X, Y, T = _columns(track)
+    N = len(X)
+    out = np.full(N, NAN)
+    if N == 1:
+        return out
+    V = _speeds(X, Y, T)
+    out[N-1] = _divide(np.array([V[N-1] - V[N-2]]), np.array([T[N-1] - T[N-2]]))[0]
+    if N > 2:
+        out[1:-1] = _divide(V[2:] - V[:-2], T[2:] - T[:-2])
+    return out
+
+
+def _vectorizedSlope(track):
+    """Vectorized version of :func:`slope` (ENU tracks only)"""
+    if track.size() == 0 or track.getSRID() != "ENU":
+        return None
+    X, Y, Z = _columns(track, with_z=True)
+    out = np.full(len(X), NAN)
+    rise = Z[1:] - Z[:-1]
+    run = np.sqrt((X[:-1] - X[1:]) ** 2 + (Y[:-1] - Y[1:]) ** 2)
+    ok = run > 0
+    values = np.full(len(rise), NAN)
+    values[ok] = np.arctan(rise[ok] / run[ok]) * 180 / np.pi
+    out[1:] = values
+    return out
+
+
+def _vectorizedAnglegeom(track):
+    """Vectorized version of :func:`anglegeom`"""
+    if track.size() == 0:
+        return None
+    X, Y, _ = _columns(track)
+    out = np.full(len(X), NAN)
+    if len(X) < 3:
+        return out
+    x1, x2, x3 = X[:-2], X[1:-1], X[2:]
+    y1, y2, y3 = Y[:-2], Y[1:-1], Y[2:]
+    num = (x1 - x2) * (x3 - x2) + (y1 - y2) * (y3 - y2)
+    den = np.sqrt((x1-x2)**2 + (y1-y2)**2) * np.sqrt((x3-x2)**2 + (y3-y2)**2)
+    # Two (or three) identical points: angle is set to 0
+    same = ((x1 == x2) & (y1 == y2)) | ((x1 == x3) & (y1 == y3)) | ((x2 == x3) & (y2 == y3))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        angles = np.arccos(np.clip(num / den, -1, 1))
+    angles[same] = 0
+    out[1:-1] = angles
+    return out
+
+
+def _vectorizedOrientation(track):
+    """Vectorized version of :func:`orientation`"""
+    if track.size() == 0:
+        return None
+    X, Y, _ = _columns(track)
+    if len(X) == 1:
+        return [NAN]
+    DX = np.empty(len(X))
+    DY = np.empty(len(X))
+    DX[1:] = X[1:] - X[:-1]
+    DY[1:] = Y[1:] - Y[:-1]
+    DX[0] = DX[1]
+    DY[0] = DY[1]
+    angles = np.degrees(np.arctan2(DY, DX))
+    angles[angles < 0] += 360
+    edges = [0] + [22.5 + k*45 for k in range(8)] + [360]
+    caps = np.digitize(angles, edges)
+    caps[caps == 9] = 1
+    return [int(c) if 1 <= c <= 8 else NAN for c in caps]
+
+
+registerVectorizedAF(ds, _vectorizedDs)
+registerVectorizedAF(heading, _vectorizedHeading)
+registerVectorizedAF(speed, _vectorizedSpeed)
+registerVectorizedAF(acceleration, _vectorizedAcceleration)
+registerVectorizedAF(slope, _vectorizedSlope)
+registerVectorizedAF(anglegeom, _vectorizedAnglegeom)
+registerVectorizedAF(orientation, _vectorizedOrientation)
@@ -55,7 +55,7 @@ import numpy as np
 
 import tracklib as tracklib
 from tracklib.util import proj_polyligne
-from tracklib.core import (ENUCoords, Obs, Operator)
+from tracklib.core import (ENUCoords, Obs, Operator, makeCoords)
 from . import (HMM, 
                MODE_OBS_AS_2D_POSITIONS, 
                MODE_VERBOSE_PROGRESS,
@@ -145,19 +145,19 @@ def __mapOnNetwork (
     if verbose:
         print("Map-matching preparation...")
         to_run = progressbar.progressbar(to_run)
+
+    # Candidate edges of all observations
+    si = network.spatial_index
+    (offsets, E, V, XP, YP, D) = [a.tolist() for a in si.withinPoints(track, search_radius)]
     
     for i in to_run:
         STATES.append([])
-        p = track[i].position
-
-        cellsize = min(network.spatial_index.csize, network.spatial_index.lsize)
-        newunit = math.ceil(search_radius / cellsize)
 
-        if (network.spatial_index.covers(p)):
-            E = network.spatial_index.neighborhood(p, unit=newunit)
-            for elem in E:
+        if (si.covers(track[i].position)):
+            for n in range(offsets[i], offsets[i + 1]):
+                elem, v, d = E[n], V[n], D[n]
+                p = makeCoords(XP[n], YP[n], 0, si.srid)
                 eg = network.EDGES[network.getEdgeId(elem)].geom
-                p, d, v = __projOnTrack(track[i].position, eg)
                 if d < search_radius:
                     STATES[-1].append((p, elem, __distToNode(eg, p, v, 0), __distToNode(eg, p, v, 1)))
                     if debug:
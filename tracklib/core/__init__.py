@@ -5,9 +5,11 @@ from .obs_coords import *
 from .obs_time import *
 from .obs import *
 from .utils import *
+from .obs_columns import *
 
 from .kernel import *
 from .operators import *
+from .query import *
 
 from .track_collection import *
 
@@ -19,3 +21,5 @@ from .track import *
 from .network import *
 from .spatial_index import *
 
+from .rtree_index import *
+from .spatiotemporal_index import *
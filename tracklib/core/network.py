@@ -56,7 +56,7 @@ import progressbar
 import numpy as np
 import matplotlib.pyplot as plt
 
-from tracklib.util.exceptions import NetworkError
+from tracklib.util.exceptions import NetworkError, UnknownModeError
 import tracklib as tracklib
 from tracklib.core import (ECEFCoords, ENUCoords, GeoCoords,
                       Obs,
@@ -214,6 +214,50 @@ class Network:
 
         self.spatial_index = None
 
+    # Adjacency lists of nodes
+    ADJACENCY = ["NEXT_EDGES", "PREV_EDGES", "NBGR_EDGES",
+                 "NEXT_NODES", "PREV_NODES", "NBGR_NODES"]
+
+    @staticmethod
+    def fromTopology(nodes: list[Node], edges: list[Edge], adjacency: dict) -> Network:
+        """Build a network from its nodes, edges and adjacency lists at once
+        (without updating the topology edge by edge as :func:`addEdge`)
+
+        :param nodes: List of :class:`Node` (in index order)
+        :param edges: List of :class:`Edge` (in index order), with their
+            source and target nodes
+        :param adjacency: Dictionary of adjacency lists (see ADJACENCY): for
+            each name, a list (one per node) of lists of ids
+        :return: A network
+        """
+        network = Network()
+        network.NODES = {node.id: node for node in nodes}
+        network.EDGES = {edge.id: edge for edge in edges}
+        network.__idx_nodes = [node.id for node in nodes]
+        network.__idx_edges = [edge.id for edge in edges]
+        for name in Network.ADJACENCY:
+            setattr(network, name, dict(zip(network.__idx_nodes, adjacency[name])))
+        return network
+
+    def save(self, path: str, spatial_index: bool = True):
+        """Save the network in a binary file (see :class:`NetworkStore`)
+
+        :param path: Path of the output file
+        :param spatial_index: Save the spatial index of the network (if any)
+        """
+        tracklib.NetworkStore.write(self, path, spatial_index)
+
+    @staticmethod
+    def load(path: str, columnar: bool = True) -> Network:
+        """Load a network saved by :func:`save`
+
+        :param path: Path of the file
+        :param columnar: Geometries of edges are mapped on the file in
+            columnar mode (otherwise they are copied in lists of observations)
+        :return: The network
+        """
+        return tracklib.NetworkStore.read(path, columnar)
+
     def addNode(self, node: Node):
         """Add a :class:`Node` to the current :class:`Network`
 
@@ -467,15 +511,25 @@ class Network:
     # Spatial index creation, export and import functions
     # ------------------------------------------------------------
     def createSpatialIndex (
-        self, resolution=None, margin: float = 0.05, verbose: bool = True
+        self, resolution=None, margin: float = 0.05, verbose: bool = True, compact: bool = False,
+        method: Literal["GRID", "RTREE"] = "GRID"
     ):
         """Create a spatial index
 
         :param resolution: TODO
         :param margin: TODO
         :param verbose: Verbose creation
-        """
-        self.spatial_index = tracklib.SpatialIndex(self, resolution, margin, verbose)
+        :param compact: Store the cells of the index in flat arrays (see
+            :class:`SpatialIndex`)
+        :param method: Structure of the index: "GRID" (:class:`SpatialIndex`)
+            or "RTREE" (:class:`RTreeIndex`, suited to skewed data)
+        """
+        if method.upper() == "RTREE":
+            self.spatial_index = tracklib.RTreeIndex(self, resolution, margin, verbose)
+        elif method.upper() == "GRID":
+            self.spatial_index = tracklib.SpatialIndex(self, resolution, margin, verbose, compact)
+        else:
+            raise UnknownModeError("Unknown spatial index method: " + str(method))
 
     def exportSpatialIndex(self, filename: str):
         """Export the spatial index to a file
@@ -50,13 +50,22 @@ from __future__ import annotations
 #from tracklib.util.exceptions import *
 
 import sys
-import copy
 
 from . import ECEFCoords, ENUCoords, ObsTime
 
 
 class Obs:
-    """Class to define an observation"""
+    """Class to define an observation
+
+    GNSS quality fields (gdop, pdop, vdop, hdop, tdop, nb_sats, mask, code,
+    azimut and elevation) default to 0. They are stored only once one of
+    them is set, to keep observations compact.
+    """
+
+    __slots__ = ("position", "timestamp", "features", "_gnss")
+
+    GNSS_FIELDS = ("gdop", "pdop", "vdop", "hdop", "tdop",
+                   "nb_sats", "mask", "code", "azimut", "elevation")
 
     def __init__(self, position: ENUCoords, timestamp: ObsTime = None):
         """Constructor of :class:`Obs` class
@@ -73,26 +82,23 @@ class Obs:
 
         self.features = []
 
-        self.gdop = 0
-        self.pdop = 0
-        self.vdop = 0
-        self.hdop = 0
-        self.tdop = 0
-
-        self.nb_sats = 0
-        self.mask = 0
-        self.code = 0
-
-        self.azimut = 0
-        self.elevation = 0
+        self._gnss = None
 
     def __str__(self) -> str:
         """String of observation"""
         return (str)(self.timestamp) + "  " + (str)(self.position)
 
     def copy(self) -> Obs:
-        """Copy the current object"""
-        return copy.deepcopy(self)
+        """Copy the current object
+
+        Position, timestamp, list of analytical features and GNSS fields are
+        duplicated. Values of analytical features are not copied.
+        """
+        obs = Obs(self.position.copy(), self.timestamp.copy())
+        obs.features = list(self.features)
+        if self._gnss is not None:
+            obs._gnss = dict(self._gnss)
+        return obs
 
     # --------------------------------------------------
     # Geom. methods (should not depend on coords type)
@@ -120,7 +126,8 @@ class Obs:
         c2 = type(obs2.position)
         nc1 = (str)(c1)[7:-1]
         nc2 = (str)(c2)[7:-1]
-        if c1 != c2:
+        # Coordinate views (columnar tracks) are subclasses of coordinate types
+        if not isinstance(obs1.position, c2) and not isinstance(obs2.position, c1):
             raise CoordTypeError(
                 "Error: cannot call "
                 + fname
@@ -182,3 +189,22 @@ class Obs:
         :param value: The value to set
         """
         self.features[af_index] = value
+
+
+def _gnssField(name: str) -> property:
+    """Lazily stored GNSS quality field of :class:`Obs` (0 if never set)"""
+
+    def getter(obs):
+        return 0 if obs._gnss is None else obs._gnss.get(name, 0)
+
+    def setter(obs, value):
+        if obs._gnss is None:
+            obs._gnss = {}
+        obs._gnss[name] = value
+
+    return property(getter, setter, doc="GNSS quality field " + name + " (defaults to 0)")
+
+
+for _name in Obs.GNSS_FIELDS:
+    setattr(Obs, _name, _gnssField(_name))
+del _name
@@ -0,0 +1,747 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains the classes to store the observations of a track in
+contiguous NumPy arrays (columnar mode of :class:`Track`):
+
+    - :class:`ObsColumns` : columns x, y, z, t and one column per analytical
+      feature, behaving as a sequence of observations
+    - :class:`ObsView` : lightweight observation reading and writing a row of
+      an :class:`ObsColumns` object
+
+Coordinates and timestamps returned by an :class:`ObsView` are views too:
+modifying them modifies the underlying columns. Views keep the index of their
+row: they must not be kept across insertions or deletions in the track.
+
+"""
+
+# For type annotation
+from __future__ import annotations
+from typing import Union
+
+import numpy as np
+
+from . import ENUCoords, GeoCoords, ECEFCoords, ObsTime, Obs, NAN
+from tracklib.util.exceptions import CoordTypeError, SizeError
+
+
+class ENUCoordsView(ENUCoords):
+    """ENU coordinates stored in a row of an :class:`ObsColumns` object"""
+
+    __slots__ = ("_columns", "_idx")
+
+    def __init__(self, columns: ObsColumns, idx: int):
+        """Constructor of :class:`ENUCoordsView` class
+
+        :param columns: Columns of the track
+        :param idx: Index of the row
+        """
+        self._columns = columns
+        self._idx = idx
+
+    E = property(lambda self: self._columns.x[self._idx],
+                 lambda self, val: self._columns._ownColumn("x").__setitem__(self._idx, val))
+    N = property(lambda self: self._columns.y[self._idx],
+                 lambda self, val: self._columns._ownColumn("y").__setitem__(self._idx, val))
+    U = property(lambda self: self._columns.z[self._idx],
+                 lambda self, val: self._columns._ownColumn("z").__setitem__(self._idx, val))
+
+    def copy(self) -> ENUCoords:
+        """Copy the current object (detached from the columns)"""
+        return ENUCoords(float(self.E), float(self.N), float(self.U))
+
+    def __deepcopy__(self, memo):
+        """Deep copy is detached from the columns"""
+        return self.copy()
+
+
+class GeoCoordsView(GeoCoords):
+    """Geographic coordinates stored in a row of an :class:`ObsColumns` object"""
+
+    __slots__ = ("_columns", "_idx")
+
+    def __init__(self, columns: ObsColumns, idx: int):
+        """Constructor of :class:`GeoCoordsView` class
+
+        :param columns: Columns of the track
+        :param idx: Index of the row
+        """
+        self._columns = columns
+        self._idx = idx
+
+    lon = property(lambda self: self._columns.x[self._idx],
+                   lambda self, val: self._columns._ownColumn("x").__setitem__(self._idx, val))
+    lat = property(lambda self: self._columns.y[self._idx],
+                   lambda self, val: self._columns._ownColumn("y").__setitem__(self._idx, val))
+    hgt = property(lambda self: self._columns.z[self._idx],
+                   lambda self, val: self._columns._ownColumn("z").__setitem__(self._idx, val))
+
+    def copy(self) -> GeoCoords:
+        """Copy the current object (detached from the columns)"""
+        return GeoCoords(float(self.lon), float(self.lat), float(self.hgt))
+
+    def __deepcopy__(self, memo):
+        """Deep copy is detached from the columns"""
+        return self.copy()
+
+
+class ECEFCoordsView(ECEFCoords):
+    """ECEF coordinates stored in a row of an :class:`ObsColumns` object"""
+
+    __slots__ = ("_columns", "_idx")
+
+    def __init__(self, columns: ObsColumns, idx: int):
+        """Constructor of :class:`ECEFCoordsView` class
+
+        :param columns: Columns of the track
+        :param idx: Index of the row
+        """
+        self._columns = columns
+        self._idx = idx
+
+    X = property(lambda self: self._columns.x[self._idx],
+                 lambda self, val: self._columns._ownColumn("x").__setitem__(self._idx, val))
+    Y = property(lambda self: self._columns.y[self._idx],
+                 lambda self, val: self._columns._ownColumn("y").__setitem__(self._idx, val))
+    Z = property(lambda self: self._columns.z[self._idx],
+                 lambda self, val: self._columns._ownColumn("z").__setitem__(self._idx, val))
+
+    def copy(self) -> ECEFCoords:
+        """Copy the current object (detached from the columns)"""
+        return ECEFCoords(float(self.X), float(self.Y), float(self.Z))
+
+    def __deepcopy__(self, memo):
+        """Deep copy is detached from the columns"""
+        return self.copy()
+
+
+# Coordinate class and view class for each srid
+_COORDS_TYPES = {
+    "ENU":  (ENUCoords, ENUCoordsView),
+    "Geo":  (GeoCoords, GeoCoordsView),
+    "ECEF": (ECEFCoords, ECEFCoordsView),
+}
+
+
+def _sridOf(coords) -> str:
+    """Return the key of `_COORDS_TYPES` matching a coordinate object"""
+    if isinstance(coords, ENUCoords):
+        return "ENU"
+    if isinstance(coords, GeoCoords):
+        return "Geo"
+    if isinstance(coords, ECEFCoords):
+        return "ECEF"
+    raise CoordTypeError("Error: unknown coordinate type " + str(type(coords)))
+
+
+def _isNumber(value) -> bool:
+    """Check if a value may be stored in a float column"""
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, complex)
+
+
+class _FeaturesView:
+    """Analytical features of a row of an :class:`ObsColumns` object.
+
+    Mimics the `features` list of an :class:`Obs` object.
+    """
+
+    __slots__ = ("_columns", "_idx")
+
+    def __init__(self, columns: ObsColumns, idx: int):
+        self._columns = columns
+        self._idx = idx
+
+    def __len__(self):
+        return len(self._columns.features)
+
+    def __getitem__(self, af_index: int):
+        return self._columns.features[af_index][self._idx]
+
+    def __setitem__(self, af_index: int, value):
+        self._columns.setFeatureValue(af_index, self._idx, value)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __str__(self):
+        return str(list(self))
+
+
+class ObsView(Obs):
+    """Observation stored in a row of an :class:`ObsColumns` object.
+
+    GNSS quality fields (dop, number of satellites...) are not stored in
+    columnar mode and are read as 0.
+    """
+
+    __slots__ = ("_columns", "_idx")
+
+    def __init__(self, columns: ObsColumns, idx: int):
+        """Constructor of :class:`ObsView` class
+
+        :param columns: Columns of the track
+        :param idx: Index of the row
+        """
+        self._columns = columns
+        self._idx = idx
+        self._gnss = None
+
+    @property
+    def position(self):
+        """Coordinates of the observation (view on the columns)"""
+        return self._columns.coords_view(self._columns, self._idx)
+
+    @position.setter
+    def position(self, coords):
+        self._columns.setPosition(self._idx, coords)
+
+    @property
+    def timestamp(self) -> ObsTime:
+        """Timestamp of the observation (the returned object is a copy)"""
+        time = ObsTime.readUnixTime(self._columns.t[self._idx])
+        time.zone = self._columns.zone
+        return time
+
+    @timestamp.setter
+    def timestamp(self, timestamp: ObsTime):
+        self._columns._ownColumn("t")[self._idx] = timestamp.toAbsTime()
+
+    @property
+    def features(self) -> _FeaturesView:
+        """Analytical features of the observation (view on the columns)"""
+        return _FeaturesView(self._columns, self._idx)
+
+    @features.setter
+    def features(self, values):
+        for k in range(len(values)):
+            self._columns.setFeatureValue(k, self._idx, values[k])
+
+    def toObs(self) -> Obs:
+        """Copy the observation into a standard (detached) :class:`Obs`"""
+        obs = Obs(self.position.copy(), self.timestamp)
+        obs.features = [v.item() if isinstance(v, np.generic) else v for v in self.features]
+        return obs
+
+    def copy(self) -> Obs:
+        """Copy the current object (detached from the columns)"""
+        return self.toObs()
+
+    def __deepcopy__(self, memo):
+        """Deep copy is detached from the columns"""
+        return self.toObs()
+
+
+class ObsColumns:
+    """Columnar storage of the observations of a track.
+
+    Coordinates, timestamps (as elapsed seconds since 1970/01/01) and
+    analytical features are stored in NumPy arrays, with some spare capacity
+    at the end to make successive appends O(1) on average. The object behaves
+    as a (mutable) list of :class:`ObsView`.
+
+    All observations share the same coordinate type and the same time zone.
+    Numerical analytical features are stored as float64 columns, the other
+    ones as object columns.
+    """
+
+    def __init__(self, srid: str = "ENU", capacity: int = 16):
+        """Constructor of :class:`ObsColumns` class
+
+        :param srid: Coordinate type of observations ("ENU", "Geo" or "ECEF")
+        :param capacity: Initial number of allocated rows
+        """
+        srid = {"ENU": "ENU", "GEO": "Geo", "ECEF": "ECEF"}.get(str(srid).upper(), srid)
+        if srid not in _COORDS_TYPES:
+            raise CoordTypeError("Error: unknown coordinate type [" + str(srid) + "]")
+        self.srid = srid
+        self.coords_type, self.coords_view = _COORDS_TYPES[srid]
+        self.n = 0
+        self.zone = 0
+        capacity = max(capacity, 1)
+        self.x = np.empty(capacity)
+        self.y = np.empty(capacity)
+        self.z = np.empty(capacity)
+        self.t = np.empty(capacity)
+        self.features = []
+
+    # =========================================================================
+    # Conversions
+    # =========================================================================
+    @staticmethod
+    def fromArrays(X, Y, Z=None, T=None, srid: str = "ENU", features=None,
+                   copy: bool = True) -> ObsColumns:
+        """Build columns from coordinate and time arrays
+
+        :param X: 1st coordinates (X, lon or E)
+        :param Y: 2nd coordinates (Y, lat or N)
+        :param Z: 3rd coordinates (Z, hgt or U), defaults to 0
+        :param T: Timestamps in seconds since 1970/01/01, defaults to 0
+        :param srid: Coordinate type ("ENU", "Geo" or "ECEF")
+        :param features: List of analytical feature values (one list per AF)
+        :param copy: If False, float64 arrays (X, Y, Z, T and features) are
+            used as columns without being copied (e.g. memory-mapped arrays)
+        :return: Columns with exactly len(X) rows
+        """
+        n = len(X)
+        if not copy:
+            return ObsColumns.__wrap(X, Y, Z, T, srid, features)
+        columns = ObsColumns(srid, n)
+        columns.x[:n] = X
+        columns.y[:n] = Y
+        columns.z[:n] = 0 if Z is None else Z
+        columns.t[:n] = 0 if T is None else T
+        columns.n = n
+        if len(Y) != n or (Z is not None and len(Z) != n) or (T is not None and len(T) != n):
+            raise SizeError("Error: coordinate and time arrays must have the same size")
+        if features is not None:
+            for values in features:
+                columns.addFeature(values)
+        return columns
+
+    @staticmethod
+    def __wrap(X, Y, Z, T, srid, features) -> ObsColumns:
+        """Columns made of existing arrays (without spare capacity)"""
+        n = len(X)
+        columns = ObsColumns(srid, 1)
+        columns.n = n
+        for name, values in [("x", X), ("y", Y), ("z", Z), ("t", T)]:
+            if values is None:
+                values = np.zeros(n)
+            elif not (isinstance(values, np.ndarray) and values.dtype == np.float64):
+                values = np.asarray(values, dtype=float)
+            if values.shape != (n,):
+                raise SizeError("Error: coordinate and time arrays must have the same size")
+            setattr(columns, name, values)
+        if features is not None:
+            for values in features:
+                if isinstance(values, np.ndarray) and values.shape == (n,) and \
+                    values.dtype in (np.float64, object):
+                    columns.features.append(values)
+                else:
+                    columns.addFeature(values)
+        return columns
+
+    @staticmethod
+    def fromObsList(list_of_obs, nb_features: int = None) -> ObsColumns:
+        """Build columns from a list of :class:`Obs`
+
+        :param list_of_obs: List of observations (with same coordinate type)
+        :param nb_features: Number of analytical features to copy (default:
+            number of features of the first observation)
+        :return: Columns with exactly len(list_of_obs) rows
+        """
+        n = len(list_of_obs)
+        if n == 0:
+            return ObsColumns()
+        first = list_of_obs[0]
+        columns = ObsColumns(_sridOf(first.position), n)
+        columns.zone = first.timestamp.zone
+        for i in range(n):
+            obs = list_of_obs[i]
+            columns.__checkCoords(obs.position)
+            columns.x[i] = obs.position.getX()
+            columns.y[i] = obs.position.getY()
+            columns.z[i] = obs.position.getZ()
+            columns.t[i] = obs.timestamp.toAbsTime()
+        columns.n = n
+        if nb_features is None:
+            nb_features = len(first.features)
+        for k in range(nb_features):
+            columns.addFeature([obs.features[k] for obs in list_of_obs])
+        return columns
+
+    def toObsList(self) -> list[Obs]:
+        """Copy the columns into a list of standard :class:`Obs`"""
+        X, Y, Z, T = [column.tolist() for column in [self.getX(), self.getY(), self.getZ(), self.getT()]]
+        features = []
+        for k in range(len(self.features)):
+            values = self.getFeature(k).tolist()
+            if self.features[k].dtype == object:
+                values = [v.item() if isinstance(v, np.generic) else v for v in values]
+            features.append(values)
+        list_of_obs = []
+        for i in range(self.n):
+            timestamp = ObsTime.readUnixTime(T[i])
+            timestamp.zone = self.zone
+            obs = Obs(self.coords_type(X[i], Y[i], Z[i]), timestamp)
+            obs.features = [values[i] for values in features]
+            list_of_obs.append(obs)
+        return list_of_obs
+
+    def copy(self, cow: bool = False) -> ObsColumns:
+        """Copy the columns
+
+        :param cow: Share the columns of analytical features with the copy
+            (copy-on-write): shared columns are made read-only (in both
+            objects), and are duplicated by the first of both objects
+            writing into them
+        """
+        if not cow:
+            return self.take(np.arange(self.n))
+        columns = ObsColumns(self.srid, self.n)
+        columns.zone = self.zone
+        columns.n = self.n
+        columns.x[: self.n] = self.getX()
+        columns.y[: self.n] = self.getY()
+        columns.z[: self.n] = self.getZ()
+        columns.t[: self.n] = self.getT()
+        for column in self.features:
+            column.flags.writeable = False
+        columns.features = list(self.features)
+        return columns
+
+    def view(self, i: int, j: int) -> ObsColumns:
+        """Columns sharing the rows i to j-1 with the current object
+
+        Modifications of the rows of the view are visible in the current
+        object (and conversely), until one of them is resized.
+
+        :param i: Index of the first row
+        :param j: Index after the last row
+        """
+        i, j, _ = slice(i, j).indices(self.n)
+        j = max(i, j)
+        columns = ObsColumns.__new__(ObsColumns)
+        columns.srid = self.srid
+        columns.coords_type, columns.coords_view = self.coords_type, self.coords_view
+        columns.zone = self.zone
+        columns.n = j - i
+        columns.x = self.x[i:j]
+        columns.y = self.y[i:j]
+        columns.z = self.z[i:j]
+        columns.t = self.t[i:j]
+        columns.features = [column[i:j] for column in self.features]
+        return columns
+
+    # =========================================================================
+    # Columns accessors (zero-copy views)
+    # =========================================================================
+    def getX(self) -> np.ndarray:
+        """View on the 1st coordinate column"""
+        return self.x[: self.n]
+
+    def getY(self) -> np.ndarray:
+        """View on the 2nd coordinate column"""
+        return self.y[: self.n]
+
+    def getZ(self) -> np.ndarray:
+        """View on the 3rd coordinate column"""
+        return self.z[: self.n]
+
+    def getT(self) -> np.ndarray:
+        """View on the time column (seconds since 1970/01/01)"""
+        return self.t[: self.n]
+
+    def getFeature(self, af_index: int) -> np.ndarray:
+        """View on the column of an analytical feature
+
+        :param af_index: Index of the analytical feature
+        """
+        return self.features[af_index][: self.n]
+
+    # =========================================================================
+    # Analytical features
+    # =========================================================================
+    def __makeColumn(self, values) -> np.ndarray:
+        """Make a column (with current capacity) filled with values"""
+        capacity = len(self.x)
+        if isinstance(values, (list, tuple, np.ndarray)):
+            if len(values) != self.n:
+                raise SizeError("Error: AF values must have the same size as the track")
+            array = np.asarray(values) if len(values) > 0 else np.empty(0)
+            if array.ndim == 1 and array.dtype.kind in "biuf":
+                column = np.empty(capacity)
+                column[: self.n] = array
+                return column
+            column = np.empty(capacity, dtype=object)
+            for i in range(self.n):
+                column[i] = values[i]
+            return column
+        if _isNumber(values):
+            column = np.empty(capacity)
+        else:
+            column = np.empty(capacity, dtype=object)
+        column[: self.n] = values
+        return column
+
+    def addFeature(self, values=0.0):
+        """Add a column of analytical feature (at the last index)
+
+        :param values: Initial value (scalar or list of values)
+        """
+        self.features.append(self.__makeColumn(values))
+
+    def setFeature(self, af_index: int, values):
+        """Update all the values of an analytical feature
+
+        :param af_index: Index of the analytical feature
+        :param values: New value (scalar or list of values)
+        """
+        self.features[af_index] = self.__makeColumn(values)
+
+    def removeFeature(self, af_index: int):
+        """Remove a column of analytical feature
+
+        :param af_index: Index of the analytical feature
+        """
+        del self.features[af_index]
+
+    def setFeatureValue(self, af_index: int, i: int, value):
+        """Set the value of an analytical feature for one observation
+
+        Float columns are converted into object columns when needed.
+
+        :param af_index: Index of the analytical feature
+        :param i: Index of the observation
+        :param value: New value
+        """
+        column = self.__own(af_index)
+        if column.dtype != object and not _isNumber(value):
+            column = column.astype(object)
+            self.features[af_index] = column
+        column[self.__index(i)] = value
+
+    def __own(self, af_index: int) -> np.ndarray:
+        """Column of an analytical feature, duplicated first if it is shared"""
+        column = self.features[af_index]
+        if not column.flags.writeable:
+            column = column.copy()
+            self.features[af_index] = column
+        return column
+
+    def _ownColumn(self, name: str) -> np.ndarray:
+        """Column x, y, z or t, duplicated first if it is read-only (e.g.
+        mapped on a file)"""
+        column = getattr(self, name)
+        if not column.flags.writeable:
+            column = column.copy()
+            setattr(self, name, column)
+        return column
+
+    def setColumn(self, name: str, values):
+        """Update all the values of column x, y, z or t
+
+        :param name: Name of the column ("x", "y", "z" or "t")
+        :param values: New values (array of size n)
+        """
+        self._ownColumn(name)[: self.n] = values
+
+    # =========================================================================
+    # Rows handling
+    # =========================================================================
+    def __index(self, i) -> int:
+        """Normalize an observation index (raises IndexError if out of range)"""
+        i = int(i)
+        if i < 0:
+            i += self.n
+        if i < 0 or i >= self.n:
+            raise IndexError("observation index out of range")
+        return i
+
+    def __checkCoords(self, coords):
+        """Check coordinate type before writing a row"""
+        if not isinstance(coords, self.coords_type):
+            raise CoordTypeError("Error: columnar track in " + self.srid +
+                                 " coordinates cannot store " + str(type(coords)))
+
+    def __reserve(self, size: int):
+        """Make sure at least `size` rows are allocated"""
+        capacity = len(self.x)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        for name in ["x", "y", "z", "t"]:
+            column = np.empty(capacity)
+            column[: self.n] = getattr(self, name)[: self.n]
+            setattr(self, name, column)
+        for k in range(len(self.features)):
+            column = np.empty(capacity, dtype=self.features[k].dtype)
+            column[: self.n] = self.features[k][: self.n]
+            self.features[k] = column
+
+    def setPosition(self, i: int, coords):
+        """Write the coordinates of one observation
+
+        :param i: Index of the observation
+        :param coords: New coordinates (same type as columns)
+        """
+        self.__checkCoords(coords)
+        i = self.__index(i)
+        self._ownColumn("x")[i] = coords.getX()
+        self._ownColumn("y")[i] = coords.getY()
+        self._ownColumn("z")[i] = coords.getZ()
+
+    def __setRow(self, i: int, obs: Obs):
+        """Write an observation in row i (allocated)"""
+        self.__checkCoords(obs.position)
+        self._ownColumn("x")[i] = obs.position.getX()
+        self._ownColumn("y")[i] = obs.position.getY()
+        self._ownColumn("z")[i] = obs.position.getZ()
+        self._ownColumn("t")[i] = obs.timestamp.toAbsTime()
+        features = obs.features
+        for k in range(len(self.features)):
+            value = features[k] if k < len(features) else NAN
+            column = self.__own(k)
+            if column.dtype != object and not _isNumber(value):
+                column = column.astype(object)
+                self.features[k] = column
+            column[i] = value
+
+    def append(self, obs: Obs):
+        """Add an observation at the end of the columns"""
+        if self.n == 0:
+            self.srid = _sridOf(obs.position)
+            self.coords_type, self.coords_view = _COORDS_TYPES[self.srid]
+            self.zone = obs.timestamp.zone
+        self.__reserve(self.n + 1)
+        self.n += 1
+        self.__setRow(self.n - 1, obs)
+
+    def extend(self, list_of_obs):
+        """Add a list of observations at the end of the columns"""
+        self.__reserve(self.n + len(list_of_obs))
+        for obs in list_of_obs:
+            self.append(obs)
+
+    def insert(self, i: int, obs: Obs):
+        """Insert an observation before index i"""
+        i = int(i)
+        if i < 0:
+            i += self.n
+        i = min(max(i, 0), self.n)
+        self.append(obs)
+        if i == self.n - 1:
+            return
+        order = np.concatenate((np.arange(i), [self.n - 1], np.arange(i, self.n - 1)))
+        self.__permute(order)
+
+    def pop(self, i: int = -1) -> Obs:
+        """Remove an observation and return it (as a standard :class:`Obs`)"""
+        obs = self[i].toObs()
+        del self[i]
+        return obs
+
+    def take(self, indices) -> ObsColumns:
+        """New columns made of the rows listed in indices
+
+        :param indices: Array of row indices (may contain duplicates)
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        if len(indices) > 0 and (indices.max() >= self.n or indices.min() < -self.n):
+            raise IndexError("observation index out of range")
+        columns = ObsColumns(self.srid, len(indices))
+        columns.zone = self.zone
+        columns.n = len(indices)
+        columns.x[: columns.n] = self.getX()[indices]
+        columns.y[: columns.n] = self.getY()[indices]
+        columns.z[: columns.n] = self.getZ()[indices]
+        columns.t[: columns.n] = self.getT()[indices]
+        columns.features = [self.getFeature(k)[indices] for k in range(len(self.features))]
+        return columns
+
+    def __permute(self, order):
+        """Reorder rows in place (views are detached first)"""
+        if self.x.base is not None:
+            self.__reserve(len(self.x) + 1)
+        for name in ["x", "y", "z", "t"]:
+            column = self._ownColumn(name)
+            column[: self.n] = column[: self.n][order]
+        for k in range(len(self.features)):
+            column = self.__own(k)
+            column[: self.n] = column[: self.n][order]
+
+    def sort(self):
+        """Sort observations in chronological order (stable)"""
+        self.__permute(np.argsort(self.getT(), kind="stable"))
+
+    def reverse(self):
+        """Reverse order of observations in place"""
+        self.__permute(np.arange(self.n)[::-1])
+
+    # =========================================================================
+    # Sequence protocol
+    # =========================================================================
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield ObsView(self, i)
+
+    def __getitem__(self, i) -> Union[ObsView, ObsColumns]:
+        if isinstance(i, slice):
+            return self.take(np.arange(self.n)[i])
+        if isinstance(i, (list, np.ndarray)):
+            return self.take(i)
+        return ObsView(self, self.__index(i))
+
+    def __setitem__(self, i, obs: Obs):
+        self.__setRow(self.__index(i), obs)
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            remove = np.arange(self.n)[i]
+        else:
+            remove = [self.__index(i)]
+        keep = np.delete(np.arange(self.n), remove)
+        self.__permute(np.concatenate((keep, remove)).astype(np.int64))
+        self.n = len(keep)
+
+    def __add__(self, other):
+        if isinstance(other, ObsColumns):
+            if (other.srid == self.srid) and (len(other.features) == len(self.features)):
+                output = self.take(np.arange(self.n))
+                output.extend(other)
+                return output
+            return self.toObsList() + other.toObsList()
+        return self.toObsList() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.toObsList()
+
+    def __str__(self) -> str:
+        return "ObsColumns(" + self.srid + ", " + str(self.n) + " obs, " + \
+            str(len(self.features)) + " AF)"
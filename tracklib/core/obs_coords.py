@@ -52,7 +52,6 @@ from typing import Union
 #from tracklib.util.exceptions import *
 
 import math
-import copy
 import matplotlib.pyplot as plt
 
 # The current constants are used in this module : 
@@ -66,6 +65,8 @@ STANDARD_PROJ = 1   # 1: flat, 2: stereographic
 class GeoCoords:
     """Class to represent geographics coordinates"""
 
+    __slots__ = ("lon", "lat", "hgt")
+
     def __init__(self, lon: float, lat: float, hgt: float = 0.0):   
         """Constructor of :class:`GeoCoords` class
 
@@ -88,8 +89,11 @@ class GeoCoords:
         return output
     
     def copy(self) -> GeoCoords:   
-        """TODO"""
-        return copy.deepcopy(self)
+        """Copy the current object
+
+        :return: A copy of current object
+        """
+        return GeoCoords(self.lon, self.lat, self.hgt)
 
     def toECEFCoords(self) -> ECEFCoords:   
         """Convert geodetic coordinates to absolute ECEF
@@ -242,6 +246,8 @@ class GeoCoords:
 
 class ENUCoords:
     """Class for representation of local projection (East, North, Up)"""
+
+    __slots__ = ("E", "N", "U")
     
     __epsilon = 0.0001
 
@@ -296,7 +302,7 @@ class ENUCoords:
 
         :return: A copy of current object
         """
-        return copy.deepcopy(self)
+        return ENUCoords(self.E, self.N, self.U)
 
     def toECEFCoords(self, base: Union[ECEFCoords, GeoCoords]) -> ECEFCoords:   
         """Convert local planimetric to absolute geocentric
@@ -506,6 +512,8 @@ class ENUCoords:
 class ECEFCoords:
     """Class to represent Earth-Centered-Earth-Fixed coordinates"""
 
+    __slots__ = ("X", "Y", "Z")
+
     # --------------------------------------------------
     # X, Y, Z in meters
     # --------------------------------------------------
@@ -535,7 +543,7 @@ class ECEFCoords:
 
         :return: A copy of current object
         """
-        return copy.deepcopy(self)
+        return ECEFCoords(self.X, self.Y, self.Z)
 
     def toGeoCoords(self) -> GeoCoords:   
         """Convert absolute geocentric coords to geodetic longitude, latitude and height
@@ -48,16 +48,26 @@ from __future__ import annotations
 # from typing import Union
 #from tracklib.util.exceptions import *
 
-import copy
 from datetime import datetime
 import random
+import numpy as np
 
 
 class ObsTime:
     """
     Class to represent the phenomenom time of an observation.
+
+    Timestamps are stored as an integer number of milliseconds elapsed since
+    01/01/1970. Calendar fields (year, month, day, hour, min, sec, ms) are
+    computed on demand. When a field is modified, fields are kept as they are
+    (possibly out of range) until the next conversion.
     """
 
+    __slots__ = ("_epoch", "_fields", "zone")
+
+    # Order of calendar fields in _fields
+    FIELDS = ("year", "month", "day", "hour", "min", "sec", "ms")
+
     BASE_YEAR = 2000
     UNIX_BASE_YEAR = 1970
 	
@@ -73,6 +83,7 @@ class ObsTime:
         ("2m", 14),
         ("2s", 17),
     ]
+    __precompiled_read_fmts = {}  # Precompiled read formats (by format)
 
     __fmt_nd = ["{:01d}", "{:02d}", "{:03d}", "{:04d}"]
     __codes = [
@@ -112,34 +123,105 @@ class ObsTime:
         """
 
         if isinstance(year, str):
-
             time = ObsTime.readTimestamp(year)
-            self.day = time.day
-            self.month = time.month
-            self.year = time.year
-            self.hour = time.hour
-            self.min = time.min
-            self.sec = time.sec
-            self.ms = time.ms
-            self.zone = zone
-
+            self._epoch = time._epoch
+            self._fields = time._fields
         else:
-
-            self.day = day
-            self.month = month
-            self.year = year
-            self.hour = hour
-            self.min = min
-            self.sec = sec
-            self.ms = ms
-            self.zone = zone
+            self._epoch = None
+            self._fields = [year, month, day, hour, min, sec, ms]
+            self.__pack()
+        self.zone = zone
 
     def copy(self) -> ObsTime:   
         """Copy the object
 
         :return: copy of current object
         """
-        return copy.deepcopy(self)
+        time = ObsTime.__new__(ObsTime)
+        time._epoch = self._epoch
+        time._fields = None if self._fields is None else list(self._fields)
+        time.zone = self.zone
+        return time
+
+    # ------------------------------------------------------------
+    # Epoch and calendar fields
+    # ------------------------------------------------------------
+    @staticmethod
+    def __daysFromCivil(year: int, month: int, day: int) -> int:
+        """Number of days between 01/01/1970 and a date (constant time)"""
+        year -= month <= 2
+        era = year // 400
+        yoe = year - era * 400
+        doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+        return era * 146097 + doe - 719468
+
+    @staticmethod
+    def __civilFromDays(days: int) -> tuple[int, int, int]:
+        """Date (year, month, day) of a number of days since 01/01/1970"""
+        days += 719468
+        era = days // 146097
+        doe = days - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        return yoe + era * 400 + (month <= 2), month, day
+
+    def __pack(self):
+        """Replace calendar fields by epoch when they form a valid date"""
+        year, month, day, hour, min, sec, ms = self._fields
+        try:
+            year | month | day | hour | min | sec | ms
+        except TypeError:
+            return
+        if not ((1 <= month <= 12) and (1 <= day <= 28) and (0 <= hour < 24)
+                and (0 <= min < 60) and (0 <= sec < 60) and (0 <= ms < 1000)):
+            if not ((1 <= month <= 12) and (0 <= hour < 24) and (0 <= min < 60)
+                    and (0 <= sec < 60) and (0 <= ms < 1000)):
+                return
+            days_in_month = ObsTime.__day_per_month[month - 1]
+            if (month == 2) and ObsTime.isLeapYear(year):
+                days_in_month += 1
+            if not (1 <= day <= days_in_month):
+                return
+        days = ObsTime.__daysFromCivil(year, month, day)
+        self._epoch = (((days * 24 + hour) * 60 + min) * 60 + sec) * 1000 + ms
+        self._fields = None
+
+    def __unpack(self) -> list:
+        """Calendar fields (computed from epoch if needed)"""
+        if self._fields is None:
+            days, ms = divmod(self._epoch, 86400000)
+            hour, ms = divmod(ms, 3600000)
+            min, ms = divmod(ms, 60000)
+            sec, ms = divmod(ms, 1000)
+            self._fields = [*ObsTime.__civilFromDays(days), hour, min, sec, ms]
+        return self._fields
+
+    def getEpoch(self) -> int:
+        """Number of milliseconds elapsed since 01/01/1970
+
+        Calendar fields out of range are carried over (e.g. 32/01 is 01/02).
+        """
+        if self._epoch is None:
+            days, hour, min, sec, ms = self.__carryFields()
+            self._epoch = (((days * 24 + hour) * 60 + min) * 60 + sec) * 1000 + ms
+        return self._epoch
+
+    def __key(self):
+        """Epoch used in comparisons"""
+        return self.getEpoch() if self._epoch is None else self._epoch
+
+    def __carryFields(self) -> tuple:
+        """Calendar fields with date converted in days since 01/01/1970"""
+        year, month, day, hour, min, sec, ms = self._fields
+        month -= 1
+        year += month // 12
+        month = month % 12 + 1
+        days = ObsTime.__daysFromCivil(year, month, 1) + day - 1
+        return days, hour, min, sec, ms
 
     @staticmethod
     def setPrintFormat(format: str):   
@@ -158,7 +240,7 @@ class ObsTime:
         :param format: Format for reading
         """
         ObsTime.__READ_FMT = format
-        ObsTime.__PRECOMPILED_READ_FMT = ObsTime.__precompileReadFmt(ObsTime.__READ_FMT)
+        ObsTime.__PRECOMPILED_READ_FMT = ObsTime.__precompiledReadFmt(format)
 
     @staticmethod
     def getPrintFormat() -> str:   
@@ -186,6 +268,8 @@ class ObsTime:
 
         **Warning:** does not consider leap seconds (31 since 1970)
 
+        Elapsed seconds are rounded to the nearest millisecond.
+
         :param elapsed_seconds: Elapsed seconds
         :return: Coverted time
         """
@@ -200,55 +284,11 @@ class ObsTime:
             elapsed_seconds = elapsed_seconds / 1000
         '''
 
-        time = ObsTime()
-
-        SECOND_PER_YEAR = 86400 * 365
-        # SECOND_PER_MONTH = 86400 * 28
-
-        # Year
-        sec = 0
-        year = ObsTime.UNIX_BASE_YEAR
-        while sec < elapsed_seconds - SECOND_PER_YEAR:
-            sec += SECOND_PER_YEAR
-            if ObsTime.isLeapYear(year):
-                sec += 86400
-            year += 1
-        time.year = year
-        elapsed_seconds -= sec
-
-        # Month
-        month = 0
-        for i in range(12):
-            sec_on_month = ObsTime.__day_per_month[month] * 86400
-            #if (month == 1) and (year % 4 == 0):
-            if (month == 1) and ObsTime.isLeapYear(year):
-                sec_on_month += 86400
-            if elapsed_seconds < sec_on_month:
-                break
-            elapsed_seconds -= sec_on_month
-            month += 1
-
-        time.month = month + 1
-
-        # Day
-        time.day = (int)(elapsed_seconds / 86400) + 1
-        elapsed_seconds -= (time.day - 1) * 86400
-
-        # Hour
-        time.hour = (int)(elapsed_seconds / 3600)
-        elapsed_seconds -= time.hour * 3600
-
-        # Minute
-        time.min = (int)(elapsed_seconds / 60)
-        elapsed_seconds -= time.min * 60
-
-        # Second
-        time.sec = (int)(elapsed_seconds)
-        elapsed_seconds -= time.sec
-
-        # Milisecond
-        time.ms = (int)(elapsed_seconds * 1000)
-
+        # Rounded to the nearest millisecond
+        time = ObsTime.__new__(ObsTime)
+        time._epoch = (int)(round((float)(elapsed_seconds) * 1000))
+        time._fields = None
+        time.zone = 0
         return time
 
     def toAbsTime(self) -> float:   
@@ -258,20 +298,16 @@ class ObsTime:
 
         :return: elapsed float seconds
         """
-        seconds = 0
-        for y in range(ObsTime.UNIX_BASE_YEAR, self.year):
-            seconds += 86400 * 365
-            if ObsTime.isLeapYear(y):
-                seconds += 86400
-        for m in range(1, self.month):
-            seconds += ObsTime.__day_per_month[m - 1] * 86400
-            if (m == 2) and ObsTime.isLeapYear(self.year):
-                seconds += 86400
-        seconds += (self.day - 1) * 86400
-        seconds += self.hour * 3600
-        seconds += self.min * 60
-        seconds += self.sec
-        seconds += self.ms / 1000.0
+        if self._fields is None:
+            seconds, ms = divmod(self._epoch, 1000)
+            return seconds + ms / 1000.0
+
+        days, hour, min, sec, ms = self.__carryFields()
+        seconds = days * 86400
+        seconds += hour * 3600
+        seconds += min * 60
+        seconds += sec
+        seconds += ms / 1000.0
 
         return seconds
 
@@ -367,6 +403,15 @@ class ObsTime:
             output += char
         return output
 
+    @staticmethod
+    def __precompiledReadFmt(format: str = None) -> list[tuple[str, int]]:
+        """Precompiled symbols of a format (of the read format if None)"""
+        if format is None:
+            return ObsTime.__PRECOMPILED_READ_FMT
+        if format not in ObsTime.__precompiled_read_fmts:
+            ObsTime.__precompiled_read_fmts[format] = ObsTime.__precompileReadFmt(format)
+        return ObsTime.__precompiled_read_fmts[format]
+
     @staticmethod
     def __precompileReadFmt(format: str) -> list[tuple[str, int]]:   
         """Precompile the reader
@@ -405,22 +450,142 @@ class ObsTime:
         return PRECOMPILED_LIST
 
     @staticmethod
-    def readTimestamp(timeAsString: str) -> ObsTime:   
+    def readTimestamp(timeAsString: str, fmt: str = None) -> ObsTime:   
         """Build timestamp from string according to READ_FMT
 
         :param timeAsString: Timestamp in string format
+        :param fmt: Format of the timestamp (READ_FMT if None). The read
+            format is not modified.
         """
         time = ObsTime()
-        PCL = ObsTime.__PRECOMPILED_READ_FMT
+        PCL = ObsTime.__precompiledReadFmt(fmt)
   
         for i in range(len(PCL)):
             index = PCL[i][1]
             time.__fillMember(
                 timeAsString[index : index + (int)(PCL[i][0][0])], PCL[i][0]
             )
+        time.__pack()
 
         return time
 
+    @staticmethod
+    def readTimestamps(timesAsStrings, fmt: str = None) -> np.ndarray:
+        """Parse a column of timestamps according to READ_FMT
+
+        Fields are sliced at their (fixed) offsets in the whole column at
+        once. Strings not made of digits at the expected offsets are parsed
+        one by one with :func:`readTimestamp`.
+
+        :param timesAsStrings: List (or array) of timestamps in string format
+        :param fmt: Format of the timestamps (READ_FMT if None)
+        :return: Array of elapsed seconds since 01/01/1970 (as returned by
+            :func:`toAbsTime`), NaN for strings that cannot be parsed
+        """
+        n = len(timesAsStrings)
+        output = np.full(n, np.nan)
+        if n == 0:
+            return output
+        PCL = ObsTime.__precompiledReadFmt(fmt)
+        strings = np.ascontiguousarray(timesAsStrings, dtype=str)
+        width = max([index + (int)(code[0]) for code, index in PCL] + [1])
+        if strings.dtype.itemsize // 4 < width:
+            strings = strings.astype("<U" + str(width))
+        chars = strings.view(np.uint32).reshape(n, -1)[:, :width].astype(np.int64) - 48
+
+        fields = [np.full(n, v, dtype=np.int64) for v in [1970, 1, 1, 0, 0, 0, 0]]
+        valid = np.ones(n, dtype=bool)
+        for code, index in PCL:
+            digits = chars[:, index : index + (int)(code[0])]
+            valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+            value = np.zeros(n, dtype=np.int64)
+            for k in range(digits.shape[1]):
+                value = 10 * value + digits[:, k]
+            if code[1] == "z":
+                value *= 10 ** (3 - (int)(code[0]))
+            if code == "2Y":
+                value += ObsTime.BASE_YEAR
+            field = {"Y": 0, "M": 1, "D": 2, "h": 3, "m": 4, "s": 5, "z": 6}[code[1]]
+            fields[field] = value
+
+        # Dates (with months and days out of range carried over)
+        year, month, day, hour, min, sec, ms = fields
+        month = month - 1
+        year = year + month // 12
+        month = month % 12 + 1
+        year = year - (month <= 2)
+        era = year // 400
+        yoe = year - era * 400
+        doy = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+        days = era * 146097 + doe - 719468 + day - 1
+        seconds = days * 86400 + hour * 3600 + min * 60 + sec
+        output[valid] = seconds[valid] + ms[valid] / 1000.0
+
+        for i in np.flatnonzero(~valid):
+            try:
+                output[i] = ObsTime.readTimestamp(str(timesAsStrings[i]), fmt).toAbsTime()
+            except ValueError:
+                pass
+        return output
+
+    @staticmethod
+    def printTimestamps(times) -> list[str]:
+        """Print a column of timestamps according to PRINT_FMT
+
+        Calendar fields are computed on the whole column at once, then each
+        timestamp is printed with a single format operation.
+
+        :param times: List (or array) of elapsed seconds since 01/01/1970
+        :return: List of timestamps in string format (as printed by :func:`__str__`)
+        """
+        if "\\" in ObsTime.__PRINT_FMT:
+            return [str(ObsTime.readUnixTime(t)) for t in np.asarray(times, dtype=float).tolist()]
+
+        # Print format compiled into a %-template
+        template = ""
+        codes = []
+        output = ObsTime.__PRINT_FMT
+        i = 0
+        while i < len(output):
+            if output[i : i + 2] in ObsTime.__codes:
+                template += "%0" + output[i] + "d"
+                codes.append(output[i : i + 2])
+                i += 2
+            else:
+                template += output[i].replace("%", "%%")
+                i += 1
+        if len(codes) == 0:
+            return [template % ()] * len(times)
+
+        # Calendar fields
+        epochs = np.round(np.asarray(times, dtype=float) * 1000).astype(np.int64)
+        days, ms = np.divmod(epochs, 86400000)
+        hour, ms = np.divmod(ms, 3600000)
+        min, ms = np.divmod(ms, 60000)
+        sec, ms = np.divmod(ms, 1000)
+        days = days + 719468
+        era = days // 146097
+        doe = days - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = np.where(mp < 10, mp + 3, mp - 9)
+        year = yoe + era * 400 + (month <= 2)
+
+        subst = {
+            "1D": day, "2D": day,
+            "1M": month, "2M": month,
+            "2Y": year % 100, "4Y": year,
+            "1h": hour, "2h": hour,
+            "1m": min, "2m": min,
+            "1s": sec, "2s": sec,
+            "1z": (ms + 50) // 100, "2z": (ms + 5) // 10, "3z": ms,
+        }
+        columns = [subst[code].tolist() for code in codes]
+        return list(map(template.__mod__, zip(*columns)))
+
     # ------------------------------------------------------------
     # Remplacing substring of length 'length', starting at pos id
     # in string 'chaine' with new string 'new'
@@ -522,7 +687,7 @@ class ObsTime:
         :param time: :class:`ObsTime` to substract
         :return: Difference (in floating point seconds) between 2 date
         """
-        return self.toAbsTime() - time.toAbsTime()
+        return (self.__key() - time.__key()) / 1000.0
 
     def __eq__(self, time: ObsTime) -> bool:   
         """Tests if two timestamps are strictly equal (up to 1 ms)
@@ -531,23 +696,7 @@ class ObsTime:
         """
         if not isinstance(time, ObsTime):
             return False
-        
-        if self.ms != time.ms:
-            return False
-        if self.sec != time.sec:
-            return False
-        if self.min != time.min:
-            return False
-        if self.hour != time.hour:
-            return False
-        if self.day != time.day:
-            return False
-        if self.month != time.month:
-            return False
-        if self.year != time.year:
-            return False
-        
-        return True
+        return self.__key() == time.__key()
 
     def __ne__(self, time: ObsTime) -> bool:   
         """Test if two timestamps are different
@@ -561,41 +710,17 @@ class ObsTime:
 
         :param time: :class:`ObsTime` to compare
         """
-        if self.year != time.year:
-            return self.year > time.year
-        if self.month != time.month:
-            return self.month > time.month
-        if self.day != time.day:
-            return self.day > time.day
-        if self.hour != time.hour:
-            return self.hour > time.hour
-        if self.min != time.min:
-            return self.min > time.min
-        if self.sec != time.sec:
-            return self.sec > time.sec
-        return self.ms > time.ms
+        return self.__key() > time.__key()
 
     def __lt__(self, time: ObsTime) -> bool:   
         """Tests chronological order of two timestamps
 
         :param time: :class:`ObsTime` to compare
         """
-        if self.year != time.year:
-            return self.year < time.year
-        if self.month != time.month:
-            return self.month < time.month
-        if self.day != time.day:
-            return self.day < time.day
-        if self.hour != time.hour:
-            return self.hour < time.hour
-        if self.min != time.min:
-            return self.min < time.min
-        if self.sec != time.sec:
-            return self.sec < time.sec
-        return self.ms < time.ms
+        return self.__key() < time.__key()
 
     def __ge__(self, time: ObsTime) -> bool:   
-        """Inverse of :method:`__gt__`
+        """Inverse of :method:`__lt__`
 
         :param time: :class:`ObsTime` to compare
         """
@@ -603,8 +728,29 @@ class ObsTime:
         return not (self < time)
 
     def __le__(self, time: ObsTime) -> bool:   
-        """Inverse of :method:`__lt__`
+        """Inverse of :method:`__gt__`
 
         :param time: :class:`ObsTime` to compare
         """
         return not (self > time)
+
+
+def _calendarField(k: int) -> property:
+    """Property reading and writing the k-th calendar field of a timestamp"""
+
+    def getter(time):
+        fields = time._fields
+        if fields is None:
+            fields = time._ObsTime__unpack()
+        return fields[k]
+
+    def setter(time, value):
+        time._ObsTime__unpack()[k] = value
+        time._epoch = None
+
+    return property(getter, setter, doc="Calendar field '" + ObsTime.FIELDS[k] + "'")
+
+
+for _k in range(len(ObsTime.FIELDS)):
+    setattr(ObsTime, ObsTime.FIELDS[_k], _calendarField(_k))
+del _k
@@ -50,10 +50,73 @@ import math
 import numpy as np
 from abc import abstractmethod
 #from tracklib.util.exceptions import *
+from tracklib.util.exceptions import KernelError
 
 from . import NAN, isnan, addListToAF, Kernel
 
 
+# -----------------------------------------------------------------------------
+#      Array-level execution helpers
+# -----------------------------------------------------------------------------
+def _asArray(values) -> np.ndarray:
+    """Values of an AF as a float array (object array if not numerical)"""
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=object)
+
+
+def _arrayTrack(*arrays):
+    """Temporary columnar track holding arrays as AFs "#0", "#1"...
+
+    Used by the default array-level execution of operators, which runs
+    the per-observation `execute` method on this track.
+    """
+    from tracklib.core.track import Track
+    n = len(arrays[0])
+    af = {"#" + str(k): arrays[k] for k in range(len(arrays))}
+    return Track.fromArrays(np.zeros(n), np.zeros(n), af=af)
+
+
+def _divide(num, den) -> np.ndarray:
+    """Element-wise division (NaN when denominator is 0)"""
+    num, den = np.broadcast_arrays(num, den)
+    out = np.full(num.shape, NAN)
+    ok = den != 0
+    out[ok] = num[ok] / den[ok]
+    return out
+
+
+def _valid(X) -> np.ndarray:
+    """Non-NaN values of an array"""
+    return X[X == X]
+
+
+def _validPairs(X1, X2):
+    """Values of two arrays where none of them is NaN"""
+    X1 = _asArray(X1)
+    X2 = _asArray(X2)
+    ok = (X1 == X1) & (X2 == X2)
+    return X1[ok], X2[ok]
+
+
+def hasArrayKernel(operator) -> bool:
+    """Check if an operator provides its own array-level execution
+
+    Operators which only implement `execute` (e.g. user-defined operators)
+    are run observation-wise on the track itself.
+
+    :param operator: An operator object
+    :return: True if operator class overrides `executeArray`
+    """
+    for cls in type(operator).__mro__:
+        if cls in _ABSTRACT_OPERATORS:
+            return False
+        if "executeArray" in cls.__dict__:
+            return True
+    return False
+
+
 class UnaryOperator:
     """Abstract Class to define a Unary Operator"""
 
@@ -66,6 +129,16 @@ class UnaryOperator:
         """
         raise NotYetImplementedError("Not yet implemented")
 
+    def executeArray(self, X):
+        """Execution of the operator on an array of values
+
+        Default implementation runs :func:`execute` on a temporary track.
+
+        :param X: Array of values
+        :return: Output value of the operator
+        """
+        return self.execute(_arrayTrack(_asArray(X)), "#0")
+
 
 class BinaryOperator:
     """Abstract Class to define a Binary Operator"""
@@ -80,6 +153,17 @@ class BinaryOperator:
         """
         raise NotYetImplementedError("Not yet implemented")
 
+    def executeArray(self, X1, X2):
+        """Execution of the operator on arrays of values
+
+        Default implementation runs :func:`execute` on a temporary track.
+
+        :param X1: Array of values
+        :param X2: Array of values
+        :return: Output value of the operator
+        """
+        return self.execute(_arrayTrack(_asArray(X1), _asArray(X2)), "#0", "#1")
+
 
 class UnaryVoidOperator:
     """Abstract Class to define a Unary Void Operator"""
@@ -94,6 +178,20 @@ class UnaryVoidOperator:
         """
         raise NotYetImplementedError("Not yet implemented")
 
+    def executeArray(self, X):
+        """Execution of the operator on an array of values
+
+        Default implementation runs :func:`execute` on a temporary track.
+
+        :param X: Array of values
+        :return: Array of output values
+        """
+        if len(X) == 0:
+            return np.empty(0)
+        track = _arrayTrack(_asArray(X))
+        self.execute(track, "#0", "#out")
+        return _asArray(track.getAnalyticalFeature("#out")).copy()
+
 
 class BinaryVoidOperator:
     """Abstract Class to define a Binary Void Operator"""
@@ -109,6 +207,21 @@ class BinaryVoidOperator:
         """
         raise NotYetImplementedError("Not yet implemented")
 
+    def executeArray(self, X1, X2):
+        """Execution of the operator on arrays of values
+
+        Default implementation runs :func:`execute` on a temporary track.
+
+        :param X1: Array of values
+        :param X2: Array of values
+        :return: Array of output values
+        """
+        if len(X1) == 0:
+            return np.empty(0)
+        track = _arrayTrack(_asArray(X1), _asArray(X2))
+        self.execute(track, "#0", "#1", "#out")
+        return _asArray(track.getAnalyticalFeature("#out")).copy()
+
 
 class ScalarOperator:
     """Abstract Class to define a Scalar Operator"""
@@ -117,12 +230,24 @@ class ScalarOperator:
     def execute(self, track, af_input1, arg):
         """Execution of the operator
 
-        :param track: TODO
-        :param af_input1: TODO
-        :param arg: TODO
+        :param track: Track to process
+        :param af_input1: Name of the input analytical feature
+        :param arg: Parameter of the operator (e.g. a number, a function or
+            a kernel, None if the operator has none)
         """
         NotYetImplementedError("Not yet implemented")
 
+    def executeArray(self, X, arg):
+        """Execution of the operator on an array of values
+
+        Default implementation runs :func:`execute` on a temporary track.
+
+        :param X: Array of values
+        :param arg: Parameter of the operator, passed through to :func:`execute`
+        :return: Output value of the operator
+        """
+        return self.execute(_arrayTrack(_asArray(X)), "#0", arg)
+
 
 class ScalarVoidOperator:
     """Abstract Class to define a Scalar Void Operator"""
@@ -131,13 +256,32 @@ class ScalarVoidOperator:
     def execute(self, track, af_input1, arg, af_output):
         """Execution of the operator
 
-        :param track: TODO
-        :param af_input1: TODO
-        :param arg: TODO
-        :param af_output:
+        :param track: Track to process
+        :param af_input1: Name of the input analytical feature
+        :param arg: Parameter of the operator (e.g. a number, a function or
+            a kernel, None if the operator has none)
+        :param af_output: Name of the output analytical feature
         """
         NotYetImplementedError("Not yet implemented")
 
+    def executeArray(self, X, arg):
+        """Execution of the operator on an array of values
+
+        Default implementation runs :func:`execute` on a temporary track.
+
+        :param X: Array of values
+        :param arg: Parameter of the operator, passed through to :func:`execute`
+        :return: Array of output values
+        """
+        if len(X) == 0:
+            return np.empty(0)
+        track = _arrayTrack(_asArray(X))
+        self.execute(track, "#0", arg, "#out")
+        return _asArray(track.getAnalyticalFeature("#out")).copy()
+
+
+_ABSTRACT_OPERATORS = (UnaryOperator, BinaryOperator, UnaryVoidOperator,
+                       BinaryVoidOperator, ScalarOperator, ScalarVoidOperator)
 
 
 # -----------------------------------------------------------------------------
@@ -157,6 +301,10 @@ class Identity(UnaryVoidOperator):
         f = lambda x: x
         return track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X):
+        """Execute the Identity operator on an array of values"""
+        return _asArray(X).copy()
+
 
 class Integrator(UnaryVoidOperator):
     """Integrator operator"""
@@ -176,6 +324,13 @@ class Integrator(UnaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X):
+        """Execute the Integrator operator on an array of values"""
+        X = _asArray(X)
+        out = np.zeros(len(X))
+        out[1:] = np.cumsum(X[1:])
+        return out
+
 
 class Differentiator(UnaryVoidOperator):
     """Differentiator Operator"""
@@ -198,6 +353,13 @@ class Differentiator(UnaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X):
+        """Execute the Differentiator operator on an array of values"""
+        X = _asArray(X)
+        out = np.full(len(X), NAN)
+        out[1:] = X[1:] - X[:-1]
+        return out
+
 
 class ForwardFiniteDiff(UnaryVoidOperator):
     """ForwardFiniteDiff Operator"""
@@ -220,6 +382,13 @@ class ForwardFiniteDiff(UnaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X):
+        """Execute the ForwardFiniteDiff operator on an array of values"""
+        X = _asArray(X)
+        out = np.full(len(X), NAN)
+        out[:-1] = X[1:] - X[:-1]
+        return out
+
 
 class BackwardFiniteDiff(UnaryVoidOperator):
     """BackwardFiniteDiff Operator"""
@@ -242,6 +411,10 @@ class BackwardFiniteDiff(UnaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X):
+        """Execute the BackwardFiniteDiff operator on an array of values"""
+        return Operator.DIFFERENTIATOR.executeArray(X)
+
 
 class CenteredFiniteDiff(UnaryVoidOperator):
     """CenteredFiniteDiff Operator"""
@@ -265,6 +438,13 @@ class CenteredFiniteDiff(UnaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X):
+        """Execute the CenteredFiniteDiff operator on an array of values"""
+        X = _asArray(X)
+        out = np.full(len(X), NAN)
+        out[1:-1] = X[2:] - X[:-2]
+        return out
+
 
 class SecondOrderFiniteDiff(UnaryVoidOperator):
     """SecondOrderFiniteDiff Operator"""
@@ -288,6 +468,15 @@ class SecondOrderFiniteDiff(UnaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X):
+        """Execute the SecondOrderFiniteDiff operator on an array of values"""
+        X = _asArray(X)
+        out = np.full(len(X), NAN)
+        out[1:-1] = X[2:] - 2 * X[1:-1] + X[:-2]
+        if len(X) > 0:
+            out[0] = NAN
+        return out
+
 
 class ShiftRight(UnaryVoidOperator):
     """ShiftRight Operator"""
@@ -301,6 +490,10 @@ class ShiftRight(UnaryVoidOperator):
         :return: TODO
         """
         return track.operate(Operator.SHIFT, af_input, +1, af_output)
+
+    def executeArray(self, X):
+        """Execute the ShiftRight operator on an array of values"""
+        return Operator.SHIFT.executeArray(X, +1)
 		
 class ShiftCircularRight(UnaryVoidOperator):
     """ShiftRight Operator"""
@@ -315,6 +508,10 @@ class ShiftCircularRight(UnaryVoidOperator):
         """
         return track.operate(Operator.SHIFT_CIRCULAR, af_input, +1, af_output)
 
+    def executeArray(self, X):
+        """Execute the ShiftCircularRight operator on an array of values"""
+        return Operator.SHIFT_CIRCULAR.executeArray(X, +1)
+
 
 class ShiftLeft(UnaryVoidOperator):
     """ShiftLeft Operator"""
@@ -328,6 +525,10 @@ class ShiftLeft(UnaryVoidOperator):
         :return: TODO
         """
         return track.operate(Operator.SHIFT, af_input, -1, af_output)
+
+    def executeArray(self, X):
+        """Execute the ShiftLeft operator on an array of values"""
+        return Operator.SHIFT.executeArray(X, -1)
 		
 class ShiftCircularLeft(UnaryVoidOperator):
     """ShiftLeft Operator"""
@@ -342,6 +543,10 @@ class ShiftCircularLeft(UnaryVoidOperator):
         """
         return track.operate(Operator.SHIFT_CIRCULAR, af_input, -1, af_output)
 
+    def executeArray(self, X):
+        """Execute the ShiftCircularLeft operator on an array of values"""
+        return Operator.SHIFT_CIRCULAR.executeArray(X, -1)
+
 
 class Inverter(UnaryVoidOperator):
     """Inverter Operator"""
@@ -357,6 +562,10 @@ class Inverter(UnaryVoidOperator):
         f = lambda x: -x
         return track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X):
+        """Execute the Inverter operator on an array of values"""
+        return -_asArray(X)
+
 
 class Inverser(UnaryVoidOperator):
     """Inverser Operator"""
@@ -371,6 +580,10 @@ class Inverser(UnaryVoidOperator):
         """
         f = lambda x: 1.0 / x
         return track.operate(Operator.APPLY, af_input, f, af_output)
+
+    def executeArray(self, X):
+        """Execute the Inverser operator on an array of values"""
+        return _divide(1.0, _asArray(X))
 		
 class Reverser(UnaryVoidOperator):
     """Reverser Operator"""
@@ -388,6 +601,10 @@ class Reverser(UnaryVoidOperator):
             temp[i] = track.getObsAnalyticalFeature(af_input, track.size()-i-1)
         track[af_output] = temp
 
+    def executeArray(self, X):
+        """Execute the Reverser operator on an array of values"""
+        return _asArray(X)[::-1].copy()
+
 
 class Rectifier(UnaryVoidOperator):
     """Rectifier Operator"""
@@ -403,6 +620,11 @@ class Rectifier(UnaryVoidOperator):
         f = lambda x: -x * (x < 0) + x * (x > 0)
         return track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X):
+        """Execute the Rectifier operator on an array of values"""
+        X = _asArray(X)
+        return -X * (X < 0) + X * (X > 0)
+
 
 class Debiaser(UnaryVoidOperator):
     """Debiaser Operator"""
@@ -418,6 +640,11 @@ class Debiaser(UnaryVoidOperator):
         mean = track.operate(Operator.AVERAGER, af_input)
         return track.operate(Operator.SCALAR_ADDER, af_input, -mean, af_output)
 
+    def executeArray(self, X):
+        """Execute the Debiaser operator on an array of values"""
+        X = _asArray(X)
+        return X + (-Operator.AVERAGER.executeArray(X))
+
 
 class Normalizer(UnaryVoidOperator):
     """Normalizer Operator"""
@@ -435,6 +662,13 @@ class Normalizer(UnaryVoidOperator):
         f = lambda x: (x - mean) / sigma
         return track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X):
+        """Execute the Normalizer operator on an array of values"""
+        X = _asArray(X)
+        mean = Operator.AVERAGER.executeArray(X)
+        sigma = Operator.STDDEV.executeArray(X)
+        return _divide(X - mean, sigma)
+
 
 class Square(UnaryVoidOperator):
     """Square Operator"""
@@ -450,6 +684,11 @@ class Square(UnaryVoidOperator):
         f = lambda x: x * x
         return track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X):
+        """Execute the Square operator on an array of values"""
+        X = _asArray(X)
+        return X * X
+
 
 class Sqrt(UnaryVoidOperator):
     """Sqrt Operator"""
@@ -464,6 +703,11 @@ class Sqrt(UnaryVoidOperator):
         """
         return track.operate(Operator.APPLY, af_input, math.sqrt, af_output)
 
+    def executeArray(self, X):
+        """Execute the Sqrt operator on an array of values"""
+        with np.errstate(invalid="ignore"):
+            return np.sqrt(_asArray(X))
+
 
 class Diode(UnaryVoidOperator):
     """Diode Operator"""
@@ -479,6 +723,11 @@ class Diode(UnaryVoidOperator):
         f = lambda x: x * (x > 0)
         return track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X):
+        """Execute the Diode operator on an array of values"""
+        X = _asArray(X)
+        return X * (X > 0)
+
 
 class Sign(UnaryVoidOperator):
     """Sign Operator"""
@@ -494,6 +743,11 @@ class Sign(UnaryVoidOperator):
         f = lambda x: 1 * (x >= 0) - 1 * (x < 0)
         return track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X):
+        """Execute the Sign operator on an array of values"""
+        X = _asArray(X)
+        return 1 * (X >= 0) - 1 * (X < 0)
+
 
 class Exp(UnaryVoidOperator):
     """Exp Operator"""
@@ -508,6 +762,11 @@ class Exp(UnaryVoidOperator):
         """
         return track.operate(Operator.APPLY, af_input, math.exp, af_output)
 
+    def executeArray(self, X):
+        """Execute the Exp operator on an array of values"""
+        with np.errstate(over="ignore"):
+            return np.exp(_asArray(X))
+
 
 class Log(UnaryVoidOperator):
     """Log Operator"""
@@ -529,6 +788,14 @@ class Log(UnaryVoidOperator):
                 temp[i] = 0
         track[af_output] = temp
 
+    def executeArray(self, X):
+        """Execute the Log operator on an array of values"""
+        X = _asArray(X)
+        out = np.zeros(len(X))
+        positive = X > 0
+        out[positive] = np.log(X[positive])
+        return out
+
 
 class Cos(UnaryVoidOperator):
     """Cos Operator"""
@@ -543,6 +810,10 @@ class Cos(UnaryVoidOperator):
         """
         return track.operate(Operator.APPLY, af_input, math.cos, af_output)
 
+    def executeArray(self, X):
+        """Execute the Cos operator on an array of values"""
+        return np.cos(_asArray(X))
+
 
 class Sin(UnaryVoidOperator):
     """Sin operator"""
@@ -557,6 +828,10 @@ class Sin(UnaryVoidOperator):
         """
         return track.operate(Operator.APPLY, af_input, math.sin, af_output)
 
+    def executeArray(self, X):
+        """Execute the Sin operator on an array of values"""
+        return np.sin(_asArray(X))
+
 
 class Tan(UnaryVoidOperator):
     """Tan Operator"""
@@ -571,6 +846,10 @@ class Tan(UnaryVoidOperator):
         """
         return track.operate(Operator.APPLY, af_input, math.tan, af_output)
 
+    def executeArray(self, X):
+        """Execute the Tan operator on an array of values"""
+        return np.tan(_asArray(X))
+
 
 # -----------------------------------------------------------------------------
 #      BinaryVoidOperator
@@ -596,6 +875,10 @@ class Adder(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Adder operator on arrays of values"""
+        return _asArray(X1) + _asArray(X2)
+
 
 class Substracter(BinaryVoidOperator):
     """Substracter Operator"""
@@ -618,6 +901,10 @@ class Substracter(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Substracter operator on arrays of values"""
+        return _asArray(X1) - _asArray(X2)
+
 
 class Multiplier(BinaryVoidOperator):
     """Multiplier Operator"""
@@ -639,6 +926,10 @@ class Multiplier(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Multiplier operator on arrays of values"""
+        return _asArray(X1) * _asArray(X2)
+
 
 class Divider(BinaryVoidOperator):
     """Divider Operator"""
@@ -664,6 +955,10 @@ class Divider(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Divider operator on arrays of values"""
+        return _divide(_asArray(X1), _asArray(X2))
+
 
 class Power(BinaryVoidOperator):
     """Power operator"""
@@ -686,6 +981,11 @@ class Power(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Power operator on arrays of values"""
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            return _asArray(X1) ** _asArray(X2)
+
 
 class Modulo(BinaryVoidOperator):
     """Modulo Operator"""
@@ -708,6 +1008,11 @@ class Modulo(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Modulo operator on arrays of values"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return _asArray(X1) % _asArray(X2)
+
 
 class Above(BinaryVoidOperator):
     """Above Operator"""
@@ -731,6 +1036,10 @@ class Above(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Above operator on arrays of values"""
+        return 0.0 + (_asArray(X1) > _asArray(X2))
+
 
 class Below(BinaryVoidOperator):
     """Below Operator"""
@@ -754,6 +1063,10 @@ class Below(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Below operator on arrays of values"""
+        return 0.0 + (_asArray(X1) < _asArray(X2))
+
 
 class QuadraticAdder(BinaryVoidOperator):
     """Quadratic Adder Operator"""
@@ -776,6 +1089,10 @@ class QuadraticAdder(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Quadratic Adder operator on arrays of values"""
+        return (_asArray(X1) ** 2 + _asArray(X2) ** 2) ** 0.5
+
 
 class Derivator(BinaryVoidOperator):
     """Derivator Operator"""
@@ -802,6 +1119,14 @@ class Derivator(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Derivator operator on arrays of values"""
+        X1 = _asArray(X1)
+        X2 = _asArray(X2)
+        out = np.zeros(len(X1))
+        out[1:] = _divide(X1[1:] - X1[:-1], X2[1:] - X2[:-1])
+        return out
+
 
 class Renormalizer(BinaryVoidOperator):
     """Renormalizer Operator"""
@@ -829,6 +1154,16 @@ class Renormalizer(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Renormalizer operator on arrays of values"""
+        X1 = _asArray(X1)
+        X2 = _asArray(X2)
+        m1 = Operator.AVERAGER.executeArray(X1)
+        m2 = Operator.AVERAGER.executeArray(X2)
+        s1 = Operator.STDDEV.executeArray(X1)
+        s2 = Operator.STDDEV.executeArray(X2)
+        return _divide((X1 - m1) * s2, s1) + m2
+
 
 class PointwiseEqualer(BinaryVoidOperator):
     """Pointwiser Equaler Operator"""
@@ -852,6 +1187,10 @@ class PointwiseEqualer(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Pointwise Equaler operator on arrays of values"""
+        return 0.0 + (_asArray(X1) == _asArray(X2))
+
 
 class Convolution(BinaryVoidOperator):
     """Convolution Operator"""
@@ -871,6 +1210,12 @@ class Convolution(BinaryVoidOperator):
         temp = np.abs(np.fft.ifft(H * np.conj(G)))
         addListToAF(track, af_output, temp)
         return temp
+
+    def executeArray(self, X1, X2):
+        """Execute the Convolution operator on arrays of values"""
+        H = np.fft.fft(_asArray(X1))
+        G = np.fft.fft(_asArray(X2))
+        return np.abs(np.fft.ifft(H * np.conj(G)))
 		
 class Correlator(BinaryVoidOperator):
     """Correlator Operator"""
@@ -892,6 +1237,16 @@ class Correlator(BinaryVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X1, X2):
+        """Execute the Correlator operator on arrays of values"""
+        X1 = _asArray(X1)
+        X2 = _asArray(X2)
+        out = np.zeros(len(X1))
+        for i in range(len(X1)):
+            shifted = Operator.SHIFT_CIRCULAR.executeArray(X1, i)
+            out[i] = Operator.CORRELATION.executeArray(shifted, X2)
+        return out
+
 
 # -----------------------------------------------------------------------------
 #      UnaryOperator
@@ -908,6 +1263,12 @@ class Min(UnaryOperator):
                 minimum = val
         return minimum
 
+    def executeArray(self, X):
+        """Execute the Min operator on an array of values"""
+        X = _valid(_asArray(X))
+        X = X[X < +1e300]
+        return X.min().item() if len(X) > 0 else +1e300
+
 
 class Max(UnaryOperator):
     """TODO"""
@@ -921,6 +1282,12 @@ class Max(UnaryOperator):
                 maximum = val
         return maximum
 
+    def executeArray(self, X):
+        """Execute the Max operator on an array of values"""
+        X = _valid(_asArray(X))
+        X = X[X > -1e300]
+        return X.max().item() if len(X) > 0 else -1e300
+
 
 class Argmin(UnaryOperator):
     """TODO"""
@@ -936,6 +1303,14 @@ class Argmin(UnaryOperator):
                 idmin = i
         return idmin
 
+    def executeArray(self, X):
+        """Execute the Argmin operator on an array of values"""
+        X = _asArray(X)
+        candidates = np.nonzero(X < +1e300)[0]
+        if len(candidates) == 0:
+            return 0
+        return int(candidates[np.argmin(X[candidates])])
+
 
 class Argmax(UnaryOperator):
     """TODO"""
@@ -951,6 +1326,14 @@ class Argmax(UnaryOperator):
                 idmax = i
         return idmax
 
+    def executeArray(self, X):
+        """Execute the Argmax operator on an array of values"""
+        X = _asArray(X)
+        candidates = np.nonzero(X > -1e300)[0]
+        if len(candidates) == 0:
+            return 0
+        return int(candidates[np.argmax(X[candidates])])
+
 
 class Median(UnaryOperator):
     """TODO"""
@@ -967,6 +1350,15 @@ class Median(UnaryOperator):
         else:
             return vals[sort_index[(int)(N // 2)]]
 
+    def executeArray(self, X):
+        """Execute the Median operator on an array of values"""
+        X = _asArray(X)
+        sort_index = np.argsort(X)
+        N = len(sort_index)
+        if N % 2 == 0:
+            return 0.5 * (X[sort_index[N // 2 - 1]] + X[sort_index[N // 2]]).item()
+        return X[sort_index[N // 2]].item()
+
 
 class Zeros(UnaryOperator):
     """TODO"""
@@ -979,6 +1371,10 @@ class Zeros(UnaryOperator):
                 zeros.append(i)
         return zeros
 
+    def executeArray(self, X):
+        """Execute the Zeros operator on an array of values"""
+        return np.nonzero(np.abs(_asArray(X)) == 0)[0].tolist()
+
 
 class Sum(UnaryOperator):
     """TODO"""
@@ -993,6 +1389,10 @@ class Sum(UnaryOperator):
             somme += track.getObsAnalyticalFeature(af_input, i)
         return somme
 
+    def executeArray(self, X):
+        """Execute the Sum operator on an array of values"""
+        return _valid(_asArray(X)).sum().item()
+
 
 class Averager(UnaryOperator):
     """The average operator: y = mean(x)"""
@@ -1009,6 +1409,11 @@ class Averager(UnaryOperator):
             mean += track.getObsAnalyticalFeature(af_input, i)
         return mean / count
 
+    def executeArray(self, X):
+        """Execute the Averager operator on an array of values"""
+        X = _valid(_asArray(X))
+        return X.sum().item() / len(X)
+
 
 class Variance(UnaryOperator):
     """TODO"""
@@ -1026,6 +1431,13 @@ class Variance(UnaryOperator):
             var += (track.getObsAnalyticalFeature(af_input, i) - mean) ** 2
         return var / count
 
+    def executeArray(self, X):
+        """Execute the Variance operator on an array of values"""
+        X = _asArray(X)
+        mean = Operator.AVERAGER.executeArray(X)
+        X = _valid(X)
+        return ((X - mean) ** 2).sum().item() / len(X)
+
 
 class StdDev(UnaryOperator):
     """TODO"""
@@ -1034,6 +1446,10 @@ class StdDev(UnaryOperator):
         """TODO"""
         return math.sqrt(track.operate(Operator.VARIANCE, af_input))
 
+    def executeArray(self, X):
+        """Execute the StdDev operator on an array of values"""
+        return math.sqrt(Operator.VARIANCE.executeArray(X))
+
 
 class Mse(UnaryOperator):
     """TODO"""
@@ -1050,6 +1466,11 @@ class Mse(UnaryOperator):
             mse += track.getObsAnalyticalFeature(af_input, i) ** 2
         return mse / count
 
+    def executeArray(self, X):
+        """Execute the Mse operator on an array of values"""
+        X = _valid(_asArray(X))
+        return (X ** 2).sum().item() / len(X)
+
 
 class Rmse(UnaryOperator):
     """Rmse Operator"""
@@ -1058,6 +1479,10 @@ class Rmse(UnaryOperator):
         """Execution of Rmse operator"""
         return math.sqrt(track.operate(Operator.MSE, af_input))
 
+    def executeArray(self, X):
+        """Execute the Rmse operator on an array of values"""
+        return math.sqrt(Operator.MSE.executeArray(X))
+
 
 class Mad(UnaryOperator):
     """TODO"""
@@ -1079,6 +1504,14 @@ class Mad(UnaryOperator):
         else:
             return AD[sort_index[(int)(N / 2 - 1)]]
 
+    def executeArray(self, X):
+        """Execute the Mad operator on an array of values"""
+        AD = np.sort(np.abs(_valid(_asArray(X))))
+        N = len(AD)
+        if N % 2 == 0:
+            return 0.5 * (AD[(int)(N / 2 - 1)] + AD[(int)(N / 2)]).item()
+        return AD[(int)(N / 2 - 1)].item()
+
 
 # -----------------------------------------------------------------------------
 #      BinaryOperator
@@ -1101,6 +1534,15 @@ class Covariance(BinaryOperator):
             count += 1
         return rho / count
 
+    def executeArray(self, X1, X2):
+        """Execute the Covariance operator on arrays of values"""
+        X1 = _asArray(X1)
+        X2 = _asArray(X2)
+        m1 = Operator.AVERAGER.executeArray(X1)
+        m2 = Operator.AVERAGER.executeArray(X2)
+        ok = (X1 == X1) & (X2 == X2)
+        return ((X1[ok] - m1) * (X2[ok] - m2)).sum().item() / int(np.count_nonzero(ok))
+
 
 class Correlation(BinaryOperator):
     """TODO"""
@@ -1111,6 +1553,12 @@ class Correlation(BinaryOperator):
         s2 = track.operate(Operator.STDDEV, af_input2)
         return track.operate(Operator.COVARIANCE, af_input1, af_input2) / (s1 * s2)
 
+    def executeArray(self, X1, X2):
+        """Execute the Correlation operator on arrays of values"""
+        s1 = Operator.STDDEV.executeArray(X1)
+        s2 = Operator.STDDEV.executeArray(X2)
+        return Operator.COVARIANCE.executeArray(X1, X2) / (s1 * s2)
+
 
 class L0Diff(BinaryOperator):
     """TODO"""
@@ -1128,6 +1576,11 @@ class L0Diff(BinaryOperator):
             ecart += 1
         return ecart
 
+    def executeArray(self, X1, X2):
+        """Execute the L0Diff operator on arrays of values"""
+        X1, X2 = _validPairs(X1, X2)
+        return int(np.count_nonzero(X1 != X2))
+
 
 class L1Diff(BinaryOperator):
     """TODO"""
@@ -1145,6 +1598,11 @@ class L1Diff(BinaryOperator):
             ecart += abs(x1 - x2)
         return ecart / count
 
+    def executeArray(self, X1, X2):
+        """Execute the L1Diff operator on arrays of values"""
+        X1, X2 = _validPairs(X1, X2)
+        return np.abs(X1 - X2).sum().item() / len(X1)
+
 
 class L2Diff(BinaryOperator):
     """TODO"""
@@ -1162,6 +1620,11 @@ class L2Diff(BinaryOperator):
             ecart += (x1 - x2) ** 2
         return math.sqrt(ecart / count)
 
+    def executeArray(self, X1, X2):
+        """Execute the L2Diff operator on arrays of values"""
+        X1, X2 = _validPairs(X1, X2)
+        return math.sqrt(((X1 - X2) ** 2).sum().item() / len(X1))
+
 
 class LInfDiff(BinaryOperator):
     """TODO"""
@@ -1179,6 +1642,13 @@ class LInfDiff(BinaryOperator):
                 ecart = val
         return ecart
 
+    def executeArray(self, X1, X2):
+        """Execute the LInfDiff operator on arrays of values"""
+        X1, X2 = _validPairs(X1, X2)
+        if len(X1) == 0:
+            return 0
+        return max(np.abs(X1 - X2).max().item(), 0)
+
 
 class Equal(BinaryOperator):
     """TODO"""
@@ -1194,6 +1664,13 @@ class Equal(BinaryOperator):
                 return False
         return True
 
+    def executeArray(self, X1, X2):
+        """Execute the Equal operator on arrays of values"""
+        X1 = _asArray(X1)
+        X2 = _asArray(X2)
+        both_nan = (X1 != X1) & (X2 != X2)
+        return bool(np.all((X1 == X2) | both_nan))
+
 
 # -----------------------------------------------------------------------------
 #      ScalarOperator
@@ -1208,6 +1685,10 @@ class Aggregate(ScalarOperator):
             temp[i] = track.getObsAnalyticalFeature(af_input, i)
         return function(temp)
 
+    def executeArray(self, X, function):
+        """Execute the Aggregate operator on an array of values"""
+        return function(_asArray(X).tolist())
+
 
 # -----------------------------------------------------------------------------
 #      ScalarVoidOperator
@@ -1227,6 +1708,16 @@ class Shift(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the Shift operator on an array of values"""
+        X = _asArray(X)
+        n = len(X)
+        out = np.full(n, NAN, dtype=X.dtype)
+        source = np.arange(n) - number
+        ok = (source >= 0) & (source < n)
+        out[ok] = X[source[ok].astype(int)]
+        return out
+
 
 class ShiftCircular(ScalarVoidOperator):
     """TODO"""
@@ -1240,6 +1731,12 @@ class ShiftCircular(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ShiftCircular operator on an array of values"""
+        X = _asArray(X)
+        n = len(X)
+        return X[((np.arange(n) - number) % n).astype(int)] if n > 0 else X.copy()
+
 
 class ShiftRev(ScalarVoidOperator):
     """TODO"""
@@ -1247,6 +1744,10 @@ class ShiftRev(ScalarVoidOperator):
     def execute(self, track, af_input, number, af_output):
         """TODO"""
         return track.operate(Operator.SHIFT, af_input, -number, af_output)
+
+    def executeArray(self, X, number):
+        """Execute the ShiftRev operator on an array of values"""
+        return Operator.SHIFT.executeArray(X, -number)
 		
 class ShiftCircularRev(ScalarVoidOperator):
     """TODO"""
@@ -1255,6 +1756,10 @@ class ShiftCircularRev(ScalarVoidOperator):
         """TODO"""
         return track.operate(Operator.SHIFT_CIRCULAR, af_input, -number, af_output)
 
+    def executeArray(self, X, number):
+        """Execute the ShiftCircularRev operator on an array of values"""
+        return Operator.SHIFT_CIRCULAR.executeArray(X, -number)
+
 
 class ScalarAdder(ScalarVoidOperator):
     """TODO"""
@@ -1268,6 +1773,10 @@ class ScalarAdder(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarAdder operator on an array of values"""
+        return _asArray(X) + number
+
 
 class ScalarSubstracter(ScalarVoidOperator):
     """TODO"""
@@ -1281,6 +1790,10 @@ class ScalarSubstracter(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarSubstracter operator on an array of values"""
+        return _asArray(X) - number
+
 
 class ScalarRevSubstracter(ScalarVoidOperator):
     """TODO"""
@@ -1294,6 +1807,10 @@ class ScalarRevSubstracter(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarRevSubstracter operator on an array of values"""
+        return number - _asArray(X)
+
 
 class ScalarMuliplier(ScalarVoidOperator):
     """TODO"""
@@ -1307,6 +1824,10 @@ class ScalarMuliplier(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarMuliplier operator on an array of values"""
+        return _asArray(X) * number
+
 
 class ScalarDivider(ScalarVoidOperator):
     """TODO"""
@@ -1317,6 +1838,10 @@ class ScalarDivider(ScalarVoidOperator):
             Operator.SCALAR_MULTIPLIER, af_input, 1.0 / number, af_output
         )
 
+    def executeArray(self, X, number):
+        """Execute the ScalarDivider operator on an array of values"""
+        return _asArray(X) * (1.0 / number)
+
 
 class ScalarRevDivider(ScalarVoidOperator):
     """TODO"""
@@ -1326,6 +1851,11 @@ class ScalarRevDivider(ScalarVoidOperator):
         track.operate(Operator.INVERSER, af_input, af_output)
         return track.operate(Operator.SCALAR_MULTIPLIER, af_output, number, af_output)
 
+    def executeArray(self, X, number):
+        """Execute the ScalarRevDivider operator on an array of values"""
+        with np.errstate(divide="ignore"):
+            return (1.0 / _asArray(X)) * number
+
 
 class ScalarPower(ScalarVoidOperator):
     """TODO"""
@@ -1339,6 +1869,11 @@ class ScalarPower(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarPower operator on an array of values"""
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            return _asArray(X) ** number
+
 
 class ScalarModulo(ScalarVoidOperator):
     """TODO"""
@@ -1352,6 +1887,11 @@ class ScalarModulo(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarModulo operator on an array of values"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return _asArray(X) % number
+
 
 class ScalarBelow(ScalarVoidOperator):
     """TODO"""
@@ -1365,6 +1905,10 @@ class ScalarBelow(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarBelow operator on an array of values"""
+        return _asArray(X) < number
+
 
 class ScalarRevBelow(ScalarVoidOperator):
     """TODO"""
@@ -1378,6 +1922,10 @@ class ScalarRevBelow(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarRevBelow operator on an array of values"""
+        return number < _asArray(X)
+
 
 class ScalarAbove(ScalarVoidOperator):
     """TODO"""
@@ -1391,6 +1939,10 @@ class ScalarAbove(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarAbove operator on an array of values"""
+        return _asArray(X) > number
+
 
 class ScalarRevAbove(ScalarVoidOperator):
     """TODO"""
@@ -1404,6 +1956,10 @@ class ScalarRevAbove(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarRevAbove operator on an array of values"""
+        return number > _asArray(X)
+
 
 class ScalarRevPower(ScalarVoidOperator):
     """TODO"""
@@ -1417,6 +1973,11 @@ class ScalarRevPower(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarRevPower operator on an array of values"""
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            return number ** _asArray(X)
+
 
 class ScalarRevModulo(ScalarVoidOperator):
     """TODO"""
@@ -1430,6 +1991,11 @@ class ScalarRevModulo(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, number):
+        """Execute the ScalarRevModulo operator on an array of values"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return number % _asArray(X)
+
 
 class Thresholder(ScalarVoidOperator):
     """TODO"""
@@ -1439,6 +2005,11 @@ class Thresholder(ScalarVoidOperator):
         f = lambda x: x * (x < number) + number * (x >= number)
         track.operate(Operator.APPLY, af_input, f, af_output)
 
+    def executeArray(self, X, number):
+        """Execute the Thresholder operator on an array of values"""
+        X = _asArray(X)
+        return X * (X < number) + number * (X >= number)
+
 
 class Apply(ScalarVoidOperator):
     """TODO"""
@@ -1452,6 +2023,10 @@ class Apply(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, function):
+        """Execute the Apply operator on an array of values"""
+        return _asArray([function(x) for x in _asArray(X).tolist()])
+
 
 class Filter(ScalarVoidOperator):
     """TODO"""
@@ -1515,6 +2090,51 @@ class Filter(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, kernel):
+        """Execute the Filter operator on an array of values"""
+        X = _asArray(X)
+
+        # Preparing kernel
+        boundary = False
+        if isinstance(kernel, Kernel):
+            boundary = kernel.filterBoundary()
+            if (str(kernel) == 'Dirac kernel'):
+                kernel = [0,1,0]
+            else:
+                kernel = kernel.toSlidingWindow()
+            kernel = np.array(kernel, dtype=float)
+        else:
+            kernel = np.array(kernel, dtype=float)
+            kernel = kernel / np.sum(kernel)
+        N = len(kernel)
+        if N % 2 == 0:
+            raise KernelError(
+                "Error: kernel must contain an odd number of values in '"
+                + type(self).__name__
+                + "' operator"
+            )
+        D = (int)(N / 2)
+        n = len(X)
+
+        # Filtering (accumulated in the same order as execute)
+        padded = np.full(n + 2 * D, NAN)
+        padded[D:D+n] = X
+        temp = np.zeros(n)
+        norm = np.zeros(n)
+        for j in range(N):
+            val = padded[2 * D - j: 2 * D - j + n]
+            ok = val == val
+            temp[ok] += val[ok] * kernel[j]
+            norm[ok] += kernel[j]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            temp = temp / norm
+
+        # Boundary correction if boundary is filtered
+        if not boundary:
+            temp[:D] = X[:D]
+            temp[max(n - D, 0):] = X[max(n - D, 0):]
+        return temp
+
 
 class Filter_FFT(ScalarVoidOperator):
     """TODO"""
@@ -1568,6 +2188,41 @@ class Filter_FFT(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, kernel):
+        """Execute the Filter_FFT operator on an array of values"""
+        X = _asArray(X)
+
+        # Preparing kernel
+        boundary = True
+        if isinstance(kernel, Kernel):
+            boundary = kernel.filterBoundary()
+            kernel = np.array(kernel.toSlidingWindow(), dtype=float)
+        else:
+            kernel = np.array(kernel, dtype=float)
+            kernel = kernel / np.sum(kernel)
+        N = len(kernel)
+        if N % 2 == 0:
+            raise KernelError(
+                "Error: kernel must contain an odd number of values in '"
+                + type(self).__name__
+                + "' operator"
+            )
+        D = (int)(N / 2)
+        n = len(X)
+
+        # Filtering
+        h = np.concatenate((kernel, np.zeros(n - N)))
+        H = np.fft.fft(h)
+        G = np.fft.fft(X)
+        temp = np.flip(np.real(np.fft.ifft(H * np.conj(G))))
+        temp = np.roll(temp, D)
+
+        # Boundary correction
+        if not boundary:
+            temp[:D] = X[:D]
+            temp[max(n - D, 0):] = X[max(n - D, 0):]
+        return temp
+
 
 class Random(ScalarVoidOperator):
     """TODO"""
@@ -1581,6 +2236,11 @@ class Random(ScalarVoidOperator):
         addListToAF(track, af_output, temp)
         return temp
 
+    def executeArray(self, X, probability):
+        """Execute the Random operator on an array of values"""
+        X = _asArray(X)
+        return np.array([probability() for i in range(len(X))]) + X
+
 
 # -----------------------------------------------------------------------------
 #  Operators
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains the query planner of SQL-like queries on tracks (see
+:func:`Track.query` and :func:`TrackCollection.query`).
+
+A query is compiled once into a plan (cached by query string), then each
+condition of the ``WHERE`` clause is evaluated as a boolean mask over the
+values of an analytical feature, and aggregators are computed with the
+array-level execution of operators.
+
+"""
+
+import re
+import functools
+import numpy as np
+
+from tracklib.util.exceptions import QueryError
+
+from . import ObsTime, compLike, Operator
+
+
+# Order matters: aggregators are recognized by their first match in SELECT
+QUERY_AGGREGATORS = [
+    "SUM",
+    "AVG",
+    "COUNT",
+    "VAR",
+    "MEDIAN",
+    "ARGMIN",
+    "ARGMAX",
+    "MIN",
+    "MAX",
+    "RMSE",
+    "MAD",
+    "STDDEV",
+    "ZEROS",
+]
+
+QUERY_COMPARATORS = ["<", ">", "<=", ">=", "=", "==", "!=", "LIKE"]
+
+_AGGREGATOR_OPERATORS = {
+    "SUM": Operator.SUM,
+    "AVG": Operator.AVERAGER,
+    "VAR": Operator.VARIANCE,
+    "MEDIAN": Operator.MEDIAN,
+    "ARGMIN": Operator.ARGMIN,
+    "ARGMAX": Operator.ARGMAX,
+    "MIN": Operator.MIN,
+    "MAX": Operator.MAX,
+    "RMSE": Operator.RMSE,
+    "MAD": Operator.MAD,
+    "STDDEV": Operator.STDDEV,
+    "ZEROS": Operator.ZEROS,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def compileQuery(cmd: str):
+    """Compile a SQL-like query (see :func:`Track.query`) into a plan
+
+    Compiled plans are cached by query string.
+
+    :param cmd: SQL-like query
+    :return: Plan (fields, aggregators, where) with fields the tuple of
+        selected fields (None for ``SELECT *``), aggregators the tuple of
+        aggregator names (one per field, or empty) and where the tuple of
+        ``OR`` clauses, each one being a tuple of ``AND`` conditions
+        (field, comparator, value), or None without ``WHERE`` clause
+    """
+    cmd = cmd.strip()
+
+    # SELECT clause
+    select_part = cmd.split("SELECT")[1].split("WHERE")[0].strip()
+    fields = None
+    aggregators = []
+    if not select_part == "*":
+        fields = []
+        for field in select_part.split(","):
+            for aggregator in QUERY_AGGREGATORS:
+                if (aggregator + "(") in field:
+                    aggregators.append(aggregator)
+                    field = field.strip()[len(aggregator) + 1 : -1]
+                    break
+            fields.append(field.strip())
+        if (len(aggregators) > 0) and (len(aggregators) != len(fields)):
+            raise QueryError("Error: aggregated and non-aggregated fields can't be mixed.")
+        fields = tuple(fields)
+
+    # WHERE clause
+    temp = cmd.split("WHERE")
+    if len(temp) < 2:
+        return fields, tuple(aggregators), None
+    where_part = temp[1]
+    if ("(" in where_part) or (")" in where_part):
+        message = "Error: parenthesis not allowed in conditions."
+        message += "Use boolean algebra rules to reformulate query or use successive queries"
+        raise QueryError(message)
+
+    where = []
+    for c1 in re.split(r"\s+OR\s+", where_part.strip()):
+        clause = []
+        for c2 in re.split(r"\s+AND\s+", c1.strip()):
+            c3 = c2.strip().split(" ")
+            if len(c3) < 3:
+                raise QueryError("Error: invalid condition '" + c2.strip() + "' in query")
+            if c3[1] not in QUERY_COMPARATORS:
+                raise QueryError("Error: invalid comparison operator '" + c3[1] + "' in query")
+            clause.append((c3[0], c3[1], " ".join(c3[2:])))
+        where.append(tuple(clause))
+
+    return fields, tuple(aggregators), tuple(where)
+
+
+def _condition(val1, operator, val2):
+    """Condition on a single value (with threshold casted to its type)"""
+
+    if operator == "LIKE":
+        return compLike(str(val1), val2)
+
+    # Booleans first (bool is a subclass of int)
+    if isinstance(val1, (bool, np.bool_)):
+        val2 = val2.upper() in ["TRUE", "T", "1"]
+    elif isinstance(val1, int):
+        val2 = int(val2)
+    elif isinstance(val1, float):
+        val2 = float(val2)
+    elif isinstance(val1, ObsTime):
+        val2 = ObsTime.readTimestamp(val2)
+
+    return _compare(val1, operator, val2)
+
+
+def _compare(val1, operator, val2):
+    """Comparison of values (scalars or arrays) with a threshold"""
+    if operator == "<":
+        return val1 < val2
+    if operator == ">":
+        return val1 > val2
+    if operator == "<=":
+        return val1 <= val2
+    if operator == ">=":
+        return val1 >= val2
+    if (operator == "=") or (operator == "=="):
+        return val1 == val2
+    if operator == "!=":
+        return val1 != val2
+
+
+def _conditionMask(track, field, operator, value) -> np.ndarray:
+    """Boolean mask of the observations of a track satisfying a condition"""
+
+    # Timestamps are compared on their number of milliseconds since 1970
+    if (field == "timestamp") and (operator != "LIKE"):
+        T = np.round(np.asarray(track.getT(), dtype=float) * 1000)
+        threshold = round(ObsTime.readTimestamp(value).toAbsTime() * 1000)
+        return _compare(T, operator, threshold)
+
+    values = track.getAnalyticalFeature(field)
+    column = values
+    if not isinstance(column, np.ndarray):
+        try:
+            column = np.asarray(values)
+        except ValueError:
+            column = np.asarray(values, dtype=object)
+
+    if (operator != "LIKE") and (column.ndim == 1):
+        if column.dtype.kind in "fiu":
+            return _compare(column, operator, float(value))
+        if column.dtype.kind == "b":
+            threshold = value.upper() in ["TRUE", "T", "1"]
+            return _compare(column, operator, threshold)
+        if (column.dtype.kind == "U") and all(isinstance(v, str) for v in values):
+            return _compare(column, operator, value)
+
+    # Mixed types and LIKE comparisons: observation-wise evaluation
+    mask = [_condition(values[i], operator, value) for i in range(len(values))]
+    return np.array(mask, dtype=bool)
+
+
+def evaluateWhere(track, where) -> np.ndarray:
+    """Boolean mask of the observations of a track satisfying a WHERE clause
+
+    :param track: A track
+    :param where: WHERE clause of a compiled query (see :func:`compileQuery`)
+    :return: Boolean array (one value per observation)
+    """
+    n = track.size()
+    if where is None:
+        return np.ones(n, dtype=bool)
+    masks = {}
+    output = np.zeros(n, dtype=bool)
+    for clause in where:
+        selected = np.ones(n, dtype=bool)
+        for condition in clause:
+            if condition not in masks:
+                masks[condition] = _conditionMask(track, *condition)
+            selected &= masks[condition]
+            if not selected.any():
+                break
+        output |= selected
+    return output
+
+
+def selectColumns(track, fields, mask) -> list:
+    """Values of the fields of a track on the observations of a mask
+
+    :param track: A track
+    :param fields: Names of the fields (analytical features)
+    :param mask: Boolean array of selected observations
+    :return: List of values (arrays for columnar tracks, lists otherwise)
+    """
+    idx = np.flatnonzero(mask)
+    columns = []
+    for field in fields:
+        values = track.getAnalyticalFeature(field)
+        if isinstance(values, np.ndarray):
+            columns.append(values[idx])
+        else:
+            columns.append([values[i] for i in idx.tolist()])
+    return columns
+
+
+def concatenateColumns(parts):
+    """Concatenation of the values of a field selected in several tracks"""
+    if all(isinstance(values, np.ndarray) for values in parts) and (len(parts) > 0):
+        return np.concatenate(parts)
+    output = []
+    for values in parts:
+        output.extend(values.tolist() if isinstance(values, np.ndarray) else values)
+    return output
+
+
+def evaluateSelect(aggregators, columns):
+    """Output of a query from the values selected for each field
+
+    :param aggregators: Aggregators of a compiled query (see :func:`compileQuery`)
+    :param columns: Values selected for each field (see :func:`selectColumns`)
+    :return: Output of the query (see :func:`Track.query`)
+    """
+    if len(aggregators) == 0:
+        return [values.tolist() if isinstance(values, np.ndarray) else values for values in columns]
+
+    OUTPUT = []
+    for values, aggregator in zip(columns, aggregators):
+        if aggregator == "COUNT":
+            OUTPUT.append(len(values))
+        if len(values) == 0:
+            return None
+        if aggregator != "COUNT":
+            OUTPUT.append(_AGGREGATOR_OPERATORS[aggregator].executeArray(values))
+
+    if len(OUTPUT) == 1:
+        return OUTPUT[0]
+
+    return OUTPUT
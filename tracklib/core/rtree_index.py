@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains a spatial index based on a packed R-tree, built with
+the Sort-Tile-Recursive (STR) algorithm over the segments (and isolated
+observations) of a collection of tracks or of the edges of a network.
+
+Unlike the regular grid of :class:`SpatialIndex`, the nodes of the tree adapt
+to the density of data, which suits skewed data sets (dense in cities and
+sparse in rural areas).
+"""
+
+from __future__ import annotations
+from typing import Any
+from tracklib.util.exceptions import *
+
+import heapq
+import math
+import numpy as np
+import matplotlib.pyplot as plt
+import pickle
+import progressbar
+
+from tracklib.core import (GeoCoords, ENUCoords, TrackCollection)
+from tracklib.core import (Bbox, Track, Edge, makeCoords)
+from tracklib.core.spatial_index import (_pointArrays, _projOnSegments, _dataArray)
+
+
+class RTreeIndex:
+    """
+    Packed R-tree spatial index (STR bulk loading).
+
+    It provides the same requests as :class:`SpatialIndex`. Entries of the
+    tree are the segments of the features (an isolated observation is a
+    degenerated segment). Neighborhoods are expressed in units of a ground
+    resolution, equivalent to the cell size of a grid index.
+    """
+
+    # Maximal number of entries (or children) of a node
+    CAPACITY = 16
+
+    def __init__(self, collection, resolution=None, margin=0.05, verbose=True, capacity=None):
+        """Constructor of :class:`RTreeIndex` class
+
+        :param collection: Collection of tracks, network, or Bbox (empty index)
+        :param resolution: Ground size of a neighborhood unit (a number, or a
+            tuple (xsize, ysize) whose largest value is used). The default is
+            1/100 of the largest side of the extent.
+        :param margin: Relative margin added to the extent of the collection
+        :param verbose: Verbose creation
+        :param capacity: Maximal number of entries of a node (default
+            :attr:`CAPACITY`)
+        """
+        if isinstance(collection, Bbox):
+            bb = collection
+        else:
+            bb = collection.bbox()
+        bb = bb.copy()
+        bb.addMargin(margin)
+        (self.xmin, self.xmax, self.ymin, self.ymax) = bb.asTuple()
+        self.srid = bb.getSrid()
+
+        ax, ay = bb.getDimensions()
+        if resolution is None:
+            resolution = max(ax, ay) / 100
+        elif isinstance(resolution, (tuple, list)):
+            resolution = max(resolution)
+        self.resolution = resolution
+        self.capacity = RTreeIndex.CAPACITY if capacity is None else capacity
+        self.collection = collection
+
+        # Entries (X1, Y1, X2, Y2, data, index of first vertex) not packed yet
+        self.pending = _entries([], [], [])
+        if isinstance(collection, Bbox):
+            self.__pack(self.pending)
+            return
+
+        boucle = range(collection.size())
+        if verbose:
+            print("Building packed R-tree spatial index...")
+            boucle = progressbar.progressbar(boucle)
+        X, Y, N = [], [], []
+        for num in boucle:
+            feature = collection[num]
+            if isinstance(feature, Edge):
+                feature = feature.geom
+            if isinstance(feature, Track) and feature.size() > 0:
+                X.append(np.asarray(feature.getX(), dtype=float))
+                Y.append(np.asarray(feature.getY(), dtype=float))
+                N.append(num)
+        self.__pack(_entries(X, Y, N))
+
+    def __str__(self):
+        """Size, depth and center of the index"""
+        c = [(self.xmin + self.xmax) / 2.0, (self.ymin + self.ymax) / 2.0]
+        output = "[" + str(self.size()) + " entries, " + str(len(self.levels)) + " levels] "
+        output += "R-tree spatial index centered on [" + str(c[0]) + "; " + str(c[1]) + "]"
+        return output
+
+    def size(self) -> int:
+        """Number of entries (segments) in the index"""
+        return self.entries[0].size + self.pending[0].size
+
+    def bbox(self):
+        """
+        Return the spatial extent covered by the index.
+        """
+        if self.srid in ['GEO', 'ENU', 'ECEF']:
+            return Bbox(makeCoords(self.xmin, self.ymin, 0, self.srid),
+                        makeCoords(self.xmax, self.ymax, 0, self.srid))
+        return None
+
+    def covers(self, p):
+        """
+        Returns true if a coord p is in the extent of the index.
+        """
+        if (p.getX() < self.xmin) or (p.getX() > self.xmax):
+            return False
+        if (p.getY() < self.ymin) or (p.getY() > self.ymax):
+            return False
+        return True
+
+    # ------------------------------------------------------------
+    # Construction and update
+    # ------------------------------------------------------------
+    def __pack(self, entries):
+        """Build the tree (STR bulk loading) over a set of entries"""
+        M = self.capacity
+        order = _strOrder(*_boxes(entries), M)
+        self.entries = tuple(array[order] for array in entries)
+        self.pending = _entries([], [], [])
+        self.boxes = _boxes(self.entries)
+
+        # Levels of nodes, from leaves to root: boxes, first child and
+        # number of children (entries for leaves, nodes of lower level else)
+        self.levels = []
+        (BX0, BY0, BX1, BY1) = self.boxes
+        n = BX0.size
+        while n > 0:
+            start = np.arange(0, n, M, dtype=np.int64)
+            count = np.minimum(M, n - start)
+            boxes = (np.minimum.reduceat(BX0, start), np.minimum.reduceat(BY0, start),
+                     np.maximum.reduceat(BX1, start), np.maximum.reduceat(BY1, start))
+            order = _strOrder(*boxes, M)
+            level = tuple(array[order] for array in boxes) + (start[order], count[order])
+            self.levels.append(level)
+            if start.size == 1:
+                break
+            (BX0, BY0, BX1, BY1) = level[:4]
+            n = BX0.size
+
+    def addFeature(self, track, num):
+        """
+        Add a new track to the index using the identifier ``num``.
+
+        Segments are first stored in a list of pending entries (searched
+        linearly), and the tree is packed again when this list gets large.
+        """
+        if track.size() == 0:
+            return
+        X = np.asarray(track.getX(), dtype=float)
+        Y = np.asarray(track.getY(), dtype=float)
+        new = _entries([X], [Y], [num])
+        self.pending = tuple(np.concatenate([a, b]) for a, b in zip(self.pending, new))
+        if self.pending[0].size > max(self.capacity**2, self.entries[0].size // 8):
+            self.__repack()
+
+    def removeFeature(self, num):
+        """
+        Remove a track from the index but NONE in the collection.
+        """
+        entries = tuple(np.concatenate([a, b]) for a, b in zip(self.entries, self.pending))
+        keep = entries[4] != num
+        self.__pack(tuple(array[keep] for array in entries))
+
+    def __repack(self):
+        """Pack all the entries (including pending entries) in the tree"""
+        self.__pack(tuple(np.concatenate([a, b]) for a, b in zip(self.entries, self.pending)))
+
+    # ------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------
+    def __search(self, x0, y0, x1, y1) -> tuple:
+        """Entries (as arrays) whose box intersects the box [x0, x1] x [y0, y1]"""
+        found = []
+        if len(self.levels) > 0:
+            idx = np.arange(self.levels[-1][0].size)
+            for (BX0, BY0, BX1, BY1, start, count) in reversed(self.levels):
+                idx = idx[(BX0[idx] <= x1) & (BX1[idx] >= x0) & (BY0[idx] <= y1) & (BY1[idx] >= y0)]
+                idx = _children(start[idx], count[idx])
+            (BX0, BY0, BX1, BY1) = self.boxes
+            idx = idx[(BX0[idx] <= x1) & (BX1[idx] >= x0) & (BY0[idx] <= y1) & (BY1[idx] >= y0)]
+            found.append(tuple(array[idx] for array in self.entries))
+        if self.pending[0].size > 0:
+            (BX0, BY0, BX1, BY1) = _boxes(self.pending)
+            idx = (BX0 <= x1) & (BX1 >= x0) & (BY0 <= y1) & (BY1 >= y0)
+            found.append(tuple(array[idx] for array in self.pending))
+        if len(found) == 0:
+            return self.pending
+        if len(found) == 1:
+            return found[0]
+        return tuple(np.concatenate(arrays) for arrays in zip(*found))
+
+    def __data(self, x0, y0, x1, y1) -> list[Any]:
+        """Data (without duplicates) of entries intersecting a box"""
+        return list(dict.fromkeys(self.__search(x0, y0, x1, y1)[4].tolist()))
+
+    def request(self, obj, j=None) -> list[Any]:
+        """
+        Request function to get data registered in the index
+        Inputs:
+            - request(coord) returns data whose segments have a bounding
+              box containing GeoCoords or ENUCoords object coord
+            - request(list) returns data whose segments have a bounding
+              box intersecting the one of segment list=[coord1, coord2].
+            - request(track) returns data whose segments have a bounding
+              box intersecting the one of a segment of the track.
+        """
+        if isinstance(obj, int):
+            raise WrongArgumentError("Error: an R-tree index has no cell (" + str(obj) + ", " + str(j) + ")")
+
+        if isinstance(obj, GeoCoords) or isinstance(obj, ENUCoords):
+            x, y = obj.getX(), obj.getY()
+            return self.__data(x, y, x, y)
+
+        if isinstance(obj, list):
+            [coord1, coord2] = obj
+            return self.__segmentData(coord1, coord2, 0)
+
+        if isinstance(obj, Track):
+            return self.__trackData(obj, lambda c1, c2: self.request([c1, c2]))
+
+    def neighborhood(self, obj, j=None, unit=0) -> list[Any]:
+        """
+        Neighborhood function to get all data registered in the index and
+        located in the vicinity of a given location.
+
+        - neighborhood(coord, unit) returns data whose segments have a
+          bounding box intersecting the square of half-side
+          (unit + 1/2) x resolution centered on coord.
+        - neighborhood([c1, c2], unit) returns data in the vicinity of the
+          bounding box of segment [c1, c2] (with the same margin)
+        - neighborhood(track, unit) returns data in the vicinity of the
+          segments of the track
+
+        If unit=-1, the minimal value is selected in order to get at least
+        1 data in function output.
+        """
+        if isinstance(obj, int):
+            raise WrongArgumentError("Error: an R-tree index has no cell (" + str(obj) + ", " + str(j) + ")")
+
+        if isinstance(obj, GeoCoords) or isinstance(obj, ENUCoords):
+            if unit < 0:
+                nearest = self.nearest(obj)
+                if len(nearest) == 0:
+                    return []
+                unit = self.groundDistanceToUnits(nearest[0][3])
+            h = (unit + 0.5) * self.resolution
+            x, y = obj.getX(), obj.getY()
+            return self.__data(x - h, y - h, x + h, y + h)
+
+        if isinstance(obj, list):
+            [coord1, coord2] = obj
+            if unit < 0:
+                nearest = self.nearest(coord1) + self.nearest(coord2)
+                if len(nearest) == 0:
+                    return []
+                unit = self.groundDistanceToUnits(min(n[3] for n in nearest))
+            return self.__segmentData(coord1, coord2, (unit + 0.5) * self.resolution)
+
+        if isinstance(obj, Track):
+            return self.__trackData(obj, lambda c1, c2: self.neighborhood([c1, c2], None, unit))
+
+    def __segmentData(self, coord1, coord2, h) -> list[Any]:
+        """Data in the vicinity (ground margin h) of the bounding box of a segment"""
+        x0, x1 = sorted([coord1.getX(), coord2.getX()])
+        y0, y1 = sorted([coord1.getY(), coord2.getY()])
+        return self.__data(x0 - h, y0 - h, x1 + h, y1 + h)
+
+    def __trackData(self, track, function) -> list[Any]:
+        """Union of the data of the segments of a track"""
+        TAB = {}
+        for i in range(1, track.size()):
+            TAB.update(dict.fromkeys(function(track[i - 1].position, track[i].position)))
+        return list(TAB)
+
+    def groundDistanceToUnits(self, distance):
+        """Convert a ground distance into a number of units"""
+        return math.floor(distance / self.resolution + 1)
+
+    # ------------------------------------------------------------
+    # Exact distance requests
+    # ------------------------------------------------------------
+    def nearest(self, coord, k: int = 1) -> list[tuple]:
+        """
+        Exact k-nearest features of a location (see
+        :func:`SpatialIndex.nearest`), with a best-first traversal of the
+        tree.
+
+        :return: Up to k tuples (data, i, proj, d) sorted on distance
+        """
+        x, y = float(coord.getX()), float(coord.getY())
+        heap = []
+        PROJ = {}
+
+        def pushEntries(entries, ids):
+            (X1, Y1, X2, Y2, N, V) = entries
+            XP, YP, D = _projOnSegments(x, y, X1, Y1, X2, Y2)
+            for n, id in enumerate(ids):
+                PROJ[id] = (N[n], V[n], XP[n], YP[n])
+                heapq.heappush(heap, (D[n], 0, id))
+
+        def pushNodes(L, idx):
+            (BX0, BY0, BX1, BY1) = self.levels[L][:4]
+            D = _boxDistance(x, y, BX0[idx], BY0[idx], BX1[idx], BY1[idx])
+            for d, i in zip(D.tolist(), idx.tolist()):
+                heapq.heappush(heap, (d, 1, L, i))
+
+        if self.pending[0].size > 0:
+            pushEntries(self.pending, [-(n + 1) for n in range(self.pending[0].size)])
+        if len(self.levels) > 0:
+            pushNodes(len(self.levels) - 1, np.arange(self.levels[-1][0].size))
+
+        FOUND = {}
+        while len(heap) > 0 and len(FOUND) < k:
+            item = heapq.heappop(heap)
+            if item[1] == 0:
+                (data, n, xp, yp) = PROJ[item[2]]
+                data = data.item() if isinstance(data, np.generic) else data
+                if data not in FOUND:
+                    FOUND[data] = (data, int(n), makeCoords(float(xp), float(yp), 0, self.srid), float(item[0]))
+                continue
+            (L, i) = item[2:]
+            start, count = self.levels[L][4][i], self.levels[L][5][i]
+            if L == 0:
+                ids = np.arange(start, start + count)
+                pushEntries(tuple(array[ids] for array in self.entries), ids.tolist())
+            else:
+                pushNodes(L - 1, np.arange(start, start + count))
+        return list(FOUND.values())
+
+    def within(self, coord, radius: float) -> list[tuple]:
+        """
+        Exact radius request (see :func:`SpatialIndex.within`).
+
+        :return: Tuples (data, i, proj, d) sorted on distance
+        """
+        (N, V, XP, YP, D) = self.__within(float(coord.getX()), float(coord.getY()), radius)
+        N = N.tolist()
+        return [(N[n], int(V[n]), makeCoords(float(XP[n]), float(YP[n]), 0, self.srid), float(D[n]))
+                for n in range(len(N))]
+
+    def __within(self, x, y, radius) -> tuple:
+        """Features at less than radius from (x, y), as arrays (data,
+        vertex, x and y of projection, distance) sorted on distance"""
+        (X1, Y1, X2, Y2, N, V) = self.__search(x - radius, y - radius, x + radius, y + radius)
+        XP, YP, D = _projOnSegments(x, y, X1, Y1, X2, Y2)
+        order = np.lexsort((V, D))
+        seen = set()
+        best = []
+        for n, data in zip(order.tolist(), N[order].tolist()):
+            if data not in seen:
+                seen.add(data)
+                best.append(n)
+        best = np.array(best, dtype=np.int64)
+        best = best[D[best] <= radius]
+        return N[best], V[best], XP[best], YP[best], D[best]
+
+    def requestPoints(self, points, unit: int = 0) -> tuple:
+        """
+        Batch version of neighborhood(coord, unit=unit) for many points (see
+        :func:`SpatialIndex.requestPoints`).
+
+        :return: (offsets, values)
+        """
+        X, Y = _pointArrays(points)
+        h = (unit + 0.5) * self.resolution
+        values = []
+        offsets = np.zeros(X.size + 1, dtype=np.int64)
+        for k, (x, y) in enumerate(zip(X.tolist(), Y.tolist())):
+            TAB = self.__data(x - h, y - h, x + h, y + h)
+            values.extend(TAB)
+            offsets[k + 1] = offsets[k] + len(TAB)
+        return offsets, _dataArray(values)
+
+    def withinPoints(self, points, radius: float) -> tuple:
+        """
+        Batch version of :func:`within` for many points (see
+        :func:`SpatialIndex.withinPoints`).
+
+        :return: (offsets, data, vertices, X, Y, distances)
+        """
+        X, Y = _pointArrays(points)
+        results = [self.__within(x, y, radius) for x, y in zip(X.tolist(), Y.tolist())]
+        offsets = np.zeros(X.size + 1, dtype=np.int64)
+        np.cumsum([r[0].size for r in results], out=offsets[1:])
+        arrays = [np.concatenate([r[n] for r in results]) if len(results) > 0 else np.zeros(0)
+                  for n in range(5)]
+        arrays[0] = _dataArray(arrays[0].tolist())
+        arrays[1] = arrays[1].astype(np.int64)
+        return (offsets, *arrays)
+
+    # ------------------------------------------------------------
+    # Plot and serialization
+    # ------------------------------------------------------------
+    def plot(self, base: bool = True, append=True):
+        """
+        Plot the leaves of the index and the collection together in the
+        same reference frame
+            - base: plot support network or track collection if True
+        """
+        if isinstance(append, bool):
+            if append:
+                ax1 = plt.gca()
+            else:
+                fig, ax1 = plt.subplots(figsize=(10, 3))
+        else:
+            ax1 = plt
+
+        if base:
+            self.collection.plot(append=ax1)
+
+        if len(self.levels) > 0:
+            (BX0, BY0, BX1, BY1) = [array.tolist() for array in self.levels[0][:4]]
+            for x0, y0, x1, y1 in zip(BX0, BY0, BX1, BY1):
+                ax1.plot([x0, x1, x1, x0, x0], [y0, y0, y1, y1, y0], "-", color="gray")
+
+    def save(self, filename):
+        """Save the R-tree (with its collection) in a pickle file"""
+        outfile = open(filename, "wb")
+        pickle.dump(self, outfile)
+        outfile.close()
+
+    @staticmethod
+    def load(filename):
+        """Load a R-tree saved by :func:`save` (only load trusted
+        files: unpickling can execute code)"""
+        infile = open(filename, "rb")
+        index = pickle.load(infile)
+        infile.close()
+        return index
+
+
+def _entries(X, Y, N) -> tuple:
+    """Entries (X1, Y1, X2, Y2, data, index of first vertex) of polylines
+    (an isolated point is a degenerated segment)"""
+    X1, Y1, X2, Y2, D, V = [], [], [], [], [], []
+    for x, y, num in zip(X, Y, N):
+        if x.size == 1:
+            x, y = np.repeat(x, 2), np.repeat(y, 2)
+        X1.append(x[:-1])
+        Y1.append(y[:-1])
+        X2.append(x[1:])
+        Y2.append(y[1:])
+        D.extend([num] * (x.size - 1))
+        V.append(np.arange(x.size - 1, dtype=np.int64))
+    coords = [np.concatenate(C + [np.zeros(0)]) for C in [X1, Y1, X2, Y2]]
+    return (*coords, _dataArray(D), np.concatenate(V + [np.zeros(0, dtype=np.int64)]))
+
+
+def _boxes(entries) -> tuple:
+    """Bounding boxes (X0, Y0, X1, Y1) of entries"""
+    (X1, Y1, X2, Y2) = entries[:4]
+    return np.minimum(X1, X2), np.minimum(Y1, Y2), np.maximum(X1, X2), np.maximum(Y1, Y2)
+
+
+def _strOrder(X0, Y0, X1, Y1, M) -> np.ndarray:
+    """Sort-Tile-Recursive order of boxes: boxes are sorted on x into
+    vertical slices of about sqrt(n / M) x M boxes, and on y in each slice"""
+    n = X0.size
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    S = math.ceil(math.sqrt(math.ceil(n / M)))
+    rank = np.empty(n, dtype=np.int64)
+    rank[np.argsort(X0 + X1, kind="stable")] = np.arange(n)
+    return np.lexsort((Y0 + Y1, rank // (S * M)))
+
+
+def _children(start, count) -> np.ndarray:
+    """Indices of the children of nodes"""
+    total = int(count.sum())
+    return np.repeat(start, count) + np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+
+
+def _boxDistance(x, y, X0, Y0, X1, Y1) -> np.ndarray:
+    """Distances of (x, y) to boxes"""
+    dx = np.maximum(np.maximum(X0 - x, x - X1), 0)
+    dy = np.maximum(np.maximum(Y0 - y, y - Y1), 0)
+    return np.hypot(dx, dy)
@@ -45,6 +45,7 @@ from typing import Any
 #from tracklib.util.exceptions import *
 
 import math
+import numpy as np
 import matplotlib.pyplot as plt
 import pickle
 import progressbar
@@ -52,7 +53,7 @@ import progressbar
 from tracklib.core import (GeoCoords, ENUCoords, TrackCollection)
 from tracklib.util import isSegmentIntersects
 
-from tracklib.core import (Bbox, Track)
+from tracklib.core import (Bbox, Track, makeCoords)
 from tracklib.core import Edge
 
 
@@ -63,7 +64,15 @@ class SpatialIndex:
     This module contains the class to manipulate a spatial Index.
     """
 
-    def __init__(self, collection, resolution=None, margin=0.05, verbose=True):
+    # Maximal number of candidate (segment, cell) pairs tested at once when
+    # building a compact index
+    CHUNK_SIZE = 2**20
+
+    # Minimal number of (cell, data) pairs added to a compact index before
+    # they are merged in its arrays
+    PENDING_SIZE = 2**16
+
+    def __init__(self, collection, resolution=None, margin=0.05, verbose=True, compact=False):
         """Constructor of :class:`SaptialIndex` class
 
         Parameters
@@ -87,6 +96,14 @@ class SpatialIndex:
         resolution : tuple (xsize, ysize)
             DESCRIPTION. The default is (100, 100).
 
+        compact : bool
+            If True, all segments are rasterized at once and the contents of
+            the cells are stored in flat arrays (see :func:`getCells`) instead
+            of nested lists. Features added later are kept in pending lists
+            of cells, merged in the arrays by batches (features with other
+            identifiers than integers convert the index back to nested
+            lists). The default is False.
+
         Returns
         -------
         None.
@@ -123,6 +140,13 @@ class SpatialIndex:
         self.lsize = resolution[1]
         # print ('nb cellule', self.xsize * self.ysize)
 
+        self.dX = ax / self.csize
+        self.dY = ay / self.lsize
+
+        if compact:
+            self.__buildCells(collection, verbose)
+            return
+
         # Tableau de collections de features appartenant a chaque dalle.
         # Un feature peut appartenir a plusieurs dalles.
         self.grid = []
@@ -131,9 +155,6 @@ class SpatialIndex:
             for j in range(self.lsize):
                 self.grid[i].append([])
 
-        self.dX = ax / self.csize
-        self.dY = ay / self.lsize
-
         # Calcul de la grille
         if isinstance(collection, tuple):
             self.collection = TrackCollection()
@@ -158,6 +179,175 @@ class SpatialIndex:
             elif isinstance(feature, Edge):
                 self.addFeature(feature.geom, num)
 
+    def __buildCells(self, collection, verbose):
+        """Compute the contents of the cells of a compact index, by
+        rasterizing all the segments of the collection at once"""
+        self.grid = None
+        self.inventaire = None
+        self.offsets = np.zeros(self.csize * self.lsize + 1, dtype=np.int64)
+        self.values = np.zeros(0, dtype=np.int64)
+        self.pending = {}
+        self.npending = 0
+        if isinstance(collection, (tuple, Bbox)):
+            if isinstance(collection, tuple):
+                self.collection = TrackCollection()
+            return
+
+        boucle = range(collection.size())
+        if verbose:
+            print("Building [" + str(self.csize) + " x " + str(self.lsize) + "] compact spatial index...")
+            boucle = progressbar.progressbar(boucle)
+        X, Y, N = [], [], []
+        for num in boucle:
+            feature = collection[num]
+            if isinstance(feature, Edge):
+                feature = feature.geom
+            if not isinstance(feature, Track) or feature.size() < 2:
+                continue
+            X.append(np.asarray(feature.getX(), dtype=float))
+            Y.append(np.asarray(feature.getY(), dtype=float))
+            N.append(np.full(feature.size() - 1, num, dtype=np.int64))
+        if len(N) > 0:
+            self.__setCells(*self.__rasterize(X, Y, N))
+
+    def __rasterize(self, X, Y, N) -> tuple:
+        """Cells crossed by the segments of polylines
+
+        :param X: List of arrays of x coordinates of polylines
+        :param Y: List of arrays of y coordinates of polylines
+        :param N: List of arrays of the data registered for each segment of
+            polylines (integers)
+        :return: Unique pairs (cell, data) as two arrays, sorted on cell
+            (row-major index i * lsize + j) and then on data
+        """
+        # Segments in grid units (segments out of grid are ignored)
+        U1 = np.concatenate([(x[:-1] - self.xmin) / self.dX for x in X])
+        U2 = np.concatenate([(x[1:] - self.xmin) / self.dX for x in X])
+        V1 = np.concatenate([(y[:-1] - self.ymin) / self.dY for y in Y])
+        V2 = np.concatenate([(y[1:] - self.ymin) / self.dY for y in Y])
+        data = np.concatenate(N)
+        umax = (self.xmax - self.xmin) / self.dX
+        vmax = (self.ymax - self.ymin) / self.dY
+        inside = ((np.minimum(U1, U2) >= 0) & (np.maximum(U1, U2) <= umax)
+                  & (np.minimum(V1, V2) >= 0) & (np.maximum(V1, V2) <= vmax))
+        U1, U2, V1, V2, data = U1[inside], U2[inside], V1[inside], V2[inside], data[inside]
+
+        # Candidate cells: bounding box of each segment
+        I0 = np.floor(np.minimum(U1, U2)).astype(np.int64)
+        J0 = np.floor(np.minimum(V1, V2)).astype(np.int64)
+        NI = np.floor(np.maximum(U1, U2)).astype(np.int64) - I0 + 1
+        NJ = np.floor(np.maximum(V1, V2)).astype(np.int64) - J0 + 1
+        counts = NI * NJ
+        ends = np.cumsum(counts)
+
+        nb = int(data.max()) + 1 if data.size > 0 else 1
+        keys = []
+        start = 0
+        while start < data.size:
+            base = ends[start] - counts[start]
+            stop = max(int(np.searchsorted(ends, base + SpatialIndex.CHUNK_SIZE, side="right")), start + 1)
+            seg = np.repeat(np.arange(start, stop), counts[start:stop])
+            local = np.arange(seg.size) - np.repeat(ends[start:stop] - counts[start:stop] - base, counts[start:stop])
+            I = I0[seg] + local // NJ[seg]
+            J = J0[seg] + local % NJ[seg]
+
+            # A cell is crossed if its corners are not all on the same side
+            # of the segment line
+            DU = U2[seg] - U1[seg]
+            DV = V2[seg] - V1[seg]
+            side = [DU * (J + dj - V1[seg]) - DV * (I + di - U1[seg])
+                    for di, dj in [(0, 0), (1, 0), (0, 1), (1, 1)]]
+            crossed = ((np.minimum.reduce(side) <= 0) & (np.maximum.reduce(side) >= 0)
+                       & (I < self.csize) & (J < self.lsize))
+            keys.append(np.unique((I[crossed] * self.lsize + J[crossed]) * nb + data[seg][crossed]))
+            start = stop
+
+        keys = np.unique(np.concatenate(keys)) if len(keys) > 0 else np.zeros(0, dtype=np.int64)
+        return keys // nb, keys % nb
+
+    def __setCells(self, cells, values):
+        """Set the contents of the cells of a compact index from pairs
+        (cell, data) sorted on cells"""
+        counts = np.bincount(cells, minlength=self.csize * self.lsize)
+        self.offsets = np.zeros(self.csize * self.lsize + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.values = np.asarray(values, dtype=np.int64)
+        self.pending = {}
+        self.npending = 0
+
+    def __expand(self):
+        """Convert a compact index into nested lists of cells"""
+        if self.grid is not None:
+            return
+        self.__mergeCells()
+        values = self.values.tolist()
+        offsets = self.offsets.tolist()
+        self.grid = []
+        self.inventaire = set()
+        for i in range(self.csize):
+            column = []
+            for j in range(self.lsize):
+                k = i * self.lsize + j
+                cell = values[offsets[k] : offsets[k + 1]]
+                column.append(cell)
+                self.inventaire.update((i, j, data) for data in cell)
+            self.grid.append(column)
+        self.offsets = None
+        self.values = None
+        self.pending = None
+
+    def isCompact(self) -> bool:
+        """Check if the contents of the cells are stored in flat arrays"""
+        return self.grid is None
+
+    @staticmethod
+    def fromCells(collection, extent: tuple, size: tuple, srid: str, offsets, values,
+                  compact: bool = False) -> SpatialIndex:
+        """Build an index from the contents of its cells (see :func:`getCells`)
+
+        :param collection: Indexed collection
+        :param extent: Extent (xmin, xmax, ymin, ymax) of the grid
+        :param size: Number of cells (in x, in y)
+        :param srid: Coordinate type of the grid
+        :param offsets: Offsets of the values of the cells (in row-major
+            order on (x, y) cell indices)
+        :param values: Values of the cells
+        :param compact: Keep the contents of the cells in the arrays
+        :return: Spatial index
+        """
+        index = SpatialIndex.__new__(SpatialIndex)
+        (index.xmin, index.xmax, index.ymin, index.ymax) = extent
+        index.srid = srid
+        index.collection = collection
+        (index.csize, index.lsize) = size
+        index.dX = (index.xmax - index.xmin) / index.csize
+        index.dY = (index.ymax - index.ymin) / index.lsize
+        index.grid = None
+        index.inventaire = None
+        index.offsets = np.asarray(offsets, dtype=np.int64)
+        index.values = np.asarray(values, dtype=np.int64)
+        index.pending = {}
+        index.npending = 0
+        if not compact:
+            index.__expand()
+        return index
+
+    def getCells(self) -> tuple:
+        """Contents of the cells as flat arrays (values of cell (i, j) are
+        values[offsets[k]:offsets[k+1]] with k = i * number of cells in y + j)
+
+        :return: A tuple (offsets, values) of int64 arrays
+        """
+        if self.isCompact():
+            self.__mergeCells()
+            return self.offsets, self.values
+        cells = [cell for column in self.grid for cell in column]
+        offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+        np.cumsum([len(cell) for cell in cells], out=offsets[1:])
+        values = np.fromiter((data for cell in cells for data in cell),
+                             dtype=np.int64, count=int(offsets[-1]))
+        return offsets, values
+
     def __str__(self):
         """TODO"""
         c = [(self.xmin + self.xmax) / 2.0, (self.ymin + self.ymax) / 2.0]
@@ -227,6 +417,15 @@ class SpatialIndex:
         -------
         None.
         """
+        if self.isCompact():
+            if isinstance(num, (int, np.integer)):
+                if track.size() > 1:
+                    X = np.asarray(track.getX(), dtype=float)
+                    Y = np.asarray(track.getY(), dtype=float)
+                    N = np.full(track.size() - 1, num, dtype=np.int64)
+                    self.__addPending(*self.__rasterize([X], [Y], [N]))
+                return
+            self.__expand()
         coord1 = None
         for i in range(track.size()):
             obs = track.getObs(i)
@@ -255,12 +454,43 @@ class SpatialIndex:
         None.
 
         """
+        if self.isCompact():
+            self.__mergeCells()
+            keep = self.values != num
+            cells = np.repeat(np.arange(self.csize * self.lsize), np.diff(self.offsets))
+            self.__setCells(cells[keep], self.values[keep])
+            return
         for i in range(self.csize):
             for j in range(self.lsize):
                 if num in self.grid[i][j]:
                     self.grid[i][j] = [v for v in self.grid[i][j] if v != num]
 
 
+    def __addPending(self, cells, values):
+        """Add pairs (cell, data) to a compact index. Data are appended to
+        the pending lists of the cells where they are not registered yet,
+        and pending lists are merged in the arrays when they get large."""
+        for k, data in zip(cells.tolist(), values.tolist()):
+            if (data in self.pending.get(k, ())) or \
+                (data in self.values[self.offsets[k] : self.offsets[k + 1]]):
+                continue
+            self.pending.setdefault(k, []).append(data)
+            self.npending += 1
+        if self.npending > max(SpatialIndex.PENDING_SIZE, (self.offsets.size + self.values.size) // 16):
+            self.__mergeCells()
+
+    def __mergeCells(self):
+        """Merge the pending lists of a compact index in its arrays"""
+        if self.npending == 0:
+            return
+        pending = [(k, data) for k, cell in self.pending.items() for data in cell]
+        new_cells, new_values = np.array(pending, dtype=np.int64).T
+        cells = np.repeat(np.arange(self.csize * self.lsize), np.diff(self.offsets))
+        cells = np.concatenate([cells, new_cells])
+        values = np.concatenate([self.values, new_values])
+        order = np.argsort(cells, kind="stable")
+        self.__setCells(cells[order], values[order])
+
     def __addSegment(self, coord1, coord2, data):
         """TODO
 
@@ -356,7 +586,7 @@ class SpatialIndex:
             for j in range(self.lsize):
                 yj1 = j * self.dY + self.ymin
                 yj2 = yj1 + self.dY
-                if len(self.grid[i][j]) > 0:
+                if len(self.request(i, j)) > 0:
                     polygon = plt.Polygon(
                         [[xi1, yj1], [xi2, yj1], [xi2, yj2], [xi1, yj2], [xi1, yj1]]
                     )
@@ -395,6 +625,10 @@ class SpatialIndex:
         if isinstance(obj, int):
             """dans la cellule (i,j)"""
             i = obj
+            if self.isCompact():
+                k = i * self.lsize + j
+                cell = self.values[self.offsets[k] : self.offsets[k + 1]].tolist()
+                return cell + self.pending[k] if k in self.pending else cell
             return self.grid[i][j]
 
         if isinstance(obj, GeoCoords) or isinstance(obj, ENUCoords):
@@ -412,17 +646,17 @@ class SpatialIndex:
 
             # Les cellules traversées par le segment
             CELLS = self.__cellsCrossSegment(p1, p2)
-            TAB = []
+            TAB = {}
             for cell in CELLS:
                 self.__addCellValuesInTAB(TAB, cell)
-            return TAB
+            return list(TAB)
 
         if isinstance(obj, Track):
             """dans les cellules traversée par la track"""
             track = obj
 
             # récupération des cellules de la track
-            TAB = []
+            TAB = {}
             pos1 = None
             for i in range(track.size()):
                 obs = track.getObs(i)
@@ -436,7 +670,7 @@ class SpatialIndex:
                         self.__addCellValuesInTAB(TAB, cell)
                 pos1 = pos2
 
-            return TAB
+            return list(TAB)
 
     # ------------------------------------------------------------
     # Neighborhood function to get all data registered in spatial
@@ -529,7 +763,7 @@ class SpatialIndex:
 
             if unit > -1:
                 # Tableau à retourner
-                TAB = []
+                TAB = {}
 
                 # Les cellules traversées par le segment
                 CELLS = self.__cellsCrossSegment(p1, p2)
@@ -539,11 +773,11 @@ class SpatialIndex:
                     for cellu in NC:
                         self.__addCellValuesInTAB(TAB, cellu)
 
-                return TAB
+                return list(TAB)
 
             u = 0
             while u <= max(self.csize, self.lsize):
-                TAB = []
+                TAB = {}
                 CELLS = self.__cellsCrossSegment(p1, p2)
                 for cell in CELLS:
                     NC = self.__neighboringcells(cell[0], cell[1], u)
@@ -564,7 +798,7 @@ class SpatialIndex:
                     for cellu in NC:
                         self.__addCellValuesInTAB(TAB, cellu)
                 # print (TAB)
-                return TAB
+                return list(TAB)
 
         # --------------------------------------------------------
         # neighborhood(track, unit)
@@ -574,7 +808,7 @@ class SpatialIndex:
 
             track = obj
 
-            TAB2 = []
+            TAB2 = {}
             pos1 = None
             for i in range(track.size()):
                 obs = track.getObs(i)
@@ -583,12 +817,231 @@ class SpatialIndex:
                 if pos1 != None:
                     CELLS = self.neighborhood([pos1, pos2], None, unit)
                     # print (CELLS, unit)
-                    for cell in CELLS:
-                        if cell not in TAB2:
-                            TAB2.append(cell)
+                    TAB2.update(dict.fromkeys(CELLS))
                 pos1 = pos2
 
-            return TAB2
+            return list(TAB2)
+
+    def nearest(self, coord, k: int = 1) -> list[tuple]:
+        """
+        Exact k-nearest features of a location.
+
+        Rings of cells around the cell containing coord are inspected
+        incrementally, until no feature of the cells not inspected yet can
+        be closer than the k-th best feature found. Distances are computed
+        in the (planar) coordinates of the grid.
+
+        Parameters
+        ----------
+        coord : {ENUCoords, GeoCoords}
+            Location of the request.
+        k : int
+            Number of features. The default is 1.
+
+        Returns
+        -------
+        list
+            Up to k tuples (data, i, proj, d), sorted on distance, where
+            data is the data registered for the feature, i the index of the
+            first vertex of its segment closest to coord, proj the
+            projection of coord on this segment and d the distance.
+        """
+        return self.__search(coord, k, None)
+
+    def within(self, coord, radius: float) -> list[tuple]:
+        """
+        Exact radius request: features located at a distance less or equal
+        than radius from a location.
+
+        Parameters
+        ----------
+        coord : {ENUCoords, GeoCoords}
+            Location of the request.
+        radius : float
+            Search radius (in the coordinates of the grid).
+
+        Returns
+        -------
+        list
+            Tuples (data, i, proj, d) sorted on distance (see :func:`nearest`).
+        """
+        return self.__search(coord, None, radius)
+
+    def __search(self, coord, k, radius) -> list[tuple]:
+        """Incremental search of the features closest to coord, stopped
+        when k features are bounded (or when radius is reached)"""
+        x, y = float(coord.getX()), float(coord.getY())
+        i = min(max(math.floor((x - self.xmin) / self.dX), 0), self.csize - 1)
+        j = min(max(math.floor((y - self.ymin) / self.dY), 0), self.lsize - 1)
+        step = min(self.dX, self.dY)
+
+        FOUND = {}
+        u = 0
+        while u <= max(self.csize, self.lsize):
+            for cell in self.__neighboringcells(i, j, u, True):
+                for data in self.request(cell[0], cell[1]):
+                    if data not in FOUND:
+                        FOUND[data] = self.__projOnFeature(data, x, y)
+            # Cells not inspected yet are at least u cells away
+            bound = u * step
+            if radius is not None:
+                if bound > radius:
+                    break
+            elif len(FOUND) >= k:
+                if sorted(p[2] for p in FOUND.values())[k - 1] <= bound:
+                    break
+            u += 1
+
+        output = []
+        for data, (n, proj, d) in FOUND.items():
+            if n < 0:
+                continue
+            if radius is None or d <= radius:
+                output.append((data, n, makeCoords(proj[0], proj[1], 0, self.srid), d))
+        output.sort(key=lambda p: p[3])
+        if k is not None:
+            output = output[:k]
+        return output
+
+    def __featureArrays(self, data) -> tuple:
+        """Coordinates (X, Y arrays) of the polyline of a registered feature"""
+        feature = self.collection[data]
+        if isinstance(feature, Edge):
+            feature = feature.geom
+        return np.asarray(feature.getX(), dtype=float), np.asarray(feature.getY(), dtype=float)
+
+    def __projOnFeature(self, data, x, y) -> tuple:
+        """Projection of (x, y) on the polyline of a registered feature
+
+        :return: Index of the first vertex of the closest segment, projection
+            (x, y) and distance (index -1 if the feature has no segment)
+        """
+        X, Y = self.__featureArrays(data)
+        if X.size < 2:
+            return -1, None, math.inf
+        XP, YP, D = _projOnSegments(x, y, X[:-1], Y[:-1], X[1:], Y[1:])
+        n = int(np.argmin(D))
+        return n, (float(XP[n]), float(YP[n])), float(D[n])
+
+    # ------------------------------------------------------------
+    # Batch requests: all points of a track, of a collection or of
+    # coordinate arrays are processed in a single call. Results
+    # are flat arrays: results of the k-th point are in the range
+    # offsets[k]:offsets[k+1] of the other arrays.
+    # ------------------------------------------------------------
+    def requestPoints(self, points, unit: int = 0) -> tuple:
+        """
+        Batch version of neighborhood(coord, unit=unit) for many points.
+
+        Parameters
+        ----------
+        points : {Track, TrackCollection, tuple}
+            Points of the request: observations of a track, of all the
+            tracks of a collection (in collection order) or a tuple (X, Y)
+            of coordinate arrays.
+        unit : int
+            Number of cells of the vicinity (unit >= 0). The default is 0.
+
+        Returns
+        -------
+        tuple
+            (offsets, values): data registered in the vicinity of the k-th
+            point are values[offsets[k]:offsets[k+1]] (no data for points
+            out of the grid).
+        """
+        X, Y = _pointArrays(points)
+        return self.__candidates(X, Y, unit, False)
+
+    def withinPoints(self, points, radius: float) -> tuple:
+        """
+        Batch version of :func:`within` for many points.
+
+        Parameters
+        ----------
+        points : {Track, TrackCollection, tuple}
+            Points of the request (see :func:`requestPoints`).
+        radius : float
+            Search radius (in the coordinates of the grid).
+
+        Returns
+        -------
+        tuple
+            (offsets, data, vertices, X, Y, distances): features located
+            at less than radius from the k-th point are described in range
+            offsets[k]:offsets[k+1] of the arrays (sorted on distance) by
+            their data, the index of the first vertex of their closest
+            segment, the coordinates of the projection and the distance.
+        """
+        X, Y = _pointArrays(points)
+        unit = max(math.ceil(radius / min(self.dX, self.dY)), 0)
+        offsets, data = self.__candidates(X, Y, unit, True)
+        P = np.repeat(np.arange(X.size), np.diff(offsets))
+
+        # Segments of the candidate features
+        features, F = np.unique(data, return_inverse=True)
+        F = F.reshape(-1)
+        XS, YS = [], []
+        for feature in features.tolist():
+            (XF, YF) = self.__featureArrays(feature)
+            XS.append(XF)
+            YS.append(YF)
+        sizes = np.array([max(x.size - 1, 0) for x in XS], dtype=np.int64)
+        starts = np.cumsum(sizes) - sizes
+        X1 = np.concatenate([x[:-1] for x in XS] + [np.zeros(0)])
+        Y1 = np.concatenate([y[:-1] for y in YS] + [np.zeros(0)])
+        X2 = np.concatenate([x[1:] for x in XS] + [np.zeros(0)])
+        Y2 = np.concatenate([y[1:] for y in YS] + [np.zeros(0)])
+
+        # Projection of the points on all the segments of their candidates
+        counts = sizes[F]
+        Q = np.repeat(np.arange(P.size), counts)
+        S = np.repeat(starts[F], counts) + np.arange(Q.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        XP, YP, D = _projOnSegments(X[P[Q]], Y[P[Q]], X1[S], Y1[S], X2[S], Y2[S])
+
+        # Closest segment of each candidate (the first one in case of tie)
+        order = np.lexsort((D, Q))
+        best = order[np.r_[True, Q[order][1:] != Q[order][:-1]]] if order.size > 0 else order
+        best = best[D[best] <= radius]
+        best = best[np.lexsort((D[best], P[Q[best]]))]
+
+        pairs = Q[best]
+        offsets = np.zeros(X.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(P[pairs], minlength=X.size), out=offsets[1:])
+        return offsets, data[pairs], S[best] - starts[F[pairs]], XP[best], YP[best], D[best]
+
+    def __candidates(self, X, Y, unit, clamp) -> tuple:
+        """Data registered in the vicinity of the cells of points (as flat
+        arrays offsets and values). Points out of the grid are assigned to
+        the closest cell if clamp is True, and have no data otherwise."""
+        I = np.floor((X - self.xmin) / self.dX)
+        J = np.floor((Y - self.ymin) / self.dY)
+        if clamp:
+            valid = np.isfinite(I) & np.isfinite(J)
+        else:
+            valid = (X >= self.xmin) & (X <= self.xmax) & (Y >= self.ymin) & (Y <= self.ymax)
+        I = np.clip(np.nan_to_num(I), 0, self.csize - 1).astype(np.int64)
+        J = np.clip(np.nan_to_num(J), 0, self.lsize - 1).astype(np.int64)
+
+        # Vicinity of each distinct cell is computed once
+        cells, inverse = np.unique(I[valid] * self.lsize + J[valid], return_inverse=True)
+        values = []
+        sizes = np.zeros(cells.size, dtype=np.int64)
+        for n, k in enumerate(cells.tolist()):
+            TAB = {}
+            for cell in self.__neighboringcells(k // self.lsize, k % self.lsize, unit):
+                self.__addCellValuesInTAB(TAB, cell)
+            values.extend(TAB)
+            sizes[n] = len(TAB)
+        starts = np.cumsum(sizes) - sizes
+
+        counts = np.zeros(X.size, dtype=np.int64)
+        counts[valid] = sizes[inverse.reshape(-1)]
+        first = np.zeros(X.size, dtype=np.int64)
+        first[valid] = starts[inverse.reshape(-1)]
+        offsets = np.zeros(X.size + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        index = np.repeat(first, counts) + np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts)
+        return offsets, _dataArray(values)[index]
 
     # ------------------------------------------------------------
     # Function to convert ground distance (metric system is
@@ -624,14 +1077,12 @@ class SpatialIndex:
         return NC
 
     # ------------------------------------------------------------
-    # Add data registered in cell within TAB structure
+    # Add data registered in cell within TAB structure (a dict
+    # used as an ordered set: data keep their first position)
     # ------------------------------------------------------------
     def __addCellValuesInTAB(self, TAB, cell):
         """TODO"""
-        values = self.request(cell[0], cell[1])
-        for d in values:
-            if d not in TAB:
-                TAB.append(d)
+        TAB.update(dict.fromkeys(self.request(cell[0], cell[1])))
 
     # ------------------------------------------------------------
     # List of cells crossing segment [coord1, coord2] (in px)
@@ -705,3 +1156,40 @@ class SpatialIndex:
         index = pickle.load(infile)
         infile.close()
         return index
+
+
+def _dataArray(values: list) -> np.ndarray:
+    """Array of data registered in an index (int64 if possible)"""
+    try:
+        return np.array(values, dtype=np.int64).reshape(-1)
+    except (TypeError, ValueError):
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+
+def _pointArrays(points) -> tuple:
+    """Coordinates (X, Y arrays) of the points of a batch request: a track,
+    a collection of tracks or a tuple of coordinate arrays"""
+    if isinstance(points, Track):
+        return np.asarray(points.getX(), dtype=float), np.asarray(points.getY(), dtype=float)
+    if isinstance(points, TrackCollection):
+        X = [np.asarray(track.getX(), dtype=float) for track in points] + [np.zeros(0)]
+        Y = [np.asarray(track.getY(), dtype=float) for track in points] + [np.zeros(0)]
+        return np.concatenate(X), np.concatenate(Y)
+    return np.asarray(points[0], dtype=float).reshape(-1), np.asarray(points[1], dtype=float).reshape(-1)
+
+
+def _projOnSegments(x, y, X1, Y1, X2, Y2) -> tuple:
+    """Orthogonal projections of points (x, y) on segments [(X1, Y1), (X2, Y2)]
+    (arrays, or scalars broadcast on arrays)
+
+    :return: Coordinates (XP, YP) of the projections and distances
+    """
+    DX, DY = X2 - X1, Y2 - Y1
+    L2 = DX * DX + DY * DY
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = np.where(L2 > 0, ((x - X1) * DX + (y - Y1) * DY) / L2, 0)
+    T = np.clip(T, 0, 1)
+    XP, YP = X1 + T * DX, Y1 + T * DY
+    return XP, YP, np.hypot(XP - x, YP - y)
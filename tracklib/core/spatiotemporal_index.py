@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains a spatio-temporal index of the observations of a
+collection of tracks.
+
+Observations are bucketed in 3D: cells of a regular grid in space, and
+time intervals of fixed duration. Requests on a box (or a disk) and a time
+window return the ranges of consecutive observations of each track
+matching the request.
+"""
+
+from __future__ import annotations
+from tracklib.util.exceptions import *
+
+import math
+import numpy as np
+import pickle
+import progressbar
+
+from tracklib.core import (ObsTime, Bbox, Track)
+
+
+class SpatioTemporalIndex:
+    """
+    Spatio-temporal index (3D buckets: grid cells x time intervals) of the
+    observations of a collection of tracks.
+
+    Results of requests are hits (num, start, end): observations start to
+    end - 1 of the track collection[num].
+    """
+
+    def __init__(self, collection, resolution=None, duration=None, margin=0.05, verbose=True):
+        """Constructor of :class:`SpatioTemporalIndex` class
+
+        :param collection: Collection of tracks (any sized collection
+            providing collection[num], e.g. :class:`TrackCollection`)
+        :param resolution: Size (xsize, ysize) of the cells. The default is
+            such that the grid has 100 cells on the largest side.
+        :param duration: Duration (in seconds) of the time intervals. The
+            default is 1/100 of the time span of the collection.
+        :param margin: Relative margin added to the spatial extent
+        :param verbose: Verbose creation
+        """
+        self.collection = collection
+
+        boucle = range(collection.size())
+        if verbose:
+            print("Building spatio-temporal index...")
+            boucle = progressbar.progressbar(boucle)
+        X, Y, T = [], [], []
+        self.srid = "ENU"
+        for num in boucle:
+            track = collection[num]
+            X.append(np.asarray(track.getX(), dtype=float))
+            Y.append(np.asarray(track.getY(), dtype=float))
+            T.append(np.asarray(track.getT(), dtype=float))
+            if track.size() > 0:
+                self.srid = track.getSRID()
+
+        # Observations of all tracks (track of each observation, and index
+        # of the first observation of each track)
+        sizes = np.array([x.size for x in X], dtype=np.int64)
+        self.first = np.cumsum(sizes) - sizes
+        self.tracks = np.repeat(np.arange(sizes.size, dtype=np.int64), sizes)
+        self.X = np.concatenate(X + [np.zeros(0)])
+        self.Y = np.concatenate(Y + [np.zeros(0)])
+        self.T = np.concatenate(T + [np.zeros(0)])
+        if self.X.size == 0:
+            raise WrongArgumentError("Error: cannot index a collection without observations")
+
+        # Extent in space and time
+        ax, ay = self.X.max() - self.X.min(), self.Y.max() - self.Y.min()
+        self.xmin, self.xmax = self.X.min() - margin * ax, self.X.max() + margin * ax
+        self.ymin, self.ymax = self.Y.min() - margin * ay, self.Y.max() + margin * ay
+        self.tmin, self.tmax = self.T.min(), self.T.max()
+        ax, ay = (self.xmax - self.xmin) or 1.0, (self.ymax - self.ymin) or 1.0
+
+        if resolution is None:
+            r = max(ax, ay) / 100
+            resolution = (r, r)
+        self.csize = max(int(ax / resolution[0]), 1)
+        self.lsize = max(int(ay / resolution[1]), 1)
+        self.dX = ax / self.csize
+        self.dY = ay / self.lsize
+
+        if duration is None:
+            duration = (self.tmax - self.tmin) / 100
+        self.duration = duration if duration > 0 else 1.0
+        self.tsize = int((self.tmax - self.tmin) // self.duration) + 1
+
+        # Buckets: observations sorted on key (cell x time interval). The
+        # observations of key keys[k] are index[offsets[k]:offsets[k+1]]
+        K = self.__keys(self.__cellsX(self.X), self.__cellsY(self.Y), self.__intervals(self.T))
+        self.index = np.argsort(K, kind="stable")
+        self.keys, starts = np.unique(K[self.index], return_index=True)
+        self.offsets = np.append(starts, K.size).astype(np.int64)
+
+    def __str__(self):
+        """Size of the grid and number of indexed observations"""
+        output = "[" + str(self.csize) + " x " + str(self.lsize) + " x " + str(self.tsize) + "] "
+        output += "spatio-temporal index of " + str(self.X.size) + " observations"
+        return output
+
+    def size(self) -> int:
+        """Number of indexed observations"""
+        return self.X.size
+
+    def __cellsX(self, X):
+        return np.clip(np.floor((X - self.xmin) / self.dX), 0, self.csize - 1).astype(np.int64)
+
+    def __cellsY(self, Y):
+        return np.clip(np.floor((Y - self.ymin) / self.dY), 0, self.lsize - 1).astype(np.int64)
+
+    def __intervals(self, T):
+        return np.clip(np.floor((T - self.tmin) / self.duration), 0, self.tsize - 1).astype(np.int64)
+
+    def __keys(self, I, J, B):
+        return (I * self.lsize + J) * self.tsize + B
+
+    # ------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------
+    def request(self, bbox, t1=None, t2=None) -> list[tuple]:
+        """
+        Observations located in a box during a time window.
+
+        Parameters
+        ----------
+        bbox : {Bbox, tuple}
+            Box (Bbox or tuple (xmin, xmax, ymin, ymax)).
+        t1, t2 : {ObsTime, float}
+            Bounds of the time window (included), as timestamps or
+            absolute times in seconds. None for no bound.
+
+        Returns
+        -------
+        list
+            Hits (num, start, end) sorted on num and start: observations
+            start to end - 1 of track collection[num].
+        """
+        if isinstance(bbox, Bbox):
+            bbox = bbox.asTuple()
+        (x0, x1, y0, y1) = bbox
+        G = self.__candidates(x0, x1, y0, y1, t1, t2)
+        G = G[(self.X[G] >= x0) & (self.X[G] <= x1) & (self.Y[G] >= y0) & (self.Y[G] <= y1)]
+        return self.__hits(G)
+
+    def within(self, coord, radius: float, t1=None, t2=None) -> list[tuple]:
+        """
+        Observations located at a distance less or equal than radius from
+        a location during a time window (see :func:`request`).
+        """
+        x, y = coord.getX(), coord.getY()
+        G = self.__candidates(x - radius, x + radius, y - radius, y + radius, t1, t2)
+        G = G[np.hypot(self.X[G] - x, self.Y[G] - y) <= radius]
+        return self.__hits(G)
+
+    def getTracks(self, hits) -> list[Track]:
+        """Tracks made of the observations of hits"""
+        return [self.collection[num].extract(start, end - 1) for (num, start, end) in hits]
+
+    def __candidates(self, x0, x1, y0, y1, t1, t2) -> np.ndarray:
+        """Observations (global indices) of the buckets intersecting a box
+        and a time window, filtered on time"""
+        t1 = -math.inf if t1 is None else _absTime(t1)
+        t2 = math.inf if t2 is None else _absTime(t2)
+        if (x0 > self.xmax) or (x1 < self.xmin) or (y0 > self.ymax) or (y1 < self.ymin):
+            return np.zeros(0, dtype=np.int64)
+        if (t1 > self.tmax) or (t2 < self.tmin) or (t1 > t2):
+            return np.zeros(0, dtype=np.int64)
+        I = np.arange(self.__cellsX(x0), self.__cellsX(x1) + 1)
+        J = np.arange(self.__cellsY(y0), self.__cellsY(y1) + 1)
+        cells = (I[:, None] * self.lsize + J[None, :]).reshape(-1)
+        b1 = self.__intervals(max(t1, self.tmin))
+        b2 = self.__intervals(min(t2, self.tmax))
+
+        # Buckets of a cell over the time window are consecutive keys
+        lo = self.offsets[np.searchsorted(self.keys, cells * self.tsize + b1, side="left")]
+        hi = self.offsets[np.searchsorted(self.keys, cells * self.tsize + b2, side="right")]
+        count = hi - lo
+        pos = np.repeat(lo, count) + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        G = self.index[pos]
+        return G[(self.T[G] >= t1) & (self.T[G] <= t2)]
+
+    def __hits(self, G) -> list[tuple]:
+        """Ranges of consecutive observations of tracks"""
+        if G.size == 0:
+            return []
+        G = np.sort(G)
+        N = self.tracks[G]
+        cut = np.flatnonzero((np.diff(G) != 1) | (np.diff(N) != 0)) + 1
+        starts = np.concatenate([[0], cut])
+        ends = np.concatenate([cut, [G.size]])
+        nums = N[starts]
+        first = self.first[nums]
+        return list(zip(nums.tolist(), (G[starts] - first).tolist(), (G[ends - 1] + 1 - first).tolist()))
+
+    def save(self, filename):
+        """Save the spatio-temporal index (with its collection) in a pickle file"""
+        outfile = open(filename, "wb")
+        pickle.dump(self, outfile)
+        outfile.close()
+
+    @staticmethod
+    def load(filename):
+        """Load a spatio-temporal index saved by :func:`save` (only load trusted
+        files: unpickling can execute code)"""
+        infile = open(filename, "rb")
+        index = pickle.load(infile)
+        infile.close()
+        return index
+
+
+def _absTime(t) -> float:
+    """Absolute time (in seconds) of a timestamp or of a number"""
+    if isinstance(t, ObsTime):
+        return t.toAbsTime()
+    return float(t)
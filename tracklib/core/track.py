@@ -52,11 +52,14 @@ import sys
 import math
 import time
 import copy
+import functools
 import numpy as np
 
-from . import (ObsTime, ENUCoords, GeoCoords, Obs, 
+from . import (ObsTime, ENUCoords, GeoCoords, ECEFCoords, 
+               Obs, ObsColumns, ObsView,
                isnan, listify, NAN, isfloat,
                compLike, makeRPN,
+               compileQuery, evaluateWhere, selectColumns, evaluateSelect,
                TrackCollection,
                DiracKernel, GaussianKernel,
                Bbox,
@@ -66,7 +69,7 @@ from tracklib.util.exceptions import QueryError, AnalyticalFeatureError, Operato
 from tracklib.util.exceptions import AnalyticalFeatureWarning
 from tracklib.plot import IPlotVisitor, MatplotlibVisitor
 from tracklib.algo import (BIAF_SPEED, BIAF_ABS_CURV, 
-                           computeAbsCurv, 
+                           computeAbsCurv, getVectorizedAF,
                            resample, MODE_SPATIAL,
                            filter_seq,
                            mapOn,
@@ -80,7 +83,7 @@ from tracklib.algo import (BIAF_SPEED, BIAF_ABS_CURV,
 from . import (UnaryOperator, BinaryOperator, 
                ScalarOperator, ScalarVoidOperator, 
                BinaryVoidOperator, UnaryVoidOperator,
-               Operator)
+               Operator, hasArrayKernel)
 
 
 class Track:
@@ -89,8 +92,14 @@ class Track:
     """
 
     def __init__(self, list_of_obs=None, user_id=0, track_id=0, base=None):
-        """Takes a (possibly empty) list of points as input"""
-        if not list_of_obs:
+        """Takes a (possibly empty) list of points as input
+
+        A :class:`ObsColumns` object may be given instead of a list of points:
+        track is then stored in columnar mode (see :func:`toColumnar`).
+        """
+        if isinstance(list_of_obs, ObsColumns):
+            self.__POINTS = list_of_obs
+        elif not list_of_obs:
             self.__POINTS = []
         else:
             self.__POINTS = list_of_obs
@@ -102,9 +111,114 @@ class Track:
 
         self.__analyticalFeaturesDico = {}
 
-    def copy(self):
-        """TODO"""
-        return copy.deepcopy(self)
+    def copy(self, cow=False):
+        """Copy the track
+
+        Observations are duplicated structurally (see :func:`Obs.copy`), other
+        attributes are deep copied.
+
+        :param cow: In columnar mode, share the columns of analytical features
+            with the copy until one of both tracks modifies them (copy-on-write).
+            Shared columns are made read-only, in the copy **and in the current
+            track**: writing in place into an array returned by
+            :func:`getAnalyticalFeature` (on either track) raises ValueError
+            until the track has modified the feature with
+            :func:`setObsAnalyticalFeature`, :func:`updateAnalyticalFeature`...
+            (which give it its own writable column).
+        """
+        output = Track.__new__(Track)
+        memo = {id(self): output}
+        for key, value in self.__dict__.items():
+            if key != "_Track__POINTS":
+                output.__dict__[key] = copy.deepcopy(value, memo)
+        if self.isColumnar():
+            output.__POINTS = self.__POINTS.copy(cow)
+        else:
+            output.__POINTS = [obs.copy() for obs in self.__POINTS]
+        return output
+
+    def view(self, i, j):
+        """Shallow slice of the track sharing its observations
+
+        Observations i to j-1 are not copied: modifying them (coordinates,
+        timestamps or analytical features) modifies the current track.
+        Adding, removing or reordering observations of the view does not
+        (and detaches the view of a columnar track).
+
+        :param i: Index of the first observation
+        :param j: Index after the last observation
+        :return: A track made of observations i to j-1
+        """
+        if self.isColumnar():
+            points = self.__POINTS.view(i, j)
+        else:
+            points = self.__POINTS[i:j]
+        track = Track(points, self.uid, self.tid, base=self.base)
+        track.no_data_value = self.no_data_value
+        track.__transmitAF(self)
+        return track
+
+    # =========================================================================
+    # Columnar storage
+    # =========================================================================
+    @staticmethod
+    def fromArrays(X, Y, Z=None, T=None, srid="ENU", af=None,
+                   user_id=0, track_id=0, base=None, copy=True) -> Track:
+        """Build a columnar track from coordinate and time arrays
+
+        :param X: 1st coordinates (X, lon or E)
+        :param Y: 2nd coordinates (Y, lat or N)
+        :param Z: 3rd coordinates (Z, hgt or U), defaults to 0
+        :param T: Timestamps in seconds since 1970/01/01, defaults to 0
+        :param srid: Coordinate type ("ENU", "Geo" or "ECEF")
+        :param af: Dictionary of analytical features (name -> values)
+        :param copy: If False, float64 arrays are used as columns without
+            being copied (see :func:`ObsColumns.fromArrays`)
+        :return: A track in columnar mode
+        """
+        if not copy:
+            af = {} if af is None else af
+            columns = ObsColumns.fromArrays(X, Y, Z, T, srid, list(af.values()), copy=False)
+            track = Track(columns, user_id, track_id, base=base)
+            track.__analyticalFeaturesDico = {name: k for k, name in enumerate(af)}
+            return track
+        track = Track(ObsColumns.fromArrays(X, Y, Z, T, srid),
+                      user_id, track_id, base=base)
+        if af is not None:
+            for name, values in af.items():
+                track.createAnalyticalFeature(name, values)
+        return track
+
+    def isColumnar(self) -> bool:
+        """Check if track is stored in columnar mode"""
+        return isinstance(self.__POINTS, ObsColumns)
+
+    def toColumnar(self) -> Track:
+        """Convert track storage into NumPy columns (in place)
+
+        In columnar mode, coordinates, timestamps and analytical features are
+        stored in arrays, :func:`getX`, :func:`getT`, :func:`getAnalyticalFeature`
+        (...) return zero-copy array views, and observations are exposed as
+        :class:`ObsView` objects reading and writing the columns. GNSS quality
+        fields of observations (dop, number of satellites...) are not kept.
+        """
+        if not self.isColumnar():
+            self.__POINTS = ObsColumns.fromObsList(
+                self.__POINTS, len(self.__analyticalFeaturesDico))
+        return self
+
+    def toPoints(self) -> Track:
+        """Convert track storage back into a list of :class:`Obs` (in place)"""
+        if self.isColumnar():
+            self.__POINTS = self.__POINTS.toObsList()
+        return self
+
+    def __reorder(self, indices):
+        """Replace observations with observations at indices"""
+        if self.isColumnar():
+            self.__POINTS = self.__POINTS.take(indices)
+        else:
+            self.__POINTS = [self.__POINTS[i] for i in indices]
 
     def __str__(self) -> str:
         """TODO"""
@@ -115,7 +229,14 @@ class Track:
 
     def getSRID(self) -> str:
         """TODO"""
-        return str(type(self.getFirstObs().position)).split(".")[-1][0:-8]
+        if self.isColumnar():
+            return self.__POINTS.srid
+        position = self.getFirstObs().position
+        if isinstance(position, GeoCoords):
+            return "Geo"
+        if isinstance(position, ECEFCoords):
+            return "ECEF"
+        return str(type(position)).split(".")[-1][0:-8]
 
     def getTimeZone(self):
         """TODO"""
@@ -123,11 +244,17 @@ class Track:
 
     def setTimeZone(self, zone):
         """TODO"""
+        if self.isColumnar():
+            self.__POINTS.zone = zone
+            return
         for i in range(len(self)):
             self[i].timestamp.zone = zone
 
     def convertToTimeZone(self, zone):
         """TODO"""
+        if self.isColumnar():
+            self.__POINTS.zone = zone
+            return
         for i in range(len(self)):
             self[i].timestamp = self[i].timestamp.convertToZone(zone)
 
@@ -194,6 +321,10 @@ class Track:
     # =========================================================================
     def toECEFCoords(self, base=None):
         """TODO"""
+        if self.isColumnar():
+            output = self.toPoints().toECEFCoords(base)
+            self.toColumnar()
+            return output
         if self.getSRID() == "Geo":
             for i in range(self.size()):
                 self.getObs(i).position = self.getObs(i).position.toECEFCoords()
@@ -213,6 +344,10 @@ class Track:
 
     def toENUCoords(self, base=None):
         """TODO"""
+        if self.isColumnar():
+            output = self.toPoints().toENUCoords(base)
+            self.toColumnar()
+            return output
         if self.getSRID() in ["Geo", "ECEF"]:
             if base == None:
                 base = self.getFirstObs().position
@@ -246,6 +381,10 @@ class Track:
 
     def toGeoCoords(self, base=None):
         """TODO"""
+        if self.isColumnar():
+            output = self.toPoints().toGeoCoords(base)
+            self.toColumnar()
+            return output
         if self.getSRID() == "ECEF":
             for i in range(self.size()):
                 self.getObs(i).position = self.getObs(i).position.toGeoCoords()
@@ -263,6 +402,10 @@ class Track:
 
     def toProjCoords(self, srid):
         """TODO"""
+        if self.isColumnar():
+            output = self.toPoints().toProjCoords(srid)
+            self.toColumnar()
+            return output
         if not (self.getSRID().upper() == "GEO"):
             print(
                 "Error: track must be in GEO coordinate for projection to SRID = "
@@ -391,6 +534,8 @@ class Track:
 
     def getX(self, i=None):
         """TODO"""
+        if self.isColumnar():
+            return self.__POINTS.getX() if i is None else self.__POINTS.getX()[i]
         if i is None:
             X = []
             for i in range(self.size()):
@@ -401,6 +546,8 @@ class Track:
 
     def getY(self, i=None):
         """TODO"""
+        if self.isColumnar():
+            return self.__POINTS.getY() if i is None else self.__POINTS.getY()[i]
         if i is None:
             Y = []
             for i in range(self.size()):
@@ -411,6 +558,8 @@ class Track:
 
     def getZ(self, i=None):
         """TODO"""
+        if self.isColumnar():
+            return self.__POINTS.getZ() if i is None else self.__POINTS.getZ()[i]
         if i is None:
             Z = []
             for i in range(self.size()):
@@ -421,6 +570,8 @@ class Track:
 
     def getT(self, i=None):
         """TODO"""
+        if self.isColumnar():
+            return self.__POINTS.getT() if i is None else self.__POINTS.getT()[i]
         if i is None:
             T = []
             for i in range(self.size()):
@@ -598,6 +749,8 @@ class Track:
         return output
 
     def getAnalyticalFeature(self, af_name):
+        if self.isColumnar():
+            return self.__getColumn(af_name)
         AF = []
         if af_name == "x":
             for i in range(self.size()):
@@ -630,6 +783,24 @@ class Track:
             AF.append(self.__POINTS[i].features[index])
         return AF
 
+    def __getColumn(self, af_name):
+        """Zero-copy view on a column (columnar mode only)"""
+        if af_name == "x":
+            return self.__POINTS.getX()
+        if af_name == "y":
+            return self.__POINTS.getY()
+        if af_name == "z":
+            return self.__POINTS.getZ()
+        if af_name == "t":
+            return self.__POINTS.getT()
+        if af_name == "timestamp":
+            return self.getTimestamps()
+        if af_name == "idx":
+            return np.arange(self.size())
+        if not af_name in self.__analyticalFeaturesDico:
+            raise AnalyticalFeatureError("track does not contain analytical feature '" + af_name + "'")
+        return self.__POINTS.getFeature(self.__analyticalFeaturesDico[af_name])
+
     def getObsAnalyticalFeatures(self, af_names, i):
         """TODO"""
         af_names = listify(af_names)
@@ -640,6 +811,8 @@ class Track:
 
     def getObsAnalyticalFeature(self, af_name, i):
         """TODO"""
+        if self.isColumnar() and af_name not in ["timestamp", "idx"]:
+            return self.__getColumn(af_name)[i]
         if af_name == "x":
             return self.getObs(i).position.getX()
         if af_name == "y":
@@ -722,11 +895,11 @@ class Track:
 
     def sort(self):
         """TODO"""
+        if self.isColumnar():
+            self.__reorder(np.argsort(self.getT()))
+            return
         sort_index = np.argsort(np.array(self.getTimestamps()))
-        new_list = []
-        for i in range(self.size()):
-            new_list.append(self.__POINTS[sort_index[i]])
-        self.__POINTS = new_list
+        self.__reorder(sort_index)
 
     def isSorted(self):
         """TODO"""
@@ -737,6 +910,8 @@ class Track:
 
     def addObs(self, obs):
         """TODO"""
+        if isinstance(obs, ObsView) and not self.isColumnar():
+            obs = obs.toObs()
         self.__POINTS.append(obs)
 
     def insertObs(self, obs, i=None):
@@ -859,10 +1034,9 @@ class Track:
         new_list = []
         for i in range(len(YEARS)):
             for j in range(len(YEARS[i])):
-                id = YEARS[i][j]
-                new_list.append(self.__POINTS[id])
+                new_list.append(YEARS[i][j])
 
-        self.__POINTS = new_list
+        self.__reorder(new_list)
 
     # =========================================================================
     # Track cleaning functions
@@ -1153,6 +1327,27 @@ class Track:
 
         idAF = self.__analyticalFeaturesDico[name]
 
+        # Whole track implementation of the algorithm (if available)
+        vectorized = getVectorizedAF(algorithm)
+        values = None if vectorized is None else vectorized(self)
+        if values is not None:
+            if self.isColumnar():
+                self.__POINTS.setFeature(idAF, values)
+            else:
+                values = Track.__toList(values) if isinstance(values, np.ndarray) else list(values)
+                self.updateAnalyticalFeature(name, values)
+            return self.getAnalyticalFeature(name)
+
+        if self.isColumnar():
+            values = [NAN] * self.size()
+            for i in range(self.size()):
+                try:
+                    values[i] = algorithm(self, i)
+                except IndexError:
+                    values[i] = NAN
+            self.__POINTS.setFeature(idAF, values)
+            return self.getAnalyticalFeature(name)
+
         for i in range(self.size()):
             value = 0
             try:
@@ -1184,6 +1379,9 @@ class Track:
 
         idAF = len(self.__analyticalFeaturesDico)
         self.__analyticalFeaturesDico[name] = idAF
+        if self.isColumnar():
+            self.__POINTS.addFeature(val_init)
+            return
         if isinstance(val_init, list):
             for i in range(self.size()):
                 self.getObs(i).features.append(val_init[i])
@@ -1200,6 +1398,9 @@ class Track:
         if self.size() <= 0:
             raise AnalyticalFeatureError("Error: can't add AF '" + name + "', there is no observation in track")
         idAF = self.__analyticalFeaturesDico[name] 
+        if self.isColumnar():
+            self.__POINTS.setFeature(idAF, new_val)
+            return
         if isinstance(new_val, list):
             for i in range(self.size()):
                 self.getObs(i).features[idAF] = new_val[i]
@@ -1212,8 +1413,11 @@ class Track:
         if not self.hasAnalyticalFeature(name):
             raise AnalyticalFeatureError("Error: track does not contain analytical feature '" + name + "'")
         idAF = self.__analyticalFeaturesDico[name]
-        for i in range(self.size()):
-            del self.getObs(i).features[idAF]
+        if self.isColumnar():
+            self.__POINTS.removeFeature(idAF)
+        else:
+            for i in range(self.size()):
+                del self.getObs(i).features[idAF]
         del self.__analyticalFeaturesDico[name]
         keys = self.__analyticalFeaturesDico.keys()
         for k in keys:
@@ -1278,7 +1482,7 @@ class Track:
         for i in range(1, len(self)):
             TO_DEL[i] = self.__compare(i - 1, i, code)
             # print(self.__compare(i-1, i, code))
-        self.__POINTS = [self.__POINTS[i] for i in range(len(self)) if not TO_DEL[i]]
+        self.__reorder([i for i in range(len(self)) if not TO_DEL[i]])
 
     def op(self, operator, arg1=None, arg2=None, arg3=None):
         """Shortcut for :func:`operate` function
@@ -1355,25 +1559,28 @@ class Track:
         if isinstance(operator, str):
             if arg1 is None:
                 arg1 = []
-            output = self.__evaluate(operator, arg1)
-            SUPPRESS_AF = self.getListAnalyticalFeatures()
-            for af in SUPPRESS_AF:
-                if af[0] == "#":
-                    self.removeAnalyticalFeature(af)
-            return output
+            return self.__evaluate(operator, arg1)
+
+        # Operators with an array-level kernel are executed in bulk on
+        # the values of the analytical features (see executeArray)
+        vectorized = hasArrayKernel(operator)
 
         # UnaryOperator
         if isinstance(operator, UnaryOperator):
             if isinstance(arg1, str):
+                if vectorized:
+                    return operator.executeArray(self.__operand(arg1, []))
                 return operator.execute(self, arg1)
             output = [0] * len(arg1)
-            for i in range(output):
-                output[i] = operator.execute(self, arg1[i])
+            for i in range(len(arg1)):
+                output[i] = self.operate(operator, arg1[i])
             return output
 
         # BinaryOperator
         if isinstance(operator, BinaryOperator):
             if isinstance(arg1, str):
+                if vectorized:
+                    return operator.executeArray(self.__operand(arg1, []), self.__operand(arg2, []))
                 return operator.execute(self, arg1, arg2)
             if len(arg1) != len(arg2):
                 raise OperatorError(
@@ -1382,17 +1589,19 @@ class Track:
                     + ": non-concordant number in input features"
                 )
             output = [0] * len(arg1)
-            for i in range(output):
-                output[i] = operator.execute(self, arg1[i], arg2[i])
+            for i in range(len(arg1)):
+                output[i] = self.operate(operator, arg1[i], arg2[i])
             return output
 
         # ScalarOperator
         if isinstance(operator, ScalarOperator):
             if isinstance(arg1, str):
+                if vectorized:
+                    return operator.executeArray(self.__operand(arg1, []), arg2)
                 return operator.execute(self, arg1, arg2)
             output = [0] * len(arg1)
             for i in range(len(arg1)):
-                output[i] = operator.execute(self, arg1[i], arg2)
+                output[i] = self.operate(operator, arg1[i], arg2)
             return output
 
         # UnaryVoidOperator
@@ -1400,6 +1609,8 @@ class Track:
             if arg2 == None:
                 arg2 = arg1
             if isinstance(arg1, str):
+                if vectorized:
+                    return self.__store(arg2, operator.executeArray(self.__operand(arg1, [])))
                 return operator.execute(self, arg1, arg2)
             if len(arg1) != len(arg2):
                 raise OperatorError(
@@ -1408,13 +1619,16 @@ class Track:
                     + ": non-concordant number in input and output features"
                 )
             for i in range(len(arg1)):
-                operator.execute(self, arg1[i], arg2[i])
+                self.operate(operator, arg1[i], arg2[i])
 
         # BinaryVoidOperator
         if isinstance(operator, BinaryVoidOperator):
             if arg3 == None:
                 arg3 = arg1
             if isinstance(arg1, str):
+                if vectorized:
+                    values = operator.executeArray(self.__operand(arg1, []), self.__operand(arg2, []))
+                    return self.__store(arg3, values)
                 return operator.execute(self, arg1, arg2, arg3)
             if len(arg1) != len(arg2):
                 raise OperatorError(
@@ -1429,13 +1643,17 @@ class Track:
                     + ": non-concordant number in input and output features"
                 )
             for i in range(len(arg1)):
-                operator.execute(self, arg1[i], arg2[i], arg3[i])
+                self.operate(operator, arg1[i], arg2[i], arg3[i])
 
         # ScalarVoidOperator
         if isinstance(operator, ScalarVoidOperator):
             if arg3 == None:
                 arg3 = arg1
             if isinstance(arg1, str):
+                if vectorized:
+                    if isinstance(arg2, str):
+                        arg2 = self.__operand(arg2, [])
+                    return self.__store(arg3, operator.executeArray(self.__operand(arg1, []), arg2))
                 return operator.execute(self, arg1, arg2, arg3)
             if len(arg1) != len(arg3):
                 raise OperatorError(
@@ -1444,7 +1662,7 @@ class Track:
                     + ": non-concordant number in input and output features"
                 )
             for i in range(len(arg1)):
-                operator.execute(self, arg1[i], arg2, arg3[i])
+                self.operate(operator, arg1[i], arg2, arg3[i])
 
     def biop(self, track, expression):
         """Shortcut for :func:`bioperate` function"""
@@ -1780,34 +1998,6 @@ class Track:
     # ==========================================================================
     #          QUERY
     
-    def __condition(val1, operator, val2):
-        """TODO"""
-        
-        if operator == "LIKE":
-            return compLike(str(val1), val2)
-
-        if isinstance(val1, int):
-            val2 = int(val2)
-        if isinstance(val1, float):
-            val2 = float(val2)
-        if isinstance(val1, ObsTime):
-            val2 = ObsTime.readTimestamp(val2)
-        if isinstance(val1, bool):
-            val2 = (val2.upper == "TRUE") or (val2.upper == "T") or (val2 == "1")
-
-        if operator == "<":
-            return val1 < val2
-        if operator == ">":
-            return val1 > val2
-        if operator == "<=":
-            return val1 <= val2
-        if operator == ">=":
-            return val1 >= val2
-        if (operator == "=") or (operator == "=="):
-            return val1 == val2
-        if operator == "!=":
-            return val1 != val2
-
     def query(self, cmd: str) -> list[Any]:
         """Query observations in a track with SQL-like commands.
 
@@ -1865,167 +2055,131 @@ class Track:
             - Capital letters must be used for SQL keywords ``SELECT, WHERE, AND, OR``
               and aggregator
 
+        Queries are compiled once into a plan (see :func:`compileQuery`), then
+        conditions are evaluated as boolean masks over the analytical features.
+
         :param cmd: TODO
         :return: TODO
         """
 
-        cmd = cmd.strip()
-
-        AGG = [
-            "SUM",
-            "AVG",
-            "COUNT",
-            "VAR",
-            "MEDIAN",
-            "ARGMIN",
-            "ARGMAX",
-            "MIN",
-            "MAX",
-            "RMSE",
-            "MAD",
-            "STDDEV",
-            "ZEROS",
-        ]
-
-        select_part = cmd.split("SELECT")[1].split("WHERE")[0].strip()
-
-        if not select_part == "*":
-            select_part = select_part.split(",")
-            aggregator = []
-            for i in range(len(select_part)):
-                for j in range(len(AGG)):
-                    if (AGG[j] + "(") in select_part[i]:
-                        aggregator.append(j)
-                        select_part[i] = select_part[i].strip()[len(AGG[j]) + 1 : -1]
-                        break
-
-        temp = cmd.split("WHERE")
-        if len(temp) < 2:
-            where_part = -1
-        else:
-            where_part = temp[1]
-            if ("(" in where_part) or (")" in where_part):
-                message = "Error: parenthesis not allowed in conditions."
-                message += "Use boolean algebra rules to reformulate query or use successive queries"
-                raise QueryError(message)
-
-        if not select_part == "*":
-            LAF = []
-            for i in range(len(select_part)):
-                LAF.append([])
-
-        output = Track()
-        BOOL = []
+        fields, aggregators, where = compileQuery(cmd)
+        mask = evaluateWhere(self, where)
 
-        for i in range(self.size()):
-            if where_part == -1:
-                select_all = True
+        if fields is None:
+            if self.isColumnar():
+                output = Track(self.__POINTS.take(np.flatnonzero(mask)))
             else:
-                c0 = where_part.split("OR")
-                select_all = False
-                for c1 in c0:
-                    c2 = c1.split("AND")
-                    select = True
-                    for c3 in c2:
-                        c4 = c3.strip().split(" ")
-                        operator = c4[1]
-                        for k in range(3, len(c4)):
-                            c4[2] += " " + c4[k]
-                        #print (self[c4[0]][i], " ", operator)
-                        select = select and Track.__condition(
-                            self[c4[0]][i], operator, c4[2]
-                        )
-                    select_all = select_all or select
-            BOOL.append(select_all)
-
-        if select_part == "*":
-            for i in range(len(BOOL)):
-                if BOOL[i]:
-                    output.addObs(self[i])
+                output = Track([self.__POINTS[i] for i in np.flatnonzero(mask).tolist()])
             output.__analyticalFeaturesDico = self.__analyticalFeaturesDico.copy()
             return output
-        else:
-            for i in range(len(BOOL)):
-                if BOOL[i]:
-                    for j in range(len(select_part)):
-                        LAF[j].append(self[select_part[j].strip()][i])
-
-            if len(aggregator) == 0:
-                return LAF
-
-            OUTPUT = []
-            for af in range(len(LAF)):
-                AF = LAF[af]
-                if AGG[aggregator[af]] == "COUNT":
-                    OUTPUT.append(len(AF))
-                if (len(aggregator) > 0) and (len(AF) == 0):
-                    return None
-                if (len(aggregator) > 0) and (len(AF) > 0):
-                    tmp = Track()
-                    for i in range(len(AF)):
-                        tmp.addObs(Obs(ENUCoords(0, 0, 0)))
-                    tmp.createAnalyticalFeature("#tmp", AF)
-                    if AGG[aggregator[af]] == "SUM":
-                        OUTPUT.append(tmp.operate(Operator.SUM, "#tmp"))
-                    if AGG[aggregator[af]] == "AVG":
-                        OUTPUT.append(tmp.operate(Operator.AVERAGER, "#tmp"))
-                    if AGG[aggregator[af]] == "VAR":
-                        OUTPUT.append(tmp.operate(Operator.VARIANCE, "#tmp"))
-                    if AGG[aggregator[af]] == "MEDIAN":
-                        OUTPUT.append(tmp.operate(Operator.MEDIAN, "#tmp"))
-                    if AGG[aggregator[af]] == "MIN":
-                        OUTPUT.append(tmp.operate(Operator.MIN, "#tmp"))
-                    if AGG[aggregator[af]] == "MAX":
-                        OUTPUT.append(tmp.operate(Operator.MAX, "#tmp"))
-                    if AGG[aggregator[af]] == "RMSE":
-                        OUTPUT.append(tmp.operate(Operator.RMSE, "#tmp"))
-                    if AGG[aggregator[af]] == "STDDEV":
-                        OUTPUT.append(tmp.operate(Operator.STDDEV, "#tmp"))
-                    if AGG[aggregator[af]] == "ARGMIN":
-                        OUTPUT.append(tmp.operate(Operator.ARGMIN, "#tmp"))
-                    if AGG[aggregator[af]] == "ARGMAX":
-                        OUTPUT.append(tmp.operate(Operator.ARGMAX, "#tmp"))
-                    if AGG[aggregator[af]] == "ZEROS":
-                        OUTPUT.append(tmp.operate(Operator.ZEROS, "#tmp"))
-                    if AGG[aggregator[af]] == "MAD":
-                        OUTPUT.append(tmp.operate(Operator.MAD, "#tmp"))
-
-            if len(OUTPUT) == 1:
-                return OUTPUT[0]
-
-            return OUTPUT
+
+        return evaluateSelect(aggregators, selectColumns(self, fields, mask))
 
 
     # ==========================================================================
 
-    def __applyOperation(self, op1, op2, operator, temp_af_counter):
-        """Applying operators through algebraic expressions"""
-        # Handling special case of affectation
-        if operator == "=":
-            if self.hasAnalyticalFeature(op2):
-                if self.hasAnalyticalFeature(op1):
-                    if op1 in ["x", "y", "z", "t"]:
-                        if op1 == "x":
-                            self.setXFromAnalyticalFeature(op2)
-                        if op1 == "y":
-                            self.setYFromAnalyticalFeature(op2)
-                        if op1 == "z":
-                            self.setZFromAnalyticalFeature(op2)
-                        if op1 == "t":
-                            self.setTFromAnalyticalFeature(op2)
-                        self.removeAnalyticalFeature(op2)
-                    else:
-                        AF = self.getAnalyticalFeature(op2)
-                        self.removeAnalyticalFeature(op1)
-                        self.createAnalyticalFeature(op1, AF)
-                else:
-                    self.createAnalyticalFeature(op1, self.getAnalyticalFeature(op2))
+    # ------------------------------------------------------------
+    # Algebraic expressions: compiled once into a RPN plan (cached
+    # by expression string), then evaluated over arrays of values.
+    # Intermediate results are arrays: no temporary AF is created.
+    # ------------------------------------------------------------
+    __RPN_OPERATORS = ["=", "+", "-", "*", "/", "^", "@", "&", "$", "<", ">", "%", "!"]
+
+    def __operand(self, operand, external):
+        """Value of an operand of the plan (scalar or array)"""
+        if not isinstance(operand, str):
+            return operand
+        if operand in external:
+            return external[operand]
+        if not self.hasAnalyticalFeature(operand):
+            raise AnalyticalFeatureError("track does not contain analytical feature '" + operand + "'")
+        values = self.getAnalyticalFeature(operand)
+        if isinstance(values, np.ndarray):
+            return values
+        try:
+            return np.asarray(values, dtype=float)
+        except (TypeError, ValueError):
+            return np.asarray(values, dtype=object)
+
+    def __setColumn(self, name, values):
+        """Set coordinates ("x", "y", "z") or times ("t") from an array"""
+        if name == "t":
+            values = [v.toAbsTime() if isinstance(v, ObsTime) else v for v in values]
+            if self.isColumnar():
+                self.__POINTS.setColumn("t", values)
             else:
-                self.createAnalyticalFeature(op1, float(op2))
+                for i in range(self.size()):
+                    self.getObs(i).timestamp = ObsTime.readUnixTime(values[i])
+            return
+        if self.isColumnar():
+            self.__POINTS.setColumn(name, values)
             return
+        values = values.tolist()
+        for i in range(self.size()):
+            if name == "x":
+                self.getObs(i).position.setX(values[i])
+            if name == "y":
+                self.getObs(i).position.setY(values[i])
+            if name == "z":
+                self.getObs(i).position.setZ(values[i])
+
+    def __assign(self, name, values):
+        """Store the result of an expression in AF (or coordinates) name"""
+        if not isinstance(values, np.ndarray):
+            values = np.full(self.size(), float(values))
+        if name in ["x", "y", "z", "t"]:
+            self.__setColumn(name, values)
+            return
+        if self.hasAnalyticalFeature(name):
+            self.removeAnalyticalFeature(name)
+        if not self.isColumnar():
+            values = Track.__toList(values)
+        self.createAnalyticalFeature(name, values)
+
+    def __toList(values):
+        """List of values of an array (no-data values are set to NAN)"""
+        return [NAN if v != v else v for v in values.tolist()]
+
+    def __store(self, name, values):
+        """Store the output array of an operator in AF (or coordinates) name"""
+        values = np.asarray(values)
+        if name in ["x", "y", "z", "t"]:
+            self.__setColumn(name, values)
+            return values if self.isColumnar() else Track.__toList(values)
+        if not self.isColumnar():
+            values = Track.__toList(values)
+        if self.hasAnalyticalFeature(name):
+            self.updateAnalyticalFeature(name, values)
+        else:
+            self.createAnalyticalFeature(name, values)
+        return values
+
+    def __applyFunction(self, name, values):
+        """Apply a function (D, LOG, AVG...) of an expression on values"""
+        if not isinstance(values, np.ndarray):
+            values = np.full(self.size(), float(values))
+        if name in Operator.NAMES_DICT_VOID:
+            return np.asarray(Operator.NAMES_DICT_VOID[name].executeArray(values))
+        if name in Operator.NAMES_DICT_NON_VOID:
+            out = Operator.NAMES_DICT_NON_VOID[name].executeArray(values)
+            return np.full(len(values), out)
+        raise OperatorError("Function '" + str(name) + "' is unknown")
+
+    def __applyOperation(self, op1, op2, operator, external):
+        """Applying operators through algebraic expressions"""
+        if operator == "=":
+            self.__assign(op1, self.__operand(op2, external))
+            return None
+        if operator == "@":
+            return self.__applyFunction(op1, self.__operand(op2, external))
+
+        op1 = self.__operand(op1, external)
+        op2 = self.__operand(op2, external)
+        op1IsAF = isinstance(op1, np.ndarray)
+        op2IsAF = isinstance(op2, np.ndarray)
 
         # Floating point operation
-        if isfloat(op1) and isfloat(op2):
+        if not op1IsAF and not op2IsAF:
             op1 = float(op1)
             op2 = float(op2)
             if operator == "+":
@@ -2037,87 +2191,42 @@ class Track:
             if operator == "/":
                 return op1 / op2
             if operator == "^":
-                return op1 ^ op2
+                return op1 ** op2
             if operator == ">":
                 return op1 > op2
             if operator == "<":
                 return op1 < op2
-
-        # Functional operator
-        if operator == "@":
-            out_af = "#" + str(temp_af_counter)
-            if op1 in Operator.NAMES_DICT_VOID:
-                self.operate(Operator.NAMES_DICT_VOID[op1], op2, out_af)
-                return out_af
-            if op1 in Operator.NAMES_DICT_NON_VOID:
-                out = self.operate(Operator.NAMES_DICT_NON_VOID[op1], op2)
-                self.createAnalyticalFeature(out_af, [out] * self.size())
-                return out_af
-            print("Function '" + op1 + "' is unknown")
-            exit(1)
-
-        op1IsAF = self.hasAnalyticalFeature(op1)
-        op2IsAF = self.hasAnalyticalFeature(op2)
+            if operator == "%":
+                return op1 % op2
+            key = None
 
         # [AF operator AF] case
-        if op1IsAF and op2IsAF:
-            out_af = "#" + str(temp_af_counter)
-            self.operate(Operator.NAMES_DICT_VOID[operator], op1, op2, out_af)
-            return out_af
-
+        elif op1IsAF and op2IsAF:
+            key = operator
         # [AF operator float] case
-        if op1IsAF and not op2IsAF:
-            out_af = "#" + str(temp_af_counter)
-            self.operate(
-                Operator.NAMES_DICT_VOID["s" + operator],
-                op1,
-                float(op2),
-                out_af,
-            )
-            return out_af
-
+        elif op1IsAF:
+            key = "s" + operator
+            op2 = float(op2)
         # [float operator AF] case
-        if op2IsAF and not op1IsAF:
-            out_af = "#" + str(temp_af_counter)
-            self.operate(
-                Operator.NAMES_DICT_VOID["sr" + operator],
-                op2,
-                float(op1),
-                out_af,
-            )
-            return out_af
-
-        print(
-            "Invalid operator "
-            + str(operator)
-            + " for operands "
-            + str(op1)
-            + " and "
-            + str(op2)
-        )
-        exit(1)
+        else:
+            key = "sr" + operator
+            op1, op2 = op2, float(op1)
 
-    def __evaluateRPN(self, expression, external=[]):
-        """TODO"""
-        stack = []
-        operators = ["=", "+", "-", "*", "/", "^", "@", "&", "$", "<", ">", "%", "!"]
-        temp_af_counter = 0
+        if key not in Operator.NAMES_DICT_VOID:
+            raise OperatorError("Invalid operator " + str(operator) + " in algebraic expression")
+        return np.asarray(Operator.NAMES_DICT_VOID[key].executeArray(op1, op2))
 
-        # Stack computation
-        for e in expression:
-            # print("STACK = ", stack, "->", e)   # DEBUG LINE
-            if e in operators:
+    def __evaluatePlan(self, plan, external):
+        """Evaluation of a compiled RPN plan"""
+        stack = []
+        for kind, token in plan:
+            if kind == "op":
                 operand2 = stack.pop()
                 operand1 = stack.pop()
-                stack.append(
-                    self.__applyOperation(operand1, operand2, e, temp_af_counter)
-                )
-                temp_af_counter += 1
+                stack.append(self.__applyOperation(operand1, operand2, token, external))
                 continue
-            if e in external:
-                e = external[e]
-            stack.append(e)
-        return expression
+            stack.append(token)
+        return stack[-1]
 
     def __convertReflexOperator(expression):
         """TODO"""
@@ -2161,8 +2270,17 @@ class Track:
         """TODO"""
         return Track.__prime(Track.__prime(rpn))
 
-    def __evaluate(self, expression, external=[]):
-        """TODO"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def compileExpression(expression):
+        """Compile an algebraic expression (see :func:`operate`)
+
+        Compiled plans are cached by expression string.
+
+        :param expression: Algebraic expression
+        :return: Plan (tuple of RPN tokens (kind, token) with kind in "op",
+            "num" or "name") and True if expression contains an affectation
+        """
         expression = expression.replace(" ", "")
         expression = Track.__specialOpChar(expression)
         expression = Track.__convertReflexOperator(expression)
@@ -2175,14 +2293,28 @@ class Track:
             if f_name[-1] in ["+", "-", "*", "/", "^"]:
                 continue
             expression = expression.replace(f_name + "(", f_name + "@(")
-        void = "=" in expression
-        if not void:
-            expression = "#output = " + expression
-        self.__evaluateRPN(Track.__double_prime(makeRPN(expression)), external)
-        if not void:
-            output = self.getAnalyticalFeature("#output")
-            self.removeAnalyticalFeature("#output")
+        plan = []
+        for e in Track.__double_prime(makeRPN(expression)):
+            if e in Track.__RPN_OPERATORS:
+                plan.append(("op", e))
+            elif isfloat(e):
+                plan.append(("num", float(e)))
+            else:
+                plan.append(("name", e))
+        return tuple(plan), "=" in expression
+
+    def __evaluate(self, expression, external=[]):
+        """TODO"""
+        plan, void = Track.compileExpression(expression)
+        output = self.__evaluatePlan(plan, external)
+        if void:
+            return
+        output = self.__operand(output, external)
+        if not isinstance(output, np.ndarray):
+            output = np.full(self.size(), float(output))
+        if self.isColumnar():
             return output
+        return Track.__toList(output)
 
     # ------------------------------------------------------------
     # Rotation of 2D track (coordinates should be ENU)
@@ -51,7 +51,10 @@ from random import randint
 
 import tracklib as tracklib
 from tracklib.core import removeNan, listify, compLike
+from tracklib.core import (compileQuery, evaluateWhere, selectColumns,
+                           concatenateColumns, evaluateSelect)
 #from tracklib.util.exceptions import *
+from tracklib.util.exceptions import UnknownModeError
 
 
 class TrackCollection:
@@ -100,11 +103,16 @@ class TrackCollection:
                 return self.getTrack(i)
         return None
 
-    def copy(self):
-        """TODO"""
+    def copy(self, cow=False):
+        """Copy the collection and its tracks
+
+        :param cow: Share columns of analytical features of columnar tracks
+            (copy-on-write, see :func:`Track.copy`). Shared columns become
+            read-only in the tracks of the current collection too.
+        """
         TRACKS = TrackCollection()
         for i in range(self.size()):
-            TRACKS.addTrack(self.getTrack(i).copy())
+            TRACKS.addTrack(self.getTrack(i).copy(cow))
         return TRACKS
 
     def setTimeZone(self, zone):
@@ -133,9 +141,18 @@ class TrackCollection:
     # Spatial index creation, export and import functions
     # =========================================================================
 
-    def createSpatialIndex(self, resolution=None, verbose=True):
-        """TODO"""
-        self.spatial_index = tracklib.SpatialIndex(self, resolution, verbose)
+    def createSpatialIndex(self, resolution=None, verbose=True, compact=False, method="GRID"):
+        """TODO
+
+        :param method: Structure of the index: "GRID" (:class:`SpatialIndex`)
+            or "RTREE" (:class:`RTreeIndex`)
+        """
+        if method.upper() == "RTREE":
+            self.spatial_index = tracklib.RTreeIndex(self, resolution, verbose=verbose)
+        elif method.upper() == "GRID":
+            self.spatial_index = tracklib.SpatialIndex(self, resolution, verbose=verbose, compact=compact)
+        else:
+            raise UnknownModeError("Unknown spatial index method: " + str(method))
 
     def exportSpatialIndex(self, filename):
         """TODO"""
@@ -275,7 +292,7 @@ class TrackCollection:
             values = track.getAnalyticalFeature(af_name)
             if not withNan:
                 values = removeNan(values)
-            valuesAF = valuesAF + values
+            valuesAF = valuesAF + list(values)
         return valuesAF
         
     def getTimestamps_str(self,withNan=True):
@@ -288,9 +305,46 @@ class TrackCollection:
     
             
     def operate(self, operator, arg1=None, arg2=None, arg3=None):
-        """TODO"""
-        for trace in self.__TRACES:
-            trace.operate(operator, arg1, arg2, arg3)
+        """Apply :func:`Track.operate` on each track of the collection
+
+        Operators are executed in bulk on the arrays of values of each
+        track (see executeArray method of operators).
+
+        :return: List of outputs (one per track)
+        """
+        return [trace.operate(operator, arg1, arg2, arg3) for trace in self.__TRACES]
+
+    def query(self, cmd):
+        """Query observations in all tracks with SQL-like commands
+
+        Syntax is the same as :func:`Track.query`. Query is compiled once,
+        then evaluated on each track and results are combined:
+
+            - ``SELECT *``: collection of the (non-empty) queried tracks
+            - ``SELECT f1, f2... fp``: values of the p fields, concatenated
+              over all tracks
+            - ``SELECT AGG1(f1)... AGGp(fp)``: aggregators computed on the
+              values selected in all tracks
+
+        :param cmd: SQL-like query
+        :return: Output of the query
+        """
+        fields, aggregators, where = compileQuery(cmd)
+
+        if fields is None:
+            output = TrackCollection()
+            for track in self:
+                selection = track.query(cmd)
+                if selection.size() > 0:
+                    output.addTrack(selection)
+            return output
+
+        parts = [[] for field in fields]
+        for track in self:
+            columns = selectColumns(track, fields, evaluateWhere(track, where))
+            for k in range(len(fields)):
+                parts[k].append(columns[k])
+        return evaluateSelect(aggregators, [concatenateColumns(part) for part in parts])
 
     def plot(self, symbols=None, markersize=[4], margin=0.05, append=False):
         """TODO"""
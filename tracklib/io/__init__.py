@@ -1,8 +1,12 @@
 """classes to load and export core objects"""
 
+from .compression import *
+from .wkt_parser import *
+
 from .network_format import *
 from .network_reader import *
 from .network_writer import *
+from .network_store import *
 
 from .raster_reader import *
 from .raster_writer import *
@@ -10,4 +14,6 @@ from .raster_writer import *
 from .track_format import *
 from .track_reader import *
 from .track_writer import *
+from .track_store import *
+from .lazy_track_collection import *
 
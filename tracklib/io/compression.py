@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains functions to read compressed files as streams.
+
+Files are decompressed on the fly according to their extension: ``.gz``
+(gzip), ``.bz2`` (bzip2), ``.xz`` and ``.lzma`` (LZMA). Members of a zip
+archive are designated by the path of the archive followed by their name in
+the archive (e.g. ``tracks.zip/2024/track_01.gpx``), and may be compressed
+themselves.
+
+Within a :func:`openArchive` block, members of the archive are all read from
+the same handle (the directory of the archive is parsed once).
+"""
+
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import threading
+import zipfile
+
+
+# Decompression functions (of a path or binary file object) by extension
+COMPRESSIONS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+ARCHIVE_EXTENSION = ".zip"
+
+# Archives kept open by openArchive (absolute path -> [ZipFile, count])
+_ARCHIVES = {}
+_ARCHIVES_LOCK = threading.Lock()
+
+
+def isCompressed(path) -> bool:
+    """Check if a file is compressed (according to its extension)"""
+    return os.path.splitext(str(path))[1].lower() in COMPRESSIONS
+
+
+def isArchive(path) -> bool:
+    """Check if a path refers to a zip archive"""
+    path = str(path)
+    return path.lower().endswith(ARCHIVE_EXTENSION) and os.path.isfile(path)
+
+
+def listArchive(path) -> list:
+    """Names of the files of a zip archive (in archive order)"""
+    with openArchive(path) as archive:
+        return [info.filename for info in archive.infolist() if not info.is_dir()]
+
+
+@contextlib.contextmanager
+def openArchive(path):
+    """Keep a zip archive open during a with block
+
+    Members of the archive opened in the block (by :func:`openStream`,
+    :func:`fileExists`...) are read from the returned handle, instead of
+    opening the archive and parsing its directory for each member.
+
+    :param path: Path of a zip archive
+    :return: The :class:`zipfile.ZipFile` object of the archive
+    """
+    key = os.path.abspath(str(path))
+    with _ARCHIVES_LOCK:
+        entry = _ARCHIVES.get(key)
+        if entry is None:
+            entry = _ARCHIVES[key] = [zipfile.ZipFile(key), 0]
+        entry[1] += 1
+    try:
+        yield entry[0]
+    finally:
+        with _ARCHIVES_LOCK:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _ARCHIVES[key]
+                entry[0].close()
+
+
+def splitArchivePath(path) -> tuple:
+    """Split the path of a member of a zip archive
+
+    :param path: Path of a file, or of a member of a zip archive
+    :return: Path of the archive and name of the member, or (path, None)
+        if the path does not refer to a member of an archive
+    """
+    path = str(path)
+    if os.path.exists(path):
+        return path, None
+    lower = path.lower()
+    index = lower.find(ARCHIVE_EXTENSION)
+    while index >= 0:
+        end = index + len(ARCHIVE_EXTENSION)
+        if path[end : end + 1] in ["/", os.sep] and os.path.isfile(path[:end]):
+            return path[:end], path[end + 1 :].replace(os.sep, "/")
+        index = lower.find(ARCHIVE_EXTENSION, end)
+    return path, None
+
+
+def fileExists(path) -> bool:
+    """Check if a path refers to a file (or to a member of a zip archive)"""
+    archive, member = splitArchivePath(path)
+    if member is None:
+        return os.path.isfile(archive)
+    with openArchive(archive) as zf:
+        try:
+            zf.getinfo(member)
+        except KeyError:
+            return False
+        return True
+
+
+def openStream(path, mode: str = "r", encoding: str = None, newline: str = None):
+    """Open a file, decompressed on the fly if needed
+
+    Plain files are opened with the built-in ``open`` function.
+
+    :param path: Path of a file (possibly compressed), or of a member of a
+        zip archive
+    :param mode: "r" (text) or "rb" (binary)
+    :param encoding: Encoding of text streams (see ``open``)
+    :param newline: Newline translation of text streams (see ``open``)
+    :return: File object
+    """
+    archive, member = splitArchivePath(path)
+    name = archive if member is None else member
+    decompress = COMPRESSIONS.get(os.path.splitext(name)[1].lower())
+
+    if (member is None) and (decompress is None):
+        if "b" in mode:
+            return open(archive, "rb")
+        return open(archive, "r", encoding=encoding, newline=newline)
+
+    if member is None:
+        stream = decompress(archive, "rb")
+    else:
+        # The member keeps the archive file open until it is closed
+        with openArchive(archive) as zf:
+            stream = zf.open(member)
+        if decompress is not None:
+            stream = decompress(stream, "rb")
+    if "b" in mode:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
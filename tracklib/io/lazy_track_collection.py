@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains a collection of tracks stored out-of-core, in shards
+on disk: binary files written by :class:`TrackStore` (tracks are referenced
+by their offset in the shard) or track files read with a
+:class:`TrackFormat` (tracks are referenced by their file).
+
+Tracks are loaded on demand and the last used ones are kept in a LRU cache
+bounded by a memory budget.
+"""
+
+# For type annotation
+from __future__ import annotations
+from tracklib.util.exceptions import *
+
+import collections
+import numpy as np
+from pathlib import Path
+
+from tracklib.core import Track, TrackCollection, Bbox, makeCoords, compLike
+from . import TrackStore, TrackReader
+
+
+# Estimated memory (in bytes) of an observation of a track of observations,
+# and of an analytical feature value in such a track
+_OBS_MEMORY = 320
+_AF_MEMORY = 56
+
+
+class LazyTrackCollection:
+    """Collection of tracks loaded on demand from shards on disk.
+
+    Metadata of tracks (ids, number of points and bounding boxes) are read
+    when the collection is opened, tracks are materialized when they are
+    accessed. Per-track algorithms registered with :func:`transform` (or
+    :func:`addAnalyticalFeature`) are applied to each track when it is loaded.
+
+    Modifications made directly on a returned track are lost when the track
+    is evicted from the cache.
+    """
+
+    def __init__(self, shards, fmt=None, memory: int = 256 * 2**20, cache_size: int = None):
+        """Constructor
+
+        Track files are read once to index their tracks. Afterwards, the
+        tracks of the last read track file are kept (outside of the memory
+        budget), so that iterating on the collection reads each file once.
+
+        :param shards: Directory or list of paths of the shards
+        :param fmt: Format of the track files (see :class:`TrackFormat`), or
+            None if shards are binary files written by :func:`TrackStore.write`
+        :param memory: Memory budget (in bytes) of the cache of tracks
+        :param cache_size: Maximal number of tracks in the cache (no limit by default)
+        """
+        if isinstance(shards, (str, Path)):
+            shards = sorted(Path(shards).iterdir())
+        self.shards = [str(path) for path in shards]
+        self.fmt = fmt
+        self.memory = memory
+        self.cache_size = cache_size
+        self.transforms = []
+        self.__cache = collections.OrderedDict()
+        self.__used = 0
+        self.__file = (None, [])  # Tracks of the last read track file (shard, tracks)
+
+        # References of tracks (shard, index in shard) and metadata
+        self.__refs = []
+        self.__stores = {}
+        self.__tids = []
+        self.__uids = []
+        self.__sizes = []
+        self.__srids = []
+        boxes = []
+        for k, path in enumerate(self.shards):
+            if fmt is None:
+                store = TrackStore(path)
+                self.__stores[k] = store
+                for i in range(store.size()):
+                    self.__refs.append((k, i))
+                    self.__tids.append(store.getTid(i))
+                    self.__uids.append(store.getUid(i))
+                    self.__sizes.append(store.getNumberOfPoints(i))
+                    self.__srids.append(store.tracks[i]["srid"])
+                boxes.append(np.asarray(store.getTrackBboxes()))
+                continue
+            self.__file = (k, self.__readFile(path))
+            for i, track in enumerate(self.__file[1]):
+                self.__refs.append((k, i))
+                self.__tids.append(track.tid)
+                self.__uids.append(track.uid)
+                self.__sizes.append(track.size())
+                self.__srids.append(track.getSRID() if track.size() > 0 else "ENU")
+                box = [np.nan] * 4
+                if track.size() > 0:
+                    X, Y = np.asarray(track.getX()), np.asarray(track.getY())
+                    box = [X.min(), X.max(), Y.min(), Y.max()]
+                boxes.append(np.array([box], dtype=float))
+        self.__bbox = np.concatenate(boxes) if len(boxes) > 0 else np.zeros((0, 4))
+
+    @staticmethod
+    def write(tracks, folder: str, shard_size: int = 1000, **options) -> LazyTrackCollection:
+        """Write tracks in binary shards, and open them as a lazy collection
+
+        Tracks are consumed one shard at a time, so that any iterable of
+        tracks (e.g. a :class:`TrackSource`) can be written without being
+        loaded in memory at once.
+
+        :param tracks: A :class:`TrackCollection` (or any iterable of tracks)
+        :param folder: Existing directory of the shards
+        :param shard_size: Number of tracks per shard
+        :param options: Options of the collection (see :class:`LazyTrackCollection`)
+        :return: The collection of the written tracks
+        """
+        paths = []
+        shard = []
+        for track in tracks:
+            shard.append(track)
+            if len(shard) >= shard_size:
+                paths.append(LazyTrackCollection.__writeShard(shard, folder, len(paths)))
+                shard = []
+        if len(shard) > 0:
+            paths.append(LazyTrackCollection.__writeShard(shard, folder, len(paths)))
+        return LazyTrackCollection(paths, **options)
+
+    @staticmethod
+    def __writeShard(tracks, folder, k) -> str:
+        """Write a shard of tracks (and return its path)"""
+        path = str(Path(folder) / ("shard_" + str(k).zfill(5) + ".tlb"))
+        TrackStore.write(tracks, path)
+        return path
+
+    # =========================================================================
+    # Metadata
+    # =========================================================================
+    def size(self) -> int:
+        """Number of tracks in the collection"""
+        return len(self.__refs)
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def getNumberOfPoints(self, i: int = None) -> int:
+        """Number of observations of the i-th track (or of all tracks), as stored"""
+        if i is None:
+            return int(sum(self.__sizes))
+        return self.__sizes[i]
+
+    def getTids(self) -> list:
+        """Track ids of the tracks of the collection"""
+        return list(self.__tids)
+
+    def getUids(self) -> list:
+        """User ids of the tracks of the collection"""
+        return list(self.__uids)
+
+    def bbox(self) -> Bbox:
+        """Bounding box of the tracks
+
+        Without registered transform, it is computed from the metadata of
+        the tracks (without loading them).
+        """
+        if len(self.transforms) > 0:
+            return TrackCollection.bbox(self)
+        boxes = self.__bbox
+        xmin, ymin = np.nanmin(boxes[:, 0]), np.nanmin(boxes[:, 2])
+        xmax, ymax = np.nanmax(boxes[:, 1]), np.nanmax(boxes[:, 3])
+        srid = self.__srids[0]
+        return Bbox(makeCoords(float(xmin), float(ymin), 0, srid),
+                    makeCoords(float(xmax), float(ymax), 0, srid))
+
+    # =========================================================================
+    # Tracks
+    # =========================================================================
+    def getTrack(self, i: int) -> Track:
+        """Get the i-th track (loaded if it is not in the cache)"""
+        if i in self.__cache:
+            self.__cache.move_to_end(i)
+            return self.__cache[i][0]
+        track = self.__load(i)
+        for function, args in self.transforms:
+            output = function(track, *args)
+            if isinstance(output, Track):
+                track = output
+        self.__store(i, track)
+        return track
+
+    def getTrackWithTid(self, tid) -> Track:
+        """Get the first track with track id tid (None if there is no such track)"""
+        for i, value in enumerate(self.__tids):
+            if value == tid:
+                return self.getTrack(i)
+        return None
+
+    def __getitem__(self, n):
+        """[[n]] Get track number n (or a :class:`TrackCollection` of the
+        tracks of a slice, or of the tracks matching a tuple (uid, tid))
+        """
+        if isinstance(n, tuple):
+            tracks = TrackCollection()
+            for i in range(self.size()):
+                if compLike(self.__uids[i], n[0]) and compLike(self.__tids[i], n[1]):
+                    tracks.addTrack(self.getTrack(i))
+            return tracks
+        if isinstance(n, slice):
+            return TrackCollection([self.getTrack(i) for i in range(*n.indices(self.size()))])
+        if n < 0:
+            n += self.size()
+        if n < 0 or n >= self.size():
+            raise IndexError("track index out of range")
+        return self.getTrack(n)
+
+    def __iter__(self):
+        for i in range(self.size()):
+            yield self.getTrack(i)
+
+    def toTrackCollection(self) -> TrackCollection:
+        """Materialize all the tracks in a collection"""
+        return TrackCollection(list(self))
+
+    def clearCache(self):
+        """Remove all the tracks from the cache"""
+        self.__cache.clear()
+        self.__used = 0
+
+    def getCacheMemory(self) -> int:
+        """Estimated memory (in bytes) of the tracks in the cache"""
+        return self.__used
+
+    def __load(self, i: int) -> Track:
+        """Read the i-th track from its shard"""
+        k, j = self.__refs[i]
+        if k in self.__stores:
+            return self.__stores[k].getTrack(j)
+        if self.__file[0] != k:
+            self.__file = (k, self.__readFile(self.shards[k]))
+        # Copy: transforms modify loaded tracks in place
+        return self.__file[1][j].copy()
+
+    def __readFile(self, path) -> list:
+        """Read the tracks of a track file"""
+        tracks = TrackReader.readFromFile(path, self.fmt, columnar=True)
+        if isinstance(tracks, Track):
+            return [tracks]
+        return list(tracks)
+
+    def __store(self, i: int, track: Track):
+        """Put a track in the cache, and evict the least recently used ones"""
+        memory = _trackMemory(track)
+        if memory > self.memory:
+            return
+        self.__cache[i] = (track, memory)
+        self.__used += memory
+        while (self.__used > self.memory) or (
+                self.cache_size is not None and len(self.__cache) > self.cache_size):
+            _, (_, memory) = self.__cache.popitem(last=False)
+            self.__used -= memory
+
+    # =========================================================================
+    # Per-track algorithms
+    # =========================================================================
+    def transform(self, function, *args):
+        """Register an algorithm applied to each track when it is loaded
+
+        :param function: Function applied as function(track, \\*args). The
+            track is modified in place, or replaced by the returned track
+        """
+        self.transforms.append((function, args))
+        self.clearCache()
+
+    def addAnalyticalFeature(self, algorithm, name=None):
+        """Register an analytical feature computed on each track when it is
+        loaded (see :func:`Track.addAnalyticalFeature`)"""
+        self.transform(lambda track: track.addAnalyticalFeature(algorithm, name))
+
+    def map(self, function, *args) -> list:
+        """Outputs of a function applied on each track (loaded one at a time)"""
+        return [function(track, *args) for track in self]
+
+    def operate(self, operator, arg1=None, arg2=None, arg3=None) -> list:
+        """Apply :func:`Track.operate` on each track of the collection"""
+        return self.map(lambda track: track.operate(operator, arg1, arg2, arg3))
+
+    def query(self, cmd):
+        """Query observations in all tracks (see :func:`TrackCollection.query`)"""
+        return TrackCollection.query(self, cmd)
+
+    def getAnalyticalFeature(self, af_name, withNan=True) -> list:
+        """Values of an analytical feature in all tracks"""
+        return TrackCollection.getAnalyticalFeature(self, af_name, withNan)
+
+    def length(self) -> float:
+        """Total length of the tracks"""
+        return TrackCollection.length(self)
+
+    def duration(self) -> float:
+        """Total duration of the tracks"""
+        return TrackCollection.duration(self)
+
+
+def _trackMemory(track: Track) -> int:
+    """Estimated memory (in bytes) of a track"""
+    nb_af = len(track.getListAnalyticalFeatures())
+    if track.isColumnar():
+        return track.size() * 8 * (4 + nb_af)
+    return track.size() * (_OBS_MEMORY + _AF_MEMORY * nb_af)
@@ -55,6 +55,10 @@ class NetworkFormat:
     resource_path = os.path.join(os.path.split(__file__)[0], "..")
     NETWORK_FILE_FORMAT = os.path.join(resource_path, "resources/network_file_format")
 
+    # Fields of the formats of NETWORK_FILE_FORMAT (name -> list of fields),
+    # read once per process (see reloadFormats)
+    __FORMATS = None
+
     # -------------------------------------------------------------
     # Load file format from network_file_format
     # -------------------------------------------------------------
@@ -85,22 +89,37 @@ class NetworkFormat:
             self.createFromDict(name)
             return
 
-    def createFromFile(self, name):
-        """TODO"""
+    @staticmethod
+    def reloadFormats():
+        """(Re)read the formats of the resource file NETWORK_FILE_FORMAT
 
-        FIELDS = []
+        Formats are read once, the first time a format is created from its
+        name. This function must be called to take into account a
+        modification of the resource file (or of NETWORK_FILE_FORMAT).
+        """
+        FORMATS = {}
         with open(NetworkFormat.NETWORK_FILE_FORMAT) as ffmt:
-            line = ffmt.readline().strip()
-            while line:
-                if line[0] == "#":
-                    line = ffmt.readline().strip()
+            for line in ffmt:
+                line = line.strip()
+                if not line or line[0] == "#":
                     continue
-                tab = line.split(",")
-                if tab[0].strip() == name:
-                    FIELDS = tab
-                    break
-                line = ffmt.readline().strip()
-        ffmt.close()
+                tab = [field.strip() for field in line.split(",")]
+                FORMATS.setdefault(tab[0], tab)
+        NetworkFormat.__FORMATS = FORMATS
+
+    @staticmethod
+    def getFormatNames() -> list:
+        """Names of the formats of the resource file NETWORK_FILE_FORMAT"""
+        if NetworkFormat.__FORMATS is None:
+            NetworkFormat.reloadFormats()
+        return list(NetworkFormat.__FORMATS)
+
+    def createFromFile(self, name):
+        """Update features from a format of the resource file (see :func:`reloadFormats`)"""
+
+        if NetworkFormat.__FORMATS is None:
+            NetworkFormat.reloadFormats()
+        FIELDS = NetworkFormat.__FORMATS.get(name, [])
 
         if len(FIELDS) < 1:
             print("Error: import format not recognize")
@@ -55,7 +55,7 @@ from tracklib.util.exceptions import *
 from tracklib.core import ObsTime, ENUCoords, ECEFCoords, GeoCoords, Obs
 from tracklib.algo import computeAbsCurv
 from tracklib.core import Bbox, Track, Network, Node, Edge, SpatialIndex
-from . import NetworkFormat
+from . import NetworkFormat, openStream, fileExists, parseWktColumn, makeObsList
 
 
 
@@ -73,6 +73,9 @@ class NetworkReader:
         in **network_file_format** (in tracklib/resources directory) which 
         describes metadata of the file. If it doesn't exists, you need to create one format.
         
+        The file may be compressed (.gz, .bz2, .xz) or a member of a zip
+        archive (see :func:`openStream`).
+        
         For example, let's define a format call 'VTT' in the file *network_file_format*
         which corresponds to a network associated with mountain bike tracks.
         So, you add a new line like this:
@@ -102,7 +105,7 @@ class NetworkReader:
         
         """        
 
-        if not os.path.isfile(path):
+        if not fileExists(path):
             raise WrongArgumentError("First parameter (path) doesn't refers to a file.")
 
         if not isinstance(formatfile, str) and not isinstance(formatfile, NetworkFormat):
@@ -116,8 +119,6 @@ class NetworkReader:
         else:
             fmt = NetworkFormat(formatfile)
             
-        num_lines = sum(1 for line in open(path))
-
         fmt.controlFormat()
 
         if verbose:
@@ -126,7 +127,7 @@ class NetworkReader:
 
         network = Network()
 
-        with open(path, encoding="utf-8") as csvfile:
+        with openStream(path, encoding="utf-8") as csvfile:
             spamreader = csv.reader(csvfile, delimiter=fmt.separator, doublequote=True)
             
             # Header
@@ -137,12 +138,16 @@ class NetworkReader:
                     break
 
             if verbose:
-                spamreader = progressbar.progressbar(spamreader, max_value=num_lines)
+                spamreader = progressbar.progressbar(spamreader, max_value=countLines(path))
+
+            # Geometries are parsed by chunks of rows
+            rows = []
             for row in spamreader:
-                res = readLineAndAddToNetwork(row, fmt)
-                if res != None:
-                    (edge, noeudIni, noeudFin) = res
-                network.addEdge(edge, noeudIni, noeudFin)
+                rows.append(row)
+                if len(rows) >= NetworkReader.CHUNK_SIZE:
+                    addRowsToNetwork(network, rows, fmt)
+                    rows = []
+            addRowsToNetwork(network, rows, fmt)
 
 
         # Return network loaded
@@ -160,9 +165,10 @@ class NetworkReader:
         cptNode = 1
         cptEdge = 1
         network = Network()
-        for res in GEOMS:
+        coords, parts, geoms = parseWktColumn([str(res[3]) for res in GEOMS])
+        for i in range(len(GEOMS)):
 
-            TAB_OBS = wktLineStringToObs(str(res[3]), 'ENU')
+            TAB_OBS = _firstLineObs(coords, parts, geoms, i, 'ENU')
             # Au moins 2 points
             if len(TAB_OBS) < 2:
                 continue
@@ -214,7 +220,7 @@ class NetworkReader:
                 }
             )
 
-            (edge, noeudIni, noeudFin) = readLineAndAddToNetwork(row, fmt)
+            (edge, noeudIni, noeudFin) = readLineAndAddToNetwork(row, fmt, TAB_OBS)
             network.addEdge(edge, noeudIni, noeudFin)
 
         return network
@@ -226,6 +232,7 @@ class NetworkReader:
 
     counter = 0
     NB_PER_PAGE = 1000
+    CHUNK_SIZE = 10000  # Number of rows of a CSV file parsed at once
     URL_SERVER = "https://data.geopf.fr/wfs/ows?"
     URL_SERVER += "service=WFS&version=2.0.0&request=GetFeature&"
     URL_SERVER += "typeName=BDTOPO_V3:troncon_de_route&"
@@ -448,15 +455,34 @@ class NetworkReader:
         
         
 
-def readLineAndAddToNetwork(row, fmt):
-    """TODO"""
+def addRowsToNetwork(network, rows, fmt):
+    """Add the edges of rows of a CSV file to a network
+
+    Geometries of all the rows are parsed at once (see :func:`parseWktColumn`).
+    """
+    coords, parts, geoms = parseWktColumn([str(row[fmt.pos_wkt]) for row in rows])
+    for i, row in enumerate(rows):
+        TAB_OBS = _firstLineObs(coords, parts, geoms, i, fmt.srid.upper())
+        res = readLineAndAddToNetwork(row, fmt, TAB_OBS)
+        if res != None:
+            (edge, noeudIni, noeudFin) = res
+            network.addEdge(edge, noeudIni, noeudFin)
+
+
+def readLineAndAddToNetwork(row, fmt, TAB_OBS=None):
+    """Build the edge and the nodes of a row of a CSV file
+
+    :param TAB_OBS: Observations of the geometry of the edge, if it is
+        already parsed (otherwise it is read from the row)
+    """
     edge_id = str(row[fmt.pos_edge_id])
     if fmt.pos_edge_id < 0:
         edge_id = NetworkReader.counter
     NetworkReader.counter = NetworkReader.counter + 1
 
-    geom = str(row[fmt.pos_wkt])
-    TAB_OBS = wktLineStringToObs(geom, fmt.srid.upper())
+    if TAB_OBS is None:
+        geom = str(row[fmt.pos_wkt])
+        TAB_OBS = wktLineStringToObs(geom, fmt.srid.upper())
 
     # Au moins 2 points
     if len(TAB_OBS) < 2:
@@ -501,47 +527,27 @@ def wktLineStringToObs(wkt, srid):
     Une polyligne de n points est modélisée par une Track (timestamp = 1970/01/01 00 :00 :00)
         Cas LINESTRING()
     """
-
-    # Creation d'une liste vide
-    TAB_OBS = list()
-
-    # Separation de la chaine
-    coords_string = wkt.split("(")
-    coords_string = coords_string[1]
-    coords_string = coords_string.split(")")[0]
-
-    coords = coords_string.split(",")
-
-    for i in range(0, len(coords)):
-        sl = coords[i].strip().split(" ")
-        x = float(sl[0])
-        y = float(sl[1])
-        if len(sl) == 3:
-            z = float(sl[2])
-        else:
-            z = 0.0
-
-        if not srid.upper() in [
-            "ENUCOORDS",
-            "ENU",
-            "GEOCOORDS",
-            "GEO",
-            "ECEFCOORDS",
-            "ECEF",
-        ]:
-            print("Error: unknown coordinate type [" + str(srid) + "]")
-            exit()
-
-        if srid.upper() in ["ENUCOORDS", "ENU"]:
-            point = ENUCoords(x, y, z)
-        if srid.upper() in ["GEOCOORDS", "GEO"]:
-            point = GeoCoords(x, y, z)
-        if srid.upper() in ["ECEFCOORDS", "ECEF"]:
-            point = ECEFCoords(x, y, z)
-
-        TAB_OBS.append(Obs(point, ObsTime()))
-
-    return TAB_OBS
+    coords, parts, geoms = parseWktColumn([wkt])
+    return _firstLineObs(coords, parts, geoms, 0, srid)
+
+
+def _firstLineObs(coords, parts, geoms, i, srid):
+    """Observations of the first linestring of the i-th parsed geometry"""
+    if not srid.upper() in [
+        "ENUCOORDS",
+        "ENU",
+        "GEOCOORDS",
+        "GEO",
+        "ECEFCOORDS",
+        "ECEF",
+    ]:
+        print("Error: unknown coordinate type [" + str(srid) + "]")
+        exit()
+
+    if geoms[i + 1] == geoms[i]:
+        return list()
+    k = geoms[i]
+    return makeObsList(coords[parts[k] : parts[k + 1]], srid)
 
 def selectNodes(network, node, distance):
     """Selection des autres noeuds dans le cercle dont node.coord est le centre,
@@ -608,3 +614,14 @@ def tabCoordsLineStringToObs(coords, srid):
         TAB_OBS.append(Obs(point, ObsTime()))
 
     return TAB_OBS
+
+
+def countLines(path, chunk_size=1 << 24):
+    """Number of lines of a file (counted on binary chunks)"""
+    count = 0
+    with openStream(path, "rb") as fp:
+        chunk = fp.read(chunk_size)
+        while chunk:
+            count += chunk.count(b"\n")
+            chunk = fp.read(chunk_size)
+    return count
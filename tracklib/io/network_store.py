@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains the class to persist networks in a native binary file,
+which can be loaded memory-mapped (without parsing geometries nor updating
+the topology edge by edge).
+
+File layout (little-endian), as in :class:`TrackStore`:
+
+- magic string ``TLNETWRK`` (8 bytes), format version (uint32), unused
+  (uint32), length of the header (uint64)
+- header (JSON): ids of nodes and edges, coordinate type, names of
+  analytical features of edges, parameters of the spatial index and
+  position of the arrays in the file
+- arrays, aligned on 64 bytes: node coordinates (``node_x``, ``node_y``,
+  ``node_z``), source and target node of each edge (``source``, ``target``,
+  int64), ``orientation`` (int64) and ``weight`` (float64) of edges,
+  offsets of edge geometries (``offsets``) in coordinate and time columns
+  (``x``, ``y``, ``z``, ``t``) shared by all edges, one column per
+  numerical analytical feature (``af:<name>``), a blob of JSON-encoded values
+  for the other analytical features (``objects``), adjacency lists of nodes in
+  CSR form (``<name>:offsets`` and ``<name>:values``, indices of nodes or
+  edges) and cells of the spatial index (``grid:offsets``, ``grid:values``)
+"""
+
+# For type annotation
+from __future__ import annotations
+from tracklib.util.exceptions import *
+
+import json
+import mmap
+import numpy as np
+
+from tracklib.core import Network, Node, Edge, Track, SpatialIndex, makeCoords
+from .track_store import _PREAMBLE, _align, _jsonable, _jsonableValue, _isNumerical
+
+
+_MAGIC = b"TLNETWRK"
+_VERSION = 1
+
+
+class NetworkStore:
+    """Binary file of a network.
+
+    A network is loaded on a single copy-on-write mapping of the file:
+    geometries of edges are columnar tracks mapped on the file without copy,
+    their modifications are private (never written in the file).
+
+    As in :class:`TrackStore`, non-numerical analytical features are stored
+    as JSON (not pickled): loading an untrusted file cannot execute code.
+    """
+
+    @staticmethod
+    def write(network: Network, path: str, spatial_index: bool = True):
+        """Write a network in a binary file
+
+        Dangling references of adjacency lists (to removed nodes or edges)
+        are not written.
+
+        :param network: Network to write
+        :param path: Path of the output file
+        :param spatial_index: Write the spatial index of the network (if any,
+            grid indexes only)
+        """
+        node_ids = list(network.getIndexNodes())
+        edge_ids = list(network.getIndexEdges())
+        nodes = [network.NODES[id] for id in node_ids]
+        edges = [network.EDGES[id] for id in edge_ids]
+        node_index = {id: k for k, id in enumerate(node_ids)}
+        edge_index = {id: k for k, id in enumerate(edge_ids)}
+
+        srid = edges[0].geom.getSRID() if len(edges) > 0 else "ENU"
+        sizes = [edge.geom.size() for edge in edges]
+        offsets = np.zeros(len(edges) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(sizes)
+
+        # Analytical features (numerical ones shared by all edges as columns)
+        names = []
+        for edge in edges:
+            for name in edge.geom.getListAnalyticalFeatures():
+                if name not in names:
+                    names.append(name)
+        numeric = [name for name in names if all(
+            edge.geom.hasAnalyticalFeature(name) and
+            _isNumerical(edge.geom.getAnalyticalFeature(name)) for edge in edges)]
+        objects = {}
+        for k, edge in enumerate(edges):
+            others = {}
+            for name in edge.geom.getListAnalyticalFeatures():
+                if name not in numeric:
+                    others[name] = _jsonableValue(edge.geom.getAnalyticalFeature(name))
+            if len(others) > 0:
+                objects[str(k)] = others
+        blob = json.dumps(objects).encode("utf-8") if len(objects) > 0 else b""
+
+        columns = [
+            ("node_x", [node.coord.getX() for node in nodes], "<f8"),
+            ("node_y", [node.coord.getY() for node in nodes], "<f8"),
+            ("node_z", [node.coord.getZ() for node in nodes], "<f8"),
+            ("source", [node_index[edge.source.id] for edge in edges], "<i8"),
+            ("target", [node_index[edge.target.id] for edge in edges], "<i8"),
+            ("orientation", [edge.orientation for edge in edges], "<i8"),
+            ("weight", [edge.weight for edge in edges], "<f8"),
+            ("offsets", offsets, "<i8"),
+        ]
+        for name, getter in [("x", Track.getX), ("y", Track.getY), ("z", Track.getZ), ("t", Track.getT)]:
+            columns.append((name, _concatenate([getter(edge.geom) for edge in edges]), "<f8"))
+        for name in numeric:
+            values = [edge.geom.getAnalyticalFeature(name) for edge in edges]
+            columns.append(("af:" + name, _concatenate(values), "<f8"))
+        columns.append(("objects", np.frombuffer(blob, dtype=np.uint8), "u1"))
+
+        # Adjacency lists
+        for name in Network.ADJACENCY:
+            index = node_index if name.endswith("NODES") else edge_index
+            lists = getattr(network, name)
+            lists = [[index[id] for id in lists.get(node_id, []) if id in index] for node_id in node_ids]
+            columns.extend(_csr(name, lists))
+
+        # Spatial index
+        grid = None
+        if spatial_index and isinstance(network.spatial_index, SpatialIndex):
+            index = network.spatial_index
+            grid = {"extent": [index.xmin, index.xmax, index.ymin, index.ymax],
+                    "size": [index.csize, index.lsize], "srid": index.srid}
+            cells, values = index.getCells()
+            columns.append(("grid:offsets", cells, "<i8"))
+            columns.append(("grid:values", values, "<i8"))
+
+        header = {
+            "nodes": [_jsonable(id) for id in node_ids],
+            "edges": [_jsonable(id) for id in edge_ids],
+            "srid": srid,
+            "af": numeric,
+            "objects": len(objects) > 0,
+            "spatial_index": grid,
+            "arrays": {},
+        }
+        _writeFile(path, header, columns)
+
+    @staticmethod
+    def read(path: str, columnar: bool = True) -> Network:
+        """Load a network written by :func:`write`
+
+        :param path: Path of the file
+        :param columnar: Geometries of edges are mapped on the file in
+            columnar mode (otherwise they are copied in lists of observations)
+        :return: The network
+        """
+        header, arrays = _readFile(path)
+        srid = header["srid"]
+
+        X, Y, Z = [arrays["node_" + name].tolist() for name in ["x", "y", "z"]]
+        nodes = [Node(id, makeCoords(X[k], Y[k], Z[k], srid)) for k, id in enumerate(header["nodes"])]
+
+        objects = {}
+        if header["objects"]:
+            objects = json.loads(arrays["objects"].tobytes().decode("utf-8"))
+        offsets = arrays["offsets"].tolist()
+        sources = arrays["source"].tolist()
+        targets = arrays["target"].tolist()
+        orientations = arrays["orientation"].tolist()
+        weights = arrays["weight"].tolist()
+        edges = []
+        for k, id in enumerate(header["edges"]):
+            i1, i2 = offsets[k], offsets[k + 1]
+            af = {name: arrays["af:" + name][i1:i2] for name in header["af"]}
+            for name, values in objects.get(str(k), {}).items():
+                af[name] = np.empty(i2 - i1, dtype=object)
+                af[name][:] = values
+            track = Track.fromArrays(arrays["x"][i1:i2], arrays["y"][i1:i2], arrays["z"][i1:i2],
+                                     arrays["t"][i1:i2], srid=srid, af=af, copy=False)
+            if not columnar:
+                track.toPoints()
+            edge = Edge(id, track)
+            edge.source = nodes[sources[k]]
+            edge.target = nodes[targets[k]]
+            edge.orientation = orientations[k]
+            edge.weight = weights[k]
+            edges.append(edge)
+
+        adjacency = {}
+        for name in Network.ADJACENCY:
+            ids = header["nodes"] if name.endswith("NODES") else header["edges"]
+            cells = arrays[name + ":offsets"].tolist()
+            values = [ids[k] for k in arrays[name + ":values"].tolist()]
+            adjacency[name] = [values[cells[k] : cells[k + 1]] for k in range(len(nodes))]
+        network = Network.fromTopology(nodes, edges, adjacency)
+
+        grid = header["spatial_index"]
+        if grid is not None:
+            network.spatial_index = SpatialIndex.fromCells(
+                network, tuple(grid["extent"]), tuple(grid["size"]), grid["srid"],
+                arrays["grid:offsets"], arrays["grid:values"], compact=True)
+        return network
+
+
+def _concatenate(chunks) -> np.ndarray:
+    """Concatenation of columns of edges"""
+    if len(chunks) == 0:
+        return np.zeros(0)
+    return np.concatenate([np.asarray(chunk, dtype=float) for chunk in chunks])
+
+
+def _csr(name: str, lists: list) -> list:
+    """Columns of a list of lists in CSR form (offsets and values)"""
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum([len(values) for values in lists], out=offsets[1:])
+    values = np.fromiter((v for values in lists for v in values), dtype=np.int64, count=int(offsets[-1]))
+    return [(name + ":offsets", offsets, "<i8"), (name + ":values", values, "<i8")]
+
+
+def _writeFile(path: str, header: dict, columns: list):
+    """Write the header and the arrays of a network file"""
+    columns = [(name, np.ascontiguousarray(values, dtype=dtype)) for name, values, dtype in columns]
+    arrays = header["arrays"]
+    for name, values in columns:
+        arrays[name] = [0, values.dtype.str, list(values.shape)]
+    length = len(json.dumps(header).encode("utf-8"))
+    while True:
+        offset = _align(_PREAMBLE.size + length)
+        for name, values in columns:
+            arrays[name][0] = offset
+            offset = _align(offset + values.nbytes)
+        encoded = json.dumps(header).encode("utf-8")
+        if len(encoded) <= length:
+            break
+        length = len(encoded)
+    encoded = encoded.ljust(length)
+
+    with open(path, "wb") as fp:
+        fp.write(_PREAMBLE.pack(_MAGIC, _VERSION, 0, length))
+        fp.write(encoded)
+        for name, values in columns:
+            fp.write(b"\0" * (arrays[name][0] - fp.tell()))
+            fp.write(values.tobytes())
+
+
+def _readFile(path: str) -> tuple:
+    """Header and arrays (on a copy-on-write mapping) of a network file"""
+    with open(path, "rb") as fp:
+        preamble = fp.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise WrongArgumentError("Error: " + str(path) + " is not a tracklib network file")
+        magic, version, _, length = _PREAMBLE.unpack(preamble)
+        if magic != _MAGIC:
+            raise WrongArgumentError("Error: " + str(path) + " is not a tracklib network file")
+        if version > _VERSION:
+            raise WrongArgumentError("Error: unsupported version " + str(version) +
+                                     " of tracklib network file")
+        header = json.loads(fp.read(length).decode("utf-8"))
+        buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    arrays = {}
+    for name, (offset, dtype, shape) in header["arrays"].items():
+        count = int(np.prod(shape))
+        if count == 0:
+            array = np.zeros(shape, dtype=dtype)
+        else:
+            array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+        arrays[name] = array.reshape(shape)
+    return header, arrays
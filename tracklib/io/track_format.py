@@ -85,6 +85,10 @@ class TrackFormat:
     resource_path = os.path.join(os.path.split(__file__)[0], "..")
     TRACK_FILE_FORMAT = os.path.join(resource_path, "resources/track_file_format")
 
+    # Fields of the formats of TRACK_FILE_FORMAT (name -> list of fields),
+    # read once per process (see reloadFormats)
+    __FORMATS = None
+
 
     # -------------------------------------------------------------
     # Load file format from track_file_format
@@ -134,6 +138,8 @@ class TrackFormat:
         self.af_names = []
         self.read_all = False
 
+        self.__plan = None
+
         if isinstance(name, dict):
             # Features updated from hashtable
             self.createFromDict(name)
@@ -202,22 +208,37 @@ class TrackFormat:
 
 
 
-    def createFromFile(self, name):
-        """TODO"""
+    @staticmethod
+    def reloadFormats():
+        """(Re)read the formats of the resource file TRACK_FILE_FORMAT
 
-        FIELDS = []
+        Formats are read once, the first time a format is created from its
+        name. This function must be called to take into account a
+        modification of the resource file (or of TRACK_FILE_FORMAT).
+        """
+        FORMATS = {}
         with open(TrackFormat.TRACK_FILE_FORMAT) as ffmt:
-            line = ffmt.readline().strip()
-            while line:
-                if line[0] == "#":
-                    line = ffmt.readline().strip()
+            for line in ffmt:
+                line = line.strip()
+                if not line or line[0] == "#":
                     continue
-                tab = line.split(",")
-                if tab[0].strip() == name:
-                    FIELDS = tab
-                    break
-                line = ffmt.readline().strip()
-        ffmt.close()
+                tab = [field.strip() for field in line.split(",")]
+                FORMATS.setdefault(tab[0], tab)
+        TrackFormat.__FORMATS = FORMATS
+
+    @staticmethod
+    def getFormatNames() -> list:
+        """Names of the formats of the resource file TRACK_FILE_FORMAT"""
+        if TrackFormat.__FORMATS is None:
+            TrackFormat.reloadFormats()
+        return list(TrackFormat.__FORMATS)
+
+    def createFromFile(self, name):
+        """Update features from a format of the resource file (see :func:`reloadFormats`)"""
+
+        if TrackFormat.__FORMATS is None:
+            TrackFormat.reloadFormats()
+        FIELDS = TrackFormat.__FORMATS.get(name, [])
 
         if len(FIELDS) < 1:
             print("Error: import format not recognize")
@@ -235,10 +256,7 @@ class TrackFormat:
         if self.time_ini == "-1":
             self.time_ini = -1
         else:
-            fmt_temp = ObsTime.getReadFormat()
-            ObsTime.setReadFormat(self.time_fmt)
-            self.time_ini = ObsTime(self.time_ini)
-            ObsTime.setReadFormat(fmt_temp)
+            self.time_ini = ObsTime.readTimestamp(self.time_ini, self.time_fmt)
         self.time_unit = 1
         self.time_fmt = FIELDS[12].strip()
 
@@ -263,6 +281,29 @@ class TrackFormat:
         self.id_track = int(FIELDS[15].strip())
 
 
+    def getColumnPlan(self) -> tuple:
+        """Plan of the columns of CSV files, computed once per format (and
+        again only if the features it depends on are modified)
+
+        :return: A tuple (separator, indices of the columns of coordinates
+            and timestamps, coordinate type of columns: "ENU", "Geo" or "ECEF")
+        """
+        key = (self.separator, self.id_E, self.id_N, self.id_U, self.id_T, self.srid)
+        if self.__plan is None or self.__plan[0] != key:
+            separator = "\t" if self.separator == "t" else self.separator
+            special = [self.id_E, self.id_N]
+            if self.id_U >= 0:
+                special.append(self.id_U)
+            if self.id_T >= 0:
+                special.append(self.id_T)
+            srid = "ENU"
+            if self.srid.upper() in ["GEOCOORDS", "GEO"]:
+                srid = "Geo"
+            if self.srid.upper() in ["ECEFCOORDS", "ECEF"]:
+                srid = "ECEF"
+            self.__plan = (key, (separator, special, srid))
+        return self.__plan[1]
+
     def __str__(self):
         output  = "----------------------------------------\n"
         output += "Track file format for CSV, WKT and GPX files:\n"
@@ -47,18 +47,25 @@ from __future__ import annotations
 from typing import Union, Literal
 from tracklib.util.exceptions import *
 
+import collections
+import concurrent.futures
+import contextlib
 import csv
 import io
 import json
 import os
+import time
+import xml.etree.ElementTree as ET
+import numpy as np
 import progressbar
 from pathlib import Path
 from xml.dom import minidom
 
 
-from . import TrackFormat
+from . import TrackFormat, openStream, fileExists, isArchive, listArchive, openArchive
+from . import parseWktColumn, wktGeometryType, makeObsList
 from tracklib.core import (ObsTime, ENUCoords, ECEFCoords, GeoCoords, Obs, 
-                           islist, isfloat, makeCoords,TrackCollection)
+                           islist, isfloat, makeCoords,TrackCollection, NAN)
 from tracklib.core import Track
 
 
@@ -66,23 +73,147 @@ from tracklib.core import Track
 class TrackSource:
     """
     Iterator that yields Track objects from a folder.
+
+    Files are read serially by default. With workers > 1, they are read by
+    a pool of processes (or threads), with at most prefetch files read
+    ahead of the consumer, so that memory stays bounded.
     """
 
-    def __init__(self, folder, fmt):
+    def __init__(self, folder, fmt, workers=1, executor="process", prefetch=None,
+                 ordered=True, errors="raise", columnar=False):
+        """Constructor
+
+        :param folder: Directory of track files
+        :param fmt: Format of the files (see :class:`TrackFormat`)
+        :param workers: Number of files read in parallel (1 for serial reading)
+        :param executor: Pool of workers: "process" or "thread"
+        :param prefetch: Maximal number of files read ahead (default: 2 * workers)
+        :param ordered: Tracks are yielded in the order of the files, otherwise
+            as soon as they are read
+        :param errors: "raise" to abort on the first error, "capture" to skip
+            the file and record (path, exception) in :attr:`errors`
+        :param columnar: Tracks are built in columnar mode (see :func:`Track.toColumnar`)
+        """
+        if executor not in ["process", "thread"]:
+            raise WrongArgumentError("Executor of track source must be 'process' or 'thread'")
+        if errors not in ["raise", "capture"]:
+            raise WrongArgumentError("Errors of track source must be 'raise' or 'capture'")
         self.folder = folder
         self.fmt = fmt
+        self.workers = max(int(workers), 1)
+        self.executor = executor
+        self.prefetch = max(self.workers, 2 * self.workers if prefetch is None else int(prefetch))
+        self.ordered = ordered
+        self.columnar = columnar
+        self.on_error = errors
+        self.errors = []
+
+    def getFiles(self) -> list:
+        """List of the files of the source (in iteration order)"""
+        return list(Path(self.folder).iterdir())
 
     def __iter__(self):
-        for file in Path(self.folder).iterdir():
-            track = TrackReader.readFromFile(file, self.fmt)
+        for file, track in self.__read():
             yield track
 
+    def __read(self):
+        """Iteration on (file, track) pairs"""
+        self.errors = []
+        if self.workers <= 1:
+            for file in self.getFiles():
+                try:
+                    track = _readTrackFile(file, self.fmt, self.columnar)
+                except Exception as e:
+                    if self.on_error == "raise":
+                        raise
+                    self.errors.append((file, e))
+                    continue
+                yield file, track
+            return
+
+        # Processes are given the read format of this process once (threads
+        # share it, and CSV files are read with the format of fmt)
+        if self.executor == "process":
+            pool = concurrent.futures.ProcessPoolExecutor(
+                self.workers, initializer=ObsTime.setReadFormat,
+                initargs=(ObsTime.getReadFormat(),))
+        else:
+            pool = concurrent.futures.ThreadPoolExecutor(self.workers)
+        files = iter(self.getFiles())
+        pending = collections.OrderedDict()
+
+        # CSV tracks are sent back by processes in columnar mode (much
+        # cheaper to pickle than observations), then converted here
+        unpack = (self.executor == "process") and not self.columnar
+
+        def submit():
+            for file in files:
+                future = pool.submit(_readTrackFile, file, self.fmt,
+                                     self.columnar or unpack)
+                pending[future] = file
+                return True
+            return False
+
+        try:
+            while (len(pending) < self.prefetch) and submit():
+                pass
+            while len(pending) > 0:
+                if self.ordered:
+                    future = next(iter(pending))
+                else:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    future = next(f for f in pending if f in done)
+                file = pending.pop(future)
+                submit()
+                try:
+                    track = future.result()
+                except Exception as e:
+                    if self.on_error == "raise":
+                        raise
+                    self.errors.append((file, e))
+                    continue
+                if unpack and isinstance(track, Track):
+                    track.toPoints()
+                yield file, track
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
     def __len__(self):
         if self.fmt.ext is not None:
             return len(list(Path(self.folder).glob('*.' + self.fmt.ext.lower())))
         return len(list(Path(self.folder).glob('*')))
 
+    def toTrackCollection(self) -> TrackCollection:
+        """Read all the tracks of the source in a collection
 
+        As in :func:`TrackReader.readFromFile` on a directory, empty tracks
+        and tracks rejected by the selector of the format are ignored, and
+        tracks read alone in a file are identified by the file name.
+        """
+        TRACES = TrackCollection()
+        for file, trace in self.__read():
+            if trace is None:
+                continue
+            if isinstance(trace, TrackCollection):
+                for track in trace:
+                    if (track is not None) and (track.size() > 0):
+                        TRACES.addTrack(track)
+                continue
+            if trace.size() <= 0:
+                continue
+            if (self.fmt.selector is not None) and not self.fmt.selector.contains(trace):
+                continue
+            trace.tid = file.name
+            TRACES.addTrack(trace)
+        return TRACES
+
+
+def _readTrackFile(path, fmt, columnar):
+    """Read a track file in a worker of :class:`TrackSource`"""
+    return TrackReader.readFromFile(str(path), fmt, columnar=columnar)
 
 
 class TrackReader:
@@ -93,7 +224,8 @@ class TrackReader:
     """
 
 
-    def readFromFile(path, track_format:Union[str, TrackFormat]="DEFAULT", verbose=False):
+    def readFromFile(path, track_format:Union[str, TrackFormat]="DEFAULT", verbose=False,
+                     columnar=False):
         '''
         Read track(s) from file(s) with geometry structured in coordinates or wkt.
         
@@ -108,12 +240,17 @@ class TrackReader:
 
         Parameters
         ----------
-        path : file or directory
-            DESCRIPTION.
+        path : file, directory or zip archive
+            Files may be compressed (.gz, .bz2, .xz) or members of a zip
+            archive (see :func:`openStream`): they are decompressed on the fly.
+            All the files of a zip archive are read as the files of a directory.
         track_format : str or dict
             name of format which describes metadata of the file
         verbose : TYPE, optional
             DESCRIPTION. The default is False.
+        columnar : bool, optional
+            CSV and WKT tracks are built in columnar mode (see Track.toColumnar).
+            The default is False.
 
         Returns
         -------
@@ -122,7 +259,7 @@ class TrackReader:
 
         '''
 
-        if not (os.path.isfile(path) or os.path.isdir(path)):
+        if not (fileExists(path) or os.path.isdir(path)):
             raise WrongArgumentError("First parameter (path) doesn't refers to a file or a dir: " + path + ".")
 
         if not isinstance(track_format, str) and not isinstance(track_format, TrackFormat):
@@ -151,44 +288,47 @@ class TrackReader:
         if verbose:
             print("The input format is valid. Loading track(s) ...")
 
-        if os.path.isdir(path):
+        # Directory or zip archive (members are read from a single handle)
+        if os.path.isdir(path) or isArchive(path):
             TRACES = TrackCollection()
-            LISTFILE = os.listdir(path)
-            step_to_run = LISTFILE
-            if verbose:
-                step_to_run = progressbar.progressbar(LISTFILE)
-            for f in step_to_run:
+            archive = openArchive(path) if isArchive(path) else contextlib.nullcontext()
+            with archive:
+                LISTFILE = os.listdir(path) if os.path.isdir(path) else listArchive(path)
+                step_to_run = LISTFILE
+                if verbose:
+                    step_to_run = progressbar.progressbar(LISTFILE)
+                for f in step_to_run:
 
-                # if path[len(path)-1:] == '/':
-                #                     collection = TrackReader.readFromGpxFast(path + f)
-                #                 else:
-                #                     collection = TrackReader.readFromGpxFast(path + '/' + f)
-                p = path + "/" + f
+                    # if path[len(path)-1:] == '/':
+                    #                     collection = TrackReader.readFromGpxFast(path + f)
+                    #                 else:
+                    #                     collection = TrackReader.readFromGpxFast(path + '/' + f)
+                    p = path + "/" + f
 
-                trace = TrackReader.readFromFile(p, track_format, verbose)
-                if trace is None:
-                    continue
-                if trace.size() <= 0:
-                    continue
-
-                if not fmt.selector is None:
-                    if not fmt.selector.contains(trace):
+                    trace = TrackReader.readFromFile(p, track_format, verbose, columnar)
+                    if trace is None:
+                        continue
+                    if trace.size() <= 0:
                         continue
 
-                if isinstance(trace, TrackCollection):
-                    for i in range(trace.size()):
-                        if trace[i] is None:
-                            continue
-                        if trace[i].size() <= 0:
+                    if not fmt.selector is None:
+                        if not fmt.selector.contains(trace):
                             continue
-                        TRACES.addTrack(trace[i])
-                else:
-                    trace.tid = f
-                    TRACES.addTrack(trace)
+
+                    if isinstance(trace, TrackCollection):
+                        for i in range(trace.size()):
+                            if trace[i] is None:
+                                continue
+                            if trace[i].size() <= 0:
+                                continue
+                            TRACES.addTrack(trace[i])
+                    else:
+                        trace.tid = f
+                        TRACES.addTrack(trace)
 
             return TRACES
 
-        elif not os.path.isfile(path):
+        elif not fileExists(path):
             return None
 
         if verbose:
@@ -197,183 +337,61 @@ class TrackReader:
 
         # On redirige suivant l'extension: CSV, GPX or WKT
         if fmt.ext == "CSV":
-            return TrackReader.__readFromCsv(path, fmt, verbose)
+            return TrackReader.__readFromCsv(path, fmt, verbose, columnar)
         elif fmt.ext == "GPX":
             return TrackReader.__readFromGpx(path, fmt, verbose)
         elif fmt.ext == "WKT":
-            return TrackReader.__readFromWkt(path, fmt, verbose)
+            return TrackReader.__readFromWkt(path, fmt, verbose, columnar)
         else:
-            return TrackReader.__readFromCsv(path, fmt, verbose)
+            return TrackReader.__readFromCsv(path, fmt, verbose, columnar)
 
 
 
     @staticmethod
-    def __readFromCsv(path: str, fmt:TrackFormat, verbose) -> Union(Track, TrackCollection):
+    def __readFromCsv(path: str, fmt:TrackFormat, verbose, columnar=False) -> Union(Track, TrackCollection):
         """
         Read track(s) from CSV file(s) with geometry structured in coordinates.
 
+        File is read by chunks of lines, converted into typed arrays (see
+        :class:`_CsvColumns`).
+
             path : file or directory
                 DESCRIPTION.
             track_format : str or dict
                 name of format which describes metadata of the file
             verbose : TYPE, optional
                 DESCRIPTION. The default is False.
+            columnar : bool, optional
+                build a track in columnar mode (see :func:`Track.toColumnar`)
             :return: a Track contains in csv files.
         """
 
+        if not fmt.srid.upper() in [
+            "ENUCOORDS", "ENU", "GEOCOORDS", "GEO", "ECEFCOORDS", "ECEF",
+        ]:
+            raise WrongArgumentError("Error: unknown coordinate type [" + str(fmt.srid) + "]")
+
         # -------------------------------------------------------
         # Reading data according to file format
         # -------------------------------------------------------
         if os.path.basename(path).split(".")[0] != None:
-            track = Track(track_id=os.path.basename(path).split(".")[0])
+            track_id = os.path.basename(path).split(".")[0]
         else:
-            track = Track()
-
-        time_fmt_save = ObsTime.getReadFormat()
-        ObsTime.setReadFormat(fmt.time_fmt)
-
-        id_special = [fmt.id_E, fmt.id_N]
-        if fmt.id_U >= 0:
-            id_special.append(fmt.id_U)
-        if fmt.id_T >= 0:
-            id_special.append(fmt.id_T)
-
-        with open(path) as fp:
-
-            # Header
-            for i in range(fmt.header):
-                line = fp.readline()
-                if line[0] == fmt.cmt:
-                    line = line[1:]
-                name_non_special = line.split(fmt.separator)
-
-            line = fp.readline().strip()
-
-            # Obs per line
-            while line:
-
-                if line.strip()[0] == fmt.cmt:
-                    name_non_special = line[1:].split(fmt.separator)
-                    line = fp.readline().strip()
-                    continue
-
-                # TODO: corriger la gestion de la tabulation en dure
-                if fmt.separator == 't':
-                    fields = line.strip().split('\t')
-                else:
-                    fields = line.strip().split(fmt.separator)
-                fields = [s for s in fields if s]
-                # if (verbose):
-                #    print(fields)
-
-                # if id_user is in data
-                if fmt.id_user > 0:
-                    track.uid = fields[fmt.id_user].strip()
-                if fmt.id_track > 0:
-                    track.tid = fields[fmt.id_track].strip()
-
-                if fmt.id_T != -1:
-                    if isinstance(fmt.time_ini, int):
-                        try:
-                            T = fields[fmt.id_T].strip().replace('"', '')
-                            time = ObsTime.readTimestamp(T)
-                        except ValueError:
-                            time = ObsTime()
-                            # if verbose:
-                            #    print (fields[fmt.id_T].strip().replace('"', ''))
-                    else:
-                        time = fmt.time_ini.addSec((float)(fields[fmt.id_T])*fmt.time_unit)
-                else:
-                    time = ObsTime()
-                
-                # Blank fields
-                if (fields[fmt.id_E].strip() == '' or fields[fmt.id_E].strip() == 'NA'):
-                    fields[fmt.id_E] = fmt.no_data_value
-                if (fields[fmt.id_N].strip() == '' or fields[fmt.id_N].strip() == 'NA'):
-                    fields[fmt.id_N] = fmt.no_data_value
-                if (fmt.id_U >= 0 and fields[fmt.id_U].strip() == ''):
-                    fields[fmt.id_U] = fmt.no_data_value
-
-                try:
-                    E = (float)(fields[fmt.id_E])
-                    N = (float)(fields[fmt.id_N])
-                except:
-                    raise WrongArgumentError("Parameter E or N is not an instantiation of a float (" + path + ")")
-
-                if (int(E) != fmt.no_data_value) and (int(N) != fmt.no_data_value):
-    
-                    if fmt.id_U >= 0:
-                        U = (float)(fields[fmt.id_U])
-                    else:
-                        U = 0
-
-                    if not fmt.srid.upper() in [
-                        "ENUCOORDS", "ENU", "GEOCOORDS", "GEO", "ECEFCOORDS", "ECEF",
-                    ]:
-                        raise WrongArgumentError("Error: unknown coordinate type [" + str(fmt.srid) + "]")
-                    if fmt.srid.upper() in ["ENUCOORDS", "ENU"]:
-                        point = Obs(ENUCoords(E, N, U), time)
-                    if fmt.srid.upper() in ["GEOCOORDS", "GEO"]:
-                        point = Obs(GeoCoords(E, N, U), time)
-                    if fmt.srid.upper() in ["ECEFCOORDS", "ECEF"]:
-                        point = Obs(ECEFCoords(E, N, U), time)
-    
-                    track.addObs(point)
-                        
-                else:
-                    no_data = fmt.no_data_value
-                    track.addObs(Obs(makeCoords(no_data, no_data, no_data, fmt.srid.upper()), time))
-
-                line = fp.readline().strip()
-
-        fp.close()
-
-        # Reading other features
-        if fmt.read_all:
-
-            name_non_special = [s.strip() for s in name_non_special if s]
-
-            for i in range(len(fields)):
-                if not (i in id_special):
-                    track.createAnalyticalFeature(name_non_special[i])
-
-            with open(path) as fp:
-                # Header
-                for i in range(fmt.header):
-                    fp.readline()
-
-                line = fp.readline()
-
-                counter = 0
-                while line:
-                    if line.strip()[0] == fmt.cmt:
-                        line = fp.readline().strip()
-                        continue
-
-                    fields = line.split(fmt.separator)
-                    fields = [s for s in fields if s]
-                    #if (verbose):
-                    #    print(fields)
-                    for i in range(len(fields)):
-                        if not (i in id_special):
-                            val = fields[i].strip()
-                            if not (name_non_special[i][-1] == "&"):
-                                try:
-                                    val = float(val)
-                                except ValueError:
-                                    val = str(val).replace('"', "")
-                            track.setObsAnalyticalFeature(
-                                name_non_special[i], counter, val
-                            )
-
-                    line = fp.readline().strip()
-                    counter += 1
-            fp.close()
-
-        ObsTime.setReadFormat(time_fmt_save)
-        
-        if track is None:
-            return None
+            track_id = 0
+
+        with openStream(path) as fp:
+            columns = _CsvColumns(fmt)
+            columns.read(fp)
+
+        X, Y, Z, T = columns.getCoordinates()
+        track = Track.fromArrays(X, Y, Z, T, columns.getSrid(), af=columns.getFeatures(),
+                                 track_id=track_id)
+        if not columnar:
+            track.toPoints()
+        if columns.uid is not None:
+            track.uid = columns.uid
+        if columns.tid is not None:
+            track.tid = columns.tid
 
         if not fmt.selector is None:
             if not fmt.selector.contains(track):
@@ -392,77 +410,72 @@ class TrackReader:
     @staticmethod
     def readFromNMEA(path):
         """The method assumes a single track in file."""
+        for track in TrackReader.streamFromNMEA(path):
+            return track
+        return Track()
 
-        track = Track()
+    @staticmethod
+    def streamObsFromNMEA(path, follow=False, poll_interval=1.0, timeout=None):
+        """
+        Reads the observations of a NMEA log incrementally.
+
+        GGA, RMC, GSA and GST sentences (of any talker) are parsed in one
+        pass and grouped by epoch: position from GGA (or RMC), date from
+        RMC, number of satellites and dops are stored in the GNSS fields of
+        the observations (nb_sats, hdop, pdop, vdop). Sentences with an
+        invalid checksum are ignored.
+
+        :param path: NMEA file
+        :param follow: wait for new lines at the end of the file (to read a
+            log being recorded)
+        :param poll_interval: time (in seconds) between two reads at the end
+            of a followed file
+        :param timeout: stop following the file after this time (in seconds)
+            without new data (None to follow it indefinitely)
+
+        :return: iterator of :class:`Obs`
+        """
+        for obs, _ in _iterNmea(path, follow, poll_interval, timeout):
+            yield obs
 
-        TMP_NB_SATS = []
-        TMP_HDOP = []
+    @staticmethod
+    def streamFromNMEA(path, duration=None, follow=False, poll_interval=1.0, timeout=None):
+        """
+        Reads a NMEA log incrementally, as tracks of limited duration.
+
+        Observations are read as in :func:`streamObsFromNMEA`. Each track
+        contains analytical features nb_sats and hdop, plus pdop and vdop
+        (if GSA sentences are logged) and sigma_lat, sigma_lon and
+        sigma_hgt (standard deviations of GST sentences, if logged).
+
+        :param path: NMEA file
+        :param duration: maximal duration (in seconds) of a track, None to
+            read the whole log in a single track
+        :param follow: wait for new lines at the end of the file (see
+            :func:`streamObsFromNMEA`)
+        :param poll_interval: time (in seconds) between two reads at the end
+            of a followed file
+        :param timeout: stop following the file after this time (in seconds)
+            without new data
+
+        :return: iterator of :class:`Track`
+        """
+        chunk = []
+        for obs, extras in _iterNmea(path, follow, poll_interval, timeout):
+            if chunk and (duration is not None):
+                if obs.timestamp - chunk[0][0].timestamp >= duration:
+                    yield _nmeaTrack(chunk)
+                    chunk = []
+            chunk.append((obs, extras))
+        if chunk:
+            yield _nmeaTrack(chunk)
 
-        current_date = ObsTime()
 
-        with open(path, "rb") as fp:
-            line = str(fp.readline())
-            while not (line in ["", "b''"]):
-            
-                # For date
-                if ("$GPRMC" in line) or ("$GNRMC" in line):
-                    date_chiffres = line.split(",")[9]
-                    current_date.day   = int(date_chiffres[0:2])
-                    current_date.month = int(date_chiffres[2:4])
-                    current_date.year  = 2000 + int(date_chiffres[4:6])
-                
-                # For position, time in day, etc.
-                if ("$GPGGA" in line) or ("$GNGGA" in line):
-                    code = "$GPGGA"
-                    if "$GNGGA" in line:
-                        code = "$GNGGA"
-                    frame = line.split(code)[1]
-                    fields = frame.split(",")
-                    h = int(fields[1][0:2])
-                    m = int(fields[1][2:4])
-                    s = int(fields[1][4:6])
-                    ms = int(fields[1][7:9])
-                    time = current_date.copy()
-                    time.hour = h
-                    time.min = m
-                    time.sec = s
-                    time.ms = ms
-                    if fields[4] == "":
-                        line = str(fp.readline())
-                        continue
-                    if fields[2] == "":
-                        line = str(fp.readline())
-                        continue
-                    lon = float(fields[4]) / 100
-                    lat = float(fields[2]) / 100
-                    lon = int(lon) + (lon - int(lon)) * 100 / 60
-                    lat = int(lat) + (lat - int(lat)) * 100 / 60
-                    hgt = float(fields[9])
-                    if fields[5] == "W":
-                        lon = -lon
-                    if fields[3] == "S":
-                        lat = -lat
-                    track.addObs(Obs(GeoCoords(lon, lat, hgt), time))
-                    TMP_NB_SATS.append(int(fields[7]))
-                    TMP_HDOP.append(float(fields[8]))
-                    # print(fields)
-
-                line = str(fp.readline())
-
-        track.createAnalyticalFeature("nb_sats")
-        track.createAnalyticalFeature("hdop")
-
-        for i in range(len(TMP_NB_SATS)):
-            track.setObsAnalyticalFeature("nb_sats", i, TMP_NB_SATS[i])
-            track.setObsAnalyticalFeature("hdop", i, TMP_HDOP[i])
-
-        return track
-    
-    
     @staticmethod
-    def __readFromWkt(path:str, fmt:TrackFormat, verbose=False) -> TrackCollection:
+    def __readFromWkt(path:str, fmt:TrackFormat, verbose=False, columnar=False) -> TrackCollection:
         """
         Read track(s) (one per line) from a CSV file, with geometry provided in wkt.
+        Geometries of all lines are parsed at once (see :func:`parseWktColumn`).
 
         Parameters
         -----------
@@ -472,55 +485,47 @@ class TrackReader:
                name of format which describes metadata of the file
         :param verbose : TYPE, optional
                The default is False.
+        :param columnar : build tracks in columnar mode (see :func:`Track.toColumnar`)
        
         :return: collection of tracks contains in wkt files.
         """
 
         TRACES = TrackCollection()
 
-        with open(path, newline="") as csvfile:
+        with openStream(path, newline="") as csvfile:
             spamreader = csv.reader(csvfile, delimiter=fmt.separator, doublequote=fmt.doublequote)
 
             # Header
             for i in range(fmt.header):
                 next(spamreader)
 
-            for fields in spamreader:
-                if len(fields) <= 0:
-                    continue
-
-                wkt = fields[fmt.id_wkt]
-                if wkt[0:5].upper() != "MULTI":
-                    track = TrackReader.parseWkt(wkt)
-
-                    if fmt.id_user >= 0:
-                        track.uid = fields[fmt.id_user]
-                    if fmt.id_track >= 0:
-                        track.tid = fields[fmt.id_track]
+            rows = [fields for fields in spamreader if len(fields) > 0]
 
-                    if not fmt.selector is None:
-                        if not fmt.selector.contains(track):
-                            continue
+        wkts = [fields[fmt.id_wkt] for fields in rows]
+        coords, parts, geoms = parseWktColumn(wkts)
 
-                    TRACES.addTrack(track)
+        for i, fields in enumerate(rows):
+            # A single geometry is read as its first linestring (or ring)
+            first, last = geoms[i], geoms[i + 1]
+            if wkts[i].lstrip()[0:5].upper() != "MULTI":
+                _checkSimpleWkt(wkts[i])
+                last = min(last, first + 1)
 
-                else:
-                    collection = TrackReader.parsMultiWkt(wkt)
-                    for track in collection:
-                        if fmt.id_user >= 0:
-                            track.uid = fields[fmt.id_user]
-                        if fmt.id_track >= 0:
-                            track.tid = fields[fmt.id_track]
-
-                        if not fmt.selector is None:
-                            if not fmt.selector.contains(track):
-                                continue
+            for k in range(first, last):
+                track = _trackFromCoords(coords[parts[k] : parts[k + 1]], "ENU", columnar)
+                if fmt.id_user >= 0:
+                    track.uid = fields[fmt.id_user]
+                if fmt.id_track >= 0:
+                    track.tid = fields[fmt.id_track]
 
-                        TRACES.addTrack(track)
+                if not fmt.selector is None:
+                    if not fmt.selector.contains(track):
+                        continue
 
+                TRACES.addTrack(track)
 
-                if verbose:
-                    print(len(TRACES), " wkt tracks loaded")
+            if verbose:
+                print(len(TRACES), " wkt tracks loaded")
 
         return TRACES
 
@@ -528,124 +533,64 @@ class TrackReader:
     @staticmethod
     def parseWkt(wkt:str, srid='ENU') -> Track:
         """
-        Read track from a str, with geometry provided in wkt. 
-        Only LineString and Polygon are handled yet.
+        Read track from a str, with geometry provided in wkt (or ewkt). 
+        Only LineString and Polygon (exterior ring) are handled yet.
 
         Parameters
         ----------
-        wkt : TYPE
-            DESCRIPTION.
+        wkt : str
+            geometry in wkt.
+        srid : str
+            coordinate type of the track ("ENU", "Geo" or "ECEF").
 
         Raises
         ------
         WrongArgumentError
-            DESCRIPTION.
+            if the type of geometry is not handled.
 
         Returns
         -------
-        track : TYPE
-            DESCRIPTION.
+        track : Track
+            track of the vertices of the geometry (with null timestamps).
 
         """
-
-        track = Track()
-
-        wkt = wkt.upper()
-        if wkt[0:4].upper() == "POLY":
-            wkt = wkt.split("((")[1].split("))")[0]
-            wkt = wkt.split(",")
-        elif wkt[0:4].upper() == "LINE":
-            wkt = wkt.split("(")[1].split(")")[0]
-            wkt = wkt.split(",")
-        else:
-            raise WrongArgumentError("This type of wkt is not yet implemented: " + wkt[0:4].upper())
-
-        for s in wkt:
-            sl = s.strip().split(" ")
-            x = float(sl[0])
-            y = float(sl[1])
-            if len(sl) == 3:
-                z = float(sl[2])
-            else:
-                z = 0.0
-                
-            point = Obs(makeCoords(x, y, z, srid), ObsTime())
-            track.addObs(point)
-
-        return track
+        _checkSimpleWkt(wkt)
+        coords, parts, geoms = parseWktColumn([wkt])
+        if len(parts) < 2:
+            return Track()
+        return _trackFromCoords(coords[parts[0] : parts[1]], srid)
 
 
     @staticmethod
     def parsMultiWkt(wkt:str, srid='ENU') -> TrackCollection:
         """
-        Read tracks from a str, with geometry provided in wkt. 
+        Read tracks from a str, with geometry provided in wkt (or ewkt). 
         Only MultiLineString and MultiPolygon are handled yet.
 
         Parameters
         ----------
-        wkt : TYPE
-            DESCRIPTION.
+        wkt : str
+            geometry in wkt.
+        srid : str
+            coordinate type of the tracks ("ENU", "Geo" or "ECEF").
 
         Raises
         ------
         WrongArgumentError
-            DESCRIPTION.
+            if the geometry is not a multi-geometry.
 
         Returns
         -------
         collection of tracks : TrackCollection
-            one track represented by a single WKT geometry in the collection.
+            one track per linestring (or ring) of the geometry.
 
         """
-
-        collection = TrackCollection()
-
-        wkt = wkt.upper()
-        if wkt[0:5].upper() != "MULTI":
+        if wktGeometryType(wkt)[0:5] != "MULTI":
             raise WrongArgumentError("This type of wkt is not yet implemented.")
-            return
-
-        if wkt[0:7].upper() == "MULTIPO":
-            wkt = wkt.split("((")[1].split("))")[0]
-            wkt = wkt.split(",")
-            if wkt[0] == "(":
-                wkt = wkt[1:]
-            wkt = wkt.split("),(")[0]  # Multipolygon not handled yet
-
-        elif wkt[0:15].upper() == "MULTILINESTRING":
-
-            # wkt = wkt.split("((")[1].split("))")[0]
-            wkt = wkt[16:-1]
-            wkt = wkt.split(")")
-            for i in range(0, len(wkt)):
-                if wkt[i] == "":
-                    continue
-                wkt[i] = wkt[i].strip()
-                if wkt[i][0] == "(":
-                    wkt[i] = wkt[i][1:]
-                if wkt[i][1] == "(":
-                    wkt[i] = wkt[i][2:]
-                if wkt[i][2] == "(":
-                    wkt[i] = wkt[i][3:]
-                if wkt[i][-1] == ")":
-                    wkt[i] = wkt[i][0:-2]
-
-                track = Track()
-                tab = wkt[i].split(",")
-                for s in tab:
-                    sl = s.strip().split(" ")
-                    x = float(sl[0])
-                    y = float(sl[1])
-                    if len(sl) == 3:
-                        z = float(sl[2])
-                    else:
-                        z = 0.0
-                        
-                    point = Obs(makeCoords(x, y, z, srid), ObsTime())
-                    track.addObs(point)
-                collection.addTrack(track)
 
-        return collection
+        coords, parts, geoms = parseWktColumn([wkt])
+        return TrackCollection([_trackFromCoords(coords[parts[k] : parts[k + 1]], srid)
+                                for k in range(len(parts) - 1)])
         
 
 
@@ -654,44 +599,35 @@ class TrackReader:
     #
     @staticmethod
     def __readFromGpx(path:str, fmt:TrackFormat, verbose) -> TrackCollection:
-        fichier = open(path, 'r')
-        LINES = fichier.readlines()
-        tracks = TrackCollection()
-        new_track = False
-
-        if fmt.type == 'trk':
-            for line in LINES:
-                if ('<'+fmt.type+'>' in line):
-                    new_track = True
-                    new_point = False
-                    tracks.addTrack(Track())
-                if ('</'+fmt.type+'>' in line):
-                    new_track = False
-                if new_track:
-                    if ('<'+fmt.type+'pt ' in line):
-                        new_point = True
-                        tps = None
-                        splits = line.split("\"")
-                        pos = makeCoords(float(splits[3]), float(splits[1]), 0, fmt.srid)
-                    if ('</'+fmt.type+'pt>' in line):
-                        new_point = False
-                        tracks[-1].addObs(Obs(pos, tps))
-                    if new_point:
-                        if '<ele>' in line:
-                            pos.hgt = float(line.split('>')[1].split('<')[0])
-                        if '<time>' in line:
-                            tps = ObsTime(line.split('>')[1].split('<')[0])
-
-        if fmt.type == 'rte':
-            tracks.addTrack(Track())
-            for line in LINES:
-                if ('<'+fmt.type+'pt' in line):
-                    splits = line.split("\"")
-                    pos = makeCoords(float(splits[3]), float(splits[1]), 0, fmt.srid)
-                    tracks[-1].addObs(Obs(pos))
-
-        fichier.close()
-        return tracks
+        return TrackCollection(list(_iterGpx(path, fmt)))
+
+    @staticmethod
+    def streamFromGpx(path:str,
+            srid: Literal["GEO", "ENU"] ="GEO",
+            type: Literal["trk", "rte", "wpt"]="trk",
+            read_all=False):
+        """
+        Reads tracks, routes or waypoints of a gpx file incrementally.
+
+        The file is parsed by chunks (single-line files are supported), and
+        each track is yielded as soon as its closing tag is read, so that
+        memory does not depend on the size of the file.
+
+        :param str path: gpx file (or file object)
+        :param str srid: coordinate system of points ("ENU", "Geo" or "ECEF")
+        :param str type: "trk" to load track points (one track per <trk>),
+                         "rte" to load route points (one track per <rte>) or
+                         "wpt" to load all waypoints of the file in a track
+        :param bool read_all: read other fields of points (such as <speed>
+                         or fields in <extensions>) as analytical features
+
+        :return: iterator of tracks
+        """
+        track_format = TrackFormat({'ext': 'GPX',
+                                    'type': type,
+                                    'srid': srid,
+                                    'read_all': read_all})
+        return _iterGpx(path, track_format)
 
 
 #     @staticmethod
@@ -834,7 +770,7 @@ class TrackReader:
                      id_E:int=-1, id_N:int=-1, id_U:int=-1, id_T:int=-1,
                      separator:str=",", DateIni=-1,  timeUnit=1,   h=0,
                      com="#", no_data_value=-999999, srid="ENUCoords",
-                     read_all=False, selector=None, verbose=False):
+                     read_all=False, selector=None, verbose=False, columnar=False):
         track_format = TrackFormat({'ext': 'CSV',
                                     'id_E': id_E,
                                     'id_N': id_N,
@@ -849,7 +785,553 @@ class TrackReader:
                                     'srid': srid,
                                     'read_all': read_all,
                                     'selector': selector})
-        return TrackReader.readFromFile(path, track_format, verbose)
+        return TrackReader.readFromFile(path, track_format, verbose, columnar)
+
+
+
+
+
+def _checkSimpleWkt(wkt: str):
+    """Raise an error if a wkt geometry is neither a linestring nor a polygon"""
+    geom_type = wktGeometryType(wkt)
+    if geom_type not in ["LINESTRING", "POLYGON"]:
+        raise WrongArgumentError("This type of wkt is not yet implemented: " + geom_type[0:4])
+
+
+def _trackFromCoords(coords, srid: str, columnar: bool = False) -> Track:
+    """Build a track (with null timestamps) from an (n, 3) array of coordinates"""
+    if columnar:
+        return Track.fromArrays(coords[:, 0], coords[:, 1], coords[:, 2], None, srid)
+    return Track(makeObsList(coords, srid))
+
+
+class _CsvColumns:
+    """Columns of a CSV track file, read by chunks of lines and converted
+    into typed arrays (see :func:`TrackReader.readFromFile`).
+
+    Lines are read as in former line-by-line reader: empty fields are
+    ignored, lines starting with the comment character give the names of
+    analytical features, and reading stops at the first empty line.
+    """
+
+    # Number of characters read at once
+    CHUNK_SIZE = 1 << 24
+
+    def __init__(self, fmt: TrackFormat):
+        """Constructor of :class:`_CsvColumns` class
+
+        :param fmt: Format of the file
+        """
+        self.fmt = fmt
+        self.separator, self.special, self.srid = fmt.getColumnPlan()
+
+        self.names = None      # Names of analytical features
+        self.uid = None
+        self.tid = None
+        self.last = []         # Fields of the last row
+        self.finished = False
+        self.sizes = []        # Number of rows of each chunk
+        self.E, self.N, self.U, self.T = [], [], [], []
+        self.af = {}           # Column index -> {chunk index: values}
+
+    def read(self, fp):
+        """Read a (text) file, with header lines"""
+        for i in range(self.fmt.header):
+            line = fp.readline()
+            if line[0] == self.fmt.cmt:
+                line = line[1:]
+            self.names = line.split(self.separator)
+
+        rest = ""
+        while not self.finished:
+            text = fp.read(_CsvColumns.CHUNK_SIZE)
+            if not text:
+                if rest:
+                    self.__parse(rest)
+                break
+            text = rest + text
+            cut = text.rfind("\n")
+            rest = text[cut + 1 :]
+            if cut >= 0:
+                self.__parse(text[:cut])
+
+    def __parse(self, text: str):
+        """Convert a chunk of complete lines"""
+        fmt = self.fmt
+        sep = self.separator
+        lines = []
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line:
+                self.finished = True
+                break
+            if line[0] == fmt.cmt:
+                self.names = line[1:].split(sep)
+                continue
+            lines.append(line)
+        if len(lines) == 0:
+            return
+
+        # Empty fields are ignored
+        if (sep + sep in text) or ("\n" + sep in text) or (sep + "\n" in text) or \
+            (sep + "\r" in text) or text.startswith(sep) or text.endswith(sep):
+            rows = [[s for s in line.split(sep) if s] for line in lines]
+        else:
+            rows = [line.split(sep) for line in lines]
+
+        self.last = rows[-1]
+        if fmt.id_user > 0:
+            self.uid = self.last[fmt.id_user].strip()
+        if fmt.id_track > 0:
+            self.tid = self.last[fmt.id_track].strip()
+
+        # Coordinates (blank fields are no-data values)
+        no_data = fmt.no_data_value
+        E = [row[fmt.id_E] for row in rows]
+        N = [row[fmt.id_N] for row in rows]
+        self.E.append(_CsvColumns.__toFloat("E", E, no_data, ["", "NA"]))
+        self.N.append(_CsvColumns.__toFloat("N", N, no_data, ["", "NA"]))
+        if fmt.id_U >= 0:
+            U = [row[fmt.id_U] for row in rows]
+            self.U.append(_CsvColumns.__toFloat("U", U, no_data, [""]))
+
+        # Timestamps
+        if fmt.id_T >= 0:
+            if isinstance(fmt.time_ini, int):
+                T = [row[fmt.id_T].strip().replace('"', '') for row in rows]
+                # Unreadable timestamps are set to 01/01/1970
+                self.T.append(np.nan_to_num(ObsTime.readTimestamps(T, fmt.time_fmt), nan=0.0))
+            else:
+                T = np.asarray([row[fmt.id_T] for row in rows], dtype=float)
+                self.T.append(fmt.time_ini.toAbsTime() + T * fmt.time_unit)
+
+        # Analytical features
+        if fmt.read_all:
+            names = [] if self.names is None else [s.strip() for s in self.names if s]
+            width = max(len(row) for row in rows)
+            for i in range(width):
+                if i in self.special:
+                    continue
+                keep_str = (i < len(names)) and (names[i][-1:] == "&")
+                values = [row[i].strip() if i < len(row) else None for row in rows]
+                self.af.setdefault(i, {})[len(self.sizes)] = \
+                    _CsvColumns.__toValues(values, keep_str)
+
+        self.sizes.append(len(rows))
+
+    @staticmethod
+    def __toFloat(name, values, no_data, blanks) -> np.ndarray:
+        """Convert a column of coordinates"""
+        try:
+            return np.asarray(values, dtype=float)
+        except ValueError:
+            values = [no_data if v.strip() in blanks else v for v in values]
+        try:
+            return np.asarray(values, dtype=float)
+        except ValueError:
+            raise WrongArgumentError("Parameter " + name + " is not an instantiation of a float")
+
+    @staticmethod
+    def __toValues(values, keep_str: bool) -> np.ndarray:
+        """Convert a column of analytical feature (floats when possible)"""
+        if not keep_str:
+            try:
+                return np.asarray(values, dtype=float)
+            except (ValueError, TypeError):
+                pass
+        output = np.empty(len(values), dtype=object)
+        for k in range(len(values)):
+            val = values[k]
+            if val is None:
+                val = 0.0
+            elif not keep_str:
+                try:
+                    val = float(val)
+                except ValueError:
+                    val = str(val).replace('"', "")
+            output[k] = val
+        return output
+
+    def getSrid(self) -> str:
+        """Coordinate type of the columns (see :class:`ObsColumns`)"""
+        return self.srid
 
+    def getCoordinates(self):
+        """Arrays of coordinates and timestamps
 
+        Coordinates of records with a no-data value in E or N are set to the
+        no-data value.
+        """
+        n = sum(self.sizes)
+        E = np.concatenate(self.E) if n > 0 else np.zeros(0)
+        N = np.concatenate(self.N) if n > 0 else np.zeros(0)
+        U = np.concatenate(self.U) if len(self.U) > 0 else np.zeros(n)
+        T = np.concatenate(self.T) if len(self.T) > 0 else np.zeros(n)
+        no_data = self.fmt.no_data_value
+        invalid = (np.trunc(E) == no_data) | (np.trunc(N) == no_data)
+        if invalid.any():
+            E[invalid] = no_data
+            N[invalid] = no_data
+            U[invalid] = no_data
+        return E, N, U, T
+
+    def getFeatures(self) -> dict:
+        """Analytical features (name -> array), for the fields of the last row"""
+        if not self.fmt.read_all or len(self.sizes) == 0:
+            return None
+        if self.names is None:
+            raise WrongArgumentError("Error: names of analytical features are missing in CSV file")
+        names = [s.strip() for s in self.names if s]
+        features = {}
+        for i in range(len(self.last)):
+            if i in self.special:
+                continue
+            chunks = self.af.get(i, {})
+            parts = []
+            for k in range(len(self.sizes)):
+                parts.append(chunks[k] if k in chunks else np.zeros(self.sizes[k]))
+            if any(part.dtype == object for part in parts):
+                parts = [part.astype(object) for part in parts]
+            features[names[i]] = np.concatenate(parts)
+        return features
+
+
+# Fields of GPX points which are not read as analytical features
+_GPX_POINT_FIELDS = {"ele", "time", "extensions"}
+
+
+def _iterGpx(path, fmt: TrackFormat, chunk_size=1 << 20):
+    """Incremental reading of the tracks of a GPX file (or file object)"""
+    target = _GpxParser(fmt)
+    parser = ET.XMLParser(target=target)
+    fp = openStream(path, "rb") if isinstance(path, (str, os.PathLike)) else path
+    try:
+        while True:
+            data = fp.read(chunk_size)
+            if not data:
+                break
+            parser.feed(data)
+            yield from target.popTracks()
+        parser.close()
+        yield from target.popTracks()
+    finally:
+        if fp is not path:
+            fp.close()
+
+
+class _GpxParser:
+    """Event-based GPX parser (target of a XMLParser), without XML tree
+
+    Tracks are stored in a queue as soon as their closing tag is read.
+    """
+
+    def __init__(self, fmt: TrackFormat):
+        self.type = fmt.type
+        self.point_tag = fmt.type + "pt" if fmt.type in ["trk", "rte"] else "wpt"
+        self.srid = fmt.srid.upper().replace("COORDS", "")
+        self.read_all = fmt.read_all
+        self.names = {}
+        self.tracks = []
+        self.builder = None
+        self.in_point = False
+        self.leaf = False
+        self.text = []
+
+    def __local(self, tag: str) -> str:
+        """Tag without namespace"""
+        name = self.names.get(tag)
+        if name is None:
+            name = tag.rsplit("}", 1)[-1].rsplit(":", 1)[-1]
+            self.names[tag] = name
+        return name
+
+    def start(self, tag, attrib):
+        name = self.__local(tag)
+        self.leaf = True
+        self.text = []
+        if name == self.point_tag:
+            if self.builder is None:
+                self.builder = _GpxTrackBuilder(self.srid, self.read_all)
+            self.builder.addPoint(attrib["lon"], attrib["lat"])
+            self.in_point = True
+        elif name == self.type:
+            self.builder = _GpxTrackBuilder(self.srid, self.read_all)
+
+    def data(self, data):
+        if self.in_point:
+            self.text.append(data)
+
+    def end(self, tag):
+        name = self.__local(tag)
+        leaf = self.leaf
+        self.leaf = False
+        if self.in_point:
+            if name == self.point_tag:
+                self.in_point = False
+            elif name == "ele":
+                self.builder.setElevation("".join(self.text))
+            elif name == "time":
+                self.builder.setTime("".join(self.text))
+            elif self.read_all and leaf and (name not in _GPX_POINT_FIELDS):
+                self.builder.setFeature(name, "".join(self.text))
+        elif (name == self.type) and (self.builder is not None):
+            self.tracks.append(self.builder.build())
+            self.builder = None
+
+    def close(self):
+        if (self.type == "wpt") and (self.builder is not None):
+            self.tracks.append(self.builder.build())
+            self.builder = None
+
+    def popTracks(self) -> list:
+        """Tracks completed since the last call"""
+        tracks = self.tracks
+        self.tracks = []
+        return tracks
 
+
+class _GpxTrackBuilder:
+    """Accumulation of the points of a GPX track into columns"""
+
+    def __init__(self, srid: str, read_all: bool):
+        self.srid = srid
+        self.read_all = read_all
+        self.X = []
+        self.Y = []
+        self.Z = []
+        self.times = []
+        self.features = {}
+
+    def addPoint(self, lon: str, lat: str):
+        self.X.append(float(lon))
+        self.Y.append(float(lat))
+        self.Z.append(0.0)
+        self.times.append(None)
+        return len(self.X) - 1
+
+    def setElevation(self, text: str):
+        # Elevation only read for geographic coordinates
+        if self.srid == "GEO":
+            self.Z[-1] = float(text)
+
+    def setTime(self, text: str):
+        self.times[-1] = text.strip()
+
+    def setFeature(self, name: str, text: str):
+        if name not in self.features:
+            self.features[name] = {}
+        text = text.strip()
+        if isfloat(text):
+            value = float(text)
+        elif islist(text):
+            value = json.loads(text)
+        else:
+            value = text
+        self.features[name][len(self.X) - 1] = value
+
+    def build(self) -> Track:
+        n = len(self.X)
+        T = np.zeros(n)
+        indices = [i for i in range(n) if self.times[i] is not None]
+        if len(indices) > 0:
+            T[indices] = ObsTime.readTimestamps([self.times[i] for i in indices])
+            for i in indices:
+                if np.isnan(T[i]):
+                    T[i] = ObsTime(self.times[i]).toAbsTime()
+        af = {}
+        for name, values in self.features.items():
+            af[name] = [values.get(i, NAN) for i in range(n)]
+        if n == 0:
+            return Track()
+        track = Track.fromArrays(self.X, self.Y, self.Z, T, self.srid, af=af)
+        return track.toPoints()
+
+
+def _iterNmeaSentences(path, follow: bool, poll_interval: float, timeout, chunk_size=1 << 20):
+    """Sentences of a (possibly growing) NMEA file, read by chunks of lines"""
+    with openStream(path, "rb") as fp:
+        pending = b""
+        waited = 0
+        while True:
+            data = fp.read(chunk_size)
+            if data:
+                data = pending + data
+                cut = data.rfind(b"\n") + 1
+                pending = data[cut:]
+                if cut > 0:
+                    yield from _nmeaSentences(data[:cut])
+                    waited = 0
+                continue
+            if not follow:
+                break
+            if (timeout is not None) and (waited >= timeout):
+                break
+            time.sleep(poll_interval)
+            waited += poll_interval
+        if pending:
+            yield from _nmeaSentences(pending)
+
+
+def _nmeaSentences(data: bytes) -> list:
+    """Fields of the sentences of a chunk of lines with a valid checksum
+
+    Checksums (XOR of the characters between '$' and '*') are computed for
+    all the sentences of the chunk at once, from the cumulative XOR of its
+    bytes.
+    """
+    text = data.decode("ascii", errors="replace")
+    sentences = []
+    starts, ends, checksums, indices = [], [], [], []
+    position = 0
+    for line in text.split("\n"):
+        start = line.find("$")
+        if start >= 0:
+            end = line.find("*", start)
+            if end < 0:
+                sentences.append(line[start + 1 :].strip())
+            else:
+                try:
+                    checksums.append(int(line[end + 1 : end + 3], 16))
+                except ValueError:
+                    position += len(line) + 1
+                    continue
+                starts.append(position + start)
+                ends.append(position + end - 1)
+                indices.append(len(sentences))
+                sentences.append(line[start + 1 : end])
+        position += len(line) + 1
+    if indices:
+        xor = np.bitwise_xor.accumulate(np.frombuffer(data, dtype=np.uint8))
+        valid = (xor[ends] ^ xor[starts]) == np.array(checksums)
+        for k in np.flatnonzero(~valid).tolist():
+            sentences[indices[k]] = None
+    return [sentence.split(",") for sentence in sentences if sentence]
+
+
+def _iterNmea(path, follow=False, poll_interval=1.0, timeout=None):
+    """Observations (with GST standard deviations) of a NMEA log"""
+    parser = _NmeaParser()
+    for fields in _iterNmeaSentences(path, follow, poll_interval, timeout):
+        record = parser.parse(fields)
+        if record is not None:
+            yield record
+    record = parser.flush()
+    if record is not None:
+        yield record
+
+
+def _nmeaTrack(records) -> Track:
+    """Track of NMEA observations, with GNSS fields as analytical features"""
+    track = Track([obs for obs, _ in records])
+    track.createAnalyticalFeature("nb_sats", [obs.nb_sats for obs, _ in records])
+    track.createAnalyticalFeature("hdop", [obs.hdop for obs, _ in records])
+    if any("pdop" in extras for _, extras in records):
+        track.createAnalyticalFeature("pdop", [obs.pdop for obs, _ in records])
+        track.createAnalyticalFeature("vdop", [obs.vdop for obs, _ in records])
+    for name in ["sigma_lat", "sigma_lon", "sigma_hgt"]:
+        if any(name in extras for _, extras in records):
+            track.createAnalyticalFeature(name, [extras.get(name, NAN) for _, extras in records])
+    return track
+
+
+class _NmeaParser:
+    """Assembly of the NMEA sentences of each epoch into an observation
+
+    The sentences of an epoch are those with the same time of day (and the
+    GSA sentences following them). An epoch is complete when a sentence of
+    another time is read.
+    """
+
+    def __init__(self):
+        self.date = None
+        self.midnight = 0.0
+        self.epoch = None
+        self.fields = {}
+
+    def parse(self, fields: list):
+        """Parse the fields of a sentence, and return the previous epoch if
+        it is complete"""
+        kind = fields[0][2:]
+        if kind not in ["GGA", "RMC", "GST", "GSA"]:
+            return None
+        record = None
+        try:
+            if kind == "GSA":
+                if self.epoch is not None:
+                    self.fields["pdop"] = float(fields[15])
+                    self.fields.setdefault("hdop", float(fields[16]))
+                    self.fields["vdop"] = float(fields[17])
+                return None
+            if len(fields) < 9 or not fields[1]:
+                return None
+            if fields[1] != self.epoch:
+                record = self.flush()
+                self.epoch = fields[1]
+            if kind == "GGA":
+                self.__parseGGA(fields)
+            elif kind == "RMC":
+                self.__parseRMC(fields)
+            else:
+                self.fields["sigma_lat"] = float(fields[6])
+                self.fields["sigma_lon"] = float(fields[7])
+                self.fields["sigma_hgt"] = float(fields[8])
+        except (ValueError, IndexError):
+            pass
+        return record
+
+    def __parseGGA(self, fields):
+        if fields[2] and fields[4]:
+            self.fields["position"] = (_nmeaDegrees(fields[4], fields[5]),
+                                       _nmeaDegrees(fields[2], fields[3]),
+                                       float(fields[9]) if fields[9] else 0.0)
+        if fields[7]:
+            self.fields["nb_sats"] = int(fields[7])
+        if fields[8]:
+            self.fields["hdop"] = float(fields[8])
+
+    def __parseRMC(self, fields):
+        date = fields[9]
+        if (len(date) >= 6) and (date != self.date):
+            day = ObsTime(2000 + int(date[4:6]), int(date[2:4]), int(date[0:2]))
+            self.midnight = day.toAbsTime()
+            self.date = date
+        if fields[2] == "A" and fields[3] and fields[5]:
+            self.fields.setdefault("rmc", (_nmeaDegrees(fields[5], fields[6]),
+                                           _nmeaDegrees(fields[3], fields[4]), 0.0))
+
+    def flush(self):
+        """Observation (and GST standard deviations) of the current epoch"""
+        fields = self.fields
+        epoch = self.epoch
+        self.fields = {}
+        self.epoch = None
+        position = fields.get("position", fields.get("rmc"))
+        if position is None:
+            return None
+        try:
+            seconds = int(epoch[0:2]) * 3600 + int(epoch[2:4]) * 60 + float(epoch[4:])
+        except ValueError:
+            return None
+        obs = Obs(GeoCoords(*position), ObsTime.readUnixTime(self.midnight + seconds))
+        if "nb_sats" in fields:
+            obs.nb_sats = fields["nb_sats"]
+        if "hdop" in fields:
+            obs.hdop = fields["hdop"]
+        extras = {}
+        if "pdop" in fields:
+            obs.pdop = extras["pdop"] = fields["pdop"]
+            obs.vdop = fields["vdop"]
+        if "sigma_lat" in fields:
+            for name in ["sigma_lat", "sigma_lon", "sigma_hgt"]:
+                extras[name] = fields[name]
+        return obs, extras
+
+
+def _nmeaDegrees(value: str, hemisphere: str) -> float:
+    """Conversion of NMEA (d)ddmm.mmmm coordinates into decimal degrees"""
+    value = float(value)
+    degrees = int(value / 100)
+    degrees += (value - 100 * degrees) / 60
+    if hemisphere in ["S", "W"]:
+        return -degrees
+    return degrees
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains the class to persist track collections in a native
+binary file, which can be opened memory-mapped.
+
+File layout (little-endian):
+
+- magic string ``TRACKLIB`` (8 bytes), format version (uint32), unused
+  (uint32), length of the header (uint64)
+- header (JSON): metadata of each track (uid, tid, srid, time zone, base,
+  names of analytical features) and position of the arrays in the file
+- arrays, aligned on 64 bytes: offset table of the tracks (``offsets``,
+  int64), bounding boxes (``bbox``, float64), coordinate and time columns
+  (``x``, ``y``, ``z``, ``t``, float64) shared by all tracks, one float64
+  column per analytical feature of floats (``af:<name>``), and a blob of
+  JSON-encoded values for the other analytical features (``objects``)
+"""
+
+# For type annotation
+from __future__ import annotations
+from tracklib.util.exceptions import *
+
+import json
+import mmap
+import struct
+import numpy as np
+
+from tracklib.core import Track, TrackCollection, Bbox, makeCoords
+
+
+MAGIC = b"TRACKLIB"
+VERSION = 1
+_ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<8sIIQ")
+
+
+class TrackStore:
+    """Memory-mapped binary file of a collection of tracks.
+
+    Opening a file only reads its header: tracks are materialized on access,
+    in columnar mode, with coordinate, time and numerical analytical feature
+    columns mapped on the file without copy. The file is mapped once,
+    read-only: columns of materialized tracks are duplicated by the first
+    modification of the track (copy-on-write), so modifications are private,
+    never written in the file nor visible in other materializations of the
+    track. Arrays returned by :func:`Track.getX` (...) must not be modified
+    in place.
+
+    Non-numerical analytical features are stored as JSON (not pickled), so
+    that opening an untrusted file cannot execute code. Booleans, integers,
+    strings, None and lists of them are read back as such; other values
+    are stored as their string representation.
+    """
+
+    def __init__(self, path: str):
+        """Open a binary file written by :func:`TrackStore.write`
+
+        :param path: Path of the file
+        """
+        self.path = path
+        with open(path, "rb") as fp:
+            preamble = fp.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise WrongArgumentError("Error: " + str(path) + " is not a tracklib binary file")
+            magic, version, _, length = _PREAMBLE.unpack(preamble)
+            if magic != MAGIC:
+                raise WrongArgumentError("Error: " + str(path) + " is not a tracklib binary file")
+            if version > VERSION:
+                raise WrongArgumentError("Error: unsupported version " + str(version) +
+                                         " of tracklib binary file")
+            header = json.loads(fp.read(length).decode("utf-8"))
+
+        self.tracks = header["tracks"]
+        self.__mmap = None
+        if len(self.tracks) > 0:
+            with open(self.path, "rb") as fp:
+                self.__mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__arrays = {}
+        for name, (offset, dtype, shape) in header["arrays"].items():
+            count = int(np.prod(shape))
+            if count == 0:
+                array = np.zeros(shape, dtype=dtype)
+            else:
+                array = np.frombuffer(self.__mmap, dtype=dtype, count=count, offset=offset)
+            self.__arrays[name] = array.reshape(shape)
+        self.offsets = self.__arrays["offsets"]
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+    @staticmethod
+    def write(collection, path: str):
+        """Write a collection of tracks in a binary file
+
+        Tracks are written column by column (one pass on the collection per
+        column). Analytical features made of floats are stored as float64
+        columns, other ones (booleans, integers, strings...) are encoded in
+        JSON.
+
+        :param collection: A :class:`TrackCollection` (or any sequence of tracks)
+        :param path: Path of the output file
+        """
+        tracks = list(collection)
+        sizes = [track.size() for track in tracks]
+        offsets = np.zeros(len(tracks) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(sizes)
+        n = int(offsets[-1])
+
+        # Metadata and classification of analytical features
+        metadata = []
+        numeric = {}
+        objects = []
+        for track in tracks:
+            features = track.getListAnalyticalFeatures()
+            base = track.base
+            if base is not None:
+                base = [type(base).__name__, base.getX(), base.getY(), base.getZ()]
+            metadata.append({
+                "uid": _jsonable(track.uid),
+                "tid": _jsonable(track.tid),
+                "srid": track.getSRID() if track.size() > 0 else "ENU",
+                "zone": track.getTimeZone() if track.size() > 0 else 0,
+                "base": base,
+                "no_data_value": _jsonable(track.no_data_value),
+                "af": features,
+                "objects": {},
+            })
+            for name in features:
+                values = track.getAnalyticalFeature(name)
+                if _isNumerical(values):
+                    numeric[name] = True
+                else:
+                    objects.append((len(metadata) - 1, name))
+
+        bbox = np.full((len(tracks), 4), np.nan)
+        for i, track in enumerate(tracks):
+            if track.size() > 0:
+                X = np.asarray(track.getX(), dtype=float)
+                Y = np.asarray(track.getY(), dtype=float)
+                bbox[i] = [X.min(), X.max(), Y.min(), Y.max()]
+
+        # JSON-encoded values of non-numerical analytical features
+        blob = []
+        position = 0
+        for i, name in objects:
+            data = _encodeValues(tracks[i].getAnalyticalFeature(name))
+            metadata[i]["objects"][name] = [position, position + len(data)]
+            blob.append(data)
+            position += len(data)
+
+        columns = [("offsets", offsets), ("bbox", bbox)]
+        for name in ["x", "y", "z", "t"]:
+            columns.append((name, _column(tracks, name)))
+        for name in numeric:
+            columns.append(("af:" + name, _column(tracks, name, metadata)))
+        columns.append(("objects", (position, blob)))
+
+        # Header (positions of arrays depend on its length)
+        arrays = {}
+        header = {"size": len(tracks), "tracks": metadata, "arrays": arrays}
+        for name, _ in columns:
+            arrays[name] = [0, "<f8", [n]]
+        arrays["offsets"] = [0, "<i8", [len(tracks) + 1]]
+        arrays["bbox"] = [0, "<f8", [len(tracks), 4]]
+        arrays["objects"] = [0, "u1", [position]]
+        length = len(json.dumps(header).encode("utf-8"))
+        while True:
+            offset = _align(_PREAMBLE.size + length)
+            for name, _ in columns:
+                arrays[name][0] = offset
+                offset = _align(offset + int(np.prod(arrays[name][2])) * np.dtype(arrays[name][1]).itemsize)
+            encoded = json.dumps(header).encode("utf-8")
+            if len(encoded) <= length:
+                break
+            length = len(encoded)
+        encoded = encoded.ljust(length)
+
+        with open(path, "wb") as fp:
+            fp.write(_PREAMBLE.pack(MAGIC, VERSION, 0, length))
+            fp.write(encoded)
+            for name, values in columns:
+                fp.write(b"\0" * (arrays[name][0] - fp.tell()))
+                if name == "objects":
+                    for data in values[1]:
+                        fp.write(data)
+                elif isinstance(values, np.ndarray):
+                    fp.write(np.ascontiguousarray(values, dtype=arrays[name][1]).tobytes())
+                else:
+                    for chunk in values:
+                        fp.write(np.ascontiguousarray(chunk, dtype="<f8").tobytes())
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+    def size(self) -> int:
+        """Number of tracks in the file"""
+        return len(self.tracks)
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def getNumberOfPoints(self, i: int = None) -> int:
+        """Number of observations of the i-th track (or of all tracks)"""
+        if i is None:
+            return int(self.offsets[-1])
+        return int(self.offsets[i + 1] - self.offsets[i])
+
+    def getUid(self, i: int):
+        """User id of the i-th track"""
+        return self.tracks[i]["uid"]
+
+    def getTid(self, i: int):
+        """Track id of the i-th track"""
+        return self.tracks[i]["tid"]
+
+    def getTrackBbox(self, i: int) -> Bbox:
+        """Bounding box of the i-th track (without materializing it)"""
+        xmin, xmax, ymin, ymax = self.__arrays["bbox"][i].tolist()
+        srid = self.tracks[i]["srid"]
+        return Bbox(makeCoords(xmin, ymin, 0, srid), makeCoords(xmax, ymax, 0, srid))
+
+    def getTrackBboxes(self) -> np.ndarray:
+        """Bounding boxes of all the tracks, as an array of (xmin, xmax, ymin,
+        ymax) rows (NaN for empty tracks)"""
+        return self.__arrays["bbox"]
+
+    def bbox(self) -> Bbox:
+        """Bounding box of all the tracks of the file"""
+        boxes = self.__arrays["bbox"]
+        xmin, ymin = np.nanmin(boxes[:, 0]), np.nanmin(boxes[:, 2])
+        xmax, ymax = np.nanmax(boxes[:, 1]), np.nanmax(boxes[:, 3])
+        srid = self.tracks[0]["srid"]
+        return Bbox(makeCoords(float(xmin), float(ymin), 0, srid),
+                    makeCoords(float(xmax), float(ymax), 0, srid))
+
+    def getTrack(self, i: int) -> Track:
+        """Materialize the i-th track (in columnar mode, without copy)"""
+        meta = self.tracks[i]
+        i1, i2 = int(self.offsets[i]), int(self.offsets[i + 1])
+        columns = [self.__arrays[name][i1:i2] for name in ["x", "y", "z", "t"]]
+        af = {}
+        for name in meta["af"]:
+            if name in meta["objects"]:
+                start, end = meta["objects"][name]
+                data = self.__arrays["objects"][start:end].tobytes()
+                values = np.empty(i2 - i1, dtype=object)
+                values[:] = _decodeValues(data)
+                af[name] = values
+            else:
+                af[name] = self.__arrays["af:" + name][i1:i2]
+        base = meta["base"]
+        if base is not None:
+            base = makeCoords(base[1], base[2], base[3], base[0])
+        track = Track.fromArrays(*columns, srid=meta["srid"], af=af, user_id=meta["uid"],
+                                 track_id=meta["tid"], base=base, copy=False)
+        track.setTimeZone(meta["zone"])
+        track.no_data_value = meta["no_data_value"]
+        return track
+
+    def __getitem__(self, i: int) -> Track:
+        if isinstance(i, slice):
+            return [self.getTrack(k) for k in range(*i.indices(self.size()))]
+        if i < 0:
+            i += self.size()
+        if i < 0 or i >= self.size():
+            raise IndexError("track index out of range")
+        return self.getTrack(i)
+
+    def __iter__(self):
+        for i in range(self.size()):
+            yield self.getTrack(i)
+
+    def toTrackCollection(self) -> TrackCollection:
+        """Materialize all the tracks of the file in a collection"""
+        return TrackCollection(list(self))
+
+
+def _jsonable(value):
+    """Value stored in the JSON header (numbers and strings are kept)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _encodeValues(values) -> bytes:
+    """Encode a list of values in JSON (values that are not JSON types are
+    stored as strings)"""
+    return json.dumps([_jsonableValue(v) for v in values]).encode("utf-8")
+
+
+def _decodeValues(data: bytes) -> list:
+    """Decode a list of values encoded by :func:`_encodeValues`"""
+    return json.loads(data.decode("utf-8"))
+
+
+def _jsonableValue(value):
+    """JSON value of an analytical feature value (lists are kept)"""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_jsonableValue(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _jsonableValue(v) for k, v in value.items()}
+    return _jsonable(value)
+
+
+def _isNumerical(values) -> bool:
+    """Check if analytical feature values can be stored in a float64 column
+    (floats only: booleans and integers would be read back as floats)"""
+    if isinstance(values, np.ndarray):
+        return values.dtype.kind == "f"
+    return all(isinstance(v, (float, np.floating)) for v in values)
+
+
+def _column(tracks, name: str, metadata=None):
+    """Chunks (one per track) of a column, NaN where an AF is not numerical"""
+    for i, track in enumerate(tracks):
+        if name == "x":
+            yield track.getX()
+        elif name == "y":
+            yield track.getY()
+        elif name == "z":
+            yield track.getZ()
+        elif name == "t":
+            yield track.getT()
+        elif track.hasAnalyticalFeature(name) and name not in metadata[i]["objects"]:
+            yield track.getAnalyticalFeature(name)
+        else:
+            yield np.full(track.size(), np.nan)
+
+
+def _align(offset: int) -> int:
+    """Next multiple of the alignment of arrays"""
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
@@ -51,6 +51,7 @@ import json
 import os
 import progressbar
 import sys 
+import numpy as np
 
 from . import TrackFormat
 from tracklib.core import (ObsTime, 
@@ -70,8 +71,20 @@ class TrackWriter:
     - __writeCollectionToKml
     - writeToGpx
     - writeToOneGpx
+    - writeToGeojson
+
+    Observations are formatted by columns and written through a large
+    buffer. Writers of several tracks accept any iterable of tracks (e.g.
+    a :class:`TrackSource` or a :class:`TrackStore`), and write each track
+    as soon as it is produced.
     """
 
+    # Size of file buffers (in bytes)
+    BUFFER_SIZE = 1 << 20
+
+    # Number of observations formatted at once
+    CHUNK_SIZE = 1 << 16
+
     def __takeFirst(elem):
         return elem[0]
 
@@ -199,7 +212,7 @@ class TrackWriter:
         # -------------------------------------------------------
         # Writing data
         # -------------------------------------------------------
-        f = open(path, "w")
+        f = open(path, "w", buffering=TrackWriter.BUFFER_SIZE)
 
         # Header
         if fmt.header > 0:
@@ -257,42 +270,30 @@ class TrackWriter:
                                 "X", "Y", "Z", "time", headerAF, O, fmt.separator)+ "\n")
 
 
-        # Data
+        # Data (formatted by columns)
         if track.getSRID().upper() == "ENU":
-            float_fmt = "{:10.3f}"
+            float_fmt = "%.3f"
         if track.getSRID().upper() == "GEO":
-            float_fmt = "{:20.10f}"
+            float_fmt = "%.10f"
         if track.getSRID().upper() == "ECEF":
-            float_fmt = "{:10.3f}"
-        
-        for i in range(track.size()):
-            x = float_fmt.format(track.getObs(i).position.getX())
-            y = float_fmt.format(track.getObs(i).position.getY())
-            if fmt.id_U == -1:
-                z = None
-            else:
-                z = float_fmt.format(track.getObs(i).position.getZ())
-            if fmt.id_T == -1:
-                t = None
-            else:
-                t = track.getObs(i).timestamp
+            float_fmt = "%.3f"
+
+        D = [(float_fmt, _column(track.getX())), (float_fmt, _column(track.getY()))]
+        if fmt.id_U != -1:
+            D.append((float_fmt, _column(track.getZ())))
+        if fmt.id_T != -1:
             if isinstance(fmt.time_ini, ObsTime):
-                t = t.toAbsTime() - fmt.time_ini.toAbsTime()
-            
-            afs = ""
-            if len(af_names) > 0:
-                for af_name in af_names:
-                    v = track.getObsAnalyticalFeature(af_name, i)
-                    if isinstance(v, int) or isinstance(v, float):
-                        afs += fmt.separator + str(f"{v:.0f}")
-                    else:
-                        afs += fmt.separator + str(v)
-                    #if af_name == 'num':
-                    #    print ('    ', type(track.getObsAnalyticalFeature(af_name, i)))
-                    #afs += fmt.separator + str(track.getObsAnalyticalFeature(af_name, i))
-                    
-            f.write(TrackWriter.__printInOrder(x, y, z, t,
-                                              afs, O, fmt.separator) + "\n")
+                T = (np.asarray(track.getT(), dtype=float) - fmt.time_ini.toAbsTime()).tolist()
+            else:
+                T = [t.strip() for t in ObsTime.printTimestamps(track.getT())]
+            D.append(("%s", T))
+        D = [D[O[k][1]] for k in range(len(D))]
+        for af_name in af_names:
+            D.append(("%s", _csvValues(track.getAnalyticalFeature(af_name))))
+
+        separator = _escape(fmt.separator)
+        template = separator.join([code for code, _ in D]) + "\n"
+        _writeRows(f, template, [values for _, values in D])
 
         f.close()
 
@@ -300,12 +301,12 @@ class TrackWriter:
     @staticmethod
     def writeToFiles(trackCollection, pathDir, ext='csv', id_E=-1, id_N=-1, id_U=-1,
                      id_T=-1, separator=",", h=0, af_names=[]):
-        """TODO"""
+        """Write each track of a collection (or of any iterable of tracks)
+        in a CSV file of directory pathDir (see :func:`writeToFile`)"""
 
         root = "track_output"
 
-        for i in range(trackCollection.size()):
-            track = trackCollection.getTrack(i)
+        for i, track in enumerate(trackCollection):
             path = pathDir + "/" + root + "_" + str(i) + "." + ext
 
             if id_N == -1:
@@ -338,63 +339,54 @@ class TrackWriter:
             print("Error: parameter track is not a Track")
             return None
         
-        out_str = '{ '
-        out_str += '    "type": "FeatureCollection", '
-        out_str += '    "features": [ '
-        
+        features = []
         if type == "POINT":
-            
-            for i in range(track.size()):
-                x = "{:15.12f}".format(track.getObs(i).position.getX())
-                y = "{:15.12f}".format(track.getObs(i).position.getY())
-            
-                out_str += '{ '
-                out_str += '    "type": "Feature", '
-                out_str += '    "geometry": { '
-                out_str += '        "type": "Point", '
-                out_str += '        "coordinates": [' + x + ', ' + y + '] '
-                out_str += '    }, '
-                out_str += '    "properties": { '
-                out_str += '        "prop0": "value0" '
-                out_str += '    } '
-                out_str += '}'
-                
-                if i != track.size() - 1:
-                    out_str += ','
-                
+            X = [float(x) for x in map("%.12f".__mod__, _column(track.getX()))]
+            Y = [float(y) for y in map("%.12f".__mod__, _column(track.getY()))]
+            for x, y in zip(X, Y):
+                features.append({
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [x, y]},
+                    "properties": {"prop0": "value0"},
+                })
+
         if type == "LINE":
-            out_str += '{ '
-            out_str += '    "type": "Feature", '
-            out_str += '    "geometry": { '
-            out_str += '        "type": "LineString", '
-                
-            out_str += '        "coordinates": ['
-            for i in range(track.size()):
-                out_str += '['
-                if track.getSRID() == "Geo":
-                    out_str += (str)(track.getObs(i).position.lon) + ", "
-                    out_str += (str)(track.getObs(i).position.lat)
-                elif track.getSRID() == "ENU":
-                    out_str += (str)(track.getObs(i).position.E) + ", "
-                    out_str += (str)(track.getObs(i).position.N)
-                out_str += ']'
-                
-                if i != track.size() - 1:
-                    out_str += ","
-            
-            out_str += '] '
-            
-            out_str += '    } '
-            out_str += '}'
-        
-    
-        out_str += '    ]'
-        out_str += '}'
-        #print (out_str)
-        
-        # parse string to json
-        out = json.loads(out_str)
-        return out
+            if (track.size() == 0) or (track.getSRID() in ["Geo", "ENU"]):
+                coords = [list(c) for c in zip(_column(track.getX()), _column(track.getY()))]
+            else:
+                coords = [[] for i in range(track.size())]
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": coords},
+            })
+
+        return {"type": "FeatureCollection", "features": features}
+
+    @staticmethod
+    def writeToGeojson(tracks: Union[Track,TrackCollection], path: str,
+                       type: Literal["LINE", "POINT"] = "LINE"):
+        """
+        Write track(s) in a GeoJSON file (see :func:`exportToGeojson`).
+
+        Features of the tracks of a collection (or of any iterable of
+        tracks) are written in a single feature collection, one track at a
+        time.
+
+        :param tracks: Track or collection of tracks
+        :param path: GeoJSON file to write
+        :param type: "POINT" or "LINE"
+        """
+        if isinstance(tracks, Track):
+            tracks = [tracks]
+
+        with open(path, "w", buffering=TrackWriter.BUFFER_SIZE) as f:
+            f.write('{"type": "FeatureCollection", "features": [')
+            separator = "\n"
+            for track in tracks:
+                for feature in TrackWriter.exportToGeojson(track, type)["features"]:
+                    f.write(separator + json.dumps(feature))
+                    separator = ",\n"
+            f.write("\n]}\n")
 
 
     # =========================================================================
@@ -419,21 +411,17 @@ class TrackWriter:
         :param c2: color for max value (default red) in POINT mode
         """
 
-        # Track collection case
-        if isinstance(track, TrackCollection):
-            return TrackWriter.__writeCollectionToKml(track, path, c1)
-
         # Network case
         if isinstance(track, Network):
             return TrackWriter.__writeCollectionToKml(track.getAllEdgeGeoms(), path, c1)
 
-        f = open(path, "w")
+        # Track collection (or iterable of tracks) case
+        if not isinstance(track, Track):
+            return TrackWriter.__writeCollectionToKml(track, path, c1)
 
-        clampToGround = True
-        for obs in track:
-            if obs.position.getZ() != 0:
-                clampToGround = False
-                break
+        f = open(path, "w", buffering=TrackWriter.BUFFER_SIZE)
+
+        clampToGround = not np.any(np.asarray(track.getZ()) != 0)
 
         if not af is None:
             vmin = track.operate(Operator.MIN, af)
@@ -462,13 +450,7 @@ class TrackWriter:
             f.write("        <altitudeMode>relativeToGround</altitudeMode>\n")
             f.write("        <coordinates>\n")
 
-            for i in range(track.size()):
-                f.write("          ")
-                f.write("{:15.12f}".format(track.getObs(i).position.getX()) + ",")
-                f.write("{:15.12f}".format(track.getObs(i).position.getY()))
-                if not clampToGround:
-                    f.write("," + "{:15.12f}".format(track.getObs(i).position.getZ()))
-                f.write("\n")
+            TrackWriter.__writeKmlCoords(f, track, clampToGround)
 
             f.write("        </coordinates>\n")
             f.write("      </LineString>\n")
@@ -481,38 +463,37 @@ class TrackWriter:
             f.write('<kml xmlns="http://earth.google.com/kml/2.1">\n')
             f.write("  <Document>\n")
 
-            for i in range(track.size()):
-                f.write("    <Placemark>")
-                if name:
-                    if isinstance(name, str):
-                        naf = str(track.getObsAnalyticalFeature(name, i)).strip()
-                        if not (naf in ["", "."]):
-                            f.write("      <name>" + naf + "</name>")
-                    else:
-                        f.write("      <name>" + str(i) + "</name>")
-                f.write("      <Style>")
-                f.write("        <IconStyle>")
-                if not af is None:
-                    v = track.getObsAnalyticalFeature(af, i)
-                    default_color = interpColors(v, vmin, vmax, c1, c2)
-                f.write(
-                    "          <color>" + rgbToHex(default_color)[2:] + "</color>"
-                )
-                f.write("          <scale>0.3</scale>")
-                f.write(
-                    "          <Icon><href>http://maps.google.com/mapfiles/kml/pal2/icon18.png</href></Icon>"
-                )
-                f.write("        </IconStyle>")
-                f.write("      </Style>")
-                f.write("      <Point>")
-                f.write("        <coordinates>")
-                f.write("          ")
-                f.write("{:15.12f}".format(track.getObs(i).position.getX()) + ",")
-                f.write("{:15.12f}".format(track.getObs(i).position.getY()) + ",")
-                f.write("{:15.12f}".format(track.getObs(i).position.getZ()))
-                f.write("        </coordinates>")
-                f.write("      </Point>")
-                f.write("    </Placemark>\n")
+            n = track.size()
+            names = [""] * n
+            if name:
+                if isinstance(name, str):
+                    labels = [str(v).strip() for v in track.getAnalyticalFeature(name)]
+                    names = ["" if (naf in ["", "."]) else "      <name>" + naf + "</name>"
+                             for naf in labels]
+                else:
+                    names = ["      <name>" + str(i) + "</name>" for i in range(n)]
+            if af is None:
+                colors = [rgbToHex(default_color)[2:]] * n
+            else:
+                colors = [rgbToHex(interpColors(v, vmin, vmax, c1, c2))[2:]
+                          for v in _column(track.getAnalyticalFeature(af))]
+
+            template = "    <Placemark>%s"
+            template += "      <Style>"
+            template += "        <IconStyle>"
+            template += "          <color>%s</color>"
+            template += "          <scale>0.3</scale>"
+            template += "          <Icon><href>http://maps.google.com/mapfiles/kml/pal2/icon18.png</href></Icon>"
+            template += "        </IconStyle>"
+            template += "      </Style>"
+            template += "      <Point>"
+            template += "        <coordinates>"
+            template += "          %15.12f,%15.12f,%15.12f"
+            template += "        </coordinates>"
+            template += "      </Point>"
+            template += "    </Placemark>\n"
+            _writeRows(f, template, [names, colors, _column(track.getX()),
+                                     _column(track.getY()), _column(track.getZ())])
 
             f.write("  </Document>\n")
             f.write("</kml>\n")
@@ -520,11 +501,20 @@ class TrackWriter:
         f.close()
         #print("KML written in file [" + path + "]")
 
+    def __writeKmlCoords(f, track, clampToGround):
+        """Write the coordinates of a track in a KML LineString"""
+        columns = [_column(track.getX()), _column(track.getY())]
+        template = "          %15.12f,%15.12f"
+        if not clampToGround:
+            columns.append(_column(track.getZ()))
+            template += ",%15.12f"
+        _writeRows(f, template + "\n", columns)
+
     def __writeCollectionToKml(tracks, path, c1=[1, 1, 1, 1]):
-        """TODO"""
+        """Write a collection (or any iterable) of tracks in a KML file"""
 
         clampToGround = True
-        f = open(path, "w")
+        f = open(path, "w", buffering=TrackWriter.BUFFER_SIZE)
 
         default_color = c1
 
@@ -533,9 +523,7 @@ class TrackWriter:
         f.write("  <Document>\n")
 
         print("KML writing...")
-        for j in progressbar.progressbar(range(tracks.size())):
-
-            track = tracks[j]
+        for track in progressbar.progressbar(tracks):
 
             f.write("    <Placemark>\n")
             f.write("      <name>" + str(track.tid) + "</name>\n")
@@ -550,13 +538,7 @@ class TrackWriter:
             f.write("      <LineString>\n")
             f.write("        <coordinates>\n")
 
-            for i in range(track.size()):
-                f.write("          ")
-                f.write("{:15.12f}".format(track.getObs(i).position.getX()) + ",")
-                f.write("{:15.12f}".format(track.getObs(i).position.getY()))
-                if not clampToGround:
-                    f.write("," + "{:15.12f}".format(track.getObs(i).position.getZ()))
-                f.write("\n")
+            TrackWriter.__writeKmlCoords(f, track, clampToGround)
 
             f.write("        </coordinates>\n")
             f.write("      </LineString>\n")
@@ -597,7 +579,7 @@ class TrackWriter:
         -----------
         
         tracks Track or TrackCollection
-               track or collection to write in GPX
+               track or collection (or any iterable of tracks) to write in GPX
         
         path str
             file or directory to write
@@ -612,9 +594,7 @@ class TrackWriter:
         """
         
         if isinstance(tracks, Track):
-            collection = TrackCollection()
-            collection.addTrack(tracks)
-            tracks = collection
+            tracks = [tracks]
         
         if not oneFile:
             if not os.path.isdir(path):
@@ -625,7 +605,7 @@ class TrackWriter:
             tabpath = path.split(".")
             if not path.split(".")[len(tabpath) - 1]  in TrackWriter.gpxfile_extension:
                 raise IOPathError("Error: path variable need to contain a file path")
-            f = open(path, "w")
+            f = open(path, "w", buffering=TrackWriter.BUFFER_SIZE)
 
         # Time output management
         fmt_save = ObsTime.getPrintFormat()
@@ -634,36 +614,30 @@ class TrackWriter:
         if oneFile:
             f.write(TrackWriter.__getGpxHeader())
             
-        for i in range(len(tracks)):
-            track = tracks.getTrack(i)
+        for track in tracks:
             
             if not oneFile:
                 filename = str(track.tid) + ".gpx"
-                f = open(path + filename, "w")
+                f = open(path + filename, "w", buffering=TrackWriter.BUFFER_SIZE)
                 f.write(TrackWriter.__getGpxHeader())
             
             f.write("    <trk>\n")
             f.write("    <name>" + str(track.tid) + "</name>\n")
             f.write("        <trkseg>\n")
-            for i in range(len(track)):
-                x = "{:3.8f}".format(track[i].position.getX())
-                y = "{:3.8f}".format(track[i].position.getY())
-                z = "{:3.8f}".format(track[i].position.getZ())
-                f.write('            <trkpt lat="' + y + '" lon="' + x + '">\n')
-                f.write("                <ele>" + z + "</ele>\n")
-                f.write("                <time>"
-                    + str(track[i].timestamp)
-                    + track[i].timestamp.printZone()
-                    + "</time>\n"
-                )
-                if af:
-                    f.write("                <extensions>\n")
-                    for af_name in track.getListAnalyticalFeatures():
-                        f.write("                    <" + af_name + ">")
-                        f.write(str(track.getObsAnalyticalFeature(af_name, i)))
-                        f.write("</" + af_name + ">\n")
-                    f.write("                </extensions>\n")
-                f.write("            </trkpt>\n")
+            columns = [_column(track.getY()), _column(track.getX()), _column(track.getZ()),
+                       ObsTime.printTimestamps(track.getT()), _printZones(track)]
+            template = '            <trkpt lat="%3.8f" lon="%3.8f">\n'
+            template += "                <ele>%3.8f</ele>\n"
+            template += "                <time>%s%s</time>\n"
+            if af:
+                template += "                <extensions>\n"
+                for af_name in track.getListAnalyticalFeatures():
+                    template += "                    <" + _escape(af_name) + ">"
+                    template += "%s</" + _escape(af_name) + ">\n"
+                    columns.append(_column(track.getAnalyticalFeature(af_name)))
+                template += "                </extensions>\n"
+            template += "            </trkpt>\n"
+            _writeRows(f, template, columns)
             f.write("        </trkseg>\n")
             f.write("    </trk>\n")
             
@@ -680,3 +654,46 @@ class TrackWriter:
         ObsTime.setPrintFormat(fmt_save)
 
 
+def _column(values) -> list:
+    """Values of a column (array or list) as a list"""
+    if isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
+
+
+def _csvValues(values) -> list:
+    """Values of an analytical feature as printed in CSV files"""
+    if isinstance(values, np.ndarray) and (values.dtype.kind == "f"):
+        return list(map("{:.0f}".format, values.tolist()))
+    return ["{:.0f}".format(v) if isinstance(v, (int, float)) else str(v) for v in values]
+
+
+def _printZones(track) -> list:
+    """Time zone codes (ISO 8601) of the observations of a track"""
+    if track.size() == 0:
+        return []
+    if track.isColumnar():
+        return [track.getFirstObs().timestamp.printZone()] * track.size()
+    codes = {}
+    output = []
+    for timestamp in track.getTimestamps():
+        if timestamp.zone not in codes:
+            codes[timestamp.zone] = timestamp.printZone()
+        output.append(codes[timestamp.zone])
+    return output
+
+
+def _escape(text: str) -> str:
+    """Text escaped to be used in a %-template"""
+    return str(text).replace("%", "%%")
+
+
+def _writeRows(f, template: str, columns: list):
+    """Write rows formatted with a %-template (one value per column)
+
+    Rows are formatted by chunks of :attr:`TrackWriter.CHUNK_SIZE` rows.
+    """
+    n = len(columns[0])
+    for i in range(0, n, TrackWriter.CHUNK_SIZE):
+        chunk = [values[i : i + TrackWriter.CHUNK_SIZE] for values in columns]
+        f.write("".join(map(template.__mod__, zip(*chunk))))
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+© Copyright Institut National de l'Information Géographique et Forestière (2020)
+Contributors: 
+    Yann Méneroux
+Creation date: 18th october 2026
+
+tracklib library provides a variety of tools, operators and 
+functions to manipulate GPS trajectories. It is a open source contribution 
+of the LASTIG laboratory at the Institut National de l'Information 
+Géographique et Forestière (the French National Mapping Agency).
+See: https://tracklib.readthedocs.io
+ 
+This software is governed by the CeCILL-C license under French law and
+abiding by the rules of distribution of free software. You can  use, 
+modify and/ or redistribute the software under the terms of the CeCILL-C
+license as circulated by CEA, CNRS and INRIA at the following URL
+"http://www.cecill.info". 
+
+As a counterpart to the access to the source code and rights to copy,
+modify and redistribute granted by the license, users are provided only
+with a limited warranty  and the software's author,  the holder of the
+economic rights,  and the successive licensors  have only  limited
+liability. 
+
+In this respect, the user's attention is drawn to the risks associated
+with loading,  using,  modifying and/or developing or reproducing the
+software by the user in light of its specific status of free software,
+that may mean  that it is complicated to manipulate,  and  that  also
+therefore means  that it is reserved for developers  and  experienced
+professionals having in-depth computer knowledge. Users are therefore
+encouraged to load and test the software's suitability as regards their
+requirements in conditions enabling the security of their systems and/or 
+data to be ensured and,  more generally, to use and operate it in the 
+same conditions as regards security. 
+
+The fact that you are presently reading this means that you have had
+knowledge of the CeCILL-C license and that you accept its terms.
+
+
+
+This module contains a bulk parser of geometries in WKT (or EWKT) format.
+
+A column of WKT strings is parsed in one pass into a single array of
+coordinates, with offsets delimiting the parts (linestrings or rings) and the
+geometries, instead of building an observation per vertex.
+"""
+
+import re
+import numpy as np
+from tracklib.util.exceptions import *
+
+from tracklib.core import Obs, ObsTime, makeCoords
+
+
+# Innermost parenthesized sequences of coordinates (linestrings or rings),
+# the last one may be unclosed (truncated geometry)
+_PARTS = re.compile(r"\(([^()]*)(?:\)|$)")
+
+
+def wktGeometryType(wkt: str) -> str:
+    """Type of a WKT (or EWKT) geometry in upper case (e.g. "LINESTRING")
+
+    The SRID of EWKT and dimension suffixes ("Z", "M", "ZM") are removed.
+    """
+    wkt = wkt.lstrip()
+    if wkt[0:5].upper() == "SRID=":
+        wkt = wkt[wkt.find(";") + 1 :]
+    words = wkt.split("(")[0].upper().split()
+    if len(words) == 0:
+        return ""
+    return words[0]
+
+
+def parseWktColumn(wkts) -> tuple:
+    """Parse a column of WKT (or EWKT) geometries in one pass
+
+    Every innermost sequence of coordinates is a part: the linestring of a
+    LINESTRING, each linestring of a MULTILINESTRING, each ring of a POLYGON
+    or a MULTIPOLYGON. Missing Z coordinates are set to 0, M coordinates
+    (4th values) are ignored.
+
+    :param wkts: List (or any iterable) of WKT strings
+    :return: A tuple (coords, parts, geoms): coords is an (n, 3) array of
+        coordinates, vertices of part k are coords[parts[k]:parts[k+1]] and
+        parts of geometry i are parts[geoms[i]:geoms[i+1]]
+    """
+    tokens = []
+    nb_vertices = []
+    dims = []
+    geoms = [0]
+    for i, wkt in enumerate(wkts):
+        for part in _PARTS.findall(wkt):
+            values = part.replace(",", " ").split()
+            nb = part.count(",") + 1
+            dim = len(values) // nb
+            first = part[: part.find(",")] if nb > 1 else part
+            if (dim < 2) or (dim * nb != len(values)) or (len(first.split()) != dim):
+                values = _completeVertices(part, i)
+                dim = 3
+            tokens.extend(values)
+            nb_vertices.append(nb)
+            dims.append(dim)
+        geoms.append(len(nb_vertices))
+
+    nb_vertices = np.array(nb_vertices, dtype=np.int64)
+    dims = np.array(dims, dtype=np.int64)
+    parts = np.zeros(len(nb_vertices) + 1, dtype=np.int64)
+    np.cumsum(nb_vertices, out=parts[1:])
+    geoms = np.array(geoms, dtype=np.int64)
+
+    try:
+        values = np.array(tokens, dtype=np.float64)
+    except ValueError as error:
+        raise WrongArgumentError("Error: invalid number in WKT geometry: " + str(error))
+
+    # Index of the first value of each vertex
+    part = np.repeat(np.arange(len(nb_vertices)), nb_vertices)
+    starts = np.zeros(len(dims), dtype=np.int64)
+    np.cumsum((nb_vertices * dims)[:-1], out=starts[1:])
+    index = starts[part] + (np.arange(parts[-1]) - parts[part]) * dims[part]
+
+    coords = np.zeros((parts[-1], 3), dtype=np.float64)
+    coords[:, 0] = values[index]
+    coords[:, 1] = values[index + 1]
+    has_z = dims[part] >= 3
+    coords[has_z, 2] = values[index[has_z] + 2]
+    return coords, parts, geoms
+
+
+def _completeVertices(part: str, i: int) -> list:
+    """Values of the vertices of a part, completed with Z = 0 when vertices
+    have different dimensions (M coordinates are removed)"""
+    values = []
+    for vertex in part.split(","):
+        xyz = vertex.split()
+        if len(xyz) < 2:
+            raise WrongArgumentError("Error: invalid coordinates in WKT geometry " + str(i))
+        values.extend(xyz[:3] if len(xyz) >= 3 else xyz + ["0"])
+    return values
+
+
+def makeObsList(coords, srid: str) -> list:
+    """Observations (with null timestamps) of an (n, 3) array of coordinates
+
+    :param coords: Coordinates of the vertices (e.g. from :func:`parseWktColumn`)
+    :param srid: Coordinate type ("ENU", "Geo" or "ECEF")
+    :return: List of :class:`Obs`
+    """
+    coords_type = type(makeCoords(0, 0, 0, srid))
+    origin = ObsTime()
+    return [Obs(coords_type(x, y, z), origin.copy()) for x, y, z in coords.tolist()]